@@ -7,8 +7,16 @@ cd "$SCRIPT_DIR" || exit 1
 
 echo "Removing ESPHome caches..."
 rm -rf esphome/.esphome
+echo "Removing generated headers of older versions..."
+rm -f esphome/components/daikin_rotex_solaris/solaris_error_codes.h
 echo "Removing Python caches..."
 rm -rf esphome/components/daikin_rotex_solaris/__pycache__
 rm -rf esphome/components/daikin_rotex_solaris/translations/__pycache__
+rm -rf tools/__pycache__ tools/tests/__pycache__ .pytest_cache
+rm -rf ha-dashboard/__pycache__ ha-dashboard/tests/__pycache__
+echo "Removing precompressed dashboard SVGs..."
+rm -f ha-dashboard/*.svg.gz ha-dashboard/*.svg.br
+echo "Removing host test harness build..."
+rm -rf esphome/tests/host/build
 
 cd "$EXECUTE_DIR" || exit 1
@@ -3,31 +3,106 @@ ESPHome integration for DAIKIN/ROTEX Solaris RPS3/RPS4 solar controller.
 
 This module:
 1. Configures sensors schema for numeric, binary and text sensors
-2. Generates solaris_error_codes.h header with translations for the specified
-language in the YAML configuration
+2. Generates the solaris_error_codes_<languages>.h header with translations for
+the languages in the YAML configuration (in the build directory, only rewritten
+when its content changed)
 3. Registers the component and sets up all sensors entities
+
+The component may be configured as a list, one instance per controller with
+its own UART, name prefix and language. The generated headers are shared by
+all instances.
 """
 
 import esphome.codegen as cg
 import esphome.config_validation as cv
-from esphome.components import uart
-from esphome.const import CONF_ID
-from pathlib import Path
+import esphome.final_validate as fv
+from esphome.components import esp32, time as time_, uart, web_server_base
+from esphome.components.esp32.const import VARIANT_ESP32, VARIANT_ESP32P4, VARIANT_ESP32S3
+from esphome.components.web_server_base import CONF_WEB_SERVER_BASE_ID
+from esphome.const import (
+    CONF_ADDRESS, CONF_BIRTH_MESSAGE, CONF_DISCOVERY, CONF_DISCOVERY_PREFIX, CONF_ID, CONF_INTERVAL, CONF_PORT,
+    CONF_PRIORITY, CONF_QOS, CONF_RETAIN, CONF_SIZE, CONF_TIME_ID, CONF_TOPIC, CONF_TOPIC_PREFIX, CONF_UART_ID,
+)
+from esphome.core import CORE
+import logging
+import time
+import zlib
+
+from .error_codes import error_codes_header_name, write_error_codes_header
+from .mqtt_discovery import discovery_messages
+from .sensors import CONF_NAME_PREFIX, SENSORS_SCHEMA, setup_sensors, write_sensor_table
+from .sensors_config import SENSORS_CONFIG
+from .translations.translations import DEFAULT_LANGUAGE, get_codes_description, translation_exists
 
-from .sensors import SENSORS_SCHEMA, setup_sensors
-from .translations.translations import DEFAULT_LANGUAGE, get_codes_description
+_LOGGER = logging.getLogger(__name__)
 
 # Configuration key in YAML for language selection
 CONF_LANGUAGE = "language"
+# Configuration key for the max-silence period after which all values are republished
+CONF_HEARTBEAT = "heartbeat"
+# Configuration keys for UART draining: time budget per loop() and backlog coalescing
+CONF_LOOP_BUDGET = "loop_budget"
+CONF_LATEST_FRAME_ONLY = "latest_frame_only"
+# Configuration block of the UART reception and parsing in a FreeRTOS task
+CONF_PARSER_TASK = "parser_task"
+CONF_CORE = "core"
+# Configuration key for the cycles without a frame before the field sensors become unknown
+CONF_STALE_CYCLES = "stale_cycles"
+# Configuration key for the period of the windowed min/max/mean sensors
+CONF_AGGREGATION_WINDOW = "aggregation_window"
+# Configuration keys for batched flash writes of the energy/run-hours/starts counters
+CONF_ACCUMULATOR_SAVE_INTERVAL = "accumulator_save_interval"
+CONF_ACCUMULATOR_SAVE_ENERGY = "accumulator_save_energy"
+# Configuration key for the update period of the health (diagnostic) sensors
+CONF_HEALTH_INTERVAL = "health_interval"
+# Configuration block of the in-RAM frame history (ring buffer size, PSRAM placement)
+CONF_HISTORY = "history"
+CONF_PSRAM = "psram"
+# Configuration block of the binary UDP frame push (target and device id)
+CONF_UDP_PUSH = "udp_push"
+CONF_DEVICE_ID = "device_id"
+# Configuration block of the low-power mode of the UDP push (batched frames, Wi-Fi duty cycling)
+CONF_LOW_POWER = "low_power"
+CONF_FLUSH_INTERVAL = "flush_interval"
+CONF_QUEUE_SIZE = "queue_size"
+CONF_RADIO_OFF = "radio_off"
+CONF_AWAKE_TIME = "awake_time"
+CONF_REBOOT_TIMEOUT = "reboot_timeout"
+# Configuration block of the batched MQTT publication (one JSON document per frame)
+CONF_MQTT_JSON = "mqtt_json"
+# Configuration block of the simulated data source (lines parsed instead of UART data)
+CONF_SIMULATE = "simulate"
+CONF_LINES = "lines"
+
+# Sensor that needs a time source ('time_id') for its timestamp
+CONF_ERR_LAST_CLEARED = "solaris_err_last_cleared"
 
 # ============================================================================
 # COMPONENT METADATA
 # ============================================================================
+DOMAIN = "daikin_rotex_solaris"
+
 # Dependencies on other ESPHome components
 DEPENDENCIES = ["uart"]
 
-# Components that will be auto-loaded by ESPHome when this component is used
-AUTO_LOAD = ["sensor", "text_sensor", "binary_sensor"]
+# Several controllers on one ESP32: the component may be given as a list
+MULTI_CONF = True
+
+
+def AUTO_LOAD():
+    """Components that will be auto-loaded by ESPHome when this component is used.
+
+    Called before validation, the socket component is only loaded when an
+    instance of the (raw) configuration has a UDP push.
+    """
+    components = ["sensor", "text_sensor", "binary_sensor"]
+    instances = (CORE.raw_config or {}).get(DOMAIN) or []
+    if isinstance(instances, dict):
+        instances = [instances]
+    if any(isinstance(instance, dict) and CONF_UDP_PUSH in instance for instance in instances):
+        components.append("socket")
+    return components
+
 
 # ============================================================================
 # C++ NAMESPACE AND CLASS REGISTRATION
@@ -43,110 +118,293 @@ DaikinRotexSolarisComponent = daikin_rotex_solaris_ns.class_(
 # ============================================================================
 # CONFIGURATION SCHEMA - defines valid YAML configuration structure
 # ============================================================================
-CONFIG_SCHEMA = (
+# Frame history ring buffer, downloadable from the web server as
+# /solaris/history.bin and /solaris/history.csv (ESP-IDF web server only)
+HISTORY_SCHEMA = cv.All(
+    cv.Schema({
+        cv.GenerateID(CONF_WEB_SERVER_BASE_ID): cv.use_id(web_server_base.WebServerBase),
+        # Ring buffer size in bytes (256 byte blocks, 4-8 bytes per frame)
+        cv.Optional(CONF_SIZE, default=16384): cv.int_range(min=1024, max=4 * 1024 * 1024),
+        # Allocate the ring buffer in PSRAM if available (e.g. ESP32-S3 with psram:)
+        cv.Optional(CONF_PSRAM, default=False): cv.boolean,
+    }),
+    cv.only_with_esp_idf,
+)
+
+# Variants with two cores, the others only have core 0
+DUAL_CORE_VARIANTS = (VARIANT_ESP32, VARIANT_ESP32S3, VARIANT_ESP32P4)
+
+
+def _validate_parser_task_core(config):
+    """Core 1 only exists on the dual-core variants"""
+    if config[CONF_CORE] == 1 and esp32.get_esp32_variant() not in DUAL_CORE_VARIANTS:
+        raise cv.Invalid(f"{esp32.get_esp32_variant()} has a single core, use core 0", path=[CONF_CORE])
+    return config
+
+
+# UART reception and parsing in a FreeRTOS task that blocks on the UART
+# driver, the main loop only publishes the completed lines (ESP-IDF only).
+# The ESPHome main loop runs on core 1, core 0 runs the task in parallel.
+PARSER_TASK_SCHEMA = cv.All(
+    cv.Schema({
+        cv.Optional(CONF_CORE, default=0): cv.int_range(min=0, max=1),
+        # FreeRTOS priority, the main loop has 1 and the Wi-Fi/TCP/IP tasks 18 and above
+        cv.Optional(CONF_PRIORITY, default=5): cv.int_range(min=1, max=17),
+        # Completed lines waiting for the main loop (rounded up to a power of
+        # two, about 80 bytes each), further lines are dropped
+        cv.Optional(CONF_QUEUE_SIZE, default=8): cv.int_range(min=2, max=256),
+    }),
+    cv.only_with_esp_idf,
+    _validate_parser_task_core,
+)
+
+# Wi-Fi connect timeout of the low-power mode, LOW_POWER_CONNECT_TIMEOUT_MS in solaris_low_power.h
+LOW_POWER_CONNECT_TIMEOUT_MS = 30000
+
+# Frames queued and sent as batches with the time they were received, Wi-Fi
+# optionally only on for the flushes (store-and-forward)
+LOW_POWER_SCHEMA = cv.Schema({
+    # Send the queued frames this often (right away when the error code changes)
+    cv.Optional(CONF_FLUSH_INTERVAL, default="60s"): cv.All(
+        cv.positive_time_period_milliseconds,
+        cv.Range(min=cv.TimePeriod(seconds=10)),
+    ),
+    # Frames kept while the network is unavailable, the oldest are dropped (28 bytes each)
+    cv.Optional(CONF_QUEUE_SIZE, default=360): cv.int_range(min=1, max=2048),
+    # Disable Wi-Fi between the flushes (requires the wifi component)
+    cv.Optional(CONF_RADIO_OFF, default=False): cv.boolean,
+    # Time Wi-Fi stays on after a flush, e.g. for the Home Assistant API and OTA
+    cv.Optional(CONF_AWAKE_TIME, default="15s"): cv.positive_time_period_milliseconds,
+})
+
+# Every parsed frame as binary datagram to a collector (tools/solaris_collector.py)
+UDP_PUSH_SCHEMA = cv.Schema({
+    cv.Required(CONF_ADDRESS): cv.ipv4address,
+    cv.Optional(CONF_PORT, default=4210): cv.port,
+    # Identifies the unit at the collector (default: derived from the node name)
+    cv.Optional(CONF_DEVICE_ID): cv.uint16_t,
+    # Batches every flush_interval instead of one datagram per frame (disabled if not configured)
+    cv.Optional(CONF_LOW_POWER): LOW_POWER_SCHEMA,
+})
+
+# Every parsed frame as one JSON document on a single MQTT topic, with Home
+# Assistant discovery of the field sensors (see mqtt_discovery.py)
+MQTT_JSON_SCHEMA = cv.All(
+    cv.Schema({
+        # Default: <topic_prefix>/solaris/frame (<topic_prefix>/solaris/<n>/frame for further instances)
+        cv.Optional(CONF_TOPIC): cv.publish_topic,
+        # Announce the field sensors to Home Assistant (default: discovery setting of mqtt:)
+        cv.Optional(CONF_DISCOVERY): cv.boolean,
+        cv.Optional(CONF_QOS, default=0): cv.mqtt_qos,
+        cv.Optional(CONF_RETAIN, default=False): cv.boolean,
+    }),
+    cv.requires_component("mqtt"),
+)
+
+# Length limits of a data line, MIN_LINE_LEN/MAX_LINE_LEN in solaris_parser.h
+MIN_LINE_LEN = 22
+MAX_LINE_LEN = 48
+# Typical frame while the pump runs. Format: Ha;BK;P1;P2;TK;TR;TS;TV;DF;Err;P
+SIMULATE_DEFAULT_LINE = "0;1;75;0;84;58;61;63;3,2;;3500"
+
+
+def _validate_simulate_line(value):
+    """A data line as sent by the controller (11 fields, parser length limits)"""
+    value = cv.string_strict(value)
+    if value.count(";") != 10:
+        raise cv.Invalid(f"Expected 11 ';' separated fields (Ha;BK;P1;P2;TK;TR;TS;TV;DF;Err;P): '{value}'")
+    if not MIN_LINE_LEN <= len(value) <= MAX_LINE_LEN:
+        raise cv.Invalid(f"Line length must be {MIN_LINE_LEN}-{MAX_LINE_LEN} characters: '{value}'")
+    return value
+
+
+# Parse the configured lines in turn instead of reading the UART (testing
+# without a controller, see tools/solaris_simulator.py for a full serial stream)
+SIMULATE_SCHEMA = cv.Schema({
+    # Time between two lines (the controller's cycle is 5 s)
+    cv.Optional(CONF_INTERVAL, default="5s"): cv.positive_time_period_milliseconds,
+    cv.Optional(CONF_LINES, default=[SIMULATE_DEFAULT_LINE]): cv.All(
+        cv.ensure_list(_validate_simulate_line), cv.Length(min=1)),
+})
+
+def _validate_time_source(config):
+    """The last-cleared timestamp is derived from a clock (e.g. homeassistant time)"""
+    if CONF_ERR_LAST_CLEARED in config and CONF_TIME_ID not in config:
+        raise cv.Invalid(f"'{CONF_ERR_LAST_CLEARED}' requires '{CONF_TIME_ID}'", path=[CONF_ERR_LAST_CLEARED])
+    return config
+
+
+CONFIG_SCHEMA = cv.All(
     cv.Schema({
         # Component ID for internal reference
         cv.GenerateID(): cv.declare_id(DaikinRotexSolarisComponent),
         # Language selection for sensor names and error messages (default: DEFAULT_LANGUAGE)
         cv.Optional(CONF_LANGUAGE, default=DEFAULT_LANGUAGE): cv.string,
+        # Put in front of all sensor names, needed with several instances
+        cv.Optional(CONF_NAME_PREFIX): cv.string_strict,
+        # Republish all values every period (0s disables the heartbeat)
+        cv.Optional(CONF_HEARTBEAT, default="5min"): cv.positive_time_period_milliseconds,
+        # Max time for reading/parsing UART data per main loop iteration (0us = unlimited)
+        cv.Optional(CONF_LOOP_BUDGET, default="2000us"): cv.positive_time_period_microseconds,
+        # After a stall publish only the newest of the queued frames
+        cv.Optional(CONF_LATEST_FRAME_ONLY, default=True): cv.boolean,
+        # Read and parse the UART in a FreeRTOS task instead of loop()
+        cv.Optional(CONF_PARSER_TASK): PARSER_TASK_SCHEMA,
+        # Field sensors unknown after this many controller cycles without a frame (0 = never)
+        cv.Optional(CONF_STALE_CYCLES, default=3): cv.int_range(min=0, max=100),
+        # Period over which the *_min/*_max/*_mean sensors are aggregated
+        cv.Optional(CONF_AGGREGATION_WINDOW, default="5min"): cv.All(
+            cv.positive_time_period_milliseconds,
+            cv.Range(min=cv.TimePeriod(seconds=10)),
+        ),
+        # Max time between flash writes of changed counters
+        cv.Optional(CONF_ACCUMULATOR_SAVE_INTERVAL, default="15min"): cv.All(
+            cv.positive_time_period_milliseconds,
+            cv.Range(min=cv.TimePeriod(minutes=1)),
+        ),
+        # Solar yield (kWh) since the last write that triggers an early write
+        cv.Optional(CONF_ACCUMULATOR_SAVE_ENERGY, default=0.5): cv.positive_float,
+        # Update period of the health sensors (and of their rate/max/mean gauges)
+        cv.Optional(CONF_HEALTH_INTERVAL, default="60s"): cv.All(
+            cv.positive_time_period_milliseconds,
+            cv.Range(min=cv.TimePeriod(seconds=10)),
+        ),
+        # In-RAM history of the received frames (disabled if not configured)
+        cv.Optional(CONF_HISTORY): HISTORY_SCHEMA,
+        # Binary UDP push of every frame (disabled if not configured)
+        cv.Optional(CONF_UDP_PUSH): UDP_PUSH_SCHEMA,
+        # One MQTT message per frame instead of one per entity (disabled if not configured)
+        cv.Optional(CONF_MQTT_JSON): MQTT_JSON_SCHEMA,
+        # Simulated lines instead of UART data (disabled if not configured)
+        cv.Optional(CONF_SIMULATE): SIMULATE_SCHEMA,
+        # Clock for the time the last controller error cleared and the MQTT JSON documents
+        cv.Optional(CONF_TIME_ID): cv.use_id(time_.RealTimeClock),
     })
     # Include sensors schema
     .extend(SENSORS_SCHEMA)
     # Required ESPHome component configuration
     .extend(cv.COMPONENT_SCHEMA)
     # Required for UART communication
-    .extend(uart.UART_DEVICE_SCHEMA)
+    .extend(uart.UART_DEVICE_SCHEMA),
+    _validate_time_source,
 )
 
 
-def _cpp_escape(s):
-    r"""Escape a Python string for safe inclusion in a C++ string literal.
-    
-    This function escapes special characters so the string can be safely
-    embedded in C++ code as a string literal:
-        - Backslashes are doubled (\ becomes \\)
-        - Quotes are escaped (" becomes \")
-    """
-    # Escape backslashes first, then quotes (order matters!)
-    return s.replace("\\", "\\\\").replace('"', '\\"')
+def _low_power(config):
+    """Low-power block of the UDP push, None if not configured"""
+    return config.get(CONF_UDP_PUSH, {}).get(CONF_LOW_POWER)
 
 
-def generate_error_codes_header(lang):
-    """Generate solaris_error_codes.h header from translations.py
-    
-    This function creates a C++ header file containing error codes definitions
-    with descriptions in the selected language. The header is generated at
-    build time.
-    
-    Args:
-        language: Language code (e.g., de, en, fr, it, es). DEFAULT_LANGUAGE 
-        will be used if the specified language is not available.
-    
+def _final_validate_low_power(config):
+    """Wi-Fi switched off between the flushes must not trigger a reboot"""
+    low_power = _low_power(config)
+    if low_power is None or not low_power[CONF_RADIO_OFF]:
+        return
+    path = [CONF_UDP_PUSH, CONF_LOW_POWER, CONF_RADIO_OFF]
+    full_config = fv.full_config.get()
+    if "wifi" not in full_config:
+        raise cv.Invalid(f"'{CONF_RADIO_OFF}' requires the wifi component", path=path)
+    if sum(bool((_low_power(instance) or {}).get(CONF_RADIO_OFF)) for instance in full_config[DOMAIN]) > 1:
+        raise cv.Invalid(f"'{CONF_RADIO_OFF}' may be set for one instance only", path=path)
+
+    # Longest time without a Wi-Fi connection: one flush interval plus a failed connect
+    offline_ms = low_power[CONF_FLUSH_INTERVAL].total_milliseconds + LOW_POWER_CONNECT_TIMEOUT_MS
+    reboot_timeout = full_config["wifi"].get(CONF_REBOOT_TIMEOUT)
+    if reboot_timeout and reboot_timeout.total_milliseconds <= offline_ms:
+        raise cv.Invalid(f"wifi '{CONF_REBOOT_TIMEOUT}' must be 0s or longer than '{CONF_FLUSH_INTERVAL}' + "
+                         f"{LOW_POWER_CONNECT_TIMEOUT_MS // 1000}s", path=path)
+    reboot_timeout = full_config.get("api", {}).get(CONF_REBOOT_TIMEOUT)
+    if reboot_timeout and reboot_timeout.total_milliseconds <= offline_ms:
+        _LOGGER.warning("api '%s' should be 0s with '%s', Home Assistant may not reconnect within '%s'",
+                        CONF_REBOOT_TIMEOUT, CONF_RADIO_OFF, CONF_AWAKE_TIME)
+
+
+def _final_validate(config):
+    """Instances must not share a UART and need distinct entity names"""
+    _final_validate_low_power(config)
+    instances = fv.full_config.get()[DOMAIN]
+    if len(instances) < 2:
+        return config
+    if sum(instance[CONF_UART_ID] == config[CONF_UART_ID] for instance in instances) > 1:
+        raise cv.Invalid(f"UART '{config[CONF_UART_ID]}' is used by several instances", path=[CONF_UART_ID])
+    if sum(instance.get(CONF_NAME_PREFIX) == config.get(CONF_NAME_PREFIX) for instance in instances) > 1:
+        raise cv.Invalid(f"'{CONF_NAME_PREFIX}' must be set and differ between instances", path=[CONF_NAME_PREFIX])
+    return config
+
+
+FINAL_VALIDATE_SCHEMA = _final_validate
+
+
+def _instance_language(config):
+    """Language of an instance, DEFAULT_LANGUAGE if there is no translation"""
+    language = config[CONF_LANGUAGE]
+    return language if translation_exists(language) else DEFAULT_LANGUAGE
+
+
+def _generate_shared_headers():
+    """Generate the headers shared by all instances (on the first to_code() call).
+
+    Writes the error codes header with the languages of all instances and the
+    sensor table with the sensors of all instances, both into the build
+    directory and only if their content changed.
+
     Returns:
-        String containing complete C++ header file content
+        Dictionary with the header languages ('languages'), the sensor table
+        slot per key ('slots') and the number of instances set up ('instances')
+    """
+    data = CORE.data.setdefault(DOMAIN, {})
+    if data:
+        return data
+
+    configs = CORE.config[DOMAIN]
+    languages = list(dict.fromkeys(_instance_language(config) for config in configs))
+    start = time.perf_counter()
+    header_path, written = write_error_codes_header(CORE.relative_src_path(), languages)
+    _LOGGER.info(
+        "%s %s in %.1f ms", header_path.name, "generated" if written else "unchanged",
+        (time.perf_counter() - start) * 1000,
+    )
+    cg.add_define("SOLARIS_ERROR_CODES_HEADER", error_codes_header_name(languages))
+
+    data["languages"] = languages
+    data["slots"] = write_sensor_table(configs)
+    data["instances"] = 0
+    return data
+
+
+def _setup_mqtt_json(var, config, index):
+    """Set the frame topic and the discovery messages of the batched MQTT publication.
+
+    The discovery configs announce every field sensor (SENSORS_CONFIG entries
+    without 'setter') with the instance's language and name prefix, whether
+    the sensor is configured as ESPHome entity or not.
     """
-    # Get translations for selected language
-    translations = get_codes_description(lang)
-
-    # ========================================================================
-    # BUILD C++ HEADER CONTENT
-    # ========================================================================
-    header_lines = [
-        "// AUTO-GENERATED FILE: Do not edit manually!",
-        "// Generated from translations.py by __init__.py during build",
-        "// Language: " + lang.upper(),
-        "",
-        "namespace esphome {",
-        "namespace daikin_rotex_solaris {",
-        "",
-        "// Struct to hold error code and description pairs",
-        "struct SolarisErrorCodes {",
-        "  char code;               // Single character error code (K, R, S, V, D, G, F, W, or \\0)",
-        "  const char *description; // Pointer to error description string in the selected language",
-        "};",
-        "",
-        "// Error codes only for the selected language",
-        "static const SolarisErrorCodes ERROR_CODES[] = {",
-    ]
-
-    # ========================================================================
-    # ADD ERROR CODE ENTRIES TO ARRAY
-    # ========================================================================
-    for key, description in translations.items():
-        # Format the error code character for C++
-        if key == "unknown":
-            # "unknown" is a special fallback entry (no character match)
-            code_char = "'\\x00'"
-        elif key == "":
-            # Empty string maps to null character (no error condition)
-            code_char = "'\\0'"
-        else:
-            # Single-character codes: K, R, S, D, V, G, F, W
-            code_char = "'" + key + "'"
-
-        # Escape the description for safe inclusion in C++ string literal
-        escaped_desc = _cpp_escape(str(description))
-        
-        # Add struct initializer to array
-        line = "  {{{}, \"{}\"}},".format(code_char, escaped_desc)
-        header_lines.append(line)
-
-    # ========================================================================
-    # CLOSE ARRAY AND ADD UTILITY CONSTANTS
-    # ========================================================================
-    header_lines.extend([
-        "};",
-        "",
-        "// Calculate array size at compile time",
-        "static constexpr size_t ERROR_CODES_COUNT = sizeof(ERROR_CODES) / sizeof(ERROR_CODES[0]);",
-        "// Index of the \"unknown\" fallback entry (always the last one)",
-        "static constexpr size_t UNKNOWN_ERROR_INDEX = ERROR_CODES_COUNT - 1;",
-        "",
-        "} // namespace daikin_rotex_solaris",
-        "} // namespace esphome"
-    ])
-
-    return "\n".join(header_lines)
+    mqtt_json = config[CONF_MQTT_JSON]
+    mqtt_config = CORE.config["mqtt"]
+    topic_prefix = mqtt_config[CONF_TOPIC_PREFIX]
+    # Same scheme as the history URLs, instance 0 keeps the single instance topic
+    default_topic = f"{topic_prefix}/solaris/frame" if index == 0 else f"{topic_prefix}/solaris/{index}/frame"
+    topic = mqtt_json.get(CONF_TOPIC, default_topic)
+    cg.add_define("USE_SOLARIS_MQTT_JSON")
+    cg.add(var.set_mqtt_json(topic, mqtt_json[CONF_QOS], mqtt_json[CONF_RETAIN]))
+
+    if not mqtt_json.get(CONF_DISCOVERY, bool(mqtt_config.get(CONF_DISCOVERY, True))):
+        return
+    lang = _instance_language(config)
+    prefix = config.get(CONF_NAME_PREFIX, "")
+    sensors = []
+    for sensor_cfg in SENSORS_CONFIG:
+        if 'setter' not in sensor_cfg:
+            name = sensor_cfg['display_name'](lang)
+            sensors.append((sensor_cfg, f"{prefix} {name}" if prefix else name))
+    object_prefix = CORE.name if index == 0 else f"{CORE.name}_{config[CONF_ID]}"
+    birth_message = mqtt_config.get(CONF_BIRTH_MESSAGE) or {}
+    messages = discovery_messages(
+        sensors, topic, mqtt_config[CONF_DISCOVERY_PREFIX], object_prefix, get_codes_description(lang),
+        availability_topic=birth_message.get(CONF_TOPIC),
+    )
+    for message in messages:
+        cg.add(var.add_mqtt_json_discovery(message.topic, message.payload))
 
 
 async def to_code(config):
@@ -155,9 +413,12 @@ async def to_code(config):
     This function:
     1. Creates the C++ component instance
     2. Registers it with ESPHome's component registry
-    3. Generates the error codes header for the selected language
+    3. Generates the shared error codes and sensor table headers (if changed)
     4. Sets up all sensor entities (numeric, binary, text)
     """
+    shared = _generate_shared_headers()
+    index = shared["instances"]
+    shared["instances"] += 1
 
     # Create new C++ component instance
     var = cg.new_Pvariable(config[CONF_ID])
@@ -168,15 +429,84 @@ async def to_code(config):
     # Register as UART device (connects to uart_id and sets up communication)
     await uart.register_uart_device(var, config)    
 
-    # Generate C++ header content with error codes in the selected language
-    language = config[CONF_LANGUAGE]
-    header_text = generate_error_codes_header(language)
+    # Several instances: own log tag, flash counters and history URLs, and the
+    # error codes table of the instance's language
+    if len(CORE.config[DOMAIN]) > 1:
+        cg.add(var.set_instance(index, f"{DOMAIN}.{config[CONF_ID]}"))
+    if len(shared["languages"]) > 1:
+        cg.add(var.set_language(shared["languages"].index(_instance_language(config))))
+
+    # Period of the full republish (publish-on-change heartbeat)
+    cg.add(var.set_heartbeat(config[CONF_HEARTBEAT]))
+
+    # UART draining: per loop() time budget and "latest frame wins" coalescing
+    cg.add(var.set_loop_budget(config[CONF_LOOP_BUDGET]))
+    cg.add(var.set_latest_frame_only(config[CONF_LATEST_FRAME_ONLY]))
+
+    # UART reception and parsing in a pinned FreeRTOS task
+    if CONF_PARSER_TASK in config:
+        parser_task = config[CONF_PARSER_TASK]
+        cg.add_define("USE_SOLARIS_PARSER_TASK")
+        cg.add(var.set_parser_task(parser_task[CONF_CORE], parser_task[CONF_PRIORITY], parser_task[CONF_QUEUE_SIZE]))
 
-    # Write Generated header file
-    component_dir = Path(__file__).parent
-    header_path = component_dir / "solaris_error_codes.h"
-    with open(header_path, "w", encoding="utf-8") as f:
-        f.write(header_text)
+    # Link watchdog: stale values after missed cycles
+    cg.add(var.set_stale_cycles(config[CONF_STALE_CYCLES]))
+
+    # Frame history with download endpoints on the web server
+    if CONF_HISTORY in config:
+        history = config[CONF_HISTORY]
+        cg.add_define("USE_SOLARIS_HISTORY")
+        cg.add(var.set_history_size(history[CONF_SIZE]))
+        cg.add(var.set_history_psram(history[CONF_PSRAM]))
+        base = await cg.get_variable(history[CONF_WEB_SERVER_BASE_ID])
+        cg.add(var.set_web_server_base(base))
+
+    # Binary UDP frame push
+    if CONF_UDP_PUSH in config:
+        udp_push = config[CONF_UDP_PUSH]
+        # Default from the node name, further instances also hash their id
+        name = CORE.name if index == 0 else f"{CORE.name}.{config[CONF_ID]}"
+        device_id = udp_push.get(CONF_DEVICE_ID, zlib.crc32(name.encode()) & 0xFFFF)
+        cg.add_define("USE_SOLARIS_UDP")
+        cg.add(var.set_udp_push(str(udp_push[CONF_ADDRESS]), udp_push[CONF_PORT], device_id))
+        # Store-and-forward batches, Wi-Fi duty cycling
+        if CONF_LOW_POWER in udp_push:
+            low_power = udp_push[CONF_LOW_POWER]
+            cg.add_define("USE_SOLARIS_LOW_POWER")
+            cg.add(var.set_low_power(low_power[CONF_FLUSH_INTERVAL], low_power[CONF_QUEUE_SIZE],
+                                     low_power[CONF_RADIO_OFF], low_power[CONF_AWAKE_TIME]))
+
+    # One MQTT document per frame with Home Assistant discovery
+    if CONF_MQTT_JSON in config:
+        _setup_mqtt_json(var, config, index)
+
+    # Simulated data source, the UART is not read
+    if CONF_SIMULATE in config:
+        simulate = config[CONF_SIMULATE]
+        cg.add_define("USE_SOLARIS_SIMULATE")
+        cg.add(var.set_simulate_interval(simulate[CONF_INTERVAL]))
+        for line in simulate[CONF_LINES]:
+            cg.add(var.add_simulate_line(line))
 
     # Initialize all sensors
-    await setup_sensors(var, config)
\ No newline at end of file
+    features = await setup_sensors(var, config, shared["slots"])
+
+    # Aggregation window is only used when aggregate sensors are configured
+    if "USE_SOLARIS_AGGREGATES" in features:
+        cg.add(var.set_aggregation_window(config[CONF_AGGREGATION_WINDOW]))
+
+    # Flash write batching is only used when accumulator sensors are configured
+    if "USE_SOLARIS_ACCUMULATORS" in features:
+        cg.add(var.set_accumulator_save_interval(config[CONF_ACCUMULATOR_SAVE_INTERVAL]))
+        cg.add(var.set_accumulator_save_energy(config[CONF_ACCUMULATOR_SAVE_ENERGY]))
+
+    # Health interval is only used when health sensors are configured
+    if "USE_SOLARIS_HEALTH" in features:
+        cg.add(var.set_health_interval(config[CONF_HEALTH_INTERVAL]))
+
+    # Clock for the last-cleared timestamp of the error statistics and the
+    # time of the MQTT JSON documents
+    uses_time = "USE_SOLARIS_ERROR_STATS" in features or CONF_MQTT_JSON in config
+    if uses_time and CONF_TIME_ID in config:
+        time_source = await cg.get_variable(config[CONF_TIME_ID])
+        cg.add(var.set_time(time_source))
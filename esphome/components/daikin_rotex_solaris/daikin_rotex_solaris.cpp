@@ -1,341 +1,663 @@
 #include "daikin_rotex_solaris.h"
 #include "esphome/core/log.h"
-#include "solaris_error_codes.h"
+#include <algorithm>
+#include <cmath>
+#include <cstring>
+#if defined(USE_SOLARIS_PARSER_TASK) && defined(USE_ESP_IDF)
+#include <driver/uart.h>
+#include "esphome/components/uart/uart_component_esp_idf.h"
+#endif
 
 namespace esphome {
 namespace daikin_rotex_solaris {
 
 void DaikinRotexSolarisComponent::dump_config() {
-  ESP_LOGCONFIG(TAG, "DAIKIN/ROTEX Solaris RPS Configuration:");
-  LOG_SENSOR("  ", "solaris_tk", solaris_tk_sensor_);
-  LOG_SENSOR("  ", "solaris_tr", solaris_tr_sensor_);
-  LOG_SENSOR("  ", "solaris_ts", solaris_ts_sensor_);
-  LOG_SENSOR("  ", "solaris_tv", solaris_tv_sensor_);
-  LOG_SENSOR("  ", "solaris_df", solaris_df_sensor_);
-  LOG_SENSOR("  ", "solaris_pwr", solaris_pwr_sensor_);
-  LOG_SENSOR("  ", "solaris_p1", solaris_p1_sensor_);
-  LOG_BINARY_SENSOR("  ", "solaris_p2", solaris_p2_sensor_);
-  LOG_BINARY_SENSOR("  ", "solaris_ha", solaris_ha_sensor_);
-  LOG_BINARY_SENSOR("  ", "solaris_bk", solaris_bk_sensor_);
-  LOG_TEXT_SENSOR("  ", "solaris_err", solaris_err_sensor_);
+  ESP_LOGCONFIG(tag_, "DAIKIN/ROTEX Solaris RPS Configuration:");
+  for (const auto &sensor : SENSOR_TABLE) {
+    switch (sensor.kind) {
+      case SENSOR_KIND_NUMERIC:
+        LOG_SENSOR("  ", sensor.key, numeric_sensors_[sensor.slot]);
+        break;
+      case SENSOR_KIND_BINARY:
+        LOG_BINARY_SENSOR("  ", sensor.key, binary_sensors_[sensor.slot]);
+        break;
+      case SENSOR_KIND_TEXT:
+        LOG_TEXT_SENSOR("  ", sensor.key, text_sensors_[sensor.slot]);
+        break;
+    }
+  }
+#ifdef USE_SOLARIS_ERROR_STATS
+  ESP_LOGCONFIG(tag_, "  Error statistics: enabled");
+#endif
+  ESP_LOGCONFIG(tag_, "  Heartbeat: %us", heartbeat_ms_ / 1000);
+  ESP_LOGCONFIG(tag_, "  Loop budget: %uus, latest frame only: %s", loop_budget_us_,
+    latest_frame_only_ ? "yes" : "no");
+#ifdef USE_SOLARIS_PARSER_TASK
+  if (parser_task_queue_size_ > 0) {
+    ESP_LOGCONFIG(tag_, "  Parser task: core %u, priority %u, queue %u lines", parser_task_core_,
+      parser_task_priority_, line_queue_.get_capacity());
+  }
+#endif
+  ESP_LOGCONFIG(tag_, "  Watchdog: values unknown after %u cycles without frame (cycle %ums%s)",
+    watchdog_.get_stale_cycles(), watchdog_.get_cycle(), watchdog_.is_cycle_known() ? "" : ", not learned yet");
+#ifdef USE_SOLARIS_AGGREGATES
+  ESP_LOGCONFIG(tag_, "  Aggregation window: %us", aggregation_window_ms_ / 1000);
+  // Only used by ESP_LOGCONFIG, which may be compiled out
+  [[maybe_unused]] static const char *const STAT_NAMES[AGGREGATE_STAT_COUNT] = {"min", "max", "mean", "twmean"};
+  for (const auto &aggregator : aggregators_) {
+    for (uint8_t stat = 0; stat < AGGREGATE_STAT_COUNT; stat++) {
+      sensor::Sensor *s = aggregator.get_sensor(static_cast<AggregateStat>(stat));
+      if (s) {
+        ESP_LOGCONFIG(tag_, "  Aggregate field %u %s: '%s'", aggregator.get_field(), STAT_NAMES[stat],
+          s->get_name().c_str());
+      }
+    }
+  }
+#endif
+#ifdef USE_SOLARIS_HISTORY
+  if (history_.is_enabled()) {
+    ESP_LOGCONFIG(tag_, "  History: %u bytes, %u frames stored", static_cast<unsigned>(history_.get_capacity()),
+      history_.get_stored_frames());
+  }
+#endif
+#ifdef USE_SOLARIS_SIMULATE
+  if (!simulate_lines_.empty()) {
+    ESP_LOGCONFIG(tag_, "  Simulation: %u lines every %ums (UART not read)",
+      static_cast<unsigned>(simulate_lines_.size()), simulate_interval_ms_);
+  }
+#endif
+#ifdef USE_SOLARIS_MQTT_JSON
+  if (mqtt_json_.is_enabled()) {
+    ESP_LOGCONFIG(tag_, "  MQTT JSON: '%s', %u discovery messages", mqtt_json_.get_topic().c_str(),
+      static_cast<unsigned>(mqtt_json_.get_discovery_count()));
+  }
+#endif
+#ifdef USE_SOLARIS_HEALTH
+  ESP_LOGCONFIG(tag_, "  Health: every %us", health_.get_interval() / 1000);
+#endif
+#ifdef USE_SOLARIS_UDP
+  if (udp_push_.is_enabled()) {
+    ESP_LOGCONFIG(tag_, "  UDP push: %s:%u, device id %u", udp_push_.get_address().c_str(), udp_push_.get_port(),
+      udp_push_.get_device_id());
+  }
+#endif
+#ifdef USE_SOLARIS_LOW_POWER
+  if (uses_low_power_()) {
+    ESP_LOGCONFIG(tag_, "  Low power: flush every %us, queue %u frames", low_power_.get_flush_interval() / 1000,
+      udp_push_.get_queue_size());
+    if (low_power_.get_radio_off()) {
+      ESP_LOGCONFIG(tag_, "  Low power: Wi-Fi off between flushes, awake %us", low_power_.get_awake_time() / 1000);
+    }
+  }
+#endif
+#ifdef USE_SOLARIS_ACCUMULATORS
+  ESP_LOGCONFIG(tag_, "  Accumulators: save every %us or %.2f kWh",
+    accumulators_.get_save_interval() / 1000, accumulators_.get_save_energy());
+  // Only used by ESP_LOGCONFIG, which may be compiled out
+  [[maybe_unused]] static const char *const ACCUMULATOR_NAMES[ACCUMULATOR_COUNT] = {
+    "energy", "p1_runtime", "p2_runtime", "bk_starts", "ha_starts"};
+  for (uint8_t i = 0; i < ACCUMULATOR_COUNT; i++) {
+    sensor::Sensor *s = accumulators_.get_sensor(static_cast<AccumulatorType>(i));
+    if (s) ESP_LOGCONFIG(tag_, "  Accumulator %s: '%s'", ACCUMULATOR_NAMES[i], s->get_name().c_str());
+  }
+#endif
+  ESP_LOGCONFIG(tag_, "  Deadbands: P1=%.2f TK=%.2f TR=%.2f TS=%.2f TV=%.2f DF=%.2f PWR=%.3f",
+    deadbands_[SOLARIS_P1], deadbands_[SOLARIS_TK], deadbands_[SOLARIS_TR], deadbands_[SOLARIS_TS],
+    deadbands_[SOLARIS_TV], deadbands_[SOLARIS_DF], deadbands_[SOLARIS_PWR]);
+}
+
+void DaikinRotexSolarisComponent::setup() {
+#ifdef USE_SOLARIS_ACCUMULATORS
+  // Further instances get their own counters next to the ones of instance 0
+  accumulators_.setup(fnv1_hash("daikin_rotex_solaris_accumulators") + instance_);
+#endif
+#ifdef USE_SOLARIS_HISTORY
+  if (history_.is_enabled()) {
+    if (!history_.allocate()) {
+      mark_failed();
+      return;
+    }
+#ifdef USE_ESP_IDF
+    if (web_server_base_ != nullptr) {
+      web_server_base_->init();
+      web_server_base_->add_handler(new SolarisHistoryHandler(&history_, instance_));  // NOLINT
+    }
+#endif
+  }
+#endif
+#ifdef USE_SOLARIS_PARSER_TASK
+  if (parser_task_queue_size_ > 0) {
+#ifdef USE_SOLARIS_SIMULATE
+    if (!simulate_lines_.empty()) return;  // The UART is not read
+#endif
+    if (!line_queue_.allocate(parser_task_queue_size_)) {
+      ESP_LOGE(tag_, "Could not allocate the parser task queue (%u lines)", parser_task_queue_size_);
+      mark_failed();
+      return;
+    }
+#ifdef USE_ESP_IDF
+    if (xTaskCreatePinnedToCore(parser_task_, "solaris_parser", PARSER_TASK_STACK_SIZE, this,
+                                parser_task_priority_, &parser_task_handle_, parser_task_core_) != pdPASS) {
+      ESP_LOGE(tag_, "Could not start the parser task");
+      mark_failed();
+      return;
+    }
+#endif
+  }
+#endif
 }
 
+#ifdef USE_SOLARIS_ACCUMULATORS
+void DaikinRotexSolarisComponent::on_safe_shutdown() {
+  accumulators_.save(millis());
+}
+#endif
+
 void DaikinRotexSolarisComponent::loop() {
   uint32_t now = millis();
+#ifdef USE_SOLARIS_HEALTH
+  const uint32_t loop_start_us = micros();
+#endif
+
+  // ========================================================================
+  // DATA SOURCE - UART, or the configured lines of the simulate: option
+  // ========================================================================
+#ifdef USE_SOLARIS_SIMULATE
+  if (!simulate_lines_.empty()) {
+    simulate_(now);
+  } else
+#endif
+#ifdef USE_SOLARIS_PARSER_TASK
+  if (line_queue_.get_capacity() > 0) {
+    drain_lines_();
+  } else
+#endif
+  {
+    read_uart_(now);
+  }
 
   // ========================================================================
-  // DEBUG SIMULATION
+  // LINK WATCHDOG - Values unknown after stale_cycles cycles without a frame
   // ========================================================================
-  // FOR DEBUGGING/TESTING PURPOSES ONLY:
-  // Uncomment this block to simulate incoming UART data for testing
-  // Parses debug string every 10 seconds
-  //
-  // static uint32_t last_debug_time = 0;
-  // if (now - last_debug_time >= 10000) { // Parse every 10s
-  //   last_debug_time = now;
-  //   // Format: Ha;BK;P1;P2;TK;TR;TS;TV;DF;Err;P
-  //   // Err codes: ''/K/R/S/V/D/G/F/W (empty = no error)
-  //   static const char DEBUG_STRING[] = "0;1;75;0;84;58;61;63;3,2;;3500";
-  //   parse_line_(DEBUG_STRING, sizeof(DEBUG_STRING) - 1);
-  // }
-  // return;
+  if (watchdog_.check_stale(now)) {
+    ESP_LOGW(tag_, "No frame for %us (cycle %ums), values unknown", watchdog_.get_stale_timeout() / 1000,
+      watchdog_.get_cycle());
+    invalidate_values_();
+#ifdef USE_SOLARIS_HEALTH
+    health_.add_stale_event();
+#endif
+  }
+
+#ifdef USE_SOLARIS_LOW_POWER
   // ========================================================================
-  // END DEBUG SIMULATION
+  // LOW-POWER MODE - Queued UDP frames as batches, Wi-Fi duty cycling
   // ========================================================================
+  if (uses_low_power_()) low_power_.loop(now, udp_push_);
+#endif
 
+#ifdef USE_SOLARIS_AGGREGATES
   // ========================================================================
-  // BUFFER TIMEOUT HANDLING - Prevent corrupted data accumulation
+  // AGGREGATION WINDOW - Publish min/max/mean once per window
   // ========================================================================
-  // If we have partial data and haven't received anything for LINE_TIMEOUT_MS
-  // discard the incomplete line to allow recovery from transmission errors
-  if (buffer_idx_ > 0 && (now - last_char_time_ > LINE_TIMEOUT_MS)) {
-    ESP_LOGW(TAG, "Line timeout(%us), clearing buffer (%u chars)", 
-      LINE_TIMEOUT_MS / 1000, buffer_idx_);
-    buffer_idx_ = 0;
-    last_char_time_ = now;
+  if (now - window_start_ >= aggregation_window_ms_) {
+    window_start_ = now;
+    for (auto &aggregator : aggregators_) {
+      aggregator.publish_window(now);
+    }
   }
+#endif
+
+#ifdef USE_SOLARIS_ACCUMULATORS
+  // Batched flash writes of the counters
+  accumulators_.save_if_due(now);
+#endif
 
+#ifdef USE_SOLARIS_MQTT_JSON
+  // Discovery messages after an MQTT (re)connect
+  mqtt_json_.loop();
+#endif
+
+#ifdef USE_SOLARIS_HEALTH
   // ========================================================================
-  // PROCESS AVAILABLE UART DATA
+  // HEALTH - Own loop() time, diagnostic sensors once per health interval
   // ========================================================================
-  while (available()) {
-    uint8_t c;
-    if (!read_byte(&c)) break;
+  health_.add_loop_time(micros() - loop_start_us);
+  health_.publish_if_due(now);
+#endif
+}
 
+void DaikinRotexSolarisComponent::read_uart_(uint32_t now) {
+  // ========================================================================
+  // LINE TIMEOUT HANDLING - Prevent corrupted data accumulation
+  // ========================================================================
+  // If we have partial data and haven't received anything for half a cycle
+  // (a line takes some ms) discard the incomplete line before the next one
+  // starts, to allow recovery from transmission errors
+  const uint32_t line_timeout = watchdog_.get_cycle() / 2;
+  if (parser_.in_line() && (now - last_char_time_ > line_timeout)) {
+    ESP_LOGW(tag_, "Line timeout(%ums), clearing buffer (%u chars)", line_timeout, parser_.line_length());
+    parser_.reset();
     last_char_time_ = now;
-
-    if (c == '\n') {
-      // ====================================================================
-      // COMPLETE LINE RECEIVED (newline detected)
-      // ====================================================================
-      if (buffer_idx_ > 0) {
-        buffer_[buffer_idx_] = '\0';  // Null-terminate for string functions
-        
-        #if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_DEBUG
-        ESP_LOGD(TAG, "Complete line (%u chars): %s", buffer_idx_, buffer_);
-        #endif
-
-        parse_line_(buffer_, buffer_idx_);
-        buffer_idx_ = 0;  // Reset for next line
-      }
-
-    } else if (c != '\r' && buffer_idx_ < BUFFER_SIZE - 1) {
-      // ====================================================================
-      // APPEND CHARACTER TO BUFFER (skip carriage return, prevent overflow)
-      // ====================================================================
-      // Store character if it's not CR and buffer has space remaining
-      buffer_[buffer_idx_++] = c;
-    }
+#ifdef USE_SOLARIS_HEALTH
+    health_.add_line_timeout();
+    line_time_us_ = 0;
+#endif
   }
-}
 
-const char *DaikinRotexSolarisComponent::get_error_text_(char error_code) {
   // ========================================================================
-  // ERROR CODE LOOKUP - Search for known error code in generated header
+  // PROCESS AVAILABLE UART DATA - Bulk reads, each byte decoded immediately
   // ========================================================================
-  // Search all entries except the last one (the "unknown error")
-  for (size_t i = 0; i < UNKNOWN_ERROR_INDEX; i++) {
-    if (ERROR_CODES[i].code == error_code) {
-      if (error_code != '\0') {
-        ESP_LOGE(TAG, "Solaris Error: Code %c; Description: %s", 
-          error_code, ERROR_CODES[i].description);
+  uint8_t chunk[UART_CHUNK_SIZE];
+  const uint32_t start_us = micros();
+  int avail;
+  while ((avail = available()) > 0) {
+    size_t len = std::min<size_t>(avail, UART_CHUNK_SIZE);
+    if (!read_array(chunk, len)) break;
+
+    last_char_time_ = now;
+#ifdef USE_SOLARIS_HEALTH
+    // A line's time is the decode time of its bytes plus its handling, summed
+    // over the chunks it arrived in
+    health_.add_bytes(len);
+    uint32_t line_start_us = micros();
+#endif
+
+    for (size_t i = 0; i < len; i++) {
+      SolarisParseResult result = parser_.feed(chunk[i]);
+      if (result != SolarisParseResult::NONE) {
+        // Complete line received (newline detected)
+        handle_line_(result, parser_);
+#ifdef USE_SOLARIS_HEALTH
+        uint32_t line_end_us = micros();
+        health_.add_line_time(line_time_us_ + (line_end_us - line_start_us));
+        line_time_us_ = 0;
+        line_start_us = line_end_us;
+#endif
       }
-      return ERROR_CODES[i].description;
+    }
+#ifdef USE_SOLARIS_HEALTH
+    line_time_us_ += micros() - line_start_us;
+#endif
+
+    // Leave the rest for the next loop() call to keep API/OTA responsive
+    if (loop_budget_us_ > 0 && (micros() - start_us >= loop_budget_us_)) {
+      ESP_LOGV(tag_, "Loop budget of %uus used up, %d bytes left", loop_budget_us_, available());
+      break;
     }
   }
 
-  // ========================================================================
-  // UNKNOWN ERROR CODE - Format fallback message with the actual code
-  // ========================================================================
-  // Unknown error code - We do not have concrete error message. Return the  
-  // actual code/message for logging and troubleshooting.
-  const char *base_msg = ERROR_CODES[UNKNOWN_ERROR_INDEX].description;
-  snprintf(error_msg_buffer_, sizeof(error_msg_buffer_), "%s ('%c')", base_msg, error_code);
-  ESP_LOGE(TAG, "Unknown error code: %c", error_code);
-  return error_msg_buffer_;
+  // Publish only the newest frame of a backlog (latest frame wins)
+  flush_pending_frame_();
 }
 
-void DaikinRotexSolarisComponent::parse_line_(const char *line, size_t len) {
-  // ========================================================================
-  // LINE VALIDATION - Check length is within acceptable range
-  // ========================================================================
-  #if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_INFO
-  ESP_LOGI(TAG, "Parsing line: '%s' (len=%u)", line, len);
-  #endif
+#ifdef USE_SOLARIS_PARSER_TASK
+void DaikinRotexSolarisComponent::receive_(const uint8_t *data, size_t len, uint32_t now) {
+  // Same line timeout as read_uart_(), reported by the main loop (logging
+  // from this task is avoided)
+  if (parser_.in_line() && (now - last_char_time_ > line_timeout_ms_.load(std::memory_order_relaxed))) {
+    parser_.reset();
+    last_char_time_ = now;
+    task_line_timeouts_.fetch_add(1, std::memory_order_relaxed);
+#ifdef USE_SOLARIS_HEALTH
+    line_time_us_ = 0;
+#endif
+  }
+  if (len == 0) return;
+
+  last_char_time_ = now;
+  task_bytes_.fetch_add(len, std::memory_order_relaxed);
+#ifdef USE_SOLARIS_HEALTH
+  uint32_t line_start_us = micros();
+#endif
+  for (size_t i = 0; i < len; i++) {
+    SolarisParseResult result = parser_.feed(data[i]);
+    if (result == SolarisParseResult::NONE) continue;
+
+    SolarisLine line{result, parser_, 0};
+#ifdef USE_SOLARIS_HEALTH
+    uint32_t line_end_us = micros();
+    line.decode_us = line_time_us_ + (line_end_us - line_start_us);
+    line_time_us_ = 0;
+    line_start_us = line_end_us;
+#endif
+    line_queue_.push(line);  // Dropped and counted if the main loop is behind
+  }
+#ifdef USE_SOLARIS_HEALTH
+  line_time_us_ += micros() - line_start_us;
+#endif
+}
 
-  if (len < MIN_LINE_LEN || len > MAX_LINE_LEN) {
-    // Boot/Info lines on startup - log and ignore these
-    if (strncmp(line, BOOT_LINE1, 7) == 0 || strncmp(line, BOOT_LINE2, 6) == 0) {
-      #if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_INFO
-      ESP_LOGI(TAG, "Boot/info line detected, ignoring.");
-      #endif
-      return;
+void DaikinRotexSolarisComponent::drain_lines_() {
+  line_timeout_ms_.store(watchdog_.get_cycle() / 2, std::memory_order_relaxed);
+
+  // Counters of the task since the last loop() call
+  const uint32_t line_timeouts = task_line_timeouts_.load(std::memory_order_relaxed);
+  if (line_timeouts != line_timeouts_seen_) {
+    const uint32_t discarded = line_timeouts - line_timeouts_seen_;
+    ESP_LOGW(tag_, "Line timeout(%ums), %u partial line(s) discarded", watchdog_.get_cycle() / 2, discarded);
+#ifdef USE_SOLARIS_HEALTH
+    for (uint32_t i = 0; i < discarded; i++) health_.add_line_timeout();
+#endif
+    line_timeouts_seen_ = line_timeouts;
+  }
+  const uint32_t dropped = line_queue_.get_dropped();
+  if (dropped != dropped_seen_) {
+    ESP_LOGW(tag_, "Parser task queue full, %u line(s) dropped", dropped - dropped_seen_);
+    dropped_seen_ = dropped;
+  }
+#ifdef USE_SOLARIS_HEALTH
+  const uint32_t bytes = task_bytes_.load(std::memory_order_relaxed);
+  health_.add_bytes(bytes - bytes_seen_);
+  bytes_seen_ = bytes;
+#endif
+
+  // Lines are handled in place and released afterwards, frames of a backlog
+  // are coalesced like the ones of a UART backlog
+  const uint32_t start_us = micros();
+  const SolarisLine *line;
+  while ((line = line_queue_.front()) != nullptr) {
+#ifdef USE_SOLARIS_HEALTH
+    const uint32_t line_start_us = micros();
+#endif
+    handle_line_(line->result, line->parser);
+#ifdef USE_SOLARIS_HEALTH
+    health_.add_line_time(line->decode_us + (micros() - line_start_us));
+#endif
+    line_queue_.pop();
+
+    if (loop_budget_us_ > 0 && (micros() - start_us >= loop_budget_us_)) {
+      ESP_LOGV(tag_, "Loop budget of %uus used up, lines left in the queue", loop_budget_us_);
+      break;
     }
-    if (strncmp(line, BOOT_LINE3, 8) == 0) {
-      #if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_INFO
-      const char BOOT_LINE_UTF8[] = "HA;BK;P1 /%;P2;TK /°C;TR /°C;TS /°C;TV /°C;V /l/min;ERROR;P/W";
-      ESP_LOGI(TAG, "Boot/info line detected, ignoring.");
-      ESP_LOGI(TAG, "Solaris line UTF-8: '%s'", BOOT_LINE_UTF8);
-      #endif
+  }
+
+  flush_pending_frame_();
+}
+
+#ifdef USE_ESP_IDF
+void DaikinRotexSolarisComponent::parser_task_(void *arg) {
+  auto *self = static_cast<DaikinRotexSolarisComponent *>(arg);
+  // The ESPHome UART component installed the driver, its RX ring buffer is
+  // read here directly (nothing else reads this UART, see _final_validate)
+  const auto port = static_cast<uart_port_t>(
+    static_cast<uart::IDFUARTComponent *>(self->parent_)->get_hw_serial_number());
+  uint8_t chunk[UART_CHUNK_SIZE];
+
+  while (true) {
+    // Sleep until the first byte arrives, wake up after the line timeout to
+    // discard a partial line, then take whatever else is buffered
+    const uint32_t line_timeout = std::max<uint32_t>(self->line_timeout_ms_.load(std::memory_order_relaxed), 1);
+    int len = uart_read_bytes(port, chunk, 1, pdMS_TO_TICKS(line_timeout) + 1);
+    if (len > 0) {
+      size_t buffered = 0;
+      if (uart_get_buffered_data_len(port, &buffered) == ESP_OK && buffered > 0) {
+        int more = uart_read_bytes(port, chunk + 1, std::min(buffered, UART_CHUNK_SIZE - 1), 0);
+        if (more > 0) len += more;
+      }
+    }
+    self->receive_(chunk, len > 0 ? len : 0, millis());
+  }
+}
+#endif
+#endif
+
+#ifdef USE_SOLARIS_SIMULATE
+void DaikinRotexSolarisComponent::simulate_(uint32_t now) {
+  if (now - last_simulated_ < simulate_interval_ms_) return;
+  last_simulated_ = now;
+  const char *line = simulate_lines_[next_simulated_];
+  next_simulated_ = (next_simulated_ + 1) % simulate_lines_.size();
+  parse_line_(line, strlen(line));
+}
+#endif
+
+#ifdef USE_SOLARIS_AGGREGATES
+void DaikinRotexSolarisComponent::set_aggregate_sensor(SolarisFields field, AggregateStat stat,
+  sensor::Sensor *s) {
+  for (auto &aggregator : aggregators_) {
+    if (aggregator.get_field() == field) {
+      aggregator.set_sensor(stat, s);
       return;
     }
+  }
+  aggregators_.emplace_back(field);
+  aggregators_.back().set_sensor(stat, s);
+}
+#endif
 
-    ESP_LOGE(TAG, "Parsing line: '%s'", line);
-    ESP_LOGE(TAG, "Invalid line length (%u), expected %u-%u", 
-      len, MIN_LINE_LEN, MAX_LINE_LEN);
-    return;
+void DaikinRotexSolarisComponent::parse_line_(const char *line, size_t len) {
+#ifdef USE_SOLARIS_HEALTH
+  const uint32_t start_us = micros();
+#endif
+  // Decode with a local parser so a partially received UART line is not affected
+  SolarisParser parser;
+  for (size_t i = 0; i < len; i++) {
+    parser.feed(static_cast<uint8_t>(line[i]));
   }
+  handle_line_(parser.feed('\n'), parser);
+#ifdef USE_SOLARIS_HEALTH
+  health_.add_line_time(micros() - start_us);
+#endif
+  flush_pending_frame_();
+}
 
-  // ========================================================================
-  // INITIALIZE PARSING STATE - Prepare for tokenization
-  // ========================================================================
-  // Parse: "Ha;BK;P1;P2;TK;TR;TS;TV;DF;Err;P"
-  int int_values[TOTAL_FIELDS] = {0};   // Array to store parsed integer values
-  float solaris_df = 0.0f;              // Flow rate (stored separately as float)
-  char error_code = '\0';               // Error code character
-  uint8_t token_idx = 0;                // Current field index being parsed
-  const char *token_start = line;       // Pointer to start of current token
+void DaikinRotexSolarisComponent::process_frame_(const SolarisFrame &frame) {
+  // The watchdog, error transitions, aggregates, accumulators, history, UDP
+  // push and MQTT JSON use every frame, also the ones dropped by coalescing
+  uint32_t now = millis();
 
   // ========================================================================
-  // SINGLE-PASS TOKENIZATION - Split by semicolon delimiter
+  // LINK WATCHDOG - Frame interval against the cycle
   // ========================================================================
-  for (size_t i = 0; i <= len; i++) {
-    bool is_delimiter = (i == len || line[i] == ';');  // Delimiter or end of string
-
-    if (is_delimiter && token_idx < TOTAL_FIELDS) {
-      size_t token_len = &line[i] - token_start;  // Calculate token length
-
-      // ====================================================================
-      // PARSE FLOW RATE (SOLARIS_DF) - Float value with comma decimal separator
-      // ====================================================================
-      if (token_idx == SOLARIS_DF) {
-        if (token_len > 0 && token_len < CONVERSION_BUFFER_SIZE) {
-          // Copy token to buffer and null-terminate
-          strncpy(conversion_buffer_, token_start, token_len);
-          conversion_buffer_[token_len] = '\0';
-
-          // Replace comma with decimal point (Solaris uses comma as decimal separator)
-          for (char *c = conversion_buffer_; *c; c++) {
-            if (*c == ',') *c = '.';
-          }
+  if (watchdog_.is_stale()) {
+    ESP_LOGI(tag_, "Frames received again");
+  }
+  FrameTiming timing = watchdog_.add_frame(now);
+  if (timing.missed > 0) {
+    ESP_LOGW(tag_, "%u frame(s) missed (%ums since the last frame, cycle %ums)", timing.missed, timing.interval,
+      watchdog_.get_cycle());
+  }
+#ifdef USE_SOLARIS_HEALTH
+  health_.add_frame_timing(timing, watchdog_.get_cycle());
+#endif
+#if defined(USE_SOLARIS_ERR) || defined(USE_SOLARIS_ERROR_STATS)
+  error_state_.update(frame.error_code(), now);
+#endif
+#ifdef USE_SOLARIS_UDP
+  if (udp_push_.is_enabled()) udp_push_.send(frame, now);
+#endif
+#ifdef USE_SOLARIS_LOW_POWER
+  if (uses_low_power_()) low_power_.add_frame(frame.error_code());
+#endif
+#ifdef USE_SOLARIS_MQTT_JSON
+  mqtt_json_.publish(frame, now);
+#endif
+#ifdef USE_SOLARIS_HISTORY
+  if (history_.is_enabled()) history_.add(frame, now);
+#endif
+#ifdef USE_SOLARIS_AGGREGATES
+  for (auto &aggregator : aggregators_) {
+    aggregator.add(frame.values[aggregator.get_field()], now);
+  }
+#endif
+#ifdef USE_SOLARIS_ACCUMULATORS
+  accumulators_.add(frame, now);
+#endif
 
-          char *endptr;
-          solaris_df = strtof(conversion_buffer_, &endptr);
-          if (endptr == conversion_buffer_) {
-            // Conversion failed (no valid number found)
-            ESP_LOGE(TAG, "Failed to parse solaris_df at token %u", token_idx);
-            solaris_df = 0.0f;
-          }
+  if (!latest_frame_only_) {
+    publish_values_(frame);
+    return;
+  }
 
-          #if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_DEBUG
-          ESP_LOGD(TAG, "Token[%u] = %.1f", token_idx, solaris_df);
-          #endif
-        } else {
-          solaris_df = 0.0f;
-        }
+  // Keep only the newest frame, older ones of the same backlog are outdated
+  if (has_pending_frame_) {
+    ESP_LOGD(tag_, "Dropping outdated frame from UART backlog");
+  }
+  pending_frame_ = frame;
+  has_pending_frame_ = true;
+}
 
-      // ====================================================================
-      // PARSE ERROR CODE (SOLARIS_ERR) - Single character value
-      // ====================================================================
-      } else if (token_idx == SOLARIS_ERR) {
-        // Error code field: single character (empty, K, R, S, V, D, G, F, W)
-        error_code = (token_len > 0) ? token_start[0] : '\0';
+void DaikinRotexSolarisComponent::flush_pending_frame_() {
+  if (has_pending_frame_) {
+    has_pending_frame_ = false;
+    publish_values_(pending_frame_);
+  }
+}
 
-        if (error_code != '\0') {
-          ESP_LOGE(TAG, "Token[%u] = '%c'", token_idx, error_code);
-        }
+void DaikinRotexSolarisComponent::handle_line_(SolarisParseResult result, const SolarisParser &parser) {
+#ifdef USE_SOLARIS_HEALTH
+  health_.add_line(result, parser, millis());
+#endif
+
+  switch (result) {
+    // ======================================================================
+    // VALID DATA LINE - Report unparsable tokens and publish the frame
+    // ======================================================================
+    case SolarisParseResult::FRAME: {
+      const SolarisFrame &frame = parser.frame();
+
+      #if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_DEBUG
+      ESP_LOGD(tag_, "Frame (%u chars): HA=%d BK=%d P1=%d P2=%d TK=%d TR=%d TS=%d TV=%d DF=%.2f ERR='%c' PWR=%d",
+        parser.last_line_length(), frame.values[SOLARIS_HA], frame.values[SOLARIS_BK],
+        frame.values[SOLARIS_P1], frame.values[SOLARIS_P2], frame.values[SOLARIS_TK],
+        frame.values[SOLARIS_TR], frame.values[SOLARIS_TS], frame.values[SOLARIS_TV],
+        frame.df(), frame.error_code(), frame.values[SOLARIS_PWR]);
+      #endif
 
-        #if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_DEBUG
-        if (error_code == '\0') {
-          ESP_LOGD(TAG, "Token[%u] = '%c'", token_idx, error_code);
-        }
-        #endif
-
-      // ====================================================================
-      // PARSE INTEGER FIELDS - All other fields are integers
-      // ====================================================================
-      } else {
-        if (token_len > 0) {
-          // Copy token to buffer and null-terminate
-          strncpy(conversion_buffer_, token_start, token_len);
-          conversion_buffer_[token_len] = '\0';
-
-          char *endptr;
-          int_values[token_idx] = static_cast<int>(strtol(conversion_buffer_, &endptr, 10));
-          if (endptr == conversion_buffer_) {
-            // Conversion failed (no valid number found)
-            ESP_LOGE(TAG, "Failed to parse token %u, using 0", token_idx);
-            int_values[token_idx] = 0;
+      if (frame.invalid_mask != 0) {
+        for (uint8_t i = 0; i < TOTAL_FIELDS; i++) {
+          if (frame.invalid_mask & (1u << i)) {
+            ESP_LOGE(tag_, "Failed to parse token %u, using 0", i);
           }
-        } else {
-          int_values[token_idx] = 0;  // Empty token defaults to 0
         }
-
-        #if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_DEBUG
-        ESP_LOGD(TAG, "Token[%u] = %d", token_idx, int_values[token_idx]);
-        #endif
       }
 
-      // Move to the next token
-      token_start = &line[i + 1];  // Move start pointer past delimiter
-      token_idx++;                 // Increment field counter
+      process_frame_(frame);
+      break;
     }
-  }
 
-  // ========================================================================
-  // VALIDATE FIELD COUNT - Ensure all 11 fields were received
-  // ========================================================================
-  if (token_idx != 11) {
-    ESP_LOGE(TAG, "Incomplete data: only %u tokens found, expected 11", token_idx);
-    return;
+    // ======================================================================
+    // BOOT/INFO LINES ON STARTUP - log and ignore these
+    // ======================================================================
+    case SolarisParseResult::BOOT_LINE:
+      // "Zyklus 5s" tells the cycle, no need to learn it
+      if (parser.last_boot_cycle() != 0) {
+        watchdog_.set_boot_cycle(parser.last_boot_cycle());
+        ESP_LOGI(tag_, "Controller cycle: %us", parser.last_boot_cycle());
+        break;
+      }
+      #if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_INFO
+      ESP_LOGI(tag_, "Boot/info line detected, ignoring.");
+      #endif
+      break;
+
+    // ======================================================================
+    // INVALID LINES - wrong length or missing fields
+    // ======================================================================
+    case SolarisParseResult::INVALID_LENGTH:
+      ESP_LOGE(tag_, "Invalid line length (%u), expected %u-%u", 
+        parser.last_line_length(), MIN_LINE_LEN, MAX_LINE_LEN);
+      break;
+
+    case SolarisParseResult::INCOMPLETE:
+      ESP_LOGE(tag_, "Incomplete data: only %u tokens found, expected %u",
+        parser.last_field_count(), TOTAL_FIELDS);
+      break;
+
+    default:
+      break;
   }
-
-  // ========================================================================
-  // PUBLISH PARSED DATA FOR ALL SENSORS
-  // ========================================================================
-  publish_values_(int_values, solaris_df, error_code, token_idx);
-
-  #if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_DEBUG
-  ESP_LOGD(TAG, "Parse complete: %u tokens processed successfully", token_idx);
-  #endif
 }
 
-void DaikinRotexSolarisComponent::publish_values_(const int int_values[], 
-  float solaris_df, char error_code, uint8_t num_tokens) {
-  // ========================================================================
-  // PUBLISH BINARY SENSORS - on/off states (true/false)
-  // ========================================================================
-  if (solaris_ha_sensor_) {
-    // Manual operation flag (solaris_ha)
-    solaris_ha_sensor_->publish_state(int_values[SOLARIS_HA] != 0);
-  }
+bool DaikinRotexSolarisComponent::should_publish_(SolarisFields field, float value, bool force) {
+  const uint16_t bit = 1u << field;
 
-  if (solaris_bk_sensor_) {
-    // Burner contact flag (solaris_bk)
-    solaris_bk_sensor_->publish_state(int_values[SOLARIS_BK] != 0);
+  // Skip if already published and the change stays within the deadband
+  if (!force && (published_mask_ & bit)) {
+    float diff = fabsf(value - last_values_[field]);
+    if (diff == 0.0f || diff < deadbands_[field] - DEADBAND_EPSILON) {
+      return false;
+    }
   }
 
-  if (solaris_p2_sensor_) {
-    // Booster pump flag (solaris_p2)
-    solaris_p2_sensor_->publish_state(int_values[SOLARIS_P2] != 0);
-  }
+  last_values_[field] = value;
+  published_mask_ |= bit;
+  return true;
+}
 
+void DaikinRotexSolarisComponent::publish_values_(const SolarisFrame &frame) {
   // ========================================================================
-  // PUBLISH NUMERIC SENSORS - Circulation pump speed (already a number)
+  // HEARTBEAT - Force a full publish every heartbeat_ms_, whether or not the
+  // values were published in between
   // ========================================================================
-  if (solaris_p1_sensor_) {
-    // Circulation pump speed (P1): 0-100 %
-    solaris_p1_sensor_->publish_state(int_values[SOLARIS_P1]);
+  uint32_t now = millis();
+  bool force = false;
+  if (heartbeat_ms_ > 0 && (now - last_heartbeat_ >= heartbeat_ms_)) {
+    force = true;
+    last_heartbeat_ = now;
   }
 
   // ========================================================================
-  // PUBLISH TEMPERATURE SENSORS - All in °C
+  // PUBLISH TABLE SENSORS - Configured sensors only, each on change (the
+  // table is shared by all instances, sensors of other instances are skipped)
   // ========================================================================
-  if (solaris_tk_sensor_) {
-    // Collector temperature (TK): -55 to +250 °C
-    solaris_tk_sensor_->publish_state(int_values[SOLARIS_TK]);
-  }
-
-  if (solaris_tr_sensor_) {
-    // Return temperature (TR): 0-100 °C
-    solaris_tr_sensor_->publish_state(int_values[SOLARIS_TR]);
-  }
-
-  if (solaris_ts_sensor_) {
-    // Storage temperature (TS): 0-100 °C
-    solaris_ts_sensor_->publish_state(int_values[SOLARIS_TS]);
-  }
-
-  if (solaris_tv_sensor_) {
-    // Flow temperature (TV): 0-100 °C
-    solaris_tv_sensor_->publish_state(int_values[SOLARIS_TV]);
+  for (const auto &sensor : SENSOR_TABLE) {
+    int32_t raw = frame.values[sensor.field];
+    switch (sensor.kind) {
+      case SENSOR_KIND_NUMERIC: {
+        // Temperatures (°C) and P1 (%) as received, DF in l/min, PWR in kW (10 W steps)
+        sensor::Sensor *s = numeric_sensors_[sensor.slot];
+        float value = sensor.value(raw);
+        if (s != nullptr && should_publish_(sensor.field, value, force)) s->publish_state(value);
+        break;
+      }
+      case SENSOR_KIND_BINARY: {
+        // HA, BK and P2 flags
+        binary_sensor::BinarySensor *s = binary_sensors_[sensor.slot];
+        bool state = raw != 0;
+        if (s != nullptr && should_publish_(sensor.field, state, force)) s->publish_state(state);
+        break;
+      }
+      case SENSOR_KIND_TEXT: {
+        // Error status, description looked up on the last transition
+        text_sensor::TextSensor *s = text_sensors_[sensor.slot];
+        if (s != nullptr && should_publish_(sensor.field, raw, force)) s->publish_state(error_state_.get_text());
+        break;
+      }
+    }
   }
 
+#ifdef USE_SOLARIS_ERROR_STATS
   // ========================================================================
-  // PUBLISH FLOW RATE SENSOR - Already in correct units (l/min)
+  // PUBLISH ERROR STATISTICS - Changed counters, duration, last-cleared time
   // ========================================================================
-  if (solaris_df_sensor_) {
-    // Flow rate (DF): 0.0-20.0 l/min
-    solaris_df_sensor_->publish_state(solaris_df);
-  }
+  error_state_.publish(now, force);
+#endif
 
+#ifdef USE_SOLARIS_ACCUMULATORS
   // ========================================================================
-  // PUBLISH POWER SENSOR - Convert from Watts to kW with rounding
+  // PUBLISH ACCUMULATORS - Counters changed by at least one display step
   // ========================================================================
-  if (solaris_pwr_sensor_) {
-    // Power (PWR): stored in Watts, convert to kW and round to 2 decimal places
-    float solaris_pwr_kw = int_values[SOLARIS_PWR] / 1000.0f;
-    solaris_pwr_kw = roundf(solaris_pwr_kw * 100.0f) / 100.0f;  // Round to 2 decimals: multiply, round, divide
-    solaris_pwr_sensor_->publish_state(solaris_pwr_kw);
-  }
+  accumulators_.publish(force);
+#endif
+}
 
-  // ========================================================================
-  // PUBLISH ERROR STATUS SENSOR - Lookup error description if applicable
-  // ========================================================================
-  if (solaris_err_sensor_) {
-    const char *error_text = get_error_text_(error_code);
-    solaris_err_sensor_->publish_state(error_text);
+void DaikinRotexSolarisComponent::invalidate_values_() {
+  // Numeric sensors as NAN and binary sensors without state show as unknown,
+  // the error text keeps the last description
+  for (const auto &sensor : SENSOR_TABLE) {
+    switch (sensor.kind) {
+      case SENSOR_KIND_NUMERIC:
+        if (numeric_sensors_[sensor.slot] != nullptr) numeric_sensors_[sensor.slot]->publish_state(NAN);
+        break;
+      case SENSOR_KIND_BINARY:
+        if (binary_sensors_[sensor.slot] != nullptr) binary_sensors_[sensor.slot]->invalidate_state();
+        break;
+      case SENSOR_KIND_TEXT:
+        break;
+    }
   }
+  published_mask_ = 0;
 }
 
 } // namespace daikin_rotex_solaris
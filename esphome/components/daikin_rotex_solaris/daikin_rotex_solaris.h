@@ -1,10 +1,35 @@
 #pragma once
 
 #include "esphome/core/component.h"
+#include "esphome/core/defines.h"
 #include "esphome/components/sensor/sensor.h"
 #include "esphome/components/text_sensor/text_sensor.h"
 #include "esphome/components/binary_sensor/binary_sensor.h"
 #include "esphome/components/uart/uart.h"
+#include "solaris_parser.h"
+#include "solaris_aggregator.h"
+#include "solaris_accumulator.h"
+#include "solaris_history.h"
+#include "solaris_udp.h"
+#include "solaris_low_power.h"
+#include "solaris_errors.h"
+#include "solaris_health.h"
+#include "solaris_mqtt.h"
+#include "solaris_watchdog.h"
+#include "solaris_line_queue.h"
+// Configured sensors, generated into the build directory by sensors.py
+#include "solaris_sensor_table.h"
+
+#if defined(USE_SOLARIS_AGGREGATES) || defined(USE_SOLARIS_SIMULATE)
+#include <vector>
+#endif
+#ifdef USE_SOLARIS_PARSER_TASK
+#include <atomic>
+#ifdef USE_ESP_IDF
+#include <freertos/FreeRTOS.h>
+#include <freertos/task.h>
+#endif
+#endif
 
 namespace esphome {
 namespace daikin_rotex_solaris {
@@ -12,123 +37,350 @@ namespace daikin_rotex_solaris {
 static const char *const TAG = "daikin_rotex_solaris"; // Used for logging
 
 // ============================================================================
-// UART BUFFER CONFIGURATION
-// ============================================================================
-static constexpr uint8_t BUFFER_SIZE = 128;          // Maximum chars stored per line (RX buffer)
-static constexpr uint8_t MIN_LINE_LEN = 22;          // Minimum valid line length (reject shorter lines)
-static constexpr uint8_t MAX_LINE_LEN = 48;          // Maximum valid line length (reject longer lines)
-static constexpr uint32_t LINE_TIMEOUT_MS = 5000;    // Clear buffer if no newline received within 5s
-
-// Boot/Info lines sent by Solaris RPS on startup - the first words for each line
-static constexpr char BOOT_LINE1[] = "SOLARIS";
-static constexpr char BOOT_LINE2[] = "Zyklus";
-static constexpr char BOOT_LINE3[] = "HA;BK;P1";
-
-// ============================================================================
-// CONVERSION AND ERROR MESSAGE BUFFERS
+// UART LINE CONFIGURATION
 // ============================================================================
-// Reused for strtof/strtol operations instead of allocating new stack buffers
-static constexpr uint8_t CONVERSION_BUFFER_SIZE = 16;     // Temporary buffer for number conversions
-static constexpr uint16_t ERROR_MSG_BUFFER_SIZE = 256;    // Error message buffer (for unknown error formatting)
+static constexpr size_t UART_CHUNK_SIZE = 64;        // Bytes fetched per read_array() call (on the stack)
+#ifdef USE_SOLARIS_PARSER_TASK
+static constexpr uint32_t PARSER_TASK_STACK_SIZE = 3072;  // Bytes, the task only decodes and queues lines
+#endif
 
 // ============================================================================
-// DATA STRUCTURE - Solaris RPS protocol
+// PUBLISH-ON-CHANGE CONFIGURATION
 // ============================================================================
-// Total number of semicolon-delimited fields in one complete data line
-static constexpr uint8_t TOTAL_FIELDS = 11;
-
-// Enum for field indices in the parsed data array
-// Protocol format: "Ha;BK;P1;P2;TK;TR;TS;TV;DF;ERR;PWR"
-enum SolarisFields : uint8_t {
-  SOLARIS_HA = 0,   // Handbetrieb (Manual Operation flag, 0/1)
-  SOLARIS_BK = 1,   // Brennerkontakt (Burner Contact flag, 0/1)
-  SOLARIS_P1 = 2,   // Umwälzpumpe (Circulation Pump speed, 0-100%)
-  SOLARIS_P2 = 3,   // Boosterpumpe (Boost Pump flag, 0/1)
-  SOLARIS_TK = 4,   // Kollektortemperatur (Collector Temperature, °C)
-  SOLARIS_TR = 5,   // Rücklauftemperatur (Return Temperature, °C)
-  SOLARIS_TS = 6,   // Speichertemperatur (Storage Temperature, °C)
-  SOLARIS_TV = 7,   // Vorlauftemperatur (Flow Temperature, °C)
-  SOLARIS_DF = 8,   // Durchfluss (Flow Rate, l/min, uses comma as decimal separator)
-  SOLARIS_ERR = 9,  // Fehlerstatus (Error code, single character: '', K, R, S, D, V, G, F, W)
-  SOLARIS_PWR = 10  // Leistung (Power output, Watts)
-};
+// Tolerance for float comparisons against the configured deadbands
+static constexpr float DEADBAND_EPSILON = 1e-4f;
 
 // ============================================================================
 // MAIN COMPONENT CLASS
 // ============================================================================
 class DaikinRotexSolarisComponent : public Component, public uart::UARTDevice {
   public:
-    void setup() override {}
+    void setup() override;          // Restore persisted state (if used)
     void loop() override;           // Main processing loop (called every cycle)
     void dump_config() override;    // Log configuration at startup
     float get_setup_priority() const override { return setup_priority::DATA; }
+#ifdef USE_SOLARIS_ACCUMULATORS
+    void on_safe_shutdown() override;  // Persist the counters before a reboot
+#endif
 
     // ========================================================================
-    // SENSOR SETTER METHODS - Register sensor pointers from configuration
+    // INSTANCE SETTINGS - Several controllers on one ESP32 (one UART each)
     // ========================================================================
-    // Regular numeric sensors (int/float values)
-    void set_solaris_p1_sensor(sensor::Sensor *s) { solaris_p1_sensor_ = s; }
-    void set_solaris_tk_sensor(sensor::Sensor *s) { solaris_tk_sensor_ = s; }
-    void set_solaris_tr_sensor(sensor::Sensor *s) { solaris_tr_sensor_ = s; }
-    void set_solaris_ts_sensor(sensor::Sensor *s) { solaris_ts_sensor_ = s; }
-    void set_solaris_tv_sensor(sensor::Sensor *s) { solaris_tv_sensor_ = s; }
-    void set_solaris_df_sensor(sensor::Sensor *s) { solaris_df_sensor_ = s; }
-    void set_solaris_pwr_sensor(sensor::Sensor *s) { solaris_pwr_sensor_ = s; }
+    // index: position in the YAML list, keeps the preferences and history URLs
+    // of the instances apart (instance 0 uses the single instance ones)
+    // tag: log tag of this instance
+    void set_instance(uint8_t index, const char *tag) {
+      instance_ = index;
+      tag_ = tag;
+      error_state_.set_log_tag(tag);
+    }
+    // Index of the instance's language in the generated error codes header
+    void set_language(uint8_t language) { error_state_.set_language(language); }
 
-    // Binary sensors (on/off states)
-    void set_solaris_ha_sensor(binary_sensor::BinarySensor *s) { solaris_ha_sensor_ = s; }
-    void set_solaris_bk_sensor(binary_sensor::BinarySensor *s) { solaris_bk_sensor_ = s; }
-    void set_solaris_p2_sensor(binary_sensor::BinarySensor *s) { solaris_p2_sensor_ = s; }
+    // ========================================================================
+    // SENSOR SETTER METHODS - Register the sensors of the generated SENSOR_TABLE
+    // ========================================================================
+    // slot: index into the sensor array of the entity type (descriptor slot).
+    // The table holds the sensors of all instances, slots of sensors that are
+    // not configured for this instance stay nullptr.
+    void set_sensor(uint8_t slot, sensor::Sensor *s) { numeric_sensors_[slot] = s; }
+    void set_sensor(uint8_t slot, binary_sensor::BinarySensor *s) { binary_sensors_[slot] = s; }
+    void set_sensor(uint8_t slot, text_sensor::TextSensor *s) { text_sensors_[slot] = s; }
 
-    // Text sensor (error status messages)
-    void set_solaris_err_sensor(text_sensor::TextSensor *s) { solaris_err_sensor_ = s; }
+    // ========================================================================
+    // PUBLISH-ON-CHANGE SETTINGS
+    // ========================================================================
+    // Minimum change of a field (in published units) before it is published again
+    void set_deadband(SolarisFields field, float deadband) { deadbands_[field] = deadband; }
+    // Republish all fields after this period even if nothing changed (0 = never)
+    void set_heartbeat(uint32_t heartbeat_ms) { heartbeat_ms_ = heartbeat_ms; }
+
+    // ========================================================================
+    // UART DRAINING SETTINGS
+    // ========================================================================
+    // Max time spent reading and parsing UART data per loop() call (0 = unlimited)
+    void set_loop_budget(uint32_t loop_budget_us) { loop_budget_us_ = loop_budget_us; }
+    // Publish only the newest frame when several frames complete in one loop() call
+    void set_latest_frame_only(bool latest_frame_only) { latest_frame_only_ = latest_frame_only; }
+#ifdef USE_SOLARIS_PARSER_TASK
+    // UART reception and parsing in a FreeRTOS task pinned to core, the main
+    // loop publishes the completed lines (up to queue_size waiting)
+    void set_parser_task(uint8_t core, uint8_t priority, uint16_t queue_size) {
+      parser_task_core_ = core;
+      parser_task_priority_ = priority;
+      parser_task_queue_size_ = queue_size;
+    }
+#endif
+
+    // ========================================================================
+    // LINK WATCHDOG SETTINGS
+    // ========================================================================
+    // Cycles without a frame before the field sensors become unknown (0 = never)
+    void set_stale_cycles(uint8_t cycles) { watchdog_.set_stale_cycles(cycles); }
+
+#ifdef USE_SOLARIS_ERROR_STATS
+    // ========================================================================
+    // ERROR STATISTICS - Diagnostic sensors about the controller errors
+    // ========================================================================
+    void set_error_count_sensor(const char *code, sensor::Sensor *s) { error_state_.set_count_sensor(code, s); }
+    void set_error_duration_sensor(sensor::Sensor *s) { error_state_.set_duration_sensor(s); }
+    void set_error_last_cleared_sensor(text_sensor::TextSensor *s) { error_state_.set_last_cleared_sensor(s); }
+#endif
+
+#if defined(USE_TIME) && (defined(USE_SOLARIS_ERROR_STATS) || defined(USE_SOLARIS_MQTT_JSON))
+    // Clock for the error last-cleared timestamp and the MQTT JSON documents
+    void set_time(time::RealTimeClock *time) {
+#ifdef USE_SOLARIS_ERROR_STATS
+      error_state_.set_time(time);
+#endif
+#ifdef USE_SOLARIS_MQTT_JSON
+      mqtt_json_.set_time(time);
+#endif
+    }
+#endif
+
+#ifdef USE_SOLARIS_AGGREGATES
+    // ========================================================================
+    // WINDOWED AGGREGATES - min/max/mean of a field per aggregation window
+    // ========================================================================
+    void set_aggregate_sensor(SolarisFields field, AggregateStat stat, sensor::Sensor *s);
+    void set_aggregation_window(uint32_t window_ms) { aggregation_window_ms_ = window_ms; }
+#endif
+
+#ifdef USE_SOLARIS_ACCUMULATORS
+    // ========================================================================
+    // ACCUMULATORS - Energy, run-hours and starts persisted in flash
+    // ========================================================================
+    void set_accumulator_sensor(AccumulatorType type, sensor::Sensor *s) { accumulators_.set_sensor(type, s); }
+    // Max time between flash writes of changed counters
+    void set_accumulator_save_interval(uint32_t interval_ms) { accumulators_.set_save_interval(interval_ms); }
+    // Yield (kWh) after which the counters are written before the interval ends
+    void set_accumulator_save_energy(float energy_kwh) { accumulators_.set_save_energy(energy_kwh); }
+#endif
+
+#ifdef USE_SOLARIS_HEALTH
+    // ========================================================================
+    // HEALTH - Parser and loop instrumentation as diagnostic sensors
+    // ========================================================================
+    void set_health_sensor(HealthMetric metric, sensor::Sensor *s) { health_.set_sensor(metric, s); }
+    // Period of the health sensor updates and of their rate, max and mean gauges
+    void set_health_interval(uint32_t interval_ms) { health_.set_interval(interval_ms); }
+#endif
+
+#ifdef USE_SOLARIS_HISTORY
+    // ========================================================================
+    // FRAME HISTORY - Ring buffer of past frames, downloadable via web_server
+    // ========================================================================
+    void set_history_size(size_t size) { history_.set_size(size); }
+    void set_history_psram(bool psram) { history_.set_psram(psram); }
+#ifdef USE_ESP_IDF
+    void set_web_server_base(web_server_base::WebServerBase *base) { web_server_base_ = base; }
+#endif
+#endif
+
+#ifdef USE_SOLARIS_UDP
+    // ========================================================================
+    // UDP PUSH - Every parsed frame as binary datagram to a collector
+    // ========================================================================
+    void set_udp_push(const std::string &address, uint16_t port, uint16_t device_id) {
+      udp_push_.set_address(address, port);
+      udp_push_.set_device_id(device_id);
+    }
+#ifdef USE_SOLARIS_LOW_POWER
+    // Store-and-forward: queue_size frames sent as batches every flush interval
+    // (or on an error code change), with radio_off Wi-Fi is only on for the flushes
+    void set_low_power(uint32_t flush_interval_ms, uint16_t queue_size, bool radio_off, uint32_t awake_ms) {
+      udp_push_.set_queue_size(queue_size);
+      low_power_.set_flush_interval(flush_interval_ms);
+      low_power_.set_radio_off(radio_off);
+      low_power_.set_awake_time(awake_ms);
+    }
+#endif
+#endif
+
+#ifdef USE_SOLARIS_MQTT_JSON
+    // ========================================================================
+    // MQTT JSON - Every frame as one JSON document on a single topic
+    // ========================================================================
+    void set_mqtt_json(const std::string &topic, uint8_t qos, bool retain) {
+      mqtt_json_.set_topic(topic);
+      mqtt_json_.set_qos(qos);
+      mqtt_json_.set_retain(retain);
+    }
+    // Home Assistant discovery config of a field sensor read from the topic
+    void add_mqtt_json_discovery(const char *topic, const char *payload) { mqtt_json_.add_discovery(topic, payload); }
+#endif
+
+#ifdef USE_SOLARIS_SIMULATE
+    // ========================================================================
+    // SIMULATION - Configured lines instead of UART data, for testing
+    // ========================================================================
+    // With lines added the UART is not read, the lines are parsed in turn
+    void add_simulate_line(const char *line) { simulate_lines_.push_back(line); }
+    void set_simulate_interval(uint32_t interval_ms) { simulate_interval_ms_ = interval_ms; }
+#endif
 
   protected:
+    // ========================================================================
+    // INSTANCE - Position in the YAML list and log tag
+    // ========================================================================
+    const char *tag_{TAG};
+    uint8_t instance_{0};
+
     // ========================================================================
     // INTERNAL PROCESSING METHODS - Core parsing and data handling
     // ========================================================================
-    // Parses a complete UART line into individual fields and validates data
+    // Reads and parses the available UART data within the loop budget
+    void read_uart_(uint32_t now);
+
+#ifdef USE_SOLARIS_PARSER_TASK
+    // Parser task side: decodes received bytes and queues the completed lines,
+    // discards a partial line after the line timeout (len 0: timeout only)
+    void receive_(const uint8_t *data, size_t len, uint32_t now);
+
+    // Main loop side: handles the queued lines within the loop budget
+    void drain_lines_();
+
+#ifdef USE_ESP_IDF
+    // FreeRTOS task: blocks on the UART driver's RX buffer, calls receive_()
+    static void parser_task_(void *arg);
+#endif
+#endif
+
+    // Parses one complete line (without line terminator) and publishes it if valid
     void parse_line_(const char *line, size_t len);
 
+    // Handles the outcome of a completed line (logging, publishing valid frames)
+    void handle_line_(SolarisParseResult result, const SolarisParser &parser);
+
+    // Accounts every valid frame and publishes it right away or keeps it as
+    // pending (latest frame wins)
+    void process_frame_(const SolarisFrame &frame);
+
+    // Publishes the pending frame, if any
+    void flush_pending_frame_();
+
     // Publishes parsed values to all registered sensor entities
-    void publish_values_(const int int_values[], float solaris_df, char error_code, uint8_t num_tokens);
+    void publish_values_(const SolarisFrame &frame);
+
+    // Marks the field sensors unknown after the link went silent, the next
+    // frame publishes all of them again
+    void invalidate_values_();
+
+    // Checks the value against the last published one and remembers it if it
+    // has to be published (first value, outside deadband or forced by heartbeat)
+    bool should_publish_(SolarisFields field, float value, bool force);
+
+    // ========================================================================
+    // SENSOR STORAGE - Pointers to the SENSOR_TABLE sensors, indexed by slot
+    // ========================================================================
+    // Arrays keep at least one element when no sensor of a kind is configured
+    sensor::Sensor *numeric_sensors_[NUMERIC_SENSOR_COUNT > 0 ? NUMERIC_SENSOR_COUNT : 1]{};
+    binary_sensor::BinarySensor *binary_sensors_[BINARY_SENSOR_COUNT > 0 ? BINARY_SENSOR_COUNT : 1]{};
+    text_sensor::TextSensor *text_sensors_[TEXT_SENSOR_COUNT > 0 ? TEXT_SENSOR_COUNT : 1]{};
 
-    // Gets error code description from error code character
-    const char *get_error_text_(char error_code);
+    // ========================================================================
+    // PUBLISH-ON-CHANGE STATE - Last published frame and heartbeat timing
+    // ========================================================================
+    float deadbands_[TOTAL_FIELDS]{};       // Per-field deadband (0 = publish any change)
+    float last_values_[TOTAL_FIELDS]{};     // Last published value per field
+    uint16_t published_mask_{0};            // Bit per field: published at least once
+    uint32_t heartbeat_ms_{0};              // Period of the full republish (0 = off)
+    uint32_t last_heartbeat_{0};            // Timestamp of the last forced full publish
 
     // ========================================================================
-    // SENSOR STORAGE - Pointers to sensor instances created by ESPHome
+    // UART STREAM STATE - Tracks incoming character stream
     // ========================================================================
-    // Numeric sensors (temperatures, flow rates, power)
-    sensor::Sensor *solaris_p1_sensor_{nullptr};
-    sensor::Sensor *solaris_tk_sensor_{nullptr};
-    sensor::Sensor *solaris_tr_sensor_{nullptr};
-    sensor::Sensor *solaris_ts_sensor_{nullptr};
-    sensor::Sensor *solaris_tv_sensor_{nullptr};
-    sensor::Sensor *solaris_df_sensor_{nullptr};
-    sensor::Sensor *solaris_pwr_sensor_{nullptr};
+    SolarisParser parser_;          // Streaming parser, decodes bytes as they arrive
+    uint32_t last_char_time_{0};    // Timestamp of last received character (partial lines are
+                                    // discarded after half a cycle without data)
+    uint32_t loop_budget_us_{0};    // Max UART processing time per loop() (0 = unlimited)
 
-    // Binary sensors (on/off states)
-    binary_sensor::BinarySensor *solaris_ha_sensor_{nullptr};
-    binary_sensor::BinarySensor *solaris_bk_sensor_{nullptr};
-    binary_sensor::BinarySensor *solaris_p2_sensor_{nullptr};
+    // ========================================================================
+    // BACKLOG COALESCING - Newest complete frame of the current loop() call
+    // ========================================================================
+    SolarisFrame pending_frame_{};
+    bool has_pending_frame_{false};
+    bool latest_frame_only_{false};
 
-    // Text sensor (error status)
-    text_sensor::TextSensor *solaris_err_sensor_{nullptr};
+    // ========================================================================
+    // LINK WATCHDOG - Cycle of the controller, missed frames and stale values
+    // ========================================================================
+    SolarisWatchdog watchdog_;
+
+    // ========================================================================
+    // ERROR STATE - Current error code, its description and statistics
+    // ========================================================================
+    SolarisErrorState error_state_;
 
+#ifdef USE_SOLARIS_AGGREGATES
     // ========================================================================
-    // UART BUFFER STATE - Tracks incoming character stream
+    // WINDOWED AGGREGATES STATE - One aggregator per field with sensors
     // ========================================================================
-    char buffer_[BUFFER_SIZE];      // Circular RX buffer for one complete line
-    uint8_t buffer_idx_{0};         // Current write position in buffer
-    uint32_t last_char_time_{0};    // Timestamp of last received character (used for timeout)
+    std::vector<FieldAggregator> aggregators_;
+    uint32_t aggregation_window_ms_{300000};
+    uint32_t window_start_{0};
+#endif
+
+#ifdef USE_SOLARIS_ACCUMULATORS
+    SolarisAccumulators accumulators_;
+#endif
+
+#ifdef USE_SOLARIS_HEALTH
+    SolarisHealth health_;
+    uint32_t line_time_us_{0};      // Decode time of the partial line from earlier chunks
+#endif
+
+#ifdef USE_SOLARIS_UDP
+    SolarisUdpPush udp_push_;
+#endif
+
+#ifdef USE_SOLARIS_LOW_POWER
+    SolarisLowPower low_power_;
+    // Only set_low_power() gives the UDP push a queue (low_power: configured)
+    bool uses_low_power_() const { return udp_push_.is_enabled() && udp_push_.get_queue_size() > 0; }
+#endif
 
+#ifdef USE_SOLARIS_MQTT_JSON
+    SolarisMqttJson mqtt_json_;
+#endif
+
+#ifdef USE_SOLARIS_HISTORY
+    SolarisHistory history_;
+#ifdef USE_ESP_IDF
+    web_server_base::WebServerBase *web_server_base_{nullptr};
+#endif
+#endif
+
+#ifdef USE_SOLARIS_PARSER_TASK
     // ========================================================================
-    // REUSABLE TEMPORARY BUFFERS
+    // PARSER TASK - parser_, last_char_time_ and line_time_us_ belong to the
+    // task while it runs, only the atomics below are shared
     // ========================================================================
-    // Reused for strtof/strtol operations instead of creating new buffers per conversion
-    char conversion_buffer_[CONVERSION_BUFFER_SIZE];   // For numeric parsing (int/float)
-    char error_msg_buffer_[ERROR_MSG_BUFFER_SIZE];     // For formatting unknown error messages
+    SolarisLineQueue line_queue_;
+    std::atomic<uint32_t> line_timeout_ms_{DEFAULT_CYCLE_MS / 2};  // Half the cycle, set by the main loop
+    std::atomic<uint32_t> task_bytes_{0};             // Received bytes, set by the task
+    std::atomic<uint32_t> task_line_timeouts_{0};     // Discarded partial lines, set by the task
+    uint32_t bytes_seen_{0};        // Counters already accounted by the main loop
+    uint32_t line_timeouts_seen_{0};
+    uint32_t dropped_seen_{0};
+    uint16_t parser_task_queue_size_{0};              // 0 = UART read in loop()
+    uint8_t parser_task_core_{0};
+    uint8_t parser_task_priority_{5};
+#ifdef USE_ESP_IDF
+    TaskHandle_t parser_task_handle_{nullptr};
+#endif
+#endif
+
+#ifdef USE_SOLARIS_SIMULATE
+    // Parses the next configured line once per interval
+    void simulate_(uint32_t now);
+
+    std::vector<const char *> simulate_lines_;
+    uint32_t simulate_interval_ms_{5000};
+    uint32_t last_simulated_{0};
+    size_t next_simulated_{0};
+#endif
 };
 
 } // namespace daikin_rotex_solaris
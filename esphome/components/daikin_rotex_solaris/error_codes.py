@@ -0,0 +1,167 @@
+"""
+Error codes header generator for DAIKIN/ROTEX Solaris RPS component.
+
+Builds the content of solaris_error_codes_<languages>.h from the translations
+for the languages selected by the component instances. Kept free of ESPHome
+imports so the header can also be generated outside of an ESPHome build (e.g.
+by the host test harness).
+"""
+
+from .headers import write_header_if_changed
+from .translations.translations import get_codes_description
+
+# Entries of the direct-indexed lookup table (7-bit ASCII error code characters)
+ERROR_CODE_TABLE_SIZE = 128
+
+
+def _cpp_escape(s):
+    r"""Escape a Python string for safe inclusion in a C++ string literal.
+    
+    This function escapes special characters so the string can be safely
+    embedded in C++ code as a string literal:
+        - Backslashes are doubled (\ becomes \\)
+        - Quotes are escaped (" becomes \")
+    """
+    # Escape backslashes first, then quotes (order matters!)
+    return s.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def generate_error_codes_header(languages):
+    """Generate solaris_error_codes_<languages>.h header from translations.py
+    
+    This function creates a C++ header file containing error codes definitions
+    with descriptions in the selected languages, one table per language. The
+    character lookup table is shared, as all languages define the same codes
+    in the same order. The header is generated at build time.
+    
+    Args:
+        languages: Language codes (e.g., ["de"] or ["de", "en"]) in the order
+        of ERROR_CODE_LANGUAGES, the index an instance passes to set_language()
+    
+    Returns:
+        String containing complete C++ header file content
+    """
+    # Get translations for the selected languages
+    translations = {lang: get_codes_description(lang) for lang in languages}
+    keys = list(translations[languages[0]])
+    for lang, codes in translations.items():
+        if list(codes) != keys:
+            raise ValueError(f"Error codes of language '{lang}' differ from '{languages[0]}'")
+
+    # ========================================================================
+    # BUILD C++ HEADER CONTENT
+    # ========================================================================
+    header_lines = [
+        "// AUTO-GENERATED FILE: Do not edit manually!",
+        "// Generated from translations.py by __init__.py during build",
+        "// Languages: " + ", ".join(lang.upper() for lang in languages),
+        "",
+        "#include <cstddef>",
+        "#include <cstdint>",
+        "",
+        "namespace esphome {",
+        "namespace daikin_rotex_solaris {",
+        "",
+        "// Struct to hold error code and description pairs",
+        "struct SolarisErrorCodes {",
+        "  char code;               // Single character error code (K, R, S, V, D, G, F, W, or \\0)",
+        "  const char *description; // Pointer to error description string in the selected language",
+        "};",
+    ]
+
+    # ========================================================================
+    # ADD ONE ERROR CODES ARRAY PER LANGUAGE
+    # ========================================================================
+    for lang, codes in translations.items():
+        header_lines.extend([
+            "",
+            "// Error codes in " + lang.upper(),
+            "static const SolarisErrorCodes ERROR_CODES_{}[] = {{".format(lang.upper()),
+        ])
+        for key, description in codes.items():
+            # Format the error code character for C++
+            if key == "unknown":
+                # "unknown" is a special fallback entry (no character match)
+                code_char = "'\\x00'"
+            elif key == "":
+                # Empty string maps to null character (no error condition)
+                code_char = "'\\0'"
+            else:
+                # Single-character codes: K, R, S, D, V, G, F, W
+                code_char = "'" + key + "'"
+
+            # Escape the description for safe inclusion in C++ string literal
+            escaped_desc = _cpp_escape(str(description))
+
+            # Add struct initializer to array
+            line = "  {{{}, \"{}\"}},".format(code_char, escaped_desc)
+            header_lines.append(line)
+        header_lines.append("};")
+
+    # ========================================================================
+    # LANGUAGE TABLE AND UTILITY CONSTANTS
+    # ========================================================================
+    first = "ERROR_CODES_" + languages[0].upper()
+    header_lines.extend([
+        "",
+        "// Error codes per language, indexed by the language index of an instance",
+        "static const SolarisErrorCodes *const ERROR_CODE_LANGUAGES[] = {{{}}};".format(
+            ", ".join("ERROR_CODES_" + lang.upper() for lang in languages)),
+        "static constexpr size_t ERROR_CODE_LANGUAGE_COUNT = {};".format(len(languages)),
+        "",
+        "// Calculate array size at compile time (same for all languages)",
+        "static constexpr size_t ERROR_CODES_COUNT = sizeof({0}) / sizeof({0}[0]);".format(first),
+        "// Index of the \"unknown\" fallback entry (always the last one)",
+        "static constexpr size_t UNKNOWN_ERROR_INDEX = ERROR_CODES_COUNT - 1;",
+        "",
+        "// Direct-indexed lookup: ERROR_CODES index per (ASCII) error code character,",
+        "// UNKNOWN_ERROR_INDEX for characters without an entry",
+        "static const uint8_t ERROR_CODE_INDEX[{}] = {{".format(ERROR_CODE_TABLE_SIZE),
+    ])
+
+    # ========================================================================
+    # ADD LOOKUP TABLE ROWS - 16 characters per line
+    # ========================================================================
+    # ERROR_CODES index per error code character
+    code_index = {ord(key) if key else 0: index for index, key in enumerate(keys) if key != "unknown"}
+    unknown_index = len(keys) - 1
+    for row in range(0, ERROR_CODE_TABLE_SIZE, 16):
+        indices = [code_index.get(c, unknown_index) for c in range(row, row + 16)]
+        header_lines.append("  " + ", ".join(str(i) for i in indices) + ",")
+
+    header_lines.extend([
+        "};",
+        "",
+        "// ERROR_CODES index of an error code character in O(1)",
+        "static inline size_t error_code_index(char code) {",
+        "  uint8_t c = static_cast<uint8_t>(code);",
+        "  return c < sizeof(ERROR_CODE_INDEX) ? ERROR_CODE_INDEX[c] : UNKNOWN_ERROR_INDEX;",
+        "}",
+        "",
+        "} // namespace daikin_rotex_solaris",
+        "} // namespace esphome"
+    ])
+
+    return "\n".join(header_lines)
+
+
+def error_codes_header_name(languages):
+    """File name of the generated header for the languages of all instances
+    (solaris_error_codes_de.h, solaris_error_codes_de_en.h)"""
+    return "solaris_error_codes_{}.h".format("_".join(languages))
+
+
+def write_error_codes_header(directory, languages):
+    """Write the error codes header for the given languages if its content changed.
+
+    Headers of several language sets can live side by side in the same directory.
+
+    Args:
+        directory: Target directory (created if missing)
+        languages: Language codes (e.g., ["de"] or ["de", "en"])
+
+    Returns:
+        Tuple of the header path and whether it was (re)written
+    """
+    return write_header_if_changed(
+        directory, error_codes_header_name(languages), generate_error_codes_header(languages))
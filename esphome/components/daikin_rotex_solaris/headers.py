@@ -0,0 +1,37 @@
+"""
+Writing of generated C++ headers for DAIKIN/ROTEX Solaris RPS component.
+
+Generated headers go to the build directory of the device and are only
+rewritten when their content changed, so the build system does not recompile
+the sources including them. Kept free of ESPHome imports (used by the host
+test harness as well).
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+
+def write_header_if_changed(directory, name, content):
+    """Write a generated header if its content hash differs from the existing file.
+
+    Args:
+        directory: Target directory (created if missing)
+        name: File name of the header
+        content: Complete header text
+
+    Returns:
+        Tuple of the header path and whether it was (re)written
+    """
+    path = Path(directory) / name
+    data = (content + "\n").encode("utf-8")
+
+    if path.is_file() and hashlib.sha256(path.read_bytes()).digest() == hashlib.sha256(data).digest():
+        return path, False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first so a parallel build never sees a partial header
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+    return path, True
@@ -0,0 +1,102 @@
+"""
+Home Assistant MQTT discovery for the batched JSON frame topic of the
+DAIKIN/ROTEX Solaris RPS component.
+
+With 'mqtt_json:' the component publishes every frame as one JSON document
+on a single topic instead of one message per entity:
+
+    {"seq":12,"uptime":61000,"time":1700000000,"ha":0,"bk":1,"p1":75,"p2":0,
+     "tk":84,"tr":58,"ts":61,"tv":63,"df":320,"err":"","pwr":3500}
+
+The values are the raw frame values (DF in 1/100 l/min, PWR in W), 'time' is
+only present with a synchronized clock and 'invalid' (bit mask of unparsable
+tokens) only when not 0. The discovery configs built here extract one field
+each with a value template and convert it to the unit of the matching
+ESPHome sensor. Kept free of ESPHome imports (tested without ESPHome).
+"""
+
+from collections import namedtuple
+import json
+
+# Entity component per SENSORS_CONFIG 'type'
+DISCOVERY_COMPONENTS = {
+    'numeric': 'sensor',
+    'binary': 'binary_sensor',
+    'text': 'sensor',
+}
+
+# One retained discovery message. The payload is a JSON object without its
+# closing brace, the component appends the device (MAC address) on the device.
+DiscoveryMessage = namedtuple("DiscoveryMessage", ["topic", "payload"])
+
+
+def json_key(key):
+    """Key of a field in the frame document (solaris_tk -> tk)"""
+    return key.removeprefix("solaris_")
+
+
+def value_template(sensor_cfg, error_texts):
+    """Jinja template extracting and converting a field of the frame document.
+
+    Args:
+        sensor_cfg: SENSORS_CONFIG entry of a field sensor
+        error_texts: Error description per error code ("" = no error,
+            "unknown" for codes without description)
+
+    Returns:
+        The value template for the discovery config
+    """
+    value = f"value_json.{json_key(sensor_cfg['key'])}"
+    if sensor_cfg['type'] == 'text':
+        # Same description as the ESPHome text sensor, looked up in Home Assistant
+        texts = {code: text for code, text in error_texts.items() if code != "unknown"}
+        mapping = json.dumps(texts, ensure_ascii=False, separators=(",", ":"))
+        default = json.dumps(error_texts["unknown"], ensure_ascii=False)
+        return f"{{{{ {mapping}.get({value}, {default}) }}}}"
+    if sensor_cfg['type'] == 'binary':
+        return f"{{{{ 'ON' if {value} else 'OFF' }}}}"
+    scale = sensor_cfg.get('step', 1) * sensor_cfg.get('divisor', 1)
+    if scale == 1:
+        return f"{{{{ {value} }}}}"
+    return f"{{{{ ({value} / {scale}) | round({sensor_cfg['accuracy']}) }}}}"
+
+
+def discovery_messages(sensors, state_topic, discovery_prefix, object_prefix, error_texts,
+                       availability_topic=None):
+    """Build the discovery messages of the field sensors read from the frame topic.
+
+    Args:
+        sensors: (SENSORS_CONFIG entry, display name) per field sensor
+        state_topic: Topic of the frame documents
+        discovery_prefix: Home Assistant discovery prefix ("homeassistant")
+        object_prefix: Node (and instance) part of the object and unique ids
+        error_texts: Error description per error code, see value_template()
+        availability_topic: Birth/last will topic of the node (None = always available)
+
+    Returns:
+        DiscoveryMessage list in the order of sensors
+    """
+    messages = []
+    for sensor_cfg, name in sensors:
+        component = DISCOVERY_COMPONENTS[sensor_cfg['type']]
+        object_id = f"{object_prefix}_{sensor_cfg['key']}"
+        config = {
+            'name': name,
+            'uniq_id': object_id,
+            'obj_id': object_id,
+            'stat_t': state_topic,
+            'val_tpl': value_template(sensor_cfg, error_texts),
+            'ic': sensor_cfg['icon'],
+        }
+        if sensor_cfg.get('unit'):
+            config['unit_of_meas'] = sensor_cfg['unit']
+        if sensor_cfg.get('device_class'):
+            config['dev_cla'] = sensor_cfg['device_class']
+        if sensor_cfg.get('state_class'):
+            config['stat_cla'] = sensor_cfg['state_class']
+        if availability_topic:
+            config['avty_t'] = availability_topic
+        payload = json.dumps(config, ensure_ascii=False, separators=(",", ":"))
+        messages.append(DiscoveryMessage(
+            f"{discovery_prefix}/{component}/{object_prefix}/{sensor_cfg['key']}/config", payload[:-1]))
+    return messages
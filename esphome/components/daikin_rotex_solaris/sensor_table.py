@@ -0,0 +1,105 @@
+"""
+Sensor table header generator for DAIKIN/ROTEX Solaris RPS component.
+
+Builds solaris_sensor_table.h with one constexpr descriptor per configured
+sensor that publishes a frame field directly (SENSORS_CONFIG entries without
+'setter'). The component publishes and logs these sensors in one loop over
+the table, sensors that are not configured do not appear in the firmware at
+all. With several component instances the table holds the sensors configured
+in any of them. Kept free of ESPHome imports so the header can also be generated outside
+of an ESPHome build (e.g. by the host test harness).
+"""
+
+from collections import namedtuple
+
+from .headers import write_header_if_changed
+
+SENSOR_TABLE_HEADER = "solaris_sensor_table.h"
+
+# C++ SolarisSensorKind per SENSORS_CONFIG 'type'
+SENSOR_KINDS = {
+    'numeric': 'SENSOR_KIND_NUMERIC',
+    'binary': 'SENSOR_KIND_BINARY',
+    'text': 'SENSOR_KIND_TEXT',
+}
+
+# One configured sensor: key, SolarisFields name, SENSORS_CONFIG type, rounding
+# step (raw units) and divisor to the sensor unit
+SensorTableEntry = namedtuple("SensorTableEntry", ["key", "field", "type", "step", "divisor"])
+
+
+def sensor_table_entry(sensor_cfg):
+    """Build the table entry of a SENSORS_CONFIG entry"""
+    return SensorTableEntry(
+        sensor_cfg['key'], sensor_cfg['field'], sensor_cfg['type'],
+        sensor_cfg.get('step', 1), sensor_cfg.get('divisor', 1),
+    )
+
+
+def sensor_define(key):
+    """C++ define enabled for a configured table sensor (solaris_tk -> USE_SOLARIS_TK)"""
+    return "USE_" + key.upper()
+
+
+def generate_sensor_table_header(entries):
+    """Generate solaris_sensor_table.h for the configured sensors.
+
+    Args:
+        entries: SensorTableEntry list in publish order
+
+    Returns:
+        Tuple of the header text and the slot per entry (index into the
+        component's sensor array of the entry's kind)
+    """
+    slots = []
+    counts = dict.fromkeys(SENSOR_KINDS, 0)
+    rows = []
+    for entry in entries:
+        slot = counts[entry.type]
+        counts[entry.type] += 1
+        slots.append(slot)
+        rows.append('  {{"{}", {}, {}, {}, {}, {:.1f}f}},'.format(
+            entry.key, entry.field, SENSOR_KINDS[entry.type], slot, entry.step, entry.divisor))
+
+    header_lines = [
+        "// AUTO-GENERATED FILE: Do not edit manually!",
+        "// Generated from SENSORS_CONFIG by sensors.py during build",
+        "#pragma once",
+        "",
+        "#include <array>",
+        # The header lives in the build's src directory (on the include path),
+        # not next to the component sources
+        '#include "esphome/components/daikin_rotex_solaris/solaris_sensors.h"',
+        "",
+        "namespace esphome {",
+        "namespace daikin_rotex_solaris {",
+        "",
+        "// Configured sensors publishing a frame field, in publish order",
+        "static constexpr std::array<SolarisSensorDescriptor, {}> SENSOR_TABLE{{{{".format(len(entries)),
+        *rows,
+        "}};",
+        "",
+        "// Sensors per kind (size of the component's sensor arrays)",
+        "static constexpr uint8_t NUMERIC_SENSOR_COUNT = {};".format(counts['numeric']),
+        "static constexpr uint8_t BINARY_SENSOR_COUNT = {};".format(counts['binary']),
+        "static constexpr uint8_t TEXT_SENSOR_COUNT = {};".format(counts['text']),
+        "",
+        "} // namespace daikin_rotex_solaris",
+        "} // namespace esphome",
+    ]
+    return "\n".join(header_lines), slots
+
+
+def write_sensor_table_header(directory, entries):
+    """Write solaris_sensor_table.h if its content changed.
+
+    Args:
+        directory: Target directory (created if missing)
+        entries: SensorTableEntry list in publish order
+
+    Returns:
+        Tuple of the header path, whether it was (re)written and the slot per entry
+    """
+    content, slots = generate_sensor_table_header(entries)
+    path, written = write_header_if_changed(directory, SENSOR_TABLE_HEADER, content)
+    return path, written, slots
@@ -5,13 +5,44 @@ Handles configuration, validation, and instantiation of sensors entities
 like temperature, flow rate, power output sensors, etc.
 """
 
+import logging
+
 import esphome.codegen as cg
 import esphome.config_validation as cv
 from esphome.components import sensor, binary_sensor, text_sensor
 from esphome.const import CONF_NAME
+from esphome.core import CORE
 
 from .translations.translations import DEFAULT_LANGUAGE, translation_exists
-from .sensors_config import SENSORS_CONFIG
+from .sensors_config import ERROR_CODE_KEYS, SENSORS_CONFIG
+from .sensor_table import sensor_define, sensor_table_entry, write_sensor_table_header
+
+_LOGGER = logging.getLogger(__name__)
+
+# Configuration key for the per-sensor publish deadband (numeric sensors only)
+CONF_DEADBAND = "deadband"
+# Configuration key for the text put in front of the sensor names of an instance
+CONF_NAME_PREFIX = "name_prefix"
+
+# C++ enums used as setter arguments ('field' and 'setter_args' in SENSORS_CONFIG)
+daikin_rotex_solaris_ns = cg.esphome_ns.namespace("daikin_rotex_solaris")
+SolarisFields = daikin_rotex_solaris_ns.enum("SolarisFields")
+AggregateStat = daikin_rotex_solaris_ns.enum("AggregateStat")
+AccumulatorType = daikin_rotex_solaris_ns.enum("AccumulatorType")
+HealthMetric = daikin_rotex_solaris_ns.enum("HealthMetric")
+
+def _setter_arg(name):
+    """Map a setter argument name from SENSORS_CONFIG to its C++ enum value"""
+    if name in ERROR_CODE_KEYS:
+        # Error code keys are passed as string ("K", ..., "unknown")
+        return name
+    if name.startswith('AGGREGATE_'):
+        return getattr(AggregateStat, name)
+    if name.startswith('ACCUMULATOR_'):
+        return getattr(AccumulatorType, name)
+    if name.startswith('HEALTH_'):
+        return getattr(HealthMetric, name)
+    return getattr(SolarisFields, name)
 
 def _generate_sensors_schema():
     """Generate sensors schema from configuration array in sensors_config.py"""
@@ -24,15 +55,23 @@ def _generate_sensors_schema():
         match sensor_type:
             case 'numeric':
                 schema_kwargs = {
-                    'unit_of_measurement': sensor_cfg['unit'],
                     'icon': sensor_cfg['icon'],
                     'accuracy_decimals': sensor_cfg['accuracy'],
                 }
+                if sensor_cfg.get('unit'):
+                    schema_kwargs['unit_of_measurement'] = sensor_cfg['unit']
                 if sensor_cfg.get('device_class'):
                     schema_kwargs['device_class'] = sensor_cfg['device_class']
                 if sensor_cfg.get('state_class'):
                     schema_kwargs['state_class'] = sensor_cfg['state_class']
+                if sensor_cfg.get('entity_category'):
+                    schema_kwargs['entity_category'] = sensor_cfg['entity_category']
                 sensor_schema = sensor.sensor_schema(**schema_kwargs)
+                if 'deadband' in sensor_cfg:
+                    sensor_schema = sensor_schema.extend({
+                        # Skip publishing until the value changed by at least this amount
+                        cv.Optional(CONF_DEADBAND, default=sensor_cfg['deadband']): cv.positive_float,
+                    })
 
             case 'binary':
                 schema_kwargs = {'icon': sensor_cfg['icon']}
@@ -41,10 +80,17 @@ def _generate_sensors_schema():
                 sensor_schema = binary_sensor.binary_sensor_schema(**schema_kwargs)
 
             case 'text':
-                sensor_schema = text_sensor.text_sensor_schema(icon=sensor_cfg['icon'])
+                schema_kwargs = {'icon': sensor_cfg['icon']}
+                if sensor_cfg.get('device_class'):
+                    schema_kwargs['device_class'] = sensor_cfg['device_class']
+                if sensor_cfg.get('entity_category'):
+                    schema_kwargs['entity_category'] = sensor_cfg['entity_category']
+                sensor_schema = text_sensor.text_sensor_schema(**schema_kwargs)
 
-        # Add name override support initially with DEFAULT_LANGUAGE
-        display_name = sensor_cfg['display_name'](DEFAULT_LANGUAGE)
+        # Add name override support initially with DEFAULT_LANGUAGE. The
+        # default is looked up only for configured sensors (callable default),
+        # so building the schema loads no language pack.
+        display_name = lambda cfg=sensor_cfg: cfg['display_name'](DEFAULT_LANGUAGE)
         schema_dict[cv.Optional(sensor_cfg['key'])] = sensor_schema.extend({
             cv.Optional(CONF_NAME, default=display_name): cv.string,
         })
@@ -56,15 +102,45 @@ def _generate_sensors_schema():
 # language at this point, so default language names are used here
 SENSORS_SCHEMA = _generate_sensors_schema()
 
-async def setup_sensors(parent, config):
+def write_sensor_table(configs):
+    """Write solaris_sensor_table.h for the field sensors of all instances.
+
+    The table is shared by all component instances and holds every field
+    sensor configured in any of them, in SENSORS_CONFIG order. The header is
+    rewritten only if it changed.
+
+    Args:
+        configs: The parsed YAML configurations of all instances
+
+    Returns:
+        Dictionary of the slot per table sensor key
+    """
+    entries = [
+        sensor_table_entry(sensor_cfg) for sensor_cfg in SENSORS_CONFIG
+        if 'setter' not in sensor_cfg and any(sensor_cfg['key'] in config for config in configs)
+    ]
+    header_path, written, slots = write_sensor_table_header(CORE.relative_src_path(), entries)
+    _LOGGER.info("%s %s (%u sensors)", header_path.name, "generated" if written else "unchanged", len(entries))
+    for entry in entries:
+        cg.add_define(sensor_define(entry.key))
+    return {entry.key: slot for entry, slot in zip(entries, slots)}
+
+async def setup_sensors(parent, config, slots):
     """Setup sensor entities from configuration.
     
     This function creates sensor instances for each sensor and registers it with 
-    the component. Sensor names are translated based on the configured language.
+    the component. Sensor names are translated based on the configured language
+    and prefixed with the instance's name prefix. Sensors publishing a frame
+    field are registered by their slot in the generated solaris_sensor_table.h
+    and enable USE_SOLARIS_<KEY>.
     
     Args:
         parent: The DaikinRotexSolarisComponent instance to register sensors with
         config: The parsed YAML configuration dictionary
+        slots: Slot per table sensor key (see write_sensor_table())
+
+    Returns:
+        Set of C++ defines enabled by the configured sensors ('define' key)
     """
     
     # Mapping of sensor types to their ESPHome creation functions
@@ -80,6 +156,11 @@ async def setup_sensors(parent, config):
     if not translation_exists(lang):
         lang = DEFAULT_LANGUAGE
     
+    # Distinguishes the entities of several instances ("Garage" -> "Garage Pumpe (P1)")
+    prefix = config.get(CONF_NAME_PREFIX, "")
+
+    features = set()
+
     # Iterate over all sensor configurations
     for sensor_cfg in SENSORS_CONFIG:
         if sensor_cfg['key'] in config:
@@ -87,7 +168,8 @@ async def setup_sensors(parent, config):
             sensor_config = config[sensor_cfg['key']]
             
             # Update sensor name with translated display name
-            sensor_config[CONF_NAME] = sensor_cfg['display_name'](lang)
+            name = sensor_cfg['display_name'](lang)
+            sensor_config[CONF_NAME] = f"{prefix} {name}" if prefix else name
 
             # Get the appropriate sensor creation function based on type
             sensor_creator = SENSOR_TYPE_HANDLERS[sensor_cfg['type']]
@@ -95,5 +177,23 @@ async def setup_sensors(parent, config):
             # Create sensor instance using the appropriate ESPHome function
             sens = await sensor_creator(sensor_config)
             
-            # Register sensor with the component using the appropriate setter
-            cg.add(getattr(parent, sensor_cfg['setter'])(sens))
\ No newline at end of file
+            # Register sensor with the component using the appropriate setter,
+            # table sensors by their slot in the shared table
+            if 'setter' in sensor_cfg:
+                setter_args = [_setter_arg(arg) for arg in sensor_cfg.get('setter_args', [])]
+                cg.add(getattr(parent, sensor_cfg['setter'])(*setter_args, sens))
+            else:
+                cg.add(parent.set_sensor(slots[sensor_cfg['key']], sens))
+                features.add(sensor_define(sensor_cfg['key']))
+
+            # Enable the optional C++ code needed by this sensor
+            if 'define' in sensor_cfg and sensor_cfg['define'] not in features:
+                features.add(sensor_cfg['define'])
+                cg.add_define(sensor_cfg['define'])
+
+            # Configure publish-on-change deadband for numeric sensors
+            if CONF_DEADBAND in sensor_config:
+                field = getattr(SolarisFields, sensor_cfg['field'])
+                cg.add(parent.set_deadband(field, sensor_config[CONF_DEADBAND]))
+
+    return features
@@ -4,7 +4,17 @@ Sensors configuration definitions for DAIKIN/ROTEX Solaris RPS component.
 This module contains the SENSORS_CONFIG array that defines all available
 sensors, their types, units, icons, and other metadata. 'display_name' is
 a lambda function that retrieves the localized name based on the provided
-language code.
+language code. 'field' is the matching SolarisFields index in the C++ code
+and 'deadband' the default minimum change (in the sensor unit) before a
+numeric sensor is published again.
+
+Sensors without 'setter' publish a frame field directly. They are listed in
+the generated sensor table (see sensor_table.py), where 'step' (raw units,
+half away from zero) and 'divisor' convert the raw value to the sensor unit.
+Sensor families with their own C++ logic name a 'setter' instead,
+'setter_args' are passed to it before the sensor,
+'define' is added as C++ define when the sensor is configured and
+'entity_category' marks diagnostic sensors.
 """
 
 from esphome.const import (
@@ -12,13 +22,23 @@ from esphome.const import (
     DEVICE_CLASS_POWER,
     DEVICE_CLASS_HEAT,
     DEVICE_CLASS_RUNNING,
+    DEVICE_CLASS_ENERGY,
+    DEVICE_CLASS_DURATION,
+    DEVICE_CLASS_TIMESTAMP,
+    ENTITY_CATEGORY_DIAGNOSTIC,
     STATE_CLASS_MEASUREMENT,
+    STATE_CLASS_TOTAL_INCREASING,
     UNIT_CELSIUS,
+    UNIT_HOUR,
     UNIT_KILOWATT,
+    UNIT_KILOWATT_HOURS,
+    UNIT_MICROSECOND,
+    UNIT_MILLISECOND,
     UNIT_PERCENT,
+    UNIT_SECOND,
 )
 
-from .translations.translations import get_sensor_name
+from .translations.translations import get_codes_description, get_sensor_name
 
 # Flow rate unit (not in ESPHome standard units)
 UNIT_LITERS_PER_MIN = "l/min"
@@ -35,84 +55,96 @@ SENSORS_CONFIG = [
         'type': 'numeric',
         'key': 'solaris_p1',
         'display_name': lambda lang: get_sensor_name('solaris_p1', lang),
-        'setter': 'set_solaris_p1_sensor',
+        'field': 'SOLARIS_P1',
         'unit': UNIT_PERCENT,
         'icon': 'mdi:pump',
         'device_class': None,
         'state_class': None,
         'accuracy': 0,
+        'deadband': 0,
     },
     # Collector Temperature (-55 to +250 °C)
     {
         'type': 'numeric',
         'key': 'solaris_tk',
         'display_name': lambda lang: get_sensor_name('solaris_tk', lang),
-        'setter': 'set_solaris_tk_sensor',
+        'field': 'SOLARIS_TK',
         'unit': UNIT_CELSIUS,
         'icon': 'mdi:sun-thermometer',
         'device_class': DEVICE_CLASS_TEMPERATURE,
         'state_class': STATE_CLASS_MEASUREMENT,
         'accuracy': 0,
+        'deadband': 0,
     },
     # Return Temperature (0-100 °C)
     {
         'type': 'numeric',
         'key': 'solaris_tr',
         'display_name': lambda lang: get_sensor_name('solaris_tr', lang),
-        'setter': 'set_solaris_tr_sensor',
+        'field': 'SOLARIS_TR',
         'unit': UNIT_CELSIUS,
         'icon': 'mdi:water-thermometer',
         'device_class': DEVICE_CLASS_TEMPERATURE,
         'state_class': STATE_CLASS_MEASUREMENT,
         'accuracy': 0,
+        'deadband': 0,
     },
     # Storage Temperature (0-100 °C)
     {
         'type': 'numeric',
         'key': 'solaris_ts',
         'display_name': lambda lang: get_sensor_name('solaris_ts', lang),
-        'setter': 'set_solaris_ts_sensor',
+        'field': 'SOLARIS_TS',
         'unit': UNIT_CELSIUS,
         'icon': 'mdi:water-thermometer',
         'device_class': DEVICE_CLASS_TEMPERATURE,
         'state_class': STATE_CLASS_MEASUREMENT,
         'accuracy': 0,
+        'deadband': 0,
     },
     # Flow Temperature (0-100 °C)
     {
         'type': 'numeric',
         'key': 'solaris_tv',
         'display_name': lambda lang: get_sensor_name('solaris_tv', lang),
-        'setter': 'set_solaris_tv_sensor',
+        'field': 'SOLARIS_TV',
         'unit': UNIT_CELSIUS,
         'icon': 'mdi:water-thermometer',
         'device_class': DEVICE_CLASS_TEMPERATURE,
         'state_class': STATE_CLASS_MEASUREMENT,
         'accuracy': 0,
+        'deadband': 0,
     },
     # Flow Rate (0-20 l/min, displayed with 1 decimal place)
     {
         'type': 'numeric',
         'key': 'solaris_df',
         'display_name': lambda lang: get_sensor_name('solaris_df', lang),
-        'setter': 'set_solaris_df_sensor',
+        'field': 'SOLARIS_DF',
+        # Received in 1/100 l/min
+        'divisor': 100,
         'unit': UNIT_LITERS_PER_MIN,
         'icon': 'mdi:waves-arrow-right',
         'device_class': None,
         'state_class': STATE_CLASS_MEASUREMENT,
         'accuracy': 1,
+        'deadband': 0.0,
     },
     # Power Output (0-X kW, displayed with 2 decimal places)
     {
         'type': 'numeric',
         'key': 'solaris_pwr',
         'display_name': lambda lang: get_sensor_name('solaris_pwr', lang),
-        'setter': 'set_solaris_pwr_sensor',
+        'field': 'SOLARIS_PWR',
+        # Received in W, rounded to 10 W and published in kW
+        'step': 10,
+        'divisor': 100,
         'unit': UNIT_KILOWATT,
         'icon': 'mdi:solar-power',
         'device_class': DEVICE_CLASS_POWER,
         'state_class': STATE_CLASS_MEASUREMENT,
         'accuracy': 2,
+        'deadband': 0.0,
     },
     # ===============
     # Binary Sensors
@@ -122,7 +154,7 @@ SENSORS_CONFIG = [
         'type': 'binary',
         'key': 'solaris_ha',
         'display_name': lambda lang: get_sensor_name('solaris_ha', lang),
-        'setter': 'set_solaris_ha_sensor',
+        'field': 'SOLARIS_HA',
         'icon': 'mdi:gesture-tap',
         'device_class': None,
     },
@@ -131,7 +163,7 @@ SENSORS_CONFIG = [
         'type': 'binary',
         'key': 'solaris_bk',
         'display_name': lambda lang: get_sensor_name('solaris_bk', lang),
-        'setter': 'set_solaris_bk_sensor',
+        'field': 'SOLARIS_BK',
         'icon': 'mdi:electric-switch',
         'device_class': DEVICE_CLASS_HEAT,
     },
@@ -140,7 +172,7 @@ SENSORS_CONFIG = [
         'type': 'binary',
         'key': 'solaris_p2',
         'display_name': lambda lang: get_sensor_name('solaris_p2', lang),
-        'setter': 'set_solaris_p2_sensor',
+        'field': 'SOLARIS_P2',
         'icon': 'mdi:pump',
         'device_class': DEVICE_CLASS_RUNNING,
     },
@@ -152,7 +184,271 @@ SENSORS_CONFIG = [
         'type': 'text',
         'key': 'solaris_err',
         'display_name': lambda lang: get_sensor_name('solaris_err', lang),
-        'setter': 'set_solaris_err_sensor',
+        'field': 'SOLARIS_ERR',
         'icon': 'mdi:alert-decagram-outline',
     },
-]
\ No newline at end of file
+]
+
+# ============================================================================
+# WINDOWED AGGREGATE SENSORS
+# ============================================================================
+# Fields with min/max/mean sensors published once per aggregation window
+AGGREGATED_KEYS = [
+    'solaris_p1', 'solaris_tk', 'solaris_tr', 'solaris_ts',
+    'solaris_tv', 'solaris_df', 'solaris_pwr',
+]
+
+# Fields with an additional time-weighted mean (sample-and-hold integration)
+TIME_WEIGHTED_KEYS = ['solaris_pwr']
+
+# Statistic key suffix and matching C++ AggregateStat value
+AGGREGATE_STATS = {
+    'min': 'AGGREGATE_MIN',
+    'max': 'AGGREGATE_MAX',
+    'mean': 'AGGREGATE_MEAN',
+    'twmean': 'AGGREGATE_TIME_WEIGHTED_MEAN',
+}
+
+
+def _aggregate_sensor(base, stat):
+    """Build the config entry of one windowed statistic of a numeric sensor"""
+    key = f"{base['key']}_{stat}"
+    return {
+        'type': 'numeric',
+        'key': key,
+        'display_name': lambda lang, key=key: get_sensor_name(key, lang),
+        'setter': 'set_aggregate_sensor',
+        'setter_args': [base['field'], AGGREGATE_STATS[stat]],
+        'define': 'USE_SOLARIS_AGGREGATES',
+        'field': base['field'],
+        'unit': base['unit'],
+        'icon': base['icon'],
+        'device_class': base['device_class'],
+        'state_class': STATE_CLASS_MEASUREMENT,
+        # Means get one more decimal than the raw value
+        'accuracy': base['accuracy'] + (1 if stat in ('mean', 'twmean') else 0),
+    }
+
+
+SENSORS_CONFIG += [
+    _aggregate_sensor(base, stat)
+    for base in SENSORS_CONFIG if base['key'] in AGGREGATED_KEYS
+    for stat in AGGREGATE_STATS
+    if stat != 'twmean' or base['key'] in TIME_WEIGHTED_KEYS
+]
+
+# ============================================================================
+# ACCUMULATOR SENSORS
+# ============================================================================
+# Counters integrated on-device from every frame and persisted in flash.
+# 'field' is the source field, the setter argument the C++ AccumulatorType.
+SENSORS_CONFIG += [
+    # Solar yield (kWh), integrated from PWR
+    {
+        'type': 'numeric',
+        'key': 'solaris_energy',
+        'display_name': lambda lang: get_sensor_name('solaris_energy', lang),
+        'setter': 'set_accumulator_sensor',
+        'setter_args': ['ACCUMULATOR_ENERGY'],
+        'define': 'USE_SOLARIS_ACCUMULATORS',
+        'field': 'SOLARIS_PWR',
+        'unit': UNIT_KILOWATT_HOURS,
+        'icon': 'mdi:solar-power-variant',
+        'device_class': DEVICE_CLASS_ENERGY,
+        'state_class': STATE_CLASS_TOTAL_INCREASING,
+        'accuracy': 2,
+    },
+    # Circulation pump run-hours (P1 > 0 %)
+    {
+        'type': 'numeric',
+        'key': 'solaris_p1_runtime',
+        'display_name': lambda lang: get_sensor_name('solaris_p1_runtime', lang),
+        'setter': 'set_accumulator_sensor',
+        'setter_args': ['ACCUMULATOR_P1_RUNTIME'],
+        'define': 'USE_SOLARIS_ACCUMULATORS',
+        'field': 'SOLARIS_P1',
+        'unit': UNIT_HOUR,
+        'icon': 'mdi:timer-outline',
+        'device_class': DEVICE_CLASS_DURATION,
+        'state_class': STATE_CLASS_TOTAL_INCREASING,
+        'accuracy': 2,
+    },
+    # Booster pump run-hours (P2 on)
+    {
+        'type': 'numeric',
+        'key': 'solaris_p2_runtime',
+        'display_name': lambda lang: get_sensor_name('solaris_p2_runtime', lang),
+        'setter': 'set_accumulator_sensor',
+        'setter_args': ['ACCUMULATOR_P2_RUNTIME'],
+        'define': 'USE_SOLARIS_ACCUMULATORS',
+        'field': 'SOLARIS_P2',
+        'unit': UNIT_HOUR,
+        'icon': 'mdi:timer-outline',
+        'device_class': DEVICE_CLASS_DURATION,
+        'state_class': STATE_CLASS_TOTAL_INCREASING,
+        'accuracy': 2,
+    },
+    # Burner contact starts (BK off -> on)
+    {
+        'type': 'numeric',
+        'key': 'solaris_bk_starts',
+        'display_name': lambda lang: get_sensor_name('solaris_bk_starts', lang),
+        'setter': 'set_accumulator_sensor',
+        'setter_args': ['ACCUMULATOR_BK_STARTS'],
+        'define': 'USE_SOLARIS_ACCUMULATORS',
+        'field': 'SOLARIS_BK',
+        'unit': None,
+        'icon': 'mdi:counter',
+        'device_class': None,
+        'state_class': STATE_CLASS_TOTAL_INCREASING,
+        'accuracy': 0,
+    },
+    # Manual operation starts (HA off -> on)
+    {
+        'type': 'numeric',
+        'key': 'solaris_ha_starts',
+        'display_name': lambda lang: get_sensor_name('solaris_ha_starts', lang),
+        'setter': 'set_accumulator_sensor',
+        'setter_args': ['ACCUMULATOR_HA_STARTS'],
+        'define': 'USE_SOLARIS_ACCUMULATORS',
+        'field': 'SOLARIS_HA',
+        'unit': None,
+        'icon': 'mdi:counter',
+        'device_class': None,
+        'state_class': STATE_CLASS_TOTAL_INCREASING,
+        'accuracy': 0,
+    },
+]
+
+# ============================================================================
+# ERROR STATISTICS SENSORS
+# ============================================================================
+# Diagnostic sensors derived from the transitions of the ERR token. The
+# occurrence counters are kept in RAM only and start from 0 after a reboot.
+ERROR_CODE_KEYS = [code for code in get_codes_description() if code]
+
+
+def _error_count_sensor(code):
+    """Build the config entry of the occurrence counter of one error code"""
+    key = f"solaris_err_count_{code.lower()}"
+    return {
+        'type': 'numeric',
+        'key': key,
+        'display_name': lambda lang, key=key: get_sensor_name(key, lang),
+        'setter': 'set_error_count_sensor',
+        'setter_args': [code],
+        'define': 'USE_SOLARIS_ERROR_STATS',
+        'field': 'SOLARIS_ERR',
+        'unit': None,
+        'icon': 'mdi:alert-circle-outline',
+        'device_class': None,
+        'state_class': STATE_CLASS_TOTAL_INCREASING,
+        'entity_category': ENTITY_CATEGORY_DIAGNOSTIC,
+        'accuracy': 0,
+    }
+
+
+SENSORS_CONFIG += [_error_count_sensor(code) for code in ERROR_CODE_KEYS]
+
+SENSORS_CONFIG += [
+    # Time since the current error appeared (0 without error)
+    {
+        'type': 'numeric',
+        'key': 'solaris_err_duration',
+        'display_name': lambda lang: get_sensor_name('solaris_err_duration', lang),
+        'setter': 'set_error_duration_sensor',
+        'define': 'USE_SOLARIS_ERROR_STATS',
+        'field': 'SOLARIS_ERR',
+        'unit': UNIT_SECOND,
+        'icon': 'mdi:timer-alert-outline',
+        'device_class': DEVICE_CLASS_DURATION,
+        'state_class': STATE_CLASS_MEASUREMENT,
+        'entity_category': ENTITY_CATEGORY_DIAGNOSTIC,
+        'accuracy': 0,
+    },
+    # Time the last error cleared (ISO 8601, requires 'time_id')
+    {
+        'type': 'text',
+        'key': 'solaris_err_last_cleared',
+        'display_name': lambda lang: get_sensor_name('solaris_err_last_cleared', lang),
+        'setter': 'set_error_last_cleared_sensor',
+        'define': 'USE_SOLARIS_ERROR_STATS',
+        'field': 'SOLARIS_ERR',
+        'icon': 'mdi:alert-remove-outline',
+        'device_class': DEVICE_CLASS_TIMESTAMP,
+        'entity_category': ENTITY_CATEGORY_DIAGNOSTIC,
+    },
+]
+
+# ============================================================================
+# HEALTH SENSORS
+# ============================================================================
+# Diagnostic sensors about the link and the component's own cost, published
+# once per health interval. The counters are kept in RAM only and start from
+# 0 after a reboot, the rate and times cover the last interval.
+UNIT_BYTES_PER_SECOND = "B/s"
+
+
+def _health_sensor(key, metric, unit, icon, state_class, accuracy, device_class=None):
+    """Build the config entry of one health metric (C++ HealthMetric)"""
+    return {
+        'type': 'numeric',
+        'key': key,
+        'display_name': lambda lang, key=key: get_sensor_name(key, lang),
+        'setter': 'set_health_sensor',
+        'setter_args': [metric],
+        'define': 'USE_SOLARIS_HEALTH',
+        'unit': unit,
+        'icon': icon,
+        'device_class': device_class,
+        'state_class': state_class,
+        'entity_category': ENTITY_CATEGORY_DIAGNOSTIC,
+        'accuracy': accuracy,
+    }
+
+
+SENSORS_CONFIG += [
+    # Valid frames since boot
+    _health_sensor('solaris_frames_ok', 'HEALTH_FRAMES_OK', None, 'mdi:check-network-outline',
+                   STATE_CLASS_TOTAL_INCREASING, 0),
+    # Lines rejected for their length since boot
+    _health_sensor('solaris_frames_rejected_length', 'HEALTH_REJECTED_LENGTH', None, 'mdi:close-network-outline',
+                   STATE_CLASS_TOTAL_INCREASING, 0),
+    # Lines rejected for missing fields since boot
+    _health_sensor('solaris_frames_rejected_incomplete', 'HEALTH_REJECTED_INCOMPLETE', None,
+                   'mdi:close-network-outline', STATE_CLASS_TOTAL_INCREASING, 0),
+    # Frames with unparsable tokens (published as 0) since boot
+    _health_sensor('solaris_frames_invalid_tokens', 'HEALTH_INVALID_TOKENS', None, 'mdi:alert-network-outline',
+                   STATE_CLASS_TOTAL_INCREASING, 0),
+    # Partial lines discarded after the line timeout since boot
+    _health_sensor('solaris_line_timeouts', 'HEALTH_LINE_TIMEOUTS', None, 'mdi:timer-sand-empty',
+                   STATE_CLASS_TOTAL_INCREASING, 0),
+    # Received UART bytes per second
+    _health_sensor('solaris_uart_rate', 'HEALTH_UART_RATE', UNIT_BYTES_PER_SECOND, 'mdi:speedometer',
+                   STATE_CLASS_MEASUREMENT, 1),
+    # Max and mean decode and handling time of a line
+    _health_sensor('solaris_line_time_max', 'HEALTH_LINE_TIME_MAX', UNIT_MICROSECOND, 'mdi:timer-outline',
+                   STATE_CLASS_MEASUREMENT, 0, DEVICE_CLASS_DURATION),
+    _health_sensor('solaris_line_time_mean', 'HEALTH_LINE_TIME_MEAN', UNIT_MICROSECOND, 'mdi:timer-outline',
+                   STATE_CLASS_MEASUREMENT, 1, DEVICE_CLASS_DURATION),
+    # Max time of one loop() call
+    _health_sensor('solaris_loop_time_max', 'HEALTH_LOOP_TIME_MAX', UNIT_MICROSECOND, 'mdi:timer-outline',
+                   STATE_CLASS_MEASUREMENT, 0, DEVICE_CLASS_DURATION),
+    # Time since the last valid frame
+    _health_sensor('solaris_last_frame_age', 'HEALTH_LAST_FRAME_AGE', UNIT_SECOND, 'mdi:timer-sand',
+                   STATE_CLASS_MEASUREMENT, 0, DEVICE_CLASS_DURATION),
+    # Cycle of the controller, from the 'Zyklus' boot line or learned from the frame intervals
+    _health_sensor('solaris_cycle', 'HEALTH_CYCLE', UNIT_SECOND, 'mdi:sync',
+                   STATE_CLASS_MEASUREMENT, 1, DEVICE_CLASS_DURATION),
+    # Cycles without a frame since boot
+    _health_sensor('solaris_frames_missed', 'HEALTH_FRAMES_MISSED', None, 'mdi:network-off-outline',
+                   STATE_CLASS_TOTAL_INCREASING, 0),
+    # Max and mean deviation of the frame intervals from the cycle
+    _health_sensor('solaris_frame_jitter_max', 'HEALTH_JITTER_MAX', UNIT_MILLISECOND, 'mdi:chart-bell-curve',
+                   STATE_CLASS_MEASUREMENT, 0, DEVICE_CLASS_DURATION),
+    _health_sensor('solaris_frame_jitter_mean', 'HEALTH_JITTER_MEAN', UNIT_MILLISECOND, 'mdi:chart-bell-curve',
+                   STATE_CLASS_MEASUREMENT, 1, DEVICE_CLASS_DURATION),
+    # Times the field sensors became unknown (no frame for stale_cycles cycles) since boot
+    _health_sensor('solaris_stale_events', 'HEALTH_STALE_EVENTS', None, 'mdi:lan-disconnect',
+                   STATE_CLASS_TOTAL_INCREASING, 0),
+]
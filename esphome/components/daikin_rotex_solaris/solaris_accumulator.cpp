@@ -0,0 +1,104 @@
+#include "solaris_accumulator.h"
+
+#ifdef USE_SOLARIS_ACCUMULATORS
+
+#include <algorithm>
+#include <cstring>
+#include "esphome/core/log.h"
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+static const char *const ACC_TAG = "daikin_rotex_solaris.accumulator";
+
+// Smallest change published again: 0.01 kWh, 0.01 h and every start, matching
+// the accuracy_decimals of the sensors
+static constexpr uint64_t PUBLISH_STEP[ACCUMULATOR_COUNT] = {
+  WMS_PER_KWH / 100, MS_PER_HOUR / 100, MS_PER_HOUR / 100, 1, 1,
+};
+
+// Convert a counter to the unit of its sensor
+static float to_sensor_unit(AccumulatorType type, uint64_t value) {
+  switch (type) {
+    case ACCUMULATOR_ENERGY:
+      return value / static_cast<double>(WMS_PER_KWH);
+    case ACCUMULATOR_P1_RUNTIME:
+    case ACCUMULATOR_P2_RUNTIME:
+      return value / static_cast<double>(MS_PER_HOUR);
+    default:
+      return value;
+  }
+}
+
+void SolarisAccumulators::setup(uint32_t hash) {
+  pref_ = global_preferences->make_preference<State>(hash, true);
+  if (pref_.load(&state_)) {
+    ESP_LOGI(ACC_TAG, "Restored counters: %.3f kWh, P1 %.2f h, P2 %.2f h, BK %u, HA %u starts",
+      to_sensor_unit(ACCUMULATOR_ENERGY, state_.values[ACCUMULATOR_ENERGY]),
+      to_sensor_unit(ACCUMULATOR_P1_RUNTIME, state_.values[ACCUMULATOR_P1_RUNTIME]),
+      to_sensor_unit(ACCUMULATOR_P2_RUNTIME, state_.values[ACCUMULATOR_P2_RUNTIME]),
+      static_cast<uint32_t>(state_.values[ACCUMULATOR_BK_STARTS]),
+      static_cast<uint32_t>(state_.values[ACCUMULATOR_HA_STARTS]));
+    saved_ = state_;
+    publish(true);
+  }
+}
+
+void SolarisAccumulators::add(const SolarisFrame &frame, uint32_t now) {
+  if (has_last_frame_) {
+    // Sample-and-hold: the previous frame is valid until this one arrived
+    uint32_t dt = std::min(now - last_frame_time_, ACCUMULATOR_MAX_GAP_MS);
+    int32_t pwr = last_frame_.values[SOLARIS_PWR];
+    if (pwr > 0) state_.values[ACCUMULATOR_ENERGY] += static_cast<uint64_t>(pwr) * dt;
+    if (last_frame_.values[SOLARIS_P1] > 0) state_.values[ACCUMULATOR_P1_RUNTIME] += dt;
+    if (last_frame_.values[SOLARIS_P2] != 0) state_.values[ACCUMULATOR_P2_RUNTIME] += dt;
+
+    // Starts are off -> on transitions, the first frame after boot has no
+    // known previous state and is never counted
+    if (last_frame_.values[SOLARIS_BK] == 0 && frame.values[SOLARIS_BK] != 0) {
+      state_.values[ACCUMULATOR_BK_STARTS]++;
+    }
+    if (last_frame_.values[SOLARIS_HA] == 0 && frame.values[SOLARIS_HA] != 0) {
+      state_.values[ACCUMULATOR_HA_STARTS]++;
+    }
+  }
+
+  last_frame_ = frame;
+  last_frame_time_ = now;
+  has_last_frame_ = true;
+}
+
+void SolarisAccumulators::publish(bool force) {
+  for (uint8_t i = 0; i < ACCUMULATOR_COUNT; i++) {
+    uint64_t value = state_.values[i];
+    if (!force && has_published_ && value - published_[i] < PUBLISH_STEP[i]) continue;
+    published_[i] = value;
+    if (sensors_[i]) sensors_[i]->publish_state(to_sensor_unit(static_cast<AccumulatorType>(i), value));
+  }
+  has_published_ = true;
+}
+
+void SolarisAccumulators::save_if_due(uint32_t now) {
+  if (now - last_save_ >= save_interval_ms_ ||
+      state_.values[ACCUMULATOR_ENERGY] - saved_.values[ACCUMULATOR_ENERGY] >= save_energy_wms_) {
+    save(now);
+  }
+}
+
+void SolarisAccumulators::save(uint32_t now) {
+  last_save_ = now;
+  if (memcmp(&state_, &saved_, sizeof(State)) == 0) return;  // Nothing new, spare the flash
+
+  if (pref_.save(&state_)) {
+    saved_ = state_;
+    ESP_LOGD(ACC_TAG, "Counters saved (%.3f kWh)",
+      to_sensor_unit(ACCUMULATOR_ENERGY, state_.values[ACCUMULATOR_ENERGY]));
+  } else {
+    ESP_LOGW(ACC_TAG, "Saving counters failed");
+  }
+}
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
+
+#endif // USE_SOLARIS_ACCUMULATORS
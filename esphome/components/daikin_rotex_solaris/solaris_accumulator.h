@@ -0,0 +1,88 @@
+#pragma once
+
+#include "esphome/core/defines.h"
+
+#ifdef USE_SOLARIS_ACCUMULATORS
+
+#include <cstdint>
+#include "esphome/core/preferences.h"
+#include "esphome/components/sensor/sensor.h"
+#include "solaris_parser.h"
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+// Counters integrated from the frames and persisted in flash
+enum AccumulatorType : uint8_t {
+  ACCUMULATOR_ENERGY = 0,       // Solar yield from PWR, in W*ms
+  ACCUMULATOR_P1_RUNTIME = 1,   // Circulation pump running (P1 > 0), in ms
+  ACCUMULATOR_P2_RUNTIME = 2,   // Booster pump running (P2 on), in ms
+  ACCUMULATOR_BK_STARTS = 3,    // Burner contact off -> on transitions
+  ACCUMULATOR_HA_STARTS = 4,    // Manual operation off -> on transitions
+  ACCUMULATOR_COUNT = 5
+};
+
+// A frame is integrated for at most this long, so a link outage does not
+// count the last power or pump state for the whole outage
+static constexpr uint32_t ACCUMULATOR_MAX_GAP_MS = 60000;
+
+// Counter units per published unit (kWh, h, starts)
+static constexpr uint64_t WMS_PER_KWH = 3600000000ULL;
+static constexpr uint64_t MS_PER_HOUR = 3600000ULL;
+
+// ============================================================================
+// ACCUMULATORS - Energy, run-hours and start counters with flash persistence
+// ============================================================================
+// Counters are exact integers in W*ms, ms and starts. Flash writes are
+// batched: the state is saved when the save interval has passed or the yield
+// grew by the significant energy step since the last save, and on shutdown.
+class SolarisAccumulators {
+  public:
+    void set_sensor(AccumulatorType type, sensor::Sensor *s) { sensors_[type] = s; }
+    sensor::Sensor *get_sensor(AccumulatorType type) const { return sensors_[type]; }
+    void set_save_interval(uint32_t interval_ms) { save_interval_ms_ = interval_ms; }
+    void set_save_energy(float energy_kwh) { save_energy_wms_ = energy_kwh * WMS_PER_KWH; }
+    uint32_t get_save_interval() const { return save_interval_ms_; }
+    float get_save_energy() const { return save_energy_wms_ / static_cast<float>(WMS_PER_KWH); }
+
+    // Restore the counters from flash and publish them
+    void setup(uint32_t hash);
+
+    // Integrate the previous frame up to now and count the starts of this one
+    void add(const SolarisFrame &frame, uint32_t now);
+
+    // Publish counters that changed by at least one display step (or all if forced)
+    void publish(bool force);
+
+    // Write the counters to flash if the save interval or energy step is reached
+    void save_if_due(uint32_t now);
+
+    // Write the counters to flash if they changed since the last save
+    void save(uint32_t now);
+
+  protected:
+    struct State {
+      uint64_t values[ACCUMULATOR_COUNT];
+    };
+
+    ESPPreferenceObject pref_;
+    sensor::Sensor *sensors_[ACCUMULATOR_COUNT]{};
+
+    State state_{};                  // Current counters
+    State saved_{};                  // Counters of the last flash write
+    uint64_t published_[ACCUMULATOR_COUNT]{};  // Counters at the last publish
+    bool has_published_{false};
+
+    SolarisFrame last_frame_{};      // Previous frame, held until the next one
+    uint32_t last_frame_time_{0};
+    bool has_last_frame_{false};
+
+    uint32_t save_interval_ms_{900000};
+    uint64_t save_energy_wms_{WMS_PER_KWH / 2};
+    uint32_t last_save_{0};
+};
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
+
+#endif // USE_SOLARIS_ACCUMULATORS
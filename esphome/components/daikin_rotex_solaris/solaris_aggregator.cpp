@@ -0,0 +1,71 @@
+#include "solaris_aggregator.h"
+
+#ifdef USE_SOLARIS_AGGREGATES
+
+#include <algorithm>
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+// Convert a fixed-point frame value to the unit of the published sensor
+static float to_sensor_unit(SolarisFields field, double value) {
+  switch (field) {
+    case SOLARIS_DF:
+      return value / DF_SCALE;   // 1/100 l/min -> l/min
+    case SOLARIS_PWR:
+      return value / 1000.0;     // W -> kW
+    default:
+      return value;
+  }
+}
+
+void FieldAggregator::integrate_(uint32_t now) {
+  if (!has_last_) return;
+  // Offsets relative to the last frame, both capped at the max hold time
+  uint32_t until = std::min(now - last_frame_time_, AGGREGATE_MAX_HOLD_MS);
+  uint32_t from = std::min(last_time_ - last_frame_time_, AGGREGATE_MAX_HOLD_MS);
+  weighted_sum_ += static_cast<int64_t>(last_value_) * (until - from);
+  weighted_ms_ += until - from;
+  last_time_ = now;
+}
+
+void FieldAggregator::add(int32_t value, uint32_t now) {
+  if (count_ == 0 || value < min_) min_ = value;
+  if (count_ == 0 || value > max_) max_ = value;
+  sum_ += value;
+  count_++;
+
+  integrate_(now);
+  last_value_ = value;
+  last_time_ = now;
+  last_frame_time_ = now;
+  has_last_ = true;
+}
+
+void FieldAggregator::publish_window(uint32_t now) {
+  // The last value keeps counting until the end of the window
+  integrate_(now);
+
+  // No frame in this window - keep the previous statistics
+  if (count_ > 0) {
+    if (sensors_[AGGREGATE_MIN]) sensors_[AGGREGATE_MIN]->publish_state(to_sensor_unit(field_, min_));
+    if (sensors_[AGGREGATE_MAX]) sensors_[AGGREGATE_MAX]->publish_state(to_sensor_unit(field_, max_));
+    if (sensors_[AGGREGATE_MEAN]) {
+      sensors_[AGGREGATE_MEAN]->publish_state(to_sensor_unit(field_, static_cast<double>(sum_) / count_));
+    }
+  }
+  if (sensors_[AGGREGATE_TIME_WEIGHTED_MEAN] && weighted_ms_ > 0) {
+    sensors_[AGGREGATE_TIME_WEIGHTED_MEAN]->publish_state(
+      to_sensor_unit(field_, static_cast<double>(weighted_sum_) / weighted_ms_));
+  }
+
+  count_ = 0;
+  sum_ = 0;
+  weighted_sum_ = 0;
+  weighted_ms_ = 0;
+}
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
+
+#endif // USE_SOLARIS_AGGREGATES
@@ -0,0 +1,68 @@
+#pragma once
+
+#include "esphome/core/defines.h"
+
+#ifdef USE_SOLARIS_AGGREGATES
+
+#include <cstdint>
+#include "esphome/components/sensor/sensor.h"
+#include "solaris_parser.h"
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+// Statistics published once per aggregation window
+enum AggregateStat : uint8_t {
+  AGGREGATE_MIN = 0,
+  AGGREGATE_MAX = 1,
+  AGGREGATE_MEAN = 2,
+  AGGREGATE_TIME_WEIGHTED_MEAN = 3,  // Sample-and-hold integral divided by covered time
+  AGGREGATE_STAT_COUNT = 4
+};
+
+// A frame value is held at most this long for the time-weighted mean, so a
+// link outage does not stretch a stale value over the whole window
+static constexpr uint32_t AGGREGATE_MAX_HOLD_MS = 60000;
+
+// ============================================================================
+// FIELD AGGREGATOR - Rolling statistics of one field for the current window
+// ============================================================================
+// Works on the exact fixed-point frame values; conversion to the published
+// unit happens once per window when the statistics are published.
+class FieldAggregator {
+  public:
+    explicit FieldAggregator(SolarisFields field) : field_(field) {}
+
+    SolarisFields get_field() const { return field_; }
+    void set_sensor(AggregateStat stat, sensor::Sensor *s) { sensors_[stat] = s; }
+    sensor::Sensor *get_sensor(AggregateStat stat) const { return sensors_[stat]; }
+
+    // Add the value of a parsed frame received at now (millis)
+    void add(int32_t value, uint32_t now);
+
+    // Publish the statistics of the finished window and start the next one
+    void publish_window(uint32_t now);
+
+  protected:
+    // Integrate the held value up to now for the time-weighted mean
+    void integrate_(uint32_t now);
+
+    SolarisFields field_;
+    sensor::Sensor *sensors_[AGGREGATE_STAT_COUNT]{};
+
+    int32_t min_{0};
+    int32_t max_{0};
+    int64_t sum_{0};             // Sum of all values in the window
+    uint32_t count_{0};          // Number of frames in the window
+    int64_t weighted_sum_{0};    // Sum of value * held milliseconds
+    uint32_t weighted_ms_{0};    // Milliseconds covered by weighted_sum_
+    int32_t last_value_{0};      // Value of the last frame
+    uint32_t last_frame_time_{0};  // Arrival of the last frame
+    uint32_t last_time_{0};      // End of the already integrated period
+    bool has_last_{false};
+};
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
+
+#endif // USE_SOLARIS_AGGREGATES
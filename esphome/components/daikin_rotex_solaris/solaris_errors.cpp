@@ -0,0 +1,99 @@
+#include "solaris_errors.h"
+#include "esphome/core/log.h"
+// solaris_error_codes_<languages>.h, generated into the build directory by __init__.py
+#include SOLARIS_ERROR_CODES_HEADER
+#include <cstdio>
+#include <cstring>
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+bool SolarisErrorState::update(char code, uint32_t now) {
+  if (text_ != nullptr && code == code_) return false;
+
+  // ========================================================================
+  // TRANSITION - Log the cleared error and look up the new description once
+  // ========================================================================
+  if (code_ != '\0' && code == '\0') {
+    ESP_LOGI(tag_, "Solaris Error: Code %c cleared after %us", code_, (now - since_) / 1000);
+#ifdef USE_SOLARIS_ERROR_STATS
+    cleared_at_ = now;
+    cleared_pending_ = true;
+#endif
+  }
+
+  const SolarisErrorCodes *codes = ERROR_CODE_LANGUAGES[language_];
+  size_t index = error_code_index(code);
+  if (index != UNKNOWN_ERROR_INDEX) {
+    text_ = codes[index].description;
+    if (code != '\0') {
+      ESP_LOGE(tag_, "Solaris Error: Code %c; Description: %s", code, text_);
+    }
+  } else {
+    // Unknown error code - We do not have concrete error message. Keep the
+    // actual code in the text for logging and troubleshooting.
+    snprintf(unknown_text_, sizeof(unknown_text_), "%s ('%c')", codes[UNKNOWN_ERROR_INDEX].description, code);
+    text_ = unknown_text_;
+    ESP_LOGE(tag_, "Unknown error code: %c", code);
+  }
+
+  code_ = code;
+  since_ = now;
+
+#ifdef USE_SOLARIS_ERROR_STATS
+  // An error present in the first frame also counts as occurrence
+  if (code != '\0') {
+    for (auto &counter : counters_) {
+      if (counter.index == index) {
+        counter.count++;
+        counter.changed = true;
+      }
+    }
+  }
+  duration_changed_ = true;
+#endif
+  return true;
+}
+
+#ifdef USE_SOLARIS_ERROR_STATS
+void SolarisErrorState::set_count_sensor(const char *code, sensor::Sensor *s) {
+  // Same keys as the translations: one character or "unknown"
+  size_t index = strcmp(code, "unknown") == 0 ? UNKNOWN_ERROR_INDEX : error_code_index(code[0]);
+  counters_.push_back(Counter{index, 0, true, s});
+}
+
+void SolarisErrorState::publish(uint32_t now, bool force) {
+  for (auto &counter : counters_) {
+    if (counter.changed || force) {
+      counter.changed = false;
+      counter.sensor->publish_state(counter.count);
+    }
+  }
+
+  if (duration_sensor_ != nullptr &&
+      (duration_changed_ || force || (code_ != '\0' && now - last_duration_publish_ >= ERROR_DURATION_INTERVAL_MS))) {
+    duration_changed_ = false;
+    last_duration_publish_ = now;
+    duration_sensor_->publish_state(get_duration(now) / 1000);
+  }
+
+#ifdef USE_TIME
+  // The clock may not be synchronized yet when the error clears, the time is
+  // then derived from the uptime as soon as it is
+  if (last_cleared_sensor_ != nullptr && cleared_pending_ && time_ != nullptr) {
+    ESPTime time_now = time_->now();
+    if (time_now.is_valid()) {
+      cleared_pending_ = false;
+      time_t cleared = time_now.timestamp - static_cast<time_t>((now - cleared_at_) / 1000);
+      // ISO 8601 as expected by Home Assistant for timestamp text sensors
+      char buffer[32];
+      ESPTime::from_epoch_local(cleared).strftime(buffer, sizeof(buffer), "%Y-%m-%dT%H:%M:%S%z");
+      last_cleared_sensor_->publish_state(buffer);
+    }
+  }
+#endif
+}
+#endif
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
@@ -0,0 +1,102 @@
+#pragma once
+
+#include "esphome/core/defines.h"
+
+#include <cstddef>
+#include <cstdint>
+
+#ifdef USE_SOLARIS_ERROR_STATS
+#include <vector>
+#include "esphome/components/sensor/sensor.h"
+#include "esphome/components/text_sensor/text_sensor.h"
+#ifdef USE_TIME
+#include "esphome/components/time/real_time_clock.h"
+#endif
+#endif
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+static const char *const ERRORS_TAG = "daikin_rotex_solaris.errors";
+
+// ============================================================================
+// ERROR MESSAGE BUFFER
+// ============================================================================
+// Unknown error formatting: "<unknown description> ('<code>')", kept per
+// instance, so sized for the translations instead of a generous 256 bytes
+static constexpr uint16_t ERROR_MSG_BUFFER_SIZE = 48;
+
+// Republish the duration of an active error this often
+static constexpr uint32_t ERROR_DURATION_INTERVAL_MS = 60000;
+
+// ============================================================================
+// ERROR STATE - Transitions of the ERR token instead of per-frame state
+// ============================================================================
+// The description is looked up (and formatted for unknown codes) once per
+// transition, entering and clearing an error is logged once. With error
+// statistics enabled the occurrences per code, the duration of the active
+// error and the time the last error cleared are published as well.
+class SolarisErrorState {
+  public:
+    // Account the error code of a frame received at now, returns true on the
+    // first frame and whenever the code changed
+    bool update(char code, uint32_t now);
+
+    // Index into ERROR_CODE_LANGUAGES of the generated header (several
+    // instances may use different languages), 0 by default
+    void set_language(uint8_t language) { language_ = language; }
+    // Log tag of the owning instance
+    void set_log_tag(const char *tag) { tag_ = tag; }
+
+    char get_code() const { return code_; }
+    // Description of the current error code in the configured language
+    const char *get_text() const { return text_; }
+    // Time (ms) since the current error appeared, 0 without error
+    uint32_t get_duration(uint32_t now) const { return code_ != '\0' ? now - since_ : 0; }
+
+#ifdef USE_SOLARIS_ERROR_STATS
+    // Occurrence counter of one code, "unknown" counts all codes without description
+    void set_count_sensor(const char *code, sensor::Sensor *s);
+    void set_duration_sensor(sensor::Sensor *s) { duration_sensor_ = s; }
+    void set_last_cleared_sensor(text_sensor::TextSensor *s) { last_cleared_sensor_ = s; }
+#ifdef USE_TIME
+    void set_time(time::RealTimeClock *time) { time_ = time; }
+#endif
+
+    // Publish changed counters, the duration (every ERROR_DURATION_INTERVAL_MS
+    // while an error is active) and the last-cleared time once it is known
+    void publish(uint32_t now, bool force);
+#endif
+
+  protected:
+    const char *tag_{ERRORS_TAG};
+    uint8_t language_{0};          // Index into ERROR_CODE_LANGUAGES
+    char code_{'\0'};              // Error code of the last frame
+    const char *text_{nullptr};    // Its description (nullptr before the first frame)
+    uint32_t since_{0};            // Time the current error appeared
+    char unknown_text_[ERROR_MSG_BUFFER_SIZE];  // Description of the current unknown code
+
+#ifdef USE_SOLARIS_ERROR_STATS
+    struct Counter {
+      size_t index;            // ERROR_CODES index
+      uint32_t count;          // Occurrences since boot
+      bool changed;            // Not published yet
+      sensor::Sensor *sensor;
+    };
+    std::vector<Counter> counters_;
+
+    sensor::Sensor *duration_sensor_{nullptr};
+    uint32_t last_duration_publish_{0};
+    bool duration_changed_{false};  // Error appeared or cleared since the last publish
+
+    text_sensor::TextSensor *last_cleared_sensor_{nullptr};
+    uint32_t cleared_at_{0};         // Time the last error cleared
+    bool cleared_pending_{false};    // Cleared, but not yet published
+#ifdef USE_TIME
+    time::RealTimeClock *time_{nullptr};
+#endif
+#endif
+};
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
@@ -0,0 +1,72 @@
+#include "solaris_health.h"
+
+#ifdef USE_SOLARIS_HEALTH
+
+#include <cmath>
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+void SolarisHealth::add_line(SolarisParseResult result, const SolarisParser &parser, uint32_t now) {
+  switch (result) {
+    case SolarisParseResult::FRAME:
+      frames_ok_++;
+      if (parser.frame().invalid_mask != 0) invalid_tokens_++;
+      last_frame_time_ = now;
+      has_frame_ = true;
+      break;
+    case SolarisParseResult::INVALID_LENGTH:
+      rejected_length_++;
+      break;
+    case SolarisParseResult::INCOMPLETE:
+      rejected_incomplete_++;
+      break;
+    default:
+      // Boot/info lines are expected after a controller restart
+      break;
+  }
+}
+
+void SolarisHealth::publish_if_due(uint32_t now) {
+  uint32_t elapsed = now - interval_start_;
+  if (elapsed < interval_ms_) return;
+  interval_start_ = now;
+
+  float values[HEALTH_METRIC_COUNT];
+  values[HEALTH_FRAMES_OK] = frames_ok_;
+  values[HEALTH_REJECTED_LENGTH] = rejected_length_;
+  values[HEALTH_REJECTED_INCOMPLETE] = rejected_incomplete_;
+  values[HEALTH_INVALID_TOKENS] = invalid_tokens_;
+  values[HEALTH_LINE_TIMEOUTS] = line_timeouts_;
+  values[HEALTH_UART_RATE] = bytes_ * 1000.0f / elapsed;
+  values[HEALTH_LINE_TIME_MAX] = line_time_max_;
+  // No line in this interval - the mean is unknown
+  values[HEALTH_LINE_TIME_MEAN] = line_time_count_ > 0 ? static_cast<float>(line_time_sum_) / line_time_count_ : NAN;
+  values[HEALTH_LOOP_TIME_MAX] = loop_time_max_;
+  // No valid frame since boot - the age is unknown
+  values[HEALTH_LAST_FRAME_AGE] = has_frame_ ? (now - last_frame_time_) / 1000.0f : NAN;
+  values[HEALTH_CYCLE] = cycle_ms_ > 0 ? cycle_ms_ / 1000.0f : NAN;
+  values[HEALTH_FRAMES_MISSED] = frames_missed_;
+  values[HEALTH_STALE_EVENTS] = stale_events_;
+  // No frame interval in this interval - the jitter is unknown
+  values[HEALTH_JITTER_MAX] = jitter_count_ > 0 ? jitter_max_ : NAN;
+  values[HEALTH_JITTER_MEAN] = jitter_count_ > 0 ? static_cast<float>(jitter_sum_) / jitter_count_ : NAN;
+
+  for (uint8_t i = 0; i < HEALTH_METRIC_COUNT; i++) {
+    if (sensors_[i]) sensors_[i]->publish_state(values[i]);
+  }
+
+  bytes_ = 0;
+  line_time_sum_ = 0;
+  line_time_count_ = 0;
+  line_time_max_ = 0;
+  loop_time_max_ = 0;
+  jitter_sum_ = 0;
+  jitter_count_ = 0;
+  jitter_max_ = 0;
+}
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
+
+#endif // USE_SOLARIS_HEALTH
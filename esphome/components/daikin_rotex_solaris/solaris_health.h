@@ -0,0 +1,106 @@
+#pragma once
+
+#include "esphome/core/defines.h"
+
+#ifdef USE_SOLARIS_HEALTH
+
+#include <cstdint>
+#include "esphome/components/sensor/sensor.h"
+#include "solaris_parser.h"
+#include "solaris_watchdog.h"
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+// Counters and gauges about the link and the component's own cost
+enum HealthMetric : uint8_t {
+  HEALTH_FRAMES_OK = 0,           // Valid frames since boot
+  HEALTH_REJECTED_LENGTH = 1,     // Lines rejected for their length since boot
+  HEALTH_REJECTED_INCOMPLETE = 2, // Lines rejected for missing fields since boot
+  HEALTH_INVALID_TOKENS = 3,      // Frames with unparsable tokens (published as 0) since boot
+  HEALTH_LINE_TIMEOUTS = 4,       // Partial lines discarded after half a cycle without data since boot
+  HEALTH_UART_RATE = 5,           // Received bytes per second over the interval
+  HEALTH_LINE_TIME_MAX = 6,       // Max decode and handling time of a line in the interval, in us
+  HEALTH_LINE_TIME_MEAN = 7,      // Mean decode and handling time of a line in the interval, in us
+  HEALTH_LOOP_TIME_MAX = 8,       // Max loop() time in the interval, in us
+  HEALTH_LAST_FRAME_AGE = 9,      // Time since the last valid frame, in s
+  HEALTH_CYCLE = 10,              // Cycle of the controller (boot line or learned), in s
+  HEALTH_FRAMES_MISSED = 11,      // Cycles without a frame since boot
+  HEALTH_JITTER_MAX = 12,         // Max deviation of a frame interval from the cycle in the interval, in ms
+  HEALTH_JITTER_MEAN = 13,        // Mean deviation of a frame interval from the cycle in the interval, in ms
+  HEALTH_STALE_EVENTS = 14,       // Times the values became stale (no frames) since boot
+  HEALTH_METRIC_COUNT = 15
+};
+
+// ============================================================================
+// HEALTH - Parser and loop instrumentation published as diagnostic sensors
+// ============================================================================
+// Recording is a few integer operations per line or loop() call, the sensors
+// are published once per interval only. Counters are cumulative since boot,
+// the gauges (rate, max and mean times) cover the last interval.
+class SolarisHealth {
+  public:
+    void set_sensor(HealthMetric metric, sensor::Sensor *s) { sensors_[metric] = s; }
+    sensor::Sensor *get_sensor(HealthMetric metric) const { return sensors_[metric]; }
+    void set_interval(uint32_t interval_ms) { interval_ms_ = interval_ms; }
+    uint32_t get_interval() const { return interval_ms_; }
+
+    // Count the outcome of a completed line
+    void add_line(SolarisParseResult result, const SolarisParser &parser, uint32_t now);
+    // Time spent decoding and handling one line
+    void add_line_time(uint32_t us) {
+      line_time_sum_ += us;
+      line_time_count_++;
+      if (us > line_time_max_) line_time_max_ = us;
+    }
+    void add_bytes(size_t bytes) { bytes_ += bytes; }
+    void add_line_timeout() { line_timeouts_++; }
+    void add_loop_time(uint32_t us) {
+      if (us > loop_time_max_) loop_time_max_ = us;
+    }
+    // Timing of a frame and the watchdog's cycle at that time
+    void add_frame_timing(const FrameTiming &timing, uint32_t cycle_ms) {
+      cycle_ms_ = cycle_ms;
+      frames_missed_ += timing.missed;
+      if (!timing.measured) return;
+      jitter_sum_ += timing.jitter;
+      jitter_count_++;
+      if (timing.jitter > jitter_max_) jitter_max_ = timing.jitter;
+    }
+    void add_stale_event() { stale_events_++; }
+
+    // Publish all sensors once per interval and start the next interval
+    void publish_if_due(uint32_t now);
+
+  protected:
+    sensor::Sensor *sensors_[HEALTH_METRIC_COUNT]{};
+    uint32_t interval_ms_{60000};
+    uint32_t interval_start_{0};
+
+    // Cumulative counters
+    uint32_t frames_ok_{0};
+    uint32_t rejected_length_{0};
+    uint32_t rejected_incomplete_{0};
+    uint32_t invalid_tokens_{0};
+    uint32_t line_timeouts_{0};
+    uint32_t last_frame_time_{0};
+    bool has_frame_{false};
+    uint32_t cycle_ms_{0};
+    uint32_t frames_missed_{0};
+    uint32_t stale_events_{0};
+
+    // Gauges of the current interval
+    uint32_t bytes_{0};
+    uint64_t line_time_sum_{0};
+    uint32_t line_time_count_{0};
+    uint32_t line_time_max_{0};
+    uint32_t loop_time_max_{0};
+    uint64_t jitter_sum_{0};
+    uint32_t jitter_count_{0};
+    uint32_t jitter_max_{0};
+};
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
+
+#endif // USE_SOLARIS_HEALTH
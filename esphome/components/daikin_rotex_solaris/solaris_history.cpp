@@ -0,0 +1,301 @@
+#include "solaris_history.h"
+
+#ifdef USE_SOLARIS_HISTORY
+
+#include <algorithm>
+#include <cinttypes>
+#include <cstring>
+#include "esphome/core/log.h"
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+static const char *const HISTORY_TAG = "daikin_rotex_solaris.history";
+
+// Block header: used bytes of the block, header included
+static constexpr size_t BLOCK_HEADER_SIZE = 2;
+
+// ============================================================================
+// VARINT HELPERS - LEB128 with zigzag mapping for signed values
+// ============================================================================
+static size_t put_varint(uint8_t *out, uint32_t value) {
+  size_t len = 0;
+  while (value >= 0x80) {
+    out[len++] = static_cast<uint8_t>(value) | 0x80;
+    value >>= 7;
+  }
+  out[len++] = static_cast<uint8_t>(value);
+  return len;
+}
+
+static size_t put_zigzag(uint8_t *out, int32_t value) {
+  uint32_t u = static_cast<uint32_t>(value);
+  return put_varint(out, (u << 1) ^ (value < 0 ? UINT32_MAX : 0));
+}
+
+// Reads a varint at pos, returns false if it runs past len
+static bool get_varint(const uint8_t *data, size_t len, size_t &pos, uint32_t &value) {
+  value = 0;
+  for (uint8_t shift = 0; shift < 35; shift += 7) {
+    if (pos >= len) return false;
+    uint8_t b = data[pos++];
+    value |= static_cast<uint32_t>(b & 0x7F) << shift;
+    if (!(b & 0x80)) return true;
+  }
+  return false;
+}
+
+static bool get_zigzag(const uint8_t *data, size_t len, size_t &pos, int32_t &value) {
+  uint32_t u;
+  if (!get_varint(data, len, pos, u)) return false;
+  value = static_cast<int32_t>((u >> 1) ^ (0u - (u & 1)));
+  return true;
+}
+
+// ============================================================================
+// RING BUFFER
+// ============================================================================
+bool SolarisHistory::allocate() {
+  num_blocks_ = size_ / HISTORY_BLOCK_SIZE;
+  if (num_blocks_ < HISTORY_MIN_BLOCKS) num_blocks_ = HISTORY_MIN_BLOCKS;
+
+  // PSRAM if requested and present, internal RAM otherwise
+  RAMAllocator<uint8_t> allocator(psram_ ? RAMAllocator<uint8_t>::ALLOC_EXTERNAL | RAMAllocator<uint8_t>::ALLOC_INTERNAL
+                                         : RAMAllocator<uint8_t>::ALLOC_INTERNAL);
+  data_ = allocator.allocate(num_blocks_ * HISTORY_BLOCK_SIZE);
+  if (data_ == nullptr) {
+    ESP_LOGE(HISTORY_TAG, "Could not allocate %u bytes for the frame history",
+      static_cast<unsigned>(num_blocks_ * HISTORY_BLOCK_SIZE));
+    num_blocks_ = 0;
+    return false;
+  }
+
+  // Block 0 is the first head block
+  data_[0] = BLOCK_HEADER_SIZE;
+  data_[1] = 0;
+  return true;
+}
+
+size_t SolarisHistory::encode_(const SolarisFrame &frame, uint32_t time_ds, bool key_frame, uint8_t *out) const {
+  const int32_t *values = frame.values;
+  uint8_t flags = (values[SOLARIS_HA] != 0 ? HISTORY_FLAG_HA : 0) |
+    (values[SOLARIS_BK] != 0 ? HISTORY_FLAG_BK : 0) | (values[SOLARIS_P2] != 0 ? HISTORY_FLAG_P2 : 0);
+
+  size_t len = 0;
+  if (key_frame) {
+    out[len++] = flags | HISTORY_KEY_FRAME;
+    len += put_varint(out + len, time_ds);
+    for (SolarisFields field : HISTORY_VALUE_FIELDS) {
+      len += put_zigzag(out + len, values[field]);
+    }
+    return len;
+  }
+
+  out[len++] = flags;
+  len += put_varint(out + len, time_ds - last_time_ds_);
+  uint8_t &mask = out[len++];
+  mask = 0;
+  for (uint8_t i = 0; i < HISTORY_VALUE_COUNT; i++) {
+    SolarisFields field = HISTORY_VALUE_FIELDS[i];
+    if (values[field] == last_frame_.values[field]) continue;
+    mask |= 1u << i;
+    // Wrapping difference, decoded back with the same wrap
+    len += put_zigzag(out + len, static_cast<int32_t>(
+      static_cast<uint32_t>(values[field]) - static_cast<uint32_t>(last_frame_.values[field])));
+  }
+  return len;
+}
+
+void SolarisHistory::next_block_() {
+  head_seq_++;
+  if (head_seq_ - tail_seq_ >= num_blocks_) {
+    // Ring full - the oldest block makes room, count the frames it held
+    uint8_t *tail = data_ + (tail_seq_ % num_blocks_) * HISTORY_BLOCK_SIZE;
+    size_t used = tail[0] | (tail[1] << 8);
+    dropped_frames_ += decode_block(tail + BLOCK_HEADER_SIZE, used - BLOCK_HEADER_SIZE, nullptr);
+    tail_seq_++;
+  }
+  uint8_t *head = data_ + (head_seq_ % num_blocks_) * HISTORY_BLOCK_SIZE;
+  head[0] = BLOCK_HEADER_SIZE;
+  head[1] = 0;
+}
+
+void SolarisHistory::add(const SolarisFrame &frame, uint32_t now) {
+  if (data_ == nullptr) return;
+
+  uint8_t record[HISTORY_MAX_RECORD_SIZE];
+  // The clock is read by export_to() on the web server task as well
+  LockGuard guard(lock_);
+  uptime_ms_ += now - last_millis_;
+  last_millis_ = now;
+  uint32_t time_ds = uptime_ms_ / 100;
+
+  uint8_t *head = data_ + (head_seq_ % num_blocks_) * HISTORY_BLOCK_SIZE;
+  size_t used = head[0] | (head[1] << 8);
+
+  // Every block starts with a key frame
+  size_t len = encode_(frame, time_ds, used == BLOCK_HEADER_SIZE || !has_last_, record);
+  if (used + len > HISTORY_BLOCK_SIZE) {
+    next_block_();
+    head = data_ + (head_seq_ % num_blocks_) * HISTORY_BLOCK_SIZE;
+    used = BLOCK_HEADER_SIZE;
+    len = encode_(frame, time_ds, true, record);
+  }
+
+  memcpy(head + used, record, len);
+  used += len;
+  head[0] = used & 0xFF;
+  head[1] = used >> 8;
+
+  last_frame_ = frame;
+  last_time_ds_ = time_ds;
+  has_last_ = true;
+  frame_count_++;
+}
+
+size_t SolarisHistory::copy_block_(uint32_t seq, uint8_t *dest) {
+  LockGuard guard(lock_);
+  if (seq - tail_seq_ > head_seq_ - tail_seq_) return 0;  // Dropped or not written yet
+  const uint8_t *block = data_ + (seq % num_blocks_) * HISTORY_BLOCK_SIZE;
+  size_t used = block[0] | (block[1] << 8);
+  memcpy(dest, block, used);
+  return used;
+}
+
+size_t SolarisHistory::decode_block(const uint8_t *data, size_t len,
+  const std::function<void(uint32_t, const SolarisFrame &)> &frame) {
+  SolarisFrame current{};
+  uint32_t time_ds = 0;
+  size_t pos = 0, records = 0;
+
+  while (pos < len) {
+    uint8_t flags = data[pos++];
+    uint32_t time;
+    if (!get_varint(data, len, pos, time)) break;
+    current.values[SOLARIS_HA] = (flags & HISTORY_FLAG_HA) ? 1 : 0;
+    current.values[SOLARIS_BK] = (flags & HISTORY_FLAG_BK) ? 1 : 0;
+    current.values[SOLARIS_P2] = (flags & HISTORY_FLAG_P2) ? 1 : 0;
+
+    bool ok = true;
+    if (flags & HISTORY_KEY_FRAME) {
+      time_ds = time;
+      for (SolarisFields field : HISTORY_VALUE_FIELDS) {
+        ok = ok && get_zigzag(data, len, pos, current.values[field]);
+      }
+    } else {
+      if (records == 0 || pos >= len) break;  // A block always starts with a key frame
+      time_ds += time;
+      uint8_t mask = data[pos++];
+      for (uint8_t i = 0; i < HISTORY_VALUE_COUNT && ok; i++) {
+        if (!(mask & (1u << i))) continue;
+        int32_t diff;
+        ok = get_zigzag(data, len, pos, diff);
+        int32_t &value = current.values[HISTORY_VALUE_FIELDS[i]];
+        value = static_cast<int32_t>(static_cast<uint32_t>(value) + static_cast<uint32_t>(diff));
+      }
+    }
+    if (!ok) break;
+
+    records++;
+    if (frame) frame(time_ds, current);
+  }
+  return records;
+}
+
+// ============================================================================
+// EXPORT - Binary blocks or CSV rows, one block copied under the lock at a time
+// ============================================================================
+void SolarisHistory::export_to(HistoryFormat format, uint32_t now,
+  const std::function<void(const char *, size_t)> &write) {
+  uint32_t now_ds;
+  uint32_t first, last;
+  {
+    LockGuard guard(lock_);
+    now_ds = (uptime_ms_ + (now - last_millis_)) / 100;
+    first = tail_seq_;
+    last = head_seq_;
+  }
+
+  if (format == HISTORY_FORMAT_BINARY) {
+    const char header[8] = {'S', 'R', 'H', static_cast<char>(HISTORY_FORMAT_VERSION),
+      static_cast<char>(now_ds), static_cast<char>(now_ds >> 8),
+      static_cast<char>(now_ds >> 16), static_cast<char>(now_ds >> 24)};
+    write(header, sizeof(header));
+  } else {
+    static const char CSV_HEADER[] = "uptime_s,age_s,ha,bk,p1,p2,tk,tr,ts,tv,df,err,pwr\n";
+    write(CSV_HEADER, sizeof(CSV_HEADER) - 1);
+  }
+
+  uint8_t block[HISTORY_BLOCK_SIZE];
+  char rows[512];
+  size_t rows_len = 0;
+  for (uint32_t seq = first; seq - first <= last - first; seq++) {
+    // Blocks dropped while the download runs are skipped
+    size_t used = copy_block_(seq, block);
+    if (used <= BLOCK_HEADER_SIZE) continue;
+
+    if (format == HISTORY_FORMAT_BINARY) {
+      write(reinterpret_cast<const char *>(block), used);
+      continue;
+    }
+
+    decode_block(block + BLOCK_HEADER_SIZE, used - BLOCK_HEADER_SIZE, [&](uint32_t time_ds, const SolarisFrame &f) {
+      if (rows_len > sizeof(rows) - 128) {
+        write(rows, rows_len);
+        rows_len = 0;
+      }
+      char err[2] = {f.error_code(), '\0'};
+      int n = snprintf(rows + rows_len, sizeof(rows) - rows_len,
+        "%" PRIu32 ".%" PRIu32 ",%" PRIu32 ".%" PRIu32 ",%" PRId32 ",%" PRId32 ",%" PRId32 ",%" PRId32
+        ",%" PRId32 ",%" PRId32 ",%" PRId32 ",%" PRId32 ",%.2f,%s,%" PRId32 "\n",
+        time_ds / 10, time_ds % 10, (now_ds - time_ds) / 10, (now_ds - time_ds) % 10,
+        f.values[SOLARIS_HA], f.values[SOLARIS_BK], f.values[SOLARIS_P1], f.values[SOLARIS_P2],
+        f.values[SOLARIS_TK], f.values[SOLARIS_TR], f.values[SOLARIS_TS], f.values[SOLARIS_TV],
+        f.df(), err, f.values[SOLARIS_PWR]);
+      if (n > 0) rows_len += std::min<size_t>(n, sizeof(rows) - rows_len - 1);
+    });
+  }
+  if (rows_len > 0) write(rows, rows_len);
+}
+
+#ifdef USE_ESP_IDF
+// ============================================================================
+// WEB HANDLER - Chunked download, no copy of the whole history in RAM
+// ============================================================================
+SolarisHistoryHandler::SolarisHistoryHandler(SolarisHistory *history, uint8_t instance) : history_(history) {
+  std::string base = instance == 0 ? "/solaris/" : "/solaris/" + std::to_string(instance) + "/";
+  url_binary_ = base + "history.bin";
+  url_csv_ = base + "history.csv";
+}
+
+bool SolarisHistoryHandler::canHandle(AsyncWebServerRequest *request) const {
+  if (request->method() != HTTP_GET) return false;
+  std::string url = request->url();
+  return url == url_binary_ || url == url_csv_;
+}
+
+void SolarisHistoryHandler::handleRequest(AsyncWebServerRequest *request) {
+  HistoryFormat format = request->url() == url_csv_ ? HISTORY_FORMAT_CSV : HISTORY_FORMAT_BINARY;
+  httpd_req_t *req = *request;
+  if (format == HISTORY_FORMAT_CSV) {
+    httpd_resp_set_type(req, "text/csv");
+    httpd_resp_set_hdr(req, "Content-Disposition", "attachment; filename=\"solaris-history.csv\"");
+  } else {
+    httpd_resp_set_type(req, "application/octet-stream");
+    httpd_resp_set_hdr(req, "Content-Disposition", "attachment; filename=\"solaris-history.bin\"");
+  }
+
+  bool ok = true;
+  history_->export_to(format, millis(), [req, &ok](const char *data, size_t len) {
+    if (ok && httpd_resp_send_chunk(req, data, len) != ESP_OK) ok = false;  // Client gone
+  });
+  if (ok) httpd_resp_send_chunk(req, nullptr, 0);
+  ESP_LOGD(HISTORY_TAG, "History download (%s) %s", format == HISTORY_FORMAT_CSV ? "csv" : "binary",
+    ok ? "done" : "aborted");
+}
+#endif
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
+
+#endif // USE_SOLARIS_HISTORY
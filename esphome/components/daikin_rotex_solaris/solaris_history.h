@@ -0,0 +1,145 @@
+#pragma once
+
+#include "esphome/core/defines.h"
+
+#ifdef USE_SOLARIS_HISTORY
+
+#include <cstdint>
+#include <functional>
+#include "esphome/core/helpers.h"
+#include "solaris_parser.h"
+
+#ifdef USE_ESP_IDF
+#include "esphome/components/web_server_base/web_server_base.h"
+#endif
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+// ============================================================================
+// HISTORY FORMAT
+// ============================================================================
+// The ring consists of fixed-size blocks. The oldest block is dropped as a
+// whole when a new one is needed, so every block starts with a key frame and
+// decodes on its own. Block: uint16 LE used bytes (header included), then
+// records. Record:
+//   flags    1 byte: bit0 HA, bit1 BK, bit2 P2, bit7 key frame
+//   key:     varint time (0.1 s since boot), zigzag varint absolute value of
+//            P1, TK, TR, TS, TV, DF, ERR, PWR
+//   delta:   varint time since the previous record (0.1 s), 1 byte mask of
+//            changed values (bit0 P1 .. bit7 PWR, same order as above), a
+//            zigzag varint difference per changed value
+// An unchanged frame takes 3 bytes, a typical one 4-8.
+//
+// Binary download: "SRH" + format version 1, uint32 LE time of the download
+// (0.1 s since boot), followed by the used part of every block, oldest first.
+static constexpr size_t HISTORY_BLOCK_SIZE = 256;
+static constexpr size_t HISTORY_MIN_BLOCKS = 2;
+static constexpr uint8_t HISTORY_FORMAT_VERSION = 1;
+
+// Values stored per record besides the HA/BK/P2 flags, in record order
+static constexpr uint8_t HISTORY_VALUE_COUNT = 8;
+static constexpr SolarisFields HISTORY_VALUE_FIELDS[HISTORY_VALUE_COUNT] = {
+  SOLARIS_P1, SOLARIS_TK, SOLARIS_TR, SOLARIS_TS, SOLARIS_TV, SOLARIS_DF, SOLARIS_ERR, SOLARIS_PWR,
+};
+
+// Flags byte: flag fields and the key frame marker
+static constexpr uint8_t HISTORY_FLAG_HA = 0x01;
+static constexpr uint8_t HISTORY_FLAG_BK = 0x02;
+static constexpr uint8_t HISTORY_FLAG_P2 = 0x04;
+static constexpr uint8_t HISTORY_KEY_FRAME = 0x80;
+
+// Flags + time + delta mask (non-key frames) + values, every varint at most
+// 5 bytes
+static constexpr size_t HISTORY_MAX_RECORD_SIZE = 1 + 5 + 1 + HISTORY_VALUE_COUNT * 5;
+
+// Download formats
+enum HistoryFormat : uint8_t {
+  HISTORY_FORMAT_BINARY = 0,
+  HISTORY_FORMAT_CSV = 1,
+};
+
+// ============================================================================
+// FRAME HISTORY - Delta-encoded ring buffer of timestamped frames
+// ============================================================================
+// Written from loop(), read by the web server task: block access is guarded
+// by a mutex, an export copies one block at a time and skips blocks that were
+// dropped meanwhile.
+class SolarisHistory {
+  public:
+    // Bytes requested for the ring (rounded down to whole blocks)
+    void set_size(size_t size) { size_ = size; }
+    // USE_SOLARIS_HISTORY is set for all instances, only the ones with a size
+    // (history: configured) allocate and record
+    bool is_enabled() const { return size_ > 0; }
+    void set_psram(bool psram) { psram_ = psram; }
+
+    // Allocate the ring, returns false if the memory is not available
+    bool allocate();
+
+    // Append a frame received at now (millis)
+    void add(const SolarisFrame &frame, uint32_t now);
+
+    // Stream the whole history in the given format. write() is called with
+    // pieces of at most HISTORY_BLOCK_SIZE + 2 (binary) or a few CSV rows.
+    void export_to(HistoryFormat format, uint32_t now, const std::function<void(const char *, size_t)> &write);
+
+    // Decode the records of one block, calls frame() per record with the time
+    // in 0.1 s since boot. Returns the number of decoded records.
+    static size_t decode_block(const uint8_t *data, size_t len,
+      const std::function<void(uint32_t, const SolarisFrame &)> &frame);
+
+    size_t get_capacity() const { return num_blocks_ * HISTORY_BLOCK_SIZE; }
+    uint32_t get_frame_count() const { return frame_count_; }
+    // Frames currently held in the ring
+    uint32_t get_stored_frames() const { return frame_count_ - dropped_frames_; }
+
+  protected:
+    // Encode the frame as record, key frame or delta to the last frame
+    size_t encode_(const SolarisFrame &frame, uint32_t time_ds, bool key_frame, uint8_t *out) const;
+    // Start a new block at the head, dropping the oldest one if the ring is full
+    void next_block_();
+    // Copy block seq if it is still in the ring, returns its used bytes or 0
+    size_t copy_block_(uint32_t seq, uint8_t *dest);
+
+    uint8_t *data_{nullptr};
+    size_t size_{0};
+    bool psram_{false};
+    size_t num_blocks_{0};
+
+    Mutex lock_;
+    uint32_t head_seq_{0};        // Sequence number of the block being written
+    uint32_t tail_seq_{0};        // Oldest block still in the ring
+    uint32_t frame_count_{0};     // Frames added since boot
+    uint32_t dropped_frames_{0};  // Frames dropped with their blocks
+
+    uint64_t uptime_ms_{0};       // Time since boot, safe against millis() overflow
+    uint32_t last_millis_{0};
+    SolarisFrame last_frame_{};   // Reference for the delta encoding
+    uint32_t last_time_ds_{0};
+    bool has_last_{false};
+};
+
+#ifdef USE_ESP_IDF
+// ============================================================================
+// HISTORY DOWNLOAD - /solaris/history.bin and /solaris/history.csv
+// ============================================================================
+// Further instances on the same device are served below /solaris/<instance>/
+class SolarisHistoryHandler : public AsyncWebHandler {
+  public:
+    SolarisHistoryHandler(SolarisHistory *history, uint8_t instance);
+
+    bool canHandle(AsyncWebServerRequest *request) const override;
+    void handleRequest(AsyncWebServerRequest *request) override;
+
+  protected:
+    SolarisHistory *history_;
+    std::string url_binary_;
+    std::string url_csv_;
+};
+#endif
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
+
+#endif // USE_SOLARIS_HISTORY
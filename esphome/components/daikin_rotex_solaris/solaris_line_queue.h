@@ -0,0 +1,83 @@
+#pragma once
+
+#include "esphome/core/defines.h"
+
+#ifdef USE_SOLARIS_PARSER_TASK
+
+#include <atomic>
+#include <cstdint>
+#include <memory>
+#include <new>
+#include "solaris_parser.h"
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+// One completed line as handed from the parser task to the main loop. The
+// parser is a copy taken right after the line completed, its frame(),
+// last_line_length(), last_field_count() and last_boot_cycle() describe the
+// line like the streaming parser does in the main loop.
+struct SolarisLine {
+  SolarisParseResult result{SolarisParseResult::NONE};
+  SolarisParser parser;
+  uint32_t decode_us{0};   // Decode time of the line's bytes in the parser task
+};
+
+// ============================================================================
+// LINE QUEUE - Lock-free single-producer/single-consumer ring
+// ============================================================================
+// The parser task pushes, the main loop reads front() and pops. Head and tail
+// are free-running counters, each written by one side only: the release store
+// of head publishes a slot to the consumer, the release store of tail returns
+// it to the producer. A full queue drops the new line (the main loop is
+// behind, older lines keep their order) and counts it.
+class SolarisLineQueue {
+  public:
+    // Allocate the ring, the capacity is size rounded up to a power of two
+    bool allocate(uint16_t size) {
+      uint32_t capacity = 1;
+      while (capacity < size) capacity <<= 1;
+      slots_.reset(new (std::nothrow) SolarisLine[capacity]);
+      if (!slots_) return false;
+      mask_ = capacity - 1;
+      return true;
+    }
+    // Slots of the ring, 0 until allocated
+    uint32_t get_capacity() const { return slots_ ? mask_ + 1 : 0; }
+
+    // Producer side: copy a line into the next free slot, false if full
+    bool push(const SolarisLine &line) {
+      const uint32_t head = head_.load(std::memory_order_relaxed);
+      if (head - tail_.load(std::memory_order_acquire) > mask_) {
+        dropped_.fetch_add(1, std::memory_order_relaxed);
+        return false;
+      }
+      slots_[head & mask_] = line;
+      head_.store(head + 1, std::memory_order_release);
+      return true;
+    }
+
+    // Consumer side: oldest queued line (nullptr if empty), valid until pop()
+    const SolarisLine *front() const {
+      const uint32_t tail = tail_.load(std::memory_order_relaxed);
+      if (tail == head_.load(std::memory_order_acquire)) return nullptr;
+      return &slots_[tail & mask_];
+    }
+    // Consumer side: release the line returned by front()
+    void pop() { tail_.store(tail_.load(std::memory_order_relaxed) + 1, std::memory_order_release); }
+
+    // Lines dropped because the queue was full (written by the producer)
+    uint32_t get_dropped() const { return dropped_.load(std::memory_order_relaxed); }
+
+  protected:
+    std::unique_ptr<SolarisLine[]> slots_;
+    uint32_t mask_{0};
+    std::atomic<uint32_t> head_{0};     // Next slot to write, producer only
+    std::atomic<uint32_t> tail_{0};     // Next slot to read, consumer only
+    std::atomic<uint32_t> dropped_{0};
+};
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
+
+#endif // USE_SOLARIS_PARSER_TASK
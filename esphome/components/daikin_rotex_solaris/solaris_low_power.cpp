@@ -0,0 +1,102 @@
+#include "solaris_low_power.h"
+
+#ifdef USE_SOLARIS_LOW_POWER
+
+#include "esphome/core/log.h"
+#ifdef USE_WIFI
+#include "esphome/components/wifi/wifi_component.h"
+#endif
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+static const char *const LOW_POWER_TAG = "daikin_rotex_solaris.low_power";
+
+void SolarisLowPower::add_frame(char error_code) {
+  if (has_frame_ && error_code != error_code_) flush_requested_ = true;
+  error_code_ = error_code;
+  has_frame_ = true;
+}
+
+bool SolarisLowPower::connected_() const {
+#ifdef USE_WIFI
+  return wifi::global_wifi_component->is_connected();
+#else
+  return true;
+#endif
+}
+
+void SolarisLowPower::set_radio_(bool on, uint32_t now) {
+#ifdef USE_WIFI
+  if (on) {
+    wifi::global_wifi_component->enable();
+  } else {
+    wifi::global_wifi_component->disable();
+  }
+#endif
+  state_ = on ? RADIO_CONNECTING : RADIO_OFF;
+  state_since_ = now;
+}
+
+void SolarisLowPower::flush_(SolarisUdpPush &udp) {
+  uint16_t queued = udp.get_queued();
+  if (udp.flush()) {
+    if (queued > 0) ESP_LOGD(LOW_POWER_TAG, "Sent %u queued frames", queued);
+  } else {
+    ESP_LOGW(LOW_POWER_TAG, "Flush incomplete, %u frames kept", udp.get_queued());
+    missed_flushes_++;
+  }
+  flush_requested_ = false;
+}
+
+void SolarisLowPower::loop(uint32_t now, SolarisUdpPush &udp) {
+  const bool due = flush_requested_ || now - last_flush_ >= flush_interval_ms_;
+
+  // Radio always on: only the sends are batched
+  if (!radio_off_) {
+    if (due) {
+      last_flush_ = now;
+      flush_(udp);
+    }
+    return;
+  }
+
+  switch (state_) {
+    case RADIO_OFF:
+      // Flushes are flush_interval apart from wakeup to wakeup
+      if (due) {
+        last_flush_ = now;
+        set_radio_(true, now);
+      }
+      break;
+
+    case RADIO_CONNECTING:
+      if (connected_()) {
+        flush_(udp);
+        state_ = RADIO_AWAKE;
+        state_since_ = now;
+      } else if (now - state_since_ >= LOW_POWER_CONNECT_TIMEOUT_MS) {
+        ESP_LOGW(LOW_POWER_TAG, "No Wi-Fi connection after %us, %u frames kept for the next flush",
+          LOW_POWER_CONNECT_TIMEOUT_MS / 1000, udp.get_queued());
+        missed_flushes_++;
+        flush_requested_ = false;
+        set_radio_(false, now);
+      }
+      break;
+
+    case RADIO_AWAKE:
+      // Error code changes still go out right away
+      if (flush_requested_) flush_(udp);
+      if (now - state_since_ >= awake_ms_) {
+        // Frames of the awake period, then the radio goes off until the next flush
+        flush_(udp);
+        set_radio_(false, now);
+      }
+      break;
+  }
+}
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
+
+#endif // USE_SOLARIS_LOW_POWER
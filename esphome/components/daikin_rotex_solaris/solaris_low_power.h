@@ -0,0 +1,69 @@
+#pragma once
+
+#include "esphome/core/defines.h"
+
+#ifdef USE_SOLARIS_LOW_POWER
+
+#include <cstdint>
+#include "solaris_udp.h"
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+// Time to wait for the Wi-Fi connection after enabling the radio, the queued
+// frames wait for the next flush if it does not come up
+static constexpr uint32_t LOW_POWER_CONNECT_TIMEOUT_MS = 30000;
+
+// ============================================================================
+// LOW-POWER MODE - Store-and-forward UDP push with Wi-Fi duty cycling
+// ============================================================================
+// The UART is read and every frame is parsed and queued by the UDP push with
+// the time it was received. The queue is flushed every flush_interval, and
+// right away when the controller's error code changes. With radio_off the
+// Wi-Fi is disabled between the flushes: it is enabled when a flush is due,
+// the queue is sent once connected, and the radio stays on for awake_time
+// (Home Assistant reconnect, OTA) before the frames of the awake period are
+// sent and the radio is disabled again.
+class SolarisLowPower {
+  public:
+    void set_flush_interval(uint32_t interval_ms) { flush_interval_ms_ = interval_ms; }
+    void set_radio_off(bool radio_off) { radio_off_ = radio_off; }
+    void set_awake_time(uint32_t awake_ms) { awake_ms_ = awake_ms; }
+    uint32_t get_flush_interval() const { return flush_interval_ms_; }
+    bool get_radio_off() const { return radio_off_; }
+    uint32_t get_awake_time() const { return awake_ms_; }
+    // Flushes that found the Wi-Fi down and wakeups without a connection
+    uint32_t get_missed_flushes() const { return missed_flushes_; }
+
+    // Account the error code of a queued frame, a change requests a flush
+    void add_frame(char error_code);
+
+    // Flush the queue of the UDP push and switch the radio when due
+    void loop(uint32_t now, SolarisUdpPush &udp);
+
+  protected:
+    enum RadioState : uint8_t { RADIO_CONNECTING, RADIO_AWAKE, RADIO_OFF };
+
+    // Send the queue and clear a requested flush
+    void flush_(SolarisUdpPush &udp);
+    void set_radio_(bool on, uint32_t now);
+    bool connected_() const;
+
+    uint32_t flush_interval_ms_{60000};
+    uint32_t awake_ms_{15000};
+    bool radio_off_{false};
+
+    // The radio is on after boot, the first flush follows the connection
+    RadioState state_{RADIO_CONNECTING};
+    uint32_t state_since_{0};
+    uint32_t last_flush_{0};      // Start of the last flush (wakeup with radio_off)
+    bool flush_requested_{false};
+    char error_code_{0};
+    bool has_frame_{false};
+    uint32_t missed_flushes_{0};
+};
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
+
+#endif // USE_SOLARIS_LOW_POWER
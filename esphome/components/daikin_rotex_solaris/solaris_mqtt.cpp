@@ -0,0 +1,98 @@
+#include "solaris_mqtt.h"
+
+#ifdef USE_SOLARIS_MQTT_JSON
+
+#include <cstdarg>
+#include <cstdio>
+#include "esphome/core/helpers.h"
+#include "esphome/core/log.h"
+#include "esphome/components/mqtt/mqtt_client.h"
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+static const char *const MQTT_TAG = "daikin_rotex_solaris.mqtt";
+
+// Append formatted text at pos, pos goes past size when the text did not fit
+static void append(char *out, size_t size, size_t &pos, const char *format, ...) {
+  if (pos >= size) return;
+  va_list args;
+  va_start(args, format);
+  int len = vsnprintf(out + pos, size - pos, format, args);
+  va_end(args);
+  pos = len < 0 ? size : pos + len;
+}
+
+size_t SolarisMqttJson::encode(const SolarisFrame &frame, uint32_t now, char *out, size_t size) {
+  const int32_t *values = frame.values;
+  size_t pos = 0;
+  append(out, size, pos, "{\"seq\":%lu,\"uptime\":%lu", static_cast<unsigned long>(sequence_++),
+    static_cast<unsigned long>(now));
+#ifdef USE_TIME
+  if (time_ != nullptr) {
+    ESPTime time = time_->now();
+    if (time.is_valid()) append(out, size, pos, ",\"time\":%lld", static_cast<long long>(time.timestamp));
+  }
+#endif
+  append(out, size, pos, ",\"ha\":%ld,\"bk\":%ld,\"p1\":%ld,\"p2\":%ld,\"tk\":%ld,\"tr\":%ld,\"ts\":%ld,\"tv\":%ld,\"df\":%ld",
+    static_cast<long>(values[SOLARIS_HA]), static_cast<long>(values[SOLARIS_BK]),
+    static_cast<long>(values[SOLARIS_P1]), static_cast<long>(values[SOLARIS_P2]),
+    static_cast<long>(values[SOLARIS_TK]), static_cast<long>(values[SOLARIS_TR]),
+    static_cast<long>(values[SOLARIS_TS]), static_cast<long>(values[SOLARIS_TV]),
+    static_cast<long>(values[SOLARIS_DF]));
+
+  // The error code is any single character the controller sent, escaped
+  // unless it is printable ASCII
+  uint8_t code = static_cast<uint8_t>(frame.error_code());
+  if (code == 0) {
+    append(out, size, pos, ",\"err\":\"\"");
+  } else if (code >= 0x20 && code < 0x7F && code != '"' && code != '\\') {
+    append(out, size, pos, ",\"err\":\"%c\"", code);
+  } else {
+    append(out, size, pos, ",\"err\":\"\\u%04x\"", code);
+  }
+
+  append(out, size, pos, ",\"pwr\":%ld", static_cast<long>(values[SOLARIS_PWR]));
+  if (frame.invalid_mask != 0) append(out, size, pos, ",\"invalid\":%u", static_cast<unsigned>(frame.invalid_mask));
+  append(out, size, pos, "}");
+  return pos < size ? pos : 0;
+}
+
+void SolarisMqttJson::publish(const SolarisFrame &frame, uint32_t now) {
+  if (!is_enabled()) return;
+  // A frame while disconnected is lost, the sequence numbers show the gap
+  char document[MQTT_JSON_BUFFER_SIZE];
+  size_t len = encode(frame, now, document, sizeof(document));
+  if (len > 0 && mqtt::global_mqtt_client->is_connected() &&
+      mqtt::global_mqtt_client->publish(topic_, document, len, qos_, retain_)) {
+    published_++;
+  } else {
+    failed_++;
+  }
+}
+
+void SolarisMqttJson::loop() {
+  if (!is_enabled()) return;
+  bool connected = mqtt::global_mqtt_client->is_connected();
+  if (connected && !connected_) {
+    // Announce again after every reconnect (the broker may have restarted)
+    next_discovery_ = 0;
+  }
+  connected_ = connected;
+  if (!connected || next_discovery_ >= discovery_.size()) return;
+
+  const Discovery &discovery = discovery_[next_discovery_];
+  std::string payload = discovery.payload;
+  payload += ",\"dev\":{\"ids\":[\"" + get_mac_address() + "\"]}}";
+  if (mqtt::global_mqtt_client->publish(discovery.topic, payload.data(), payload.size(), 0, true)) {
+    next_discovery_++;
+    if (next_discovery_ == discovery_.size()) {
+      ESP_LOGD(MQTT_TAG, "Published %u discovery messages", static_cast<unsigned>(discovery_.size()));
+    }
+  }
+}
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
+
+#endif // USE_SOLARIS_MQTT_JSON
@@ -0,0 +1,85 @@
+#pragma once
+
+#include "esphome/core/defines.h"
+
+#ifdef USE_SOLARIS_MQTT_JSON
+
+#include <cstdint>
+#include <string>
+#include <vector>
+#include "solaris_parser.h"
+#ifdef USE_TIME
+#include "esphome/components/time/real_time_clock.h"
+#endif
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+// Longest frame document: all values at their field limits, clock set and
+// invalid tokens reported
+static constexpr size_t MQTT_JSON_BUFFER_SIZE = 256;
+
+// ============================================================================
+// MQTT JSON - One document per frame on a single topic
+// ============================================================================
+// Replaces the per-entity MQTT messages (one per sensor and frame) by one
+// compact document with the raw frame values, see mqtt_discovery.py for the
+// format. Home Assistant discovery configs generated at build time announce
+// the field sensors with value templates; they are published retained after
+// every (re)connect, one per loop() call.
+class SolarisMqttJson {
+  public:
+    void set_topic(const std::string &topic) { topic_ = topic; }
+    void set_qos(uint8_t qos) { qos_ = qos; }
+    void set_retain(bool retain) { retain_ = retain; }
+    const std::string &get_topic() const { return topic_; }
+    // USE_SOLARIS_MQTT_JSON is set for all instances, only the ones with a
+    // topic (mqtt_json: configured) publish
+    bool is_enabled() const { return !topic_.empty(); }
+    uint32_t get_published() const { return published_; }
+    uint32_t get_failed() const { return failed_; }
+#ifdef USE_TIME
+    void set_time(time::RealTimeClock *time) { time_ = time; }
+#endif
+
+    // Discovery message, payload is a JSON object without the closing brace
+    // (the device block is appended)
+    void add_discovery(const char *topic, const char *payload) { discovery_.push_back({topic, payload}); }
+    size_t get_discovery_count() const { return discovery_.size(); }
+
+    // Write the document of the frame received at now (millis), uses and
+    // advances the sequence number. Returns the length (0 if it did not fit).
+    size_t encode(const SolarisFrame &frame, uint32_t now, char *out, size_t size);
+
+    // Publish the frame received at now (millis), skipped while disconnected
+    void publish(const SolarisFrame &frame, uint32_t now);
+
+    // Publish the discovery messages after a (re)connect
+    void loop();
+
+  protected:
+    struct Discovery {
+      const char *topic;
+      const char *payload;
+    };
+
+    std::string topic_;
+    uint8_t qos_{0};
+    bool retain_{false};
+#ifdef USE_TIME
+    time::RealTimeClock *time_{nullptr};
+#endif
+
+    std::vector<Discovery> discovery_;
+    size_t next_discovery_{0};   // Next discovery message to publish
+    bool connected_{false};      // Connection state seen by the last loop()
+
+    uint32_t sequence_{0};       // Sequence number of the next document
+    uint32_t published_{0};      // Documents published
+    uint32_t failed_{0};         // Documents the client refused or skipped while disconnected
+};
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
+
+#endif // USE_SOLARIS_MQTT_JSON
@@ -0,0 +1,95 @@
+#include "solaris_parser.h"
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+void SolarisParser::reset() {
+  length_ = 0;
+  field_ = 0;
+  invalid_mask_ = 0;
+  boot_prefix_ = 0x07;
+  cycle_s_ = 0;
+  cycle_done_ = false;
+  start_token_();
+}
+
+void SolarisParser::start_token_() {
+  acc_ = 0;
+  token_len_ = 0;
+  frac_digits_ = 0;
+  state_ = NUM_LEADING;
+  negative_ = false;
+  has_digits_ = false;
+  round_up_ = false;
+  if (field_ == SOLARIS_ERR) frame_.values[SOLARIS_ERR] = 0;  // Empty token = no error
+}
+
+void SolarisParser::match_boot_prefix_(uint8_t c) {
+  // length_ is already incremented: compare against position length_ - 1
+  const uint8_t pos = length_ - 1;
+  if ((boot_prefix_ & 0x01) && pos < sizeof(BOOT_LINE1) - 1 && c != BOOT_LINE1[pos]) boot_prefix_ &= ~0x01;
+  if ((boot_prefix_ & 0x02) && pos < sizeof(BOOT_LINE2) - 1 && c != BOOT_LINE2[pos]) boot_prefix_ &= ~0x02;
+  if ((boot_prefix_ & 0x04) && pos < sizeof(BOOT_LINE3) - 1 && c != BOOT_LINE3[pos]) boot_prefix_ &= ~0x04;
+}
+
+void SolarisParser::end_field_() {
+  // ========================================================================
+  // CONVERT ACCUMULATED DIGITS - error code is already stored as character
+  // ========================================================================
+  if (field_ != SOLARIS_ERR) {
+    int32_t value = 0;
+    if (token_len_ > MAX_TOKEN_LEN) {
+      invalid_mask_ |= 1u << field_;  // Does not fit any valid number
+    } else if (has_digits_) {
+      value = acc_;
+      if (field_ == SOLARIS_DF) {
+        // Scale to 1/DF_SCALE l/min depending on the number of decimals received
+        if (value > INT32_MAX / DF_SCALE) {
+          value = INT32_MAX;
+        } else if (frac_digits_ < 2) {
+          value *= (frac_digits_ == 1) ? 10 : 100;
+        } else if (round_up_) {
+          value++;
+        }
+      }
+      if (negative_) value = -value;
+    } else if (token_len_ > 0) {
+      invalid_mask_ |= 1u << field_;  // Token without any digit
+    }
+    frame_.values[field_] = value;
+  }
+
+  field_++;
+  start_token_();
+}
+
+SolarisParseResult SolarisParser::finish_line_() {
+  if (length_ == 0) return SolarisParseResult::NONE;  // Empty line (e.g. CRLF only)
+
+  if (field_ < TOTAL_FIELDS) end_field_();  // Last token is terminated by the newline
+
+  // ========================================================================
+  // CLASSIFY THE LINE - length first, then boot lines, then field count
+  // ========================================================================
+  SolarisParseResult result;
+  if (length_ < MIN_LINE_LEN || length_ > MAX_LINE_LEN) {
+    bool boot = ((boot_prefix_ & 0x01) && length_ >= sizeof(BOOT_LINE1) - 1) ||
+                ((boot_prefix_ & 0x02) && length_ >= sizeof(BOOT_LINE2) - 1) ||
+                ((boot_prefix_ & 0x04) && length_ >= sizeof(BOOT_LINE3) - 1);
+    result = boot ? SolarisParseResult::BOOT_LINE : SolarisParseResult::INVALID_LENGTH;
+  } else if (field_ != TOTAL_FIELDS) {
+    result = SolarisParseResult::INCOMPLETE;
+  } else {
+    result = SolarisParseResult::FRAME;
+  }
+
+  last_cycle_s_ = (result == SolarisParseResult::BOOT_LINE && boot_prefix_ == 0x02) ? cycle_s_ : 0;
+  frame_.invalid_mask = invalid_mask_;
+  last_length_ = length_;
+  last_fields_ = field_;
+  reset();
+  return result;
+}
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
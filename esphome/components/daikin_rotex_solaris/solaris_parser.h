@@ -0,0 +1,206 @@
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+// ============================================================================
+// LINE VALIDATION
+// ============================================================================
+static constexpr uint8_t MIN_LINE_LEN = 22;          // Minimum valid line length (reject shorter lines)
+static constexpr uint8_t MAX_LINE_LEN = 48;          // Maximum valid line length (reject longer lines)
+static constexpr uint8_t MAX_TOKEN_LEN = 15;         // Longer tokens cannot hold a valid number
+
+// Boot/Info lines sent by Solaris RPS on startup - the first words for each line
+static constexpr char BOOT_LINE1[] = "SOLARIS";
+static constexpr char BOOT_LINE2[] = "Zyklus";
+static constexpr char BOOT_LINE3[] = "HA;BK;P1";
+
+// ============================================================================
+// DATA STRUCTURE - Solaris RPS protocol
+// ============================================================================
+// Total number of semicolon-delimited fields in one complete data line
+static constexpr uint8_t TOTAL_FIELDS = 11;
+
+// Enum for field indices in the parsed data array
+// Protocol format: "Ha;BK;P1;P2;TK;TR;TS;TV;DF;ERR;PWR"
+enum SolarisFields : uint8_t {
+  SOLARIS_HA = 0,   // Handbetrieb (Manual Operation flag, 0/1)
+  SOLARIS_BK = 1,   // Brennerkontakt (Burner Contact flag, 0/1)
+  SOLARIS_P1 = 2,   // Umwälzpumpe (Circulation Pump speed, 0-100%)
+  SOLARIS_P2 = 3,   // Boosterpumpe (Boost Pump flag, 0/1)
+  SOLARIS_TK = 4,   // Kollektortemperatur (Collector Temperature, °C)
+  SOLARIS_TR = 5,   // Rücklauftemperatur (Return Temperature, °C)
+  SOLARIS_TS = 6,   // Speichertemperatur (Storage Temperature, °C)
+  SOLARIS_TV = 7,   // Vorlauftemperatur (Flow Temperature, °C)
+  SOLARIS_DF = 8,   // Durchfluss (Flow Rate, l/min, uses comma as decimal separator)
+  SOLARIS_ERR = 9,  // Fehlerstatus (Error code, single character: '', K, R, S, D, V, G, F, W)
+  SOLARIS_PWR = 10  // Leistung (Power output, Watts)
+};
+
+// Fixed-point scale of the flow rate: DF is stored in 1/100 l/min
+static constexpr int32_t DF_SCALE = 100;
+
+// One decoded data line. All values are exact integers in protocol units:
+// flags 0/1, percent, °C, DF in 1/DF_SCALE l/min, PWR in Watts and ERR as
+// the raw error code character ('\0' = no error).
+struct SolarisFrame {
+  int32_t values[TOTAL_FIELDS];
+  uint16_t invalid_mask;   // Bit per field: token present but not a number (published as 0)
+
+  char error_code() const { return static_cast<char>(values[SOLARIS_ERR]); }
+  float df() const { return values[SOLARIS_DF] / static_cast<float>(DF_SCALE); }
+  // Power in kW rounded to 2 decimals (10 W steps, half away from zero)
+  float pwr_kw() const {
+    int32_t tens = values[SOLARIS_PWR] / 10, rest = values[SOLARIS_PWR] % 10;
+    if (rest >= 5) tens++;
+    if (rest <= -5) tens--;
+    return tens / 100.0f;
+  }
+};
+
+// Outcome of a completed line
+enum class SolarisParseResult : uint8_t {
+  NONE = 0,         // Line not complete yet (or empty line)
+  FRAME,            // Valid data line, frame() holds the values
+  BOOT_LINE,        // Boot/info line (SOLARIS, Zyklus, HA;BK;P1 header)
+  INVALID_LENGTH,   // Line shorter than MIN_LINE_LEN or longer than MAX_LINE_LEN
+  INCOMPLETE,       // Fewer than TOTAL_FIELDS fields
+};
+
+// ============================================================================
+// STREAMING PARSER
+// ============================================================================
+// Byte-level state machine: every received byte is tokenized immediately and
+// numbers are accumulated in fixed-point, so no line buffer, second pass or
+// float conversion is needed. Semantics match the former strtol/strtof based
+// parser: leading whitespace and sign are accepted, a number ends at the first
+// non-digit, tokens without digits are flagged invalid and read as 0, fields
+// after the 11th are ignored.
+class SolarisParser {
+  public:
+    // Feed one received byte. Returns the result once a line is completed by '\n'.
+    SolarisParseResult feed(uint8_t c) {
+      if (c == '\n') return finish_line_();
+      if (c == '\r') return SolarisParseResult::NONE;  // CR is never part of a line
+
+      if (length_ < UINT8_MAX) length_++;
+      if (boot_prefix_ != 0 && length_ < sizeof(BOOT_LINE3)) match_boot_prefix_(c);
+      if (boot_prefix_ == 0x02 && length_ >= sizeof(BOOT_LINE2)) cycle_digit_(c);
+      if (field_ >= TOTAL_FIELDS) return SolarisParseResult::NONE;  // Extra fields are ignored
+
+      if (c == ';') {
+        end_field_();
+      } else {
+        token_char_(c);
+      }
+      return SolarisParseResult::NONE;
+    }
+
+    // Discard a partially received line (e.g. after a timeout)
+    void reset();
+
+    // True while a line is being received
+    bool in_line() const { return length_ > 0; }
+    // Characters received so far for the current line
+    uint8_t line_length() const { return length_; }
+    // Length and field count of the last completed line
+    uint8_t last_line_length() const { return last_length_; }
+    uint8_t last_field_count() const { return last_fields_; }
+    // Cycle of the last completed "Zyklus 5s" boot line in s, 0 for any other line
+    uint16_t last_boot_cycle() const { return last_cycle_s_; }
+    // Values of the last completed line. Valid after feed() returned FRAME
+    // until the next byte is fed - copy it if it has to be kept longer.
+    const SolarisFrame &frame() const { return frame_; }
+
+  protected:
+    // Number scanner states of the current token
+    enum NumberState : uint8_t { NUM_LEADING, NUM_SIGN, NUM_INT, NUM_FRAC, NUM_DONE };
+
+    void token_char_(uint8_t c) {
+      if (token_len_ < UINT8_MAX) token_len_++;
+      if (field_ == SOLARIS_ERR) {
+        if (token_len_ == 1) frame_.values[SOLARIS_ERR] = static_cast<uint8_t>(c);
+        return;
+      }
+
+      uint8_t digit = c - '0';
+      switch (state_) {
+        case NUM_LEADING:
+          if (c == ' ' || (c >= '\t' && c <= '\f')) return;  // strtol skips leading whitespace
+          if (c == '-' || c == '+') {
+            negative_ = (c == '-');
+            state_ = NUM_SIGN;
+            return;
+          }
+          // fall through
+        case NUM_SIGN:
+        case NUM_INT:
+          if (digit <= 9) {
+            accumulate_(digit);
+            state_ = NUM_INT;
+          } else if ((c == ',' || c == '.') && field_ == SOLARIS_DF) {
+            state_ = NUM_FRAC;
+          } else {
+            state_ = NUM_DONE;
+          }
+          return;
+        case NUM_FRAC:
+          if (digit > 9) {
+            state_ = NUM_DONE;
+          } else if (frac_digits_ < 2) {
+            accumulate_(digit);
+            frac_digits_++;
+          } else {
+            if (frac_digits_ == 2 && digit >= 5) round_up_ = true;  // Round half up on the 3rd digit
+            frac_digits_ = 3;
+          }
+          return;
+        default:
+          return;
+      }
+    }
+
+    void accumulate_(uint8_t digit) {
+      has_digits_ = true;
+      acc_ = acc_ <= (INT32_MAX - 9) / 10 ? acc_ * 10 + digit : INT32_MAX;
+    }
+
+    // First number after the "Zyklus" prefix, the controller's cycle in s
+    void cycle_digit_(uint8_t c) {
+      uint8_t digit = c - '0';
+      if (digit <= 9 && !cycle_done_) {
+        cycle_s_ = cycle_s_ < 1000 ? cycle_s_ * 10 + digit : cycle_s_;
+      } else if (cycle_s_ != 0) {
+        cycle_done_ = true;
+      }
+    }
+
+    void match_boot_prefix_(uint8_t c);
+    void end_field_();
+    SolarisParseResult finish_line_();
+    void start_token_();
+
+    SolarisFrame frame_{};
+    int32_t acc_{0};             // Digits of the current token (DF including up to 2 decimals)
+    uint16_t invalid_mask_{0};   // Invalid fields of the current line
+    uint8_t length_{0};          // Characters of the current line (CR excluded, saturating)
+    uint8_t last_length_{0};     // Length of the last completed line
+    uint8_t last_fields_{0};     // Field count of the last completed line
+    uint8_t field_{0};           // Index of the field being received
+    uint8_t token_len_{0};       // Characters in the current token
+    uint8_t frac_digits_{0};     // Decimals seen in the DF token
+    uint8_t boot_prefix_{0x07};  // Bit per boot line prefix still matching the line start
+    uint16_t cycle_s_{0};        // Number of the current "Zyklus" line
+    uint16_t last_cycle_s_{0};   // Cycle of the last completed line (0 = no "Zyklus" line)
+    bool cycle_done_{false};     // The number of the "Zyklus" line ended
+    NumberState state_{NUM_LEADING};
+    bool negative_{false};
+    bool has_digits_{false};
+    bool round_up_{false};
+};
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
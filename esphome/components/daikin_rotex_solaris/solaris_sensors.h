@@ -0,0 +1,38 @@
+#pragma once
+
+#include <cstdint>
+#include "solaris_parser.h"
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+// Entity type of a sensor in the generated SENSOR_TABLE
+enum SolarisSensorKind : uint8_t {
+  SENSOR_KIND_NUMERIC = 0,    // sensor::Sensor, scaled field value
+  SENSOR_KIND_BINARY = 1,     // binary_sensor::BinarySensor, field != 0
+  SENSOR_KIND_TEXT = 2,       // text_sensor::TextSensor, error description
+};
+
+// ============================================================================
+// SENSOR DESCRIPTOR - One entry of solaris_sensor_table.h (see sensor_table.py)
+// ============================================================================
+struct SolarisSensorDescriptor {
+  const char *key;            // YAML key, used for logging
+  SolarisFields field;        // Published frame field
+  SolarisSensorKind kind;
+  uint8_t slot;               // Index into the component's sensor array of this kind
+  int16_t step;               // Rounding step in raw units (half away from zero)
+  float divisor;              // Raw units per sensor unit after rounding
+
+  // Sensor value of a raw field value, rounded in integer math
+  constexpr float value(int32_t raw) const {
+    if (step == 1) return raw / divisor;
+    int32_t steps = raw / step, rest = raw % step;
+    if (rest * 2 >= step) steps++;
+    if (rest * 2 <= -step) steps--;
+    return steps / divisor;
+  }
+};
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
@@ -0,0 +1,150 @@
+#include "solaris_udp.h"
+
+#ifdef USE_SOLARIS_UDP
+
+#include <algorithm>
+#include <cstring>
+#include "esphome/core/log.h"
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+static const char *const UDP_TAG = "daikin_rotex_solaris.udp";
+
+// Little endian stores and saturation to the record field width
+static void put_u16(uint8_t *out, uint16_t value) {
+  out[0] = value;
+  out[1] = value >> 8;
+}
+
+static void put_u32(uint8_t *out, uint32_t value) {
+  put_u16(out, value);
+  put_u16(out + 2, value >> 16);
+}
+
+static int16_t saturate_i16(int32_t value) {
+  return static_cast<int16_t>(std::max<int32_t>(INT16_MIN, std::min<int32_t>(INT16_MAX, value)));
+}
+
+bool SolarisUdpPush::open_() {
+  socket_ = socket::socket(AF_INET, SOCK_DGRAM, IPPROTO_UDP);
+  if (socket_ == nullptr) {
+    ESP_LOGE(UDP_TAG, "Could not create UDP socket");
+    return false;
+  }
+  socket_->setblocking(false);
+  addr_len_ = socket::set_sockaddr(reinterpret_cast<struct sockaddr *>(&addr_), sizeof(addr_), address_, port_);
+  if (addr_len_ == 0) {
+    ESP_LOGE(UDP_TAG, "Invalid UDP target address '%s'", address_.c_str());
+    socket_ = nullptr;
+    return false;
+  }
+  return true;
+}
+
+void SolarisUdpPush::encode_header(uint8_t *out, uint8_t count) const {
+  out[0] = 'S';
+  out[1] = 'R';
+  out[2] = UDP_FORMAT_VERSION;
+  out[3] = count;
+  put_u16(out + 4, device_id_);
+  put_u16(out + 6, UDP_RECORD_SIZE);
+}
+
+void SolarisUdpPush::encode_record(const SolarisFrame &frame, uint32_t now, uint8_t *out) {
+  const int32_t *values = frame.values;
+  put_u32(out, sequence_++);
+  put_u32(out + 4, now);
+  put_u32(out + 8, static_cast<uint32_t>(values[SOLARIS_PWR]));
+  put_u16(out + 12, saturate_i16(values[SOLARIS_TK]));
+  put_u16(out + 14, saturate_i16(values[SOLARIS_TR]));
+  put_u16(out + 16, saturate_i16(values[SOLARIS_TS]));
+  put_u16(out + 18, saturate_i16(values[SOLARIS_TV]));
+  put_u16(out + 20, saturate_i16(values[SOLARIS_DF]));
+  out[22] = std::max<int32_t>(0, std::min<int32_t>(UINT8_MAX, values[SOLARIS_P1]));
+  out[23] = (values[SOLARIS_HA] != 0 ? 0x01 : 0) | (values[SOLARIS_BK] != 0 ? 0x02 : 0) |
+    (values[SOLARIS_P2] != 0 ? 0x04 : 0);
+  out[24] = static_cast<uint8_t>(values[SOLARIS_ERR]);
+  out[25] = 0;
+  put_u16(out + 26, frame.invalid_mask);
+}
+
+bool SolarisUdpPush::ready_() {
+  if (socket_ != nullptr) return true;
+  if (open_failed_) return false;
+  open_failed_ = !open_();
+  return !open_failed_;
+}
+
+bool SolarisUdpPush::send_datagram_(const uint8_t *data, size_t len) {
+  // Non-blocking: a datagram the stack cannot take now is not retried here
+  ssize_t sent = socket_->sendto(data, len, 0, reinterpret_cast<struct sockaddr *>(&addr_), addr_len_);
+  if (sent == static_cast<ssize_t>(len)) {
+    if (failing_) ESP_LOGI(UDP_TAG, "Sending frames to %s:%u resumed", address_.c_str(), port_);
+    failing_ = false;
+    sent_++;
+    return true;
+  }
+  // Log only the first failure of an outage
+  if (!failing_) ESP_LOGW(UDP_TAG, "Sending frame to %s:%u failed", address_.c_str(), port_);
+  failing_ = true;
+  failed_++;
+  return false;
+}
+
+void SolarisUdpPush::set_queue_size(uint16_t size) {
+  queue_size_ = size;
+  queued_ = 0;
+  queue_.assign(size > 0 ? UDP_HEADER_SIZE + size * UDP_RECORD_SIZE : 0, 0);
+}
+
+void SolarisUdpPush::send(const SolarisFrame &frame, uint32_t now) {
+  if (queue_size_ > 0) {
+    uint8_t *records = queue_.data() + UDP_HEADER_SIZE;
+    if (queued_ == queue_size_) {
+      // Network unavailable for long: the oldest record makes room
+      memmove(records, records + UDP_RECORD_SIZE, (queued_ - 1) * UDP_RECORD_SIZE);
+      queued_--;
+      dropped_++;
+    }
+    encode_record(frame, now, records + queued_ * UDP_RECORD_SIZE);
+    queued_++;
+    return;
+  }
+
+  if (!ready_()) return;
+  uint8_t datagram[UDP_HEADER_SIZE + UDP_RECORD_SIZE];
+  encode_header(datagram, 1);
+  encode_record(frame, now, datagram + UDP_HEADER_SIZE);
+  // A lost frame shows up as a gap in the sequence numbers at the collector
+  send_datagram_(datagram, sizeof(datagram));
+}
+
+bool SolarisUdpPush::flush() {
+  if (queued_ == 0) return true;
+  if (!ready_()) return false;
+
+  uint8_t *records = queue_.data() + UDP_HEADER_SIZE;
+  uint16_t done = 0;
+  while (done < queued_) {
+    uint8_t count = std::min<uint16_t>(queued_ - done, UDP_MAX_BATCH_RECORDS);
+    // The header goes right in front of the batch: into the spare bytes, or
+    // over the end of the batch sent before
+    uint8_t *datagram = records + done * UDP_RECORD_SIZE - UDP_HEADER_SIZE;
+    encode_header(datagram, count);
+    if (!send_datagram_(datagram, UDP_HEADER_SIZE + count * UDP_RECORD_SIZE)) break;
+    done += count;
+  }
+
+  // Records not sent stay queued for the next flush
+  if (done > 0) {
+    memmove(records, records + done * UDP_RECORD_SIZE, (queued_ - done) * UDP_RECORD_SIZE);
+    queued_ -= done;
+  }
+  return queued_ == 0;
+}
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
+
+#endif // USE_SOLARIS_UDP
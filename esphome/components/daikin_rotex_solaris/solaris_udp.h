@@ -0,0 +1,116 @@
+#pragma once
+
+#include "esphome/core/defines.h"
+
+#ifdef USE_SOLARIS_UDP
+
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <vector>
+#include "esphome/components/socket/socket.h"
+#include "solaris_parser.h"
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+// ============================================================================
+// UDP FRAME FORMAT - little endian, see tools/solaris_collector.py
+// ============================================================================
+// Datagram: header followed by `count` fixed-size records.
+//   header  0  'S' 'R'   magic
+//           2  uint8     format version
+//           3  uint8     record count
+//           4  uint16    device id
+//           6  uint16    record size (UDP_RECORD_SIZE)
+//   record  0  uint32    sequence number (per frame since boot)
+//           4  uint32    millis() when the frame was received
+//           8  int32     PWR (W)
+//          12  int16     TK, TR, TS, TV (°C)
+//          20  int16     DF (1/100 l/min)
+//          22  uint8     P1 (%)
+//          23  uint8     flags: bit0 HA, bit1 BK, bit2 P2
+//          24  uint8     ERR code character (0 = no error)
+//          25  uint8     reserved (0)
+//          26  uint16    invalid token mask (bit per SolarisFields index)
+// Values beyond the field width are saturated.
+static constexpr uint8_t UDP_FORMAT_VERSION = 1;
+static constexpr size_t UDP_HEADER_SIZE = 8;
+static constexpr size_t UDP_RECORD_SIZE = 28;
+// Records per datagram of a queue flush, 8 + 48 * 28 = 1352 bytes stay below
+// the 1472 byte UDP payload of a 1500 byte MTU (no IP fragmentation)
+static constexpr uint8_t UDP_MAX_BATCH_RECORDS = 48;
+
+// ============================================================================
+// UDP PUSH - One datagram per parsed frame, or queued frames as batches
+// ============================================================================
+// With a queue (store-and-forward) send() only encodes the record with the
+// time the frame was received, flush() sends the queued records in datagrams
+// of up to UDP_MAX_BATCH_RECORDS. Records the network stack refuses stay
+// queued, a full queue drops its oldest record (a gap for the collector).
+class SolarisUdpPush {
+  public:
+    void set_address(const std::string &address, uint16_t port) {
+      address_ = address;
+      port_ = port;
+    }
+    void set_device_id(uint16_t device_id) { device_id_ = device_id; }
+    const std::string &get_address() const { return address_; }
+    uint16_t get_port() const { return port_; }
+    uint16_t get_device_id() const { return device_id_; }
+    // USE_SOLARIS_UDP is set for all instances, only the ones with a target
+    // (udp_push: configured) send
+    bool is_enabled() const { return !address_.empty() && port_ != 0; }
+    uint32_t get_sent() const { return sent_; }
+    uint32_t get_failed() const { return failed_; }
+
+    // Queue up to size records instead of sending each frame (0 = no queue)
+    void set_queue_size(uint16_t size);
+    uint16_t get_queue_size() const { return queue_size_; }
+    uint16_t get_queued() const { return queued_; }
+    uint32_t get_dropped() const { return dropped_; }
+
+    // Send the frame received at now (millis) as one datagram, or queue it
+    void send(const SolarisFrame &frame, uint32_t now);
+    // Send the queued records, returns true once the queue is empty
+    bool flush();
+
+    // Fill the datagram header for count records
+    void encode_header(uint8_t *out, uint8_t count) const;
+    // Fill one record, uses and advances the sequence number
+    void encode_record(const SolarisFrame &frame, uint32_t now, uint8_t *out);
+
+  protected:
+    // Create the socket on first use (the network stack is up by then)
+    bool open_();
+    // Socket open, or opened now (false if the push is disabled)
+    bool ready_();
+    // Send one complete datagram, accounts and logs the outcome
+    bool send_datagram_(const uint8_t *data, size_t len);
+
+    std::string address_;
+    uint16_t port_{0};
+    uint16_t device_id_{0};
+
+    std::unique_ptr<socket::Socket> socket_;
+    struct sockaddr_storage addr_{};
+    socklen_t addr_len_{0};
+
+    uint32_t sequence_{0};   // Sequence number of the next record
+    uint32_t sent_{0};       // Datagrams sent
+    uint32_t failed_{0};     // Datagrams the network stack refused (e.g. Wi-Fi down)
+    bool failing_{false};    // Last send failed
+    bool open_failed_{false};  // Socket or address invalid, push disabled
+
+    // Store-and-forward queue: UDP_HEADER_SIZE spare bytes for the header of
+    // the first batch, then the queued records, oldest first
+    std::vector<uint8_t> queue_;
+    uint16_t queue_size_{0};  // Max queued records (0 = send every frame right away)
+    uint16_t queued_{0};      // Records in the queue
+    uint32_t dropped_{0};     // Records dropped from a full queue
+};
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
+
+#endif // USE_SOLARIS_UDP
@@ -0,0 +1,83 @@
+#include "solaris_watchdog.h"
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+void SolarisWatchdog::set_boot_cycle(uint16_t cycle_s) {
+  if (cycle_s == 0) return;
+  cycle_ms_ = cycle_s * 1000u;
+  cycle_source_ = CYCLE_BOOT_LINE;
+}
+
+uint32_t SolarisWatchdog::median_() const {
+  // Insertion sort of a copy, the window is a few entries
+  uint32_t sorted[CYCLE_WINDOW];
+  for (uint8_t i = 0; i < interval_count_; i++) {
+    uint8_t j = i;
+    for (; j > 0 && sorted[j - 1] > intervals_[i]; j--) sorted[j] = sorted[j - 1];
+    sorted[j] = intervals_[i];
+  }
+  return sorted[interval_count_ / 2];
+}
+
+void SolarisWatchdog::learn_(uint32_t interval) {
+  // Frames of a backlog follow each other immediately, the frame after them
+  // is timed from the late handled last one
+  if (interval < MIN_CYCLE_MS) {
+    after_backlog_ = true;
+    return;
+  }
+  if (after_backlog_) {
+    after_backlog_ = false;
+    return;
+  }
+
+  intervals_[next_interval_] = interval;
+  next_interval_ = (next_interval_ + 1) % CYCLE_WINDOW;
+  if (interval_count_ < CYCLE_WINDOW) interval_count_++;
+  if (interval_count_ < CYCLE_MIN_INTERVALS) return;
+
+  const uint32_t median = median_();
+  if (cycle_source_ == CYCLE_DEFAULT || median < cycle_ms_ * 3 / 4 || median > cycle_ms_ * 5 / 4) {
+    // First estimate, or most intervals of the window moved away (controller
+    // set to another cycle)
+    cycle_ms_ = median;
+    cycle_source_ = CYCLE_LEARNED;
+  } else if (interval >= cycle_ms_ * 3 / 4 && interval <= cycle_ms_ * 5 / 4) {
+    // Slow moving average of the regular intervals (1/8 weight)
+    cycle_ms_ = static_cast<uint32_t>((static_cast<uint64_t>(cycle_ms_) * 7 + interval + 4) / 8);
+  }
+}
+
+FrameTiming SolarisWatchdog::add_frame(uint32_t now) {
+  FrameTiming timing{0, 0, 0, false};
+  if (has_frame_) {
+    timing.interval = now - last_frame_;
+    if (cycle_source_ != CYCLE_BOOT_LINE) learn_(timing.interval);
+
+    // Cycles covered by the interval, rounded. Frames of a backlog follow
+    // each other immediately and are not measured.
+    uint32_t cycles = (timing.interval + cycle_ms_ / 2) / cycle_ms_;
+    if (cycles > 0) {
+      uint32_t expected = cycles * cycle_ms_;
+      timing.missed = cycles - 1;
+      timing.jitter = timing.interval > expected ? timing.interval - expected : expected - timing.interval;
+      timing.measured = true;
+    }
+  }
+  last_frame_ = now;
+  has_frame_ = true;
+  stale_ = false;
+  return timing;
+}
+
+bool SolarisWatchdog::check_stale(uint32_t now) {
+  // Nothing published yet, or already reported
+  if (stale_cycles_ == 0 || !has_frame_ || stale_) return false;
+  if (now - last_frame_ <= get_stale_timeout()) return false;
+  stale_ = true;
+  return true;
+}
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
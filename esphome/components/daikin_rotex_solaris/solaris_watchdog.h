@@ -0,0 +1,84 @@
+#pragma once
+
+#include <cstdint>
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+// ============================================================================
+// CYCLE CONFIGURATION
+// ============================================================================
+// Cycle assumed until it is learned, the controller's default 'Zyklus'
+static constexpr uint32_t DEFAULT_CYCLE_MS = 5000;
+// Shortest cycle the controller can be set to, shorter intervals are frames
+// of a UART backlog and not learned
+static constexpr uint32_t MIN_CYCLE_MS = 1000;
+// Intervals the learned cycle is the median of, a single frame handled late
+// (loop or Wi-Fi stall) or a missed frame does not change it
+static constexpr uint8_t CYCLE_WINDOW = 5;
+// Intervals needed before the cycle is learned
+static constexpr uint8_t CYCLE_MIN_INTERVALS = 3;
+
+// Timing of a frame relative to the one before
+struct FrameTiming {
+  uint32_t interval;    // Time since the previous frame (ms)
+  uint32_t missed;      // Cycles without a frame in between
+  uint32_t jitter;      // Deviation of the interval from the nearest cycle multiple (ms)
+  bool measured;        // A previous frame exists and the interval spans at least half a cycle
+};
+
+// ============================================================================
+// LINK WATCHDOG - Cycle learning, missed frames and stale data detection
+// ============================================================================
+// The controller sends one frame per cycle. The cycle is taken from the
+// "Zyklus" boot line if the controller restarts while connected, otherwise it
+// is learned from the intervals between frames: the median of the last
+// CYCLE_WINDOW intervals, followed by a slow average while the intervals stay
+// within a quarter of it. The cycle only moves down or up once most intervals
+// of the window agree. Frames are timed when they are handled, so the
+// intervals of a backlog (frames handled together) and the one right after it
+// are not learned. The data is stale after stale_cycles cycles without a
+// frame plus half a cycle of tolerance for the jitter.
+class SolarisWatchdog {
+  public:
+    // Cycles without a frame before the values are stale (0 = never)
+    void set_stale_cycles(uint8_t cycles) { stale_cycles_ = cycles; }
+    uint8_t get_stale_cycles() const { return stale_cycles_; }
+
+    // Cycle of a "Zyklus" boot line (s), replaces the learned one
+    void set_boot_cycle(uint16_t cycle_s);
+
+    // Account a frame received at now (millis), returns its timing
+    FrameTiming add_frame(uint32_t now);
+
+    // True once when the data became stale (no frame for stale_cycles cycles)
+    bool check_stale(uint32_t now);
+
+    // Current cycle: from the boot line, learned or DEFAULT_CYCLE_MS (ms)
+    uint32_t get_cycle() const { return cycle_ms_; }
+    bool is_cycle_known() const { return cycle_source_ != CYCLE_DEFAULT; }
+    bool is_stale() const { return stale_; }
+    uint32_t get_stale_timeout() const { return stale_cycles_ * cycle_ms_ + cycle_ms_ / 2; }
+
+  protected:
+    enum CycleSource : uint8_t { CYCLE_DEFAULT, CYCLE_LEARNED, CYCLE_BOOT_LINE };
+
+    // Update the learned cycle from the interval of two consecutive frames
+    void learn_(uint32_t interval);
+    // Median of the intervals in the window
+    uint32_t median_() const;
+
+    uint32_t cycle_ms_{DEFAULT_CYCLE_MS};
+    CycleSource cycle_source_{CYCLE_DEFAULT};
+    uint8_t stale_cycles_{3};
+    uint32_t intervals_[CYCLE_WINDOW]{};   // Last learnable intervals, ring
+    uint8_t interval_count_{0};
+    uint8_t next_interval_{0};
+    bool after_backlog_{false};   // The previous frame was handled late, in a backlog
+    uint32_t last_frame_{0};
+    bool has_frame_{false};
+    bool stale_{false};
+};
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
@@ -10,6 +10,63 @@ SENSOR_NAMES_DE = {
     "solaris_bk": "Brennerkontakt",
     "solaris_p2": "Boosterpumpe",
     "solaris_err": "Fehlerstatus",
+    # Windowed aggregates (min/max/mean per aggregation window)
+    "solaris_p1_min": "Umwälzpumpe Minimum",
+    "solaris_p1_max": "Umwälzpumpe Maximum",
+    "solaris_p1_mean": "Umwälzpumpe Mittelwert",
+    "solaris_tk_min": "Kollektortemperatur Minimum",
+    "solaris_tk_max": "Kollektortemperatur Maximum",
+    "solaris_tk_mean": "Kollektortemperatur Mittelwert",
+    "solaris_tr_min": "Rücklauftemperatur Minimum",
+    "solaris_tr_max": "Rücklauftemperatur Maximum",
+    "solaris_tr_mean": "Rücklauftemperatur Mittelwert",
+    "solaris_ts_min": "Speichertemperatur Minimum",
+    "solaris_ts_max": "Speichertemperatur Maximum",
+    "solaris_ts_mean": "Speichertemperatur Mittelwert",
+    "solaris_tv_min": "Vorlauftemperatur Minimum",
+    "solaris_tv_max": "Vorlauftemperatur Maximum",
+    "solaris_tv_mean": "Vorlauftemperatur Mittelwert",
+    "solaris_df_min": "Durchfluss Minimum",
+    "solaris_df_max": "Durchfluss Maximum",
+    "solaris_df_mean": "Durchfluss Mittelwert",
+    "solaris_pwr_min": "Leistung Minimum",
+    "solaris_pwr_max": "Leistung Maximum",
+    "solaris_pwr_mean": "Leistung Mittelwert",
+    "solaris_pwr_twmean": "Leistung zeitgewichteter Mittelwert",
+    # Accumulators (persistent counters)
+    "solaris_energy": "Solarertrag",
+    "solaris_p1_runtime": "Umwälzpumpe Laufzeit",
+    "solaris_p2_runtime": "Boosterpumpe Laufzeit",
+    "solaris_bk_starts": "Brennerkontakt Starts",
+    "solaris_ha_starts": "Handbetrieb Starts",
+    # Error statistics (diagnostic)
+    "solaris_err_count_k": "Fehler K Anzahl",
+    "solaris_err_count_r": "Fehler R Anzahl",
+    "solaris_err_count_s": "Fehler S Anzahl",
+    "solaris_err_count_d": "Fehler D Anzahl",
+    "solaris_err_count_v": "Fehler V Anzahl",
+    "solaris_err_count_g": "Fehler G Anzahl",
+    "solaris_err_count_f": "Fehler F Anzahl",
+    "solaris_err_count_w": "Fehler W Anzahl",
+    "solaris_err_count_unknown": "Unbekannte Fehler Anzahl",
+    "solaris_err_duration": "Fehlerdauer",
+    "solaris_err_last_cleared": "Fehler zuletzt behoben",
+    # Health (diagnostic)
+    "solaris_frames_ok": "Frames OK",
+    "solaris_frames_rejected_length": "Verworfene Frames (Länge)",
+    "solaris_frames_rejected_incomplete": "Verworfene Frames (unvollständig)",
+    "solaris_frames_invalid_tokens": "Frames mit ungültigen Werten",
+    "solaris_line_timeouts": "Zeilen-Timeouts",
+    "solaris_uart_rate": "UART-Datenrate",
+    "solaris_line_time_max": "Zeilenzeit Max",
+    "solaris_line_time_mean": "Zeilenzeit Mittel",
+    "solaris_loop_time_max": "Loop-Zeit Max",
+    "solaris_last_frame_age": "Alter letzter Frame",
+    "solaris_cycle": "Zyklus",
+    "solaris_frames_missed": "Verpasste Frames",
+    "solaris_frame_jitter_max": "Frame-Jitter Max",
+    "solaris_frame_jitter_mean": "Frame-Jitter Mittelwert",
+    "solaris_stale_events": "Verbindungsausfälle",
 }
 
 ERROR_CODES_DE = {
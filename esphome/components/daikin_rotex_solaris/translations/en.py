@@ -10,6 +10,63 @@ SENSOR_NAMES_EN ={
     "solaris_bk": "Burner Contact",
     "solaris_p2": "Booster Pump",
     "solaris_err": "Error Status",
+    # Windowed aggregates (min/max/mean per aggregation window)
+    "solaris_p1_min": "Circulation Pump Min",
+    "solaris_p1_max": "Circulation Pump Max",
+    "solaris_p1_mean": "Circulation Pump Mean",
+    "solaris_tk_min": "Collector Temperature Min",
+    "solaris_tk_max": "Collector Temperature Max",
+    "solaris_tk_mean": "Collector Temperature Mean",
+    "solaris_tr_min": "Return Temperature Min",
+    "solaris_tr_max": "Return Temperature Max",
+    "solaris_tr_mean": "Return Temperature Mean",
+    "solaris_ts_min": "Storage Temperature Min",
+    "solaris_ts_max": "Storage Temperature Max",
+    "solaris_ts_mean": "Storage Temperature Mean",
+    "solaris_tv_min": "Flow Temperature Min",
+    "solaris_tv_max": "Flow Temperature Max",
+    "solaris_tv_mean": "Flow Temperature Mean",
+    "solaris_df_min": "Flow Rate Min",
+    "solaris_df_max": "Flow Rate Max",
+    "solaris_df_mean": "Flow Rate Mean",
+    "solaris_pwr_min": "Power Min",
+    "solaris_pwr_max": "Power Max",
+    "solaris_pwr_mean": "Power Mean",
+    "solaris_pwr_twmean": "Power Time-Weighted Mean",
+    # Accumulators (persistent counters)
+    "solaris_energy": "Solar Yield",
+    "solaris_p1_runtime": "Circulation Pump Runtime",
+    "solaris_p2_runtime": "Booster Pump Runtime",
+    "solaris_bk_starts": "Burner Contact Starts",
+    "solaris_ha_starts": "Manual Operation Starts",
+    # Error statistics (diagnostic)
+    "solaris_err_count_k": "Error K Count",
+    "solaris_err_count_r": "Error R Count",
+    "solaris_err_count_s": "Error S Count",
+    "solaris_err_count_d": "Error D Count",
+    "solaris_err_count_v": "Error V Count",
+    "solaris_err_count_g": "Error G Count",
+    "solaris_err_count_f": "Error F Count",
+    "solaris_err_count_w": "Error W Count",
+    "solaris_err_count_unknown": "Unknown Error Count",
+    "solaris_err_duration": "Error Duration",
+    "solaris_err_last_cleared": "Error Last Cleared",
+    # Health (diagnostic)
+    "solaris_frames_ok": "Frames OK",
+    "solaris_frames_rejected_length": "Frames Rejected (Length)",
+    "solaris_frames_rejected_incomplete": "Frames Rejected (Incomplete)",
+    "solaris_frames_invalid_tokens": "Frames With Invalid Tokens",
+    "solaris_line_timeouts": "Line Timeouts",
+    "solaris_uart_rate": "UART Rate",
+    "solaris_line_time_max": "Line Time Max",
+    "solaris_line_time_mean": "Line Time Mean",
+    "solaris_loop_time_max": "Loop Time Max",
+    "solaris_last_frame_age": "Last Frame Age",
+    "solaris_cycle": "Cycle",
+    "solaris_frames_missed": "Missed Frames",
+    "solaris_frame_jitter_max": "Frame Jitter Max",
+    "solaris_frame_jitter_mean": "Frame Jitter Mean",
+    "solaris_stale_events": "Link Outages",
 }
 
 ERROR_CODES_EN ={
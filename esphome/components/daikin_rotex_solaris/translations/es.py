@@ -10,6 +10,63 @@ SENSOR_NAMES_ES ={
     "solaris_bk": "Contacto del quemador",
     "solaris_p2": "Bomba de refuerzo",
     "solaris_err": "Estado de error",
+    # Windowed aggregates (min/max/mean per aggregation window)
+    "solaris_p1_min": "Bomba de circulación mín",
+    "solaris_p1_max": "Bomba de circulación máx",
+    "solaris_p1_mean": "Bomba de circulación media",
+    "solaris_tk_min": "Temperatura del colector mín",
+    "solaris_tk_max": "Temperatura del colector máx",
+    "solaris_tk_mean": "Temperatura del colector media",
+    "solaris_tr_min": "Temperatura de retorno mín",
+    "solaris_tr_max": "Temperatura de retorno máx",
+    "solaris_tr_mean": "Temperatura de retorno media",
+    "solaris_ts_min": "Temperatura de almacenamiento mín",
+    "solaris_ts_max": "Temperatura de almacenamiento máx",
+    "solaris_ts_mean": "Temperatura de almacenamiento media",
+    "solaris_tv_min": "Temperatura de ida mín",
+    "solaris_tv_max": "Temperatura de ida máx",
+    "solaris_tv_mean": "Temperatura de ida media",
+    "solaris_df_min": "Caudal mín",
+    "solaris_df_max": "Caudal máx",
+    "solaris_df_mean": "Caudal media",
+    "solaris_pwr_min": "Potencia mín",
+    "solaris_pwr_max": "Potencia máx",
+    "solaris_pwr_mean": "Potencia media",
+    "solaris_pwr_twmean": "Potencia media ponderada en el tiempo",
+    # Accumulators (persistent counters)
+    "solaris_energy": "Rendimiento solar",
+    "solaris_p1_runtime": "Bomba de circulación horas de funcionamiento",
+    "solaris_p2_runtime": "Bomba de refuerzo horas de funcionamiento",
+    "solaris_bk_starts": "Contacto del quemador arranques",
+    "solaris_ha_starts": "Funcionamiento manual arranques",
+    # Error statistics (diagnostic)
+    "solaris_err_count_k": "Recuento de errores K",
+    "solaris_err_count_r": "Recuento de errores R",
+    "solaris_err_count_s": "Recuento de errores S",
+    "solaris_err_count_d": "Recuento de errores D",
+    "solaris_err_count_v": "Recuento de errores V",
+    "solaris_err_count_g": "Recuento de errores G",
+    "solaris_err_count_f": "Recuento de errores F",
+    "solaris_err_count_w": "Recuento de errores W",
+    "solaris_err_count_unknown": "Recuento de errores desconocidos",
+    "solaris_err_duration": "Duración del error",
+    "solaris_err_last_cleared": "Último error resuelto",
+    # Health (diagnostic)
+    "solaris_frames_ok": "Tramas OK",
+    "solaris_frames_rejected_length": "Tramas rechazadas (longitud)",
+    "solaris_frames_rejected_incomplete": "Tramas rechazadas (incompletas)",
+    "solaris_frames_invalid_tokens": "Tramas con valores no válidos",
+    "solaris_line_timeouts": "Timeouts de línea",
+    "solaris_uart_rate": "Tasa UART",
+    "solaris_line_time_max": "Tiempo de línea máx",
+    "solaris_line_time_mean": "Tiempo de línea medio",
+    "solaris_loop_time_max": "Tiempo de bucle máx",
+    "solaris_last_frame_age": "Antigüedad última trama",
+    "solaris_cycle": "Ciclo",
+    "solaris_frames_missed": "Tramas perdidas",
+    "solaris_frame_jitter_max": "Jitter de trama máx",
+    "solaris_frame_jitter_mean": "Jitter de trama medio",
+    "solaris_stale_events": "Cortes de enlace",
 }
 
 ERROR_CODES_ES ={
@@ -10,6 +10,63 @@ SENSOR_NAMES_FR ={
     "solaris_bk": "Contact brûleur",
     "solaris_p2": "Pompe de suralimentation",
     "solaris_err": "État d'erreur",
+    # Windowed aggregates (min/max/mean per aggregation window)
+    "solaris_p1_min": "Pompe de circulation min",
+    "solaris_p1_max": "Pompe de circulation max",
+    "solaris_p1_mean": "Pompe de circulation moyenne",
+    "solaris_tk_min": "Température du collecteur min",
+    "solaris_tk_max": "Température du collecteur max",
+    "solaris_tk_mean": "Température du collecteur moyenne",
+    "solaris_tr_min": "Température de retour min",
+    "solaris_tr_max": "Température de retour max",
+    "solaris_tr_mean": "Température de retour moyenne",
+    "solaris_ts_min": "Température de stockage min",
+    "solaris_ts_max": "Température de stockage max",
+    "solaris_ts_mean": "Température de stockage moyenne",
+    "solaris_tv_min": "Température de départ min",
+    "solaris_tv_max": "Température de départ max",
+    "solaris_tv_mean": "Température de départ moyenne",
+    "solaris_df_min": "Débit min",
+    "solaris_df_max": "Débit max",
+    "solaris_df_mean": "Débit moyenne",
+    "solaris_pwr_min": "Puissance min",
+    "solaris_pwr_max": "Puissance max",
+    "solaris_pwr_mean": "Puissance moyenne",
+    "solaris_pwr_twmean": "Puissance moyenne pondérée dans le temps",
+    # Accumulators (persistent counters)
+    "solaris_energy": "Rendement solaire",
+    "solaris_p1_runtime": "Pompe de circulation durée de fonctionnement",
+    "solaris_p2_runtime": "Pompe de suralimentation durée de fonctionnement",
+    "solaris_bk_starts": "Contact brûleur démarrages",
+    "solaris_ha_starts": "Fonctionnement manuel démarrages",
+    # Error statistics (diagnostic)
+    "solaris_err_count_k": "Nombre d'erreurs K",
+    "solaris_err_count_r": "Nombre d'erreurs R",
+    "solaris_err_count_s": "Nombre d'erreurs S",
+    "solaris_err_count_d": "Nombre d'erreurs D",
+    "solaris_err_count_v": "Nombre d'erreurs V",
+    "solaris_err_count_g": "Nombre d'erreurs G",
+    "solaris_err_count_f": "Nombre d'erreurs F",
+    "solaris_err_count_w": "Nombre d'erreurs W",
+    "solaris_err_count_unknown": "Nombre d'erreurs inconnues",
+    "solaris_err_duration": "Durée de l'erreur",
+    "solaris_err_last_cleared": "Dernière erreur résolue",
+    # Health (diagnostic)
+    "solaris_frames_ok": "Trames OK",
+    "solaris_frames_rejected_length": "Trames rejetées (longueur)",
+    "solaris_frames_rejected_incomplete": "Trames rejetées (incomplètes)",
+    "solaris_frames_invalid_tokens": "Trames avec valeurs invalides",
+    "solaris_line_timeouts": "Timeouts de ligne",
+    "solaris_uart_rate": "Débit UART",
+    "solaris_line_time_max": "Temps de ligne max",
+    "solaris_line_time_mean": "Temps de ligne moyen",
+    "solaris_loop_time_max": "Temps de boucle max",
+    "solaris_last_frame_age": "Âge de la dernière trame",
+    "solaris_cycle": "Cycle",
+    "solaris_frames_missed": "Trames manquées",
+    "solaris_frame_jitter_max": "Gigue de trame max",
+    "solaris_frame_jitter_mean": "Gigue de trame moyenne",
+    "solaris_stale_events": "Pertes de liaison",
 }
 
 ERROR_CODES_FR ={
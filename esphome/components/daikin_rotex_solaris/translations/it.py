@@ -10,6 +10,63 @@ SENSOR_NAMES_IT ={
     "solaris_bk": "Contatto bruciatore",
     "solaris_p2": "Pompa di potenziamento",
     "solaris_err": "Stato errore",
+    # Windowed aggregates (min/max/mean per aggregation window)
+    "solaris_p1_min": "Pompa di circolazione min",
+    "solaris_p1_max": "Pompa di circolazione max",
+    "solaris_p1_mean": "Pompa di circolazione media",
+    "solaris_tk_min": "Temperatura collettore min",
+    "solaris_tk_max": "Temperatura collettore max",
+    "solaris_tk_mean": "Temperatura collettore media",
+    "solaris_tr_min": "Temperatura di ritorno min",
+    "solaris_tr_max": "Temperatura di ritorno max",
+    "solaris_tr_mean": "Temperatura di ritorno media",
+    "solaris_ts_min": "Temperatura di accumulo min",
+    "solaris_ts_max": "Temperatura di accumulo max",
+    "solaris_ts_mean": "Temperatura di accumulo media",
+    "solaris_tv_min": "Temperatura di mandata min",
+    "solaris_tv_max": "Temperatura di mandata max",
+    "solaris_tv_mean": "Temperatura di mandata media",
+    "solaris_df_min": "Portata min",
+    "solaris_df_max": "Portata max",
+    "solaris_df_mean": "Portata media",
+    "solaris_pwr_min": "Potenza min",
+    "solaris_pwr_max": "Potenza max",
+    "solaris_pwr_mean": "Potenza media",
+    "solaris_pwr_twmean": "Potenza media ponderata nel tempo",
+    # Accumulators (persistent counters)
+    "solaris_energy": "Resa solare",
+    "solaris_p1_runtime": "Pompa di circolazione ore di funzionamento",
+    "solaris_p2_runtime": "Pompa di potenziamento ore di funzionamento",
+    "solaris_bk_starts": "Contatto bruciatore avvii",
+    "solaris_ha_starts": "Funzionamento manuale avvii",
+    # Error statistics (diagnostic)
+    "solaris_err_count_k": "Conteggio errori K",
+    "solaris_err_count_r": "Conteggio errori R",
+    "solaris_err_count_s": "Conteggio errori S",
+    "solaris_err_count_d": "Conteggio errori D",
+    "solaris_err_count_v": "Conteggio errori V",
+    "solaris_err_count_g": "Conteggio errori G",
+    "solaris_err_count_f": "Conteggio errori F",
+    "solaris_err_count_w": "Conteggio errori W",
+    "solaris_err_count_unknown": "Conteggio errori sconosciuti",
+    "solaris_err_duration": "Durata errore",
+    "solaris_err_last_cleared": "Ultimo errore risolto",
+    # Health (diagnostic)
+    "solaris_frames_ok": "Frame OK",
+    "solaris_frames_rejected_length": "Frame scartati (lunghezza)",
+    "solaris_frames_rejected_incomplete": "Frame scartati (incompleti)",
+    "solaris_frames_invalid_tokens": "Frame con valori non validi",
+    "solaris_line_timeouts": "Timeout di riga",
+    "solaris_uart_rate": "Velocità UART",
+    "solaris_line_time_max": "Tempo di riga max",
+    "solaris_line_time_mean": "Tempo di riga medio",
+    "solaris_loop_time_max": "Tempo di loop max",
+    "solaris_last_frame_age": "Età ultimo frame",
+    "solaris_cycle": "Ciclo",
+    "solaris_frames_missed": "Frame persi",
+    "solaris_frame_jitter_max": "Jitter frame max",
+    "solaris_frame_jitter_mean": "Jitter frame medio",
+    "solaris_stale_events": "Interruzioni collegamento",
 }
 
 ERROR_CODES_IT ={
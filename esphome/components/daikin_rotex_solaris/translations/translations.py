@@ -1,86 +1,110 @@
 """
-Multilingual sensor name and error message support for DAIKIN/ROTEX Solaris 
+Multilingual sensor name and error message support for DAIKIN/ROTEX Solaris
 component
 
 This module provides translations for sensor names and error codes in multiple
-languages. Translations are used by __init__.py to generate the 
+languages. Translations are used by __init__.py to generate the
 solaris_error_codes.h header file only with the selected language and to set
 sensor names translations upon initialization.
+
+Language packs are discovered by file: every <lang>.py module in this
+directory defining SENSOR_NAMES_<LANG> and ERROR_CODES_<LANG> is a language.
+A pack is only imported on first use, so a configuration run loads the
+selected language and the fallback but not the others. Adding a language
+needs no changes here.
 """
 
-from .de import SENSOR_NAMES_DE, ERROR_CODES_DE
-from .en import SENSOR_NAMES_EN, ERROR_CODES_EN
-from .fr import SENSOR_NAMES_FR, ERROR_CODES_FR
-from .it import SENSOR_NAMES_IT, ERROR_CODES_IT
-from .es import SENSOR_NAMES_ES, ERROR_CODES_ES
+import importlib
+import os
 
 DEFAULT_LANGUAGE = "de" # Default language and fallback
 
 # ============================================================================
-# SENSOR NAMES TRANSLATIONS - Used to label sensors in the UI
+# LANGUAGE PACK REGISTRY - Discovered by file, imported on first use
 # ============================================================================
-SENSORS_TRANSLATIONS = {
-    "de": SENSOR_NAMES_DE,
-    "en": SENSOR_NAMES_EN,
-    "fr": SENSOR_NAMES_FR,
-    "it": SENSOR_NAMES_IT,
-    "es": SENSOR_NAMES_ES,
-}
+_PACK_DIR = os.path.dirname(os.path.abspath(__file__))
+# Modules in this directory that are no language pack
+_NOT_PACKS = {"translations", "__init__"}
+
+# Caches: discovered language codes and the loaded packs per language. Plain
+# os and dicts, pathlib and functools alone cost more than loading all packs.
+_languages = None
+_packs = {}
+
+
+def available_languages():
+    """Language codes of all language packs in this directory (sorted)"""
+    global _languages
+    if _languages is None:
+        stems = (name[:-3] for name in os.listdir(_PACK_DIR) if name.endswith(".py"))
+        _languages = tuple(sorted(stem for stem in stems if stem not in _NOT_PACKS))
+    return _languages
+
+
+def _load_pack(lang):
+    """Import a language pack on first use.
+
+    Returns:
+        Tuple of the sensor names and error codes dictionaries, or None if
+        there is no pack for the language
+    """
+    if lang not in _packs:
+        pack = None
+        if lang in available_languages():
+            module = importlib.import_module(f"{__package__}.{lang}")
+            suffix = lang.upper()
+            pack = getattr(module, f"SENSOR_NAMES_{suffix}"), getattr(module, f"ERROR_CODES_{suffix}")
+        _packs[lang] = pack
+    return _packs[lang]
 
-# ============================================================================
-# ERROR CODES TRANSLATIONS - Error codes to description mapping
-# ============================================================================
-# Note: "unknown" entry is used as fallback for any error code not listed - should not happen
-ERROR_CODES_TRANSLATIONS = {
-    "de": ERROR_CODES_DE,
-    "en": ERROR_CODES_EN,
-    "fr": ERROR_CODES_FR,
-    "it": ERROR_CODES_IT,
-    "es": ERROR_CODES_ES,
-}
 
 def get_sensor_name(key, lang=DEFAULT_LANGUAGE):
     """Get sensor name for a given key and language.
-    
+
     Args:
         key: Sensor configuration key (e.g., "solaris_p1")
         lang: Language code (e.g., en, de, fr, it, es). Defaults to DEFAULT_LANGUAGE.
-    
+
     Returns:
-        Sensor name for given language or fallback to DEFAULT_LANGUAGE 
+        Sensor name for given language or fallback to DEFAULT_LANGUAGE
         if language not supported
     """
 
-    if lang in SENSORS_TRANSLATIONS and key in SENSORS_TRANSLATIONS[lang]:
-        return SENSORS_TRANSLATIONS[lang][key]
-    
-    return SENSORS_TRANSLATIONS.get(DEFAULT_LANGUAGE, {}).get(key, key)
+    pack = _load_pack(lang)
+    if pack is not None and key in pack[0]:
+        return pack[0][key]
+
+    return _load_pack(DEFAULT_LANGUAGE)[0].get(key, key)
 
 
 def get_codes_description(lang=DEFAULT_LANGUAGE):
     """Get error codes descriptions for a specific lang.
-    
+
     Args:
         lang: Language code (e.g., en, de, fr, it, es). Defaults to DEFAULT_LANGUAGE.
-    
+
     Returns:
         Dictionary mapping error code to description for the selected language.
     """
-    
-    if lang not in ERROR_CODES_TRANSLATIONS:
-        lang = DEFAULT_LANGUAGE
-    
-    return ERROR_CODES_TRANSLATIONS[lang]
+
+    pack = _load_pack(lang)
+    if pack is None:
+        pack = _load_pack(DEFAULT_LANGUAGE)
+
+    return pack[1]
 
 
 def translation_exists(lang):
     """Check if a lang exists in the translation dictionaries.
-    
+
     Args:
         lang: Language code (e.g., en, de, fr, it, es).
-    
+
     Returns:
-        bool: True if language exists in both SENSORS_TRANSLATIONS **AND**
-              ERROR_CODES_TRANSLATIONS, False otherwise
+        bool: True if a language pack with sensor names **AND** error codes
+              exists, False otherwise
     """
-    return lang in SENSORS_TRANSLATIONS and lang in ERROR_CODES_TRANSLATIONS
\ No newline at end of file
+    try:
+        return _load_pack(lang) is not None
+    except (ImportError, AttributeError):
+        return False
@@ -0,0 +1,53 @@
+"""Load the modules of the component without running its __init__.py.
+
+The ESPHome independent modules are imported as they are, sensors.py and
+sensors_config.py with the stand-ins in stubs/ for esphome.codegen,
+config_validation, const, core and the entity platforms (esphome_stubs).
+
+Kept out of conftest.py so the test modules import them by a name of their
+own, several conftest modules (tools/tests, ha-dashboard/tests) are loaded
+in one pytest run.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+COMPONENT_DIR = Path(__file__).resolve().parents[2] / "components" / "daikin_rotex_solaris"
+PACKAGE = "daikin_rotex_solaris"
+STUBS_DIR = Path(__file__).resolve().parent / "stubs"
+GOLDEN_DIR = Path(__file__).resolve().parent / "golden"
+# Component modules that import ESPHome, reloaded against the stand-ins
+ESPHOME_MODULES = [f"{PACKAGE}.sensors", f"{PACKAGE}.sensors_config"]
+
+# Imports a component submodule in a fresh interpreter, for the subprocess based checks
+LOADER = f"""
+import importlib, importlib.util, sys
+spec = importlib.util.spec_from_file_location(
+    {PACKAGE!r}, {str(COMPONENT_DIR / "__init__.py")!r}, submodule_search_locations=[{str(COMPONENT_DIR)!r}])
+sys.modules[{PACKAGE!r}] = importlib.util.module_from_spec(spec)
+"""
+
+# LOADER with the ESPHome stand-ins on sys.path
+STUB_LOADER = LOADER + f"sys.path.insert(0, {str(STUBS_DIR)!r})\n"
+
+
+def load_component_module(name):
+    """Import a submodule of the component package (bare package, no ESPHome)"""
+    if PACKAGE not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            PACKAGE, COMPONENT_DIR / "__init__.py", submodule_search_locations=[str(COMPONENT_DIR)])
+        sys.modules[PACKAGE] = importlib.util.module_from_spec(spec)
+    return importlib.import_module(f"{PACKAGE}.{name}")
+
+
+def check_golden(name, content):
+    """Compare content with golden/<name>, UPDATE_GOLDEN=1 rewrites the file"""
+    path = GOLDEN_DIR / name
+    if os.environ.get("UPDATE_GOLDEN"):
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    assert path.is_file(), f"{path.name} missing, run with UPDATE_GOLDEN=1"
+    assert content == path.read_text(encoding="utf-8"), f"{path.name} differs, run with UPDATE_GOLDEN=1 if intended"
@@ -0,0 +1,34 @@
+"""Fixtures of the component tests, the module loading is in component_helpers.py"""
+
+import importlib
+import sys
+
+import pytest
+
+from component_helpers import ESPHOME_MODULES, STUBS_DIR, load_component_module
+
+
+@pytest.fixture
+def translations():
+    return load_component_module("translations.translations")
+
+
+@pytest.fixture
+def esphome_stubs(monkeypatch, tmp_path):
+    """The ESPHome stand-ins on sys.path, CORE building into tmp_path.
+
+    Returns the codegen stand-in, its STATEMENTS start empty. The stand-ins
+    and the modules importing them are removed again afterwards, so they
+    never shadow an installed ESPHome.
+    """
+    def unload():
+        for name in list(sys.modules):
+            if name == "esphome" or name.startswith("esphome.") or name in ESPHOME_MODULES:
+                del sys.modules[name]
+
+    unload()
+    monkeypatch.syspath_prepend(str(STUBS_DIR))
+    codegen = importlib.import_module("esphome.codegen")
+    importlib.import_module("esphome.core").CORE.build_path = tmp_path
+    yield codegen
+    unload()
@@ -0,0 +1,60 @@
+// AUTO-GENERATED FILE: Do not edit manually!
+// Generated from translations.py by __init__.py during build
+// Languages: FR
+
+#include <cstddef>
+#include <cstdint>
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+// Struct to hold error code and description pairs
+struct SolarisErrorCodes {
+  char code;               // Single character error code (K, R, S, V, D, G, F, W, or \0)
+  const char *description; // Pointer to error description string in the selected language
+};
+
+// Error codes in FR
+static const SolarisErrorCodes ERROR_CODES_FR[] = {
+  {'\0', "Pas d'erreur"},
+  {'K', "Capteur de température du collecteur"},
+  {'R', "Capteur de température de retour"},
+  {'S', "Capteur de température de stockage"},
+  {'D', "Capteur de débit"},
+  {'V', "Capteur de température de départ"},
+  {'G', "Erreur du convertisseur A/D / Erreur de tension d'alimentation / Erreur de tension de référence"},
+  {'F', "Débit minimum V1 non atteint au démarrage après l'expiration du 'Temps P2'"},
+  {'W', "Débit minimum V1 non atteint au démarrage après l'expiration du 'Temps P2'"},
+  {'\x00', "Erreur inconnue"},
+};
+
+// Error codes per language, indexed by the language index of an instance
+static const SolarisErrorCodes *const ERROR_CODE_LANGUAGES[] = {ERROR_CODES_FR};
+static constexpr size_t ERROR_CODE_LANGUAGE_COUNT = 1;
+
+// Calculate array size at compile time (same for all languages)
+static constexpr size_t ERROR_CODES_COUNT = sizeof(ERROR_CODES_FR) / sizeof(ERROR_CODES_FR[0]);
+// Index of the "unknown" fallback entry (always the last one)
+static constexpr size_t UNKNOWN_ERROR_INDEX = ERROR_CODES_COUNT - 1;
+
+// Direct-indexed lookup: ERROR_CODES index per (ASCII) error code character,
+// UNKNOWN_ERROR_INDEX for characters without an entry
+static const uint8_t ERROR_CODE_INDEX[128] = {
+  0, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+  9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+  9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+  9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+  9, 9, 9, 9, 4, 9, 7, 6, 9, 9, 9, 1, 9, 9, 9, 9,
+  9, 9, 2, 3, 9, 9, 5, 8, 9, 9, 9, 9, 9, 9, 9, 9,
+  9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+  9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+};
+
+// ERROR_CODES index of an error code character in O(1)
+static inline size_t error_code_index(char code) {
+  uint8_t c = static_cast<uint8_t>(code);
+  return c < sizeof(ERROR_CODE_INDEX) ? ERROR_CODE_INDEX[c] : UNKNOWN_ERROR_INDEX;
+}
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
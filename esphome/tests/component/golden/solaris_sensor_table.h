@@ -0,0 +1,32 @@
+// AUTO-GENERATED FILE: Do not edit manually!
+// Generated from SENSORS_CONFIG by sensors.py during build
+#pragma once
+
+#include <array>
+#include "esphome/components/daikin_rotex_solaris/solaris_sensors.h"
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+// Configured sensors publishing a frame field, in publish order
+static constexpr std::array<SolarisSensorDescriptor, 11> SENSOR_TABLE{{
+  {"solaris_p1", SOLARIS_P1, SENSOR_KIND_NUMERIC, 0, 1, 1.0f},
+  {"solaris_tk", SOLARIS_TK, SENSOR_KIND_NUMERIC, 1, 1, 1.0f},
+  {"solaris_tr", SOLARIS_TR, SENSOR_KIND_NUMERIC, 2, 1, 1.0f},
+  {"solaris_ts", SOLARIS_TS, SENSOR_KIND_NUMERIC, 3, 1, 1.0f},
+  {"solaris_tv", SOLARIS_TV, SENSOR_KIND_NUMERIC, 4, 1, 1.0f},
+  {"solaris_df", SOLARIS_DF, SENSOR_KIND_NUMERIC, 5, 1, 100.0f},
+  {"solaris_pwr", SOLARIS_PWR, SENSOR_KIND_NUMERIC, 6, 10, 100.0f},
+  {"solaris_ha", SOLARIS_HA, SENSOR_KIND_BINARY, 0, 1, 1.0f},
+  {"solaris_bk", SOLARIS_BK, SENSOR_KIND_BINARY, 1, 1, 1.0f},
+  {"solaris_p2", SOLARIS_P2, SENSOR_KIND_BINARY, 2, 1, 1.0f},
+  {"solaris_err", SOLARIS_ERR, SENSOR_KIND_TEXT, 0, 1, 1.0f},
+}};
+
+// Sensors per kind (size of the component's sensor arrays)
+static constexpr uint8_t NUMERIC_SENSOR_COUNT = 7;
+static constexpr uint8_t BINARY_SENSOR_COUNT = 3;
+static constexpr uint8_t TEXT_SENSOR_COUNT = 1;
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
@@ -0,0 +1,6 @@
+"""Stand-ins for the parts of ESPHome the component's Python modules use.
+
+Put on sys.path by the component tests (see ../../conftest.py). Schemas apply
+their defaults and reject unknown keys, codegen records the generated
+statements as C++ text in codegen.STATEMENTS for golden-output comparisons.
+"""
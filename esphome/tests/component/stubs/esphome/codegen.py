@@ -0,0 +1,76 @@
+"""Stand-in for esphome.codegen - records the generated statements as C++ text"""
+
+# cg.add() expressions and cg.add_define() defines in call order
+STATEMENTS = []
+
+
+def reset():
+    """Forget the statements of the previous code generation"""
+    STATEMENTS.clear()
+
+
+def cpp_literal(value):
+    """C++ text of a Python value passed to a generated call"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    if isinstance(value, float):
+        text = repr(value)
+        return f"{text}f" if "." in text or "e" in text else f"{text}.0f"
+    return str(value)
+
+
+class MockObj:
+    """C++ expression: attributes and calls extend the text ("a->b(1)")"""
+
+    def __init__(self, base, op="."):
+        self.base = base
+        self.op = op
+
+    def __str__(self):
+        return self.base
+
+    def __repr__(self):
+        return f"MockObj({self.base!r})"
+
+    def __getattr__(self, attr):
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        return MockObj(f"{self.base}{self.op}{attr}")
+
+    def __call__(self, *args):
+        return MockObj(f"{self.base}({', '.join(cpp_literal(arg) for arg in args)})")
+
+    def namespace(self, name):
+        return MockObj(f"{self.base}::{name}", "::")
+
+    def enum(self, name):
+        # Unscoped enum: the values live in the enclosing namespace
+        return MockObj(self.base, "::")
+
+    def class_(self, name, *parents):
+        return MockObj(f"{self.base}::{name}", "::")
+
+
+esphome_ns = MockObj("esphome", "::")
+Component = esphome_ns.class_("Component")
+
+
+def add(expression):
+    STATEMENTS.append(f"{expression};")
+
+
+def add_define(name, value=None):
+    STATEMENTS.append(f"#define {name}" if value is None else f"#define {name} {value}")
+
+
+def new_entity(cls, config, options):
+    """Entity allocation like the ESPHome sensor platforms, one setter per option"""
+    var = MockObj(config["id"], "->")
+    STATEMENTS.append(f"{var} = new {cls}();")
+    add(var.set_name(config["name"]))
+    for option in options:
+        if option in config:
+            add(getattr(var, f"set_{option}")(config[option]))
+    return var
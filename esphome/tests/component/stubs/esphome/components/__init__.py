@@ -0,0 +1,14 @@
+"""Stand-ins for the entity platforms: schema options become defaults"""
+
+import esphome.config_validation as cv
+from esphome.const import CONF_ID, CONF_NAME
+
+
+def entity_schema(**options):
+    """Schema of an entity with the given options (icon=..., device_class=...)"""
+    schema = {
+        cv.Optional(CONF_ID): cv.string,
+        cv.Optional(CONF_NAME): cv.string,
+    }
+    schema.update({cv.Optional(option, default=value): lambda value: value for option, value in options.items()})
+    return cv.Schema(schema)
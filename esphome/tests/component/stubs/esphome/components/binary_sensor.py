@@ -0,0 +1,16 @@
+"""Stand-in for esphome.components.binary_sensor"""
+
+import esphome.codegen as cg
+
+from . import entity_schema
+
+# Options of binary_sensor_schema() in the order of the generated setters
+OPTIONS = ('icon', 'device_class')
+
+
+def binary_sensor_schema(**options):
+    return entity_schema(**options)
+
+
+async def new_binary_sensor(config):
+    return cg.new_entity("binary_sensor::BinarySensor", config, OPTIONS)
@@ -0,0 +1,16 @@
+"""Stand-in for esphome.components.sensor"""
+
+import esphome.codegen as cg
+
+from . import entity_schema
+
+# Options of sensor_schema() in the order of the generated setters
+OPTIONS = ('icon', 'accuracy_decimals', 'unit_of_measurement', 'device_class', 'state_class', 'entity_category')
+
+
+def sensor_schema(**options):
+    return entity_schema(**options)
+
+
+async def new_sensor(config):
+    return cg.new_entity("sensor::Sensor", config, OPTIONS)
@@ -0,0 +1,16 @@
+"""Stand-in for esphome.components.text_sensor"""
+
+import esphome.codegen as cg
+
+from . import entity_schema
+
+# Options of text_sensor_schema() in the order of the generated setters
+OPTIONS = ('icon', 'device_class', 'entity_category')
+
+
+def text_sensor_schema(**options):
+    return entity_schema(**options)
+
+
+async def new_text_sensor(config):
+    return cg.new_entity("text_sensor::TextSensor", config, OPTIONS)
@@ -0,0 +1,87 @@
+"""Stand-in for esphome.config_validation - schemas with defaults, a few validators"""
+
+UNDEFINED = object()
+
+
+class Invalid(Exception):
+    """Validation error, path like the ESPHome one"""
+
+    def __init__(self, message, path=None):
+        super().__init__(message)
+        self.path = path or []
+
+
+class Optional:
+    def __init__(self, key, default=UNDEFINED):
+        self.key = key
+        self.default = default
+
+    def __str__(self):
+        return self.key
+
+
+class Required(Optional):
+    pass
+
+
+class Schema:
+    """Mapping of Optional/Required keys to validators, applies the defaults
+    (callable defaults are called) and rejects unknown keys"""
+
+    def __init__(self, schema):
+        self.schema = dict(schema)
+
+    def extend(self, *schemas):
+        merged = {str(key): (key, validator) for key, validator in self.schema.items()}
+        for schema in schemas:
+            items = schema.schema if isinstance(schema, Schema) else schema
+            merged.update({str(key): (key, validator) for key, validator in items.items()})
+        return Schema(dict(merged.values()))
+
+    def __call__(self, config):
+        if not isinstance(config, dict):
+            raise Invalid(f"expected a dictionary, got {config!r}")
+        keys = {str(key): key for key in self.schema}
+        for name in config:
+            if name not in keys:
+                raise Invalid(f"extra keys not allowed @ data['{name}']", [name])
+        result = {}
+        for name, key in keys.items():
+            validator = self.schema[key]
+            if name in config:
+                value = config[name]
+            elif isinstance(key, Required):
+                raise Invalid(f"required key not provided @ data['{name}']", [name])
+            elif key.default is not UNDEFINED:
+                value = key.default() if callable(key.default) else key.default
+            else:
+                continue
+            try:
+                result[name] = validator(value)
+            except Invalid as err:
+                raise Invalid(str(err), [name, *err.path]) from None
+        return result
+
+
+def string(value):
+    if isinstance(value, (dict, list)):
+        raise Invalid(f"expected a string, got {value!r}")
+    return str(value)
+
+
+def boolean(value):
+    if not isinstance(value, bool):
+        raise Invalid(f"expected a boolean, got {value!r}")
+    return value
+
+
+def int_(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or int(value) != value:
+        raise Invalid(f"expected an integer, got {value!r}")
+    return int(value)
+
+
+def positive_float(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+        raise Invalid(f"expected a positive number, got {value!r}")
+    return float(value)
@@ -0,0 +1,26 @@
+"""Stand-in for esphome.const - the constants used by the component"""
+
+CONF_ID = "id"
+CONF_NAME = "name"
+
+DEVICE_CLASS_DURATION = "duration"
+DEVICE_CLASS_ENERGY = "energy"
+DEVICE_CLASS_HEAT = "heat"
+DEVICE_CLASS_POWER = "power"
+DEVICE_CLASS_RUNNING = "running"
+DEVICE_CLASS_TEMPERATURE = "temperature"
+DEVICE_CLASS_TIMESTAMP = "timestamp"
+
+ENTITY_CATEGORY_DIAGNOSTIC = "diagnostic"
+
+STATE_CLASS_MEASUREMENT = "measurement"
+STATE_CLASS_TOTAL_INCREASING = "total_increasing"
+
+UNIT_CELSIUS = "°C"
+UNIT_HOUR = "h"
+UNIT_KILOWATT = "kW"
+UNIT_KILOWATT_HOURS = "kWh"
+UNIT_MICROSECOND = "µs"
+UNIT_MILLISECOND = "ms"
+UNIT_PERCENT = "%"
+UNIT_SECOND = "s"
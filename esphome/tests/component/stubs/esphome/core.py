@@ -0,0 +1,17 @@
+"""Stand-in for esphome.core - CORE with the build directory of a test"""
+
+from pathlib import Path
+
+
+class _Core:
+    """Build state, build_path is set by the tests (e.g. to tmp_path)"""
+
+    def __init__(self):
+        self.name = "solaris"
+        self.build_path = None
+
+    def relative_src_path(self, *path):
+        return str(Path(self.build_path, "src", *path))
+
+
+CORE = _Core()
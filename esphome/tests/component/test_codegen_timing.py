@@ -0,0 +1,80 @@
+"""Config-time cost of the component: import and code generation with the ESPHome stand-ins.
+
+The measured times are recorded as properties (pytest --junitxml) to track
+them over time. The budgets are several times the times measured on a
+desktop and only catch gross regressions, like a language pack loaded per
+sensor or a quadratic loop over SENSORS_CONFIG.
+"""
+
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+from component_helpers import PACKAGE, STUB_LOADER, load_component_module
+
+# Importing sensors.py (schema, SENSORS_CONFIG, default language pack) in a
+# fresh interpreter, measured about 30 ms
+IMPORT_BUDGET_MS = 150
+# Error codes header of all languages, measured below 0.1 ms
+HEADER_BUDGET_MS = 10
+# Schema validation, sensor table and setup_sensors() of every sensor, measured about 3 ms
+SETUP_BUDGET_MS = 50
+
+# Runs after STUB_LOADER: imports sensors.py, prints the loaded language packs and the time
+PROBE = f"""
+import json, time
+start = time.perf_counter()
+importlib.import_module("{PACKAGE}.sensors")
+elapsed = (time.perf_counter() - start) * 1000
+prefix = "{PACKAGE}.translations."
+packs = sorted(m[len(prefix):] for m in sys.modules if m.startswith(prefix) and m != prefix + "translations")
+print(json.dumps({{"packs": packs, "ms": elapsed}}))
+"""
+
+
+def best_of(runs, func):
+    """Shortest time of func() over runs calls (ms), after one warm-up call"""
+    func()
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def test_import_time(record_property):
+    proc = subprocess.run([sys.executable, "-c", STUB_LOADER + PROBE], capture_output=True, text=True, check=True)
+    result = json.loads(proc.stdout)
+    record_property("import_ms", round(result["ms"], 2))
+    # The schema names use callable defaults, only the fallback pack (for the error code keys) is loaded
+    assert result["packs"] == ["de"]
+    assert result["ms"] < IMPORT_BUDGET_MS
+
+
+def test_header_time(record_property, translations):
+    error_codes = load_component_module("error_codes")
+    languages = list(translations.available_languages())
+    ms = best_of(20, lambda: error_codes.generate_error_codes_header(languages))
+    record_property("error_codes_header_ms", round(ms, 3))
+    assert ms < HEADER_BUDGET_MS
+
+
+def test_setup_time(record_property, esphome_stubs):
+    sensors = load_component_module("sensors")
+    sensors_config = load_component_module("sensors_config")
+    raw = {cfg['key']: {"id": cfg['key']} for cfg in sensors_config.SENSORS_CONFIG}
+
+    def generate():
+        esphome_stubs.reset()
+        config = sensors.SENSORS_SCHEMA(raw)
+        config.update(language="fr")
+        slots = sensors.write_sensor_table([config])
+        asyncio.run(sensors.setup_sensors(esphome_stubs.MockObj("solaris", "->"), config, slots))
+
+    ms = best_of(10, generate)
+    record_property("setup_sensors_ms", round(ms, 3))
+    record_property("sensors", len(raw))
+    assert ms < SETUP_BUDGET_MS
@@ -0,0 +1,66 @@
+"""Tests for the generated error codes header (error_codes.py)"""
+
+import re
+
+import pytest
+
+from component_helpers import check_golden, load_component_module
+
+# Description literal of an error code table entry ({'K', "..."})
+DESCRIPTION_RE = re.compile(r"""^  \{'[^']+', "((?:[^"\\]|\\.)*)"\},$""", re.M)
+LANGUAGES = load_component_module("translations.translations").available_languages()
+
+
+@pytest.fixture
+def error_codes():
+    return load_component_module("error_codes")
+
+
+def test_header_name(error_codes):
+    assert error_codes.error_codes_header_name(["de"]) == "solaris_error_codes_de.h"
+    assert error_codes.error_codes_header_name(["de", "en"]) == "solaris_error_codes_de_en.h"
+
+
+def test_one_table_per_language(error_codes):
+    header = error_codes.generate_error_codes_header(["en", "fr"])
+    assert "static const SolarisErrorCodes ERROR_CODES_EN[]" in header
+    assert "static const SolarisErrorCodes ERROR_CODES_FR[]" in header
+    # Language index of an instance = position in the list
+    assert "ERROR_CODE_LANGUAGES[] = {ERROR_CODES_EN, ERROR_CODES_FR};" in header
+    assert "ERROR_CODE_LANGUAGE_COUNT = 2;" in header
+    # One shared character lookup table
+    assert header.count("static const uint8_t ERROR_CODE_INDEX[") == 1
+
+
+def test_lookup_table(error_codes, translations):
+    header = error_codes.generate_error_codes_header(["de"])
+    rows = re.search(r"ERROR_CODE_INDEX\[\d+\] = \{(.*?)\};", header, re.S).group(1)
+    index = [int(i) for i in rows.replace(",", " ").split()]
+    codes = list(translations.get_codes_description("de"))
+    assert len(index) == error_codes.ERROR_CODE_TABLE_SIZE
+    assert index[ord("K")] == codes.index("K")
+    assert index[0] == codes.index("")
+    assert index[ord("X")] == codes.index("unknown") == len(codes) - 1
+
+
+def test_cpp_escape(error_codes):
+    assert error_codes._cpp_escape('Zeit "P2"') == 'Zeit \\"P2\\"'
+    assert error_codes._cpp_escape("a\\b") == "a\\\\b"
+    # UTF-8 goes into the literal unchanged (the source files are UTF-8)
+    assert error_codes._cpp_escape("Rücklauf, débit, señal") == "Rücklauf, débit, señal"
+
+
+@pytest.mark.parametrize("lang", LANGUAGES)
+def test_golden_header(error_codes, translations, lang):
+    header = error_codes.generate_error_codes_header([lang])
+    check_golden(error_codes.error_codes_header_name([lang]), header + "\n")
+
+    # Every description survives the escaping, non-ASCII characters included
+    literals = [re.sub(r"\\(.)", r"\1", text) for text in DESCRIPTION_RE.findall(header)]
+    assert literals == list(translations.get_codes_description(lang).values())
+
+
+def test_write_only_on_change(error_codes, tmp_path):
+    path, written = error_codes.write_error_codes_header(tmp_path, ["de", "en"])
+    assert written and path.name == "solaris_error_codes_de_en.h"
+    assert error_codes.write_error_codes_header(tmp_path, ["de", "en"]) == (path, False)
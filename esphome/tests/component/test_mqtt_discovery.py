@@ -0,0 +1,51 @@
+"""Tests for the Home Assistant discovery of the MQTT JSON frame topic (mqtt_discovery.py)"""
+
+import json
+
+import pytest
+
+from component_helpers import load_component_module
+
+TK = {'type': 'numeric', 'key': 'solaris_tk', 'unit': "°C", 'icon': 'mdi:sun-thermometer',
+      'device_class': 'temperature', 'state_class': 'measurement', 'accuracy': 0}
+PWR = {'type': 'numeric', 'key': 'solaris_pwr', 'unit': "kW", 'icon': 'mdi:solar-power', 'step': 10,
+       'divisor': 100, 'device_class': 'power', 'state_class': 'measurement', 'accuracy': 2}
+BK = {'type': 'binary', 'key': 'solaris_bk', 'icon': 'mdi:fire', 'device_class': 'running'}
+ERR = {'type': 'text', 'key': 'solaris_err', 'icon': 'mdi:alert'}
+
+
+@pytest.fixture
+def discovery():
+    return load_component_module("mqtt_discovery")
+
+
+def test_value_templates(discovery, translations):
+    texts = translations.get_codes_description("en")
+    assert discovery.value_template(TK, texts) == "{{ value_json.tk }}"
+    # Raw W -> kW, the unit and rounding of the ESPHome sensor
+    assert discovery.value_template(PWR, texts) == "{{ (value_json.pwr / 1000) | round(2) }}"
+    assert discovery.value_template(BK, texts) == "{{ 'ON' if value_json.bk else 'OFF' }}"
+    err = discovery.value_template(ERR, texts)
+    assert '"K":"Collector Temperature Sensor"' in err
+    assert err.endswith('.get(value_json.err, "Unknown Error") }}')
+
+
+def test_discovery_messages(discovery, translations):
+    sensors = [(TK, "Garage Kollektortemperatur"), (BK, "Garage Brennerkontakt"), (ERR, "Garage Fehler")]
+    messages = discovery.discovery_messages(
+        sensors, "node/solaris/frame", "homeassistant", "node", translations.get_codes_description("de"),
+        availability_topic="node/status")
+    assert [m.topic for m in messages] == [
+        "homeassistant/sensor/node/solaris_tk/config",
+        "homeassistant/binary_sensor/node/solaris_bk/config",
+        "homeassistant/sensor/node/solaris_err/config",
+    ]
+    for message in messages:
+        # The component closes the object after appending the device
+        config = json.loads(message.payload + ',"dev":{"ids":["a0b1c2d3e4f5"]}}')
+        assert config['stat_t'] == "node/solaris/frame"
+        assert config['avty_t'] == "node/status"
+        assert config['uniq_id'].startswith("node_solaris_")
+    tk = json.loads(messages[0].payload + "}")
+    assert (tk['name'], tk['unit_of_meas'], tk['dev_cla']) == ("Garage Kollektortemperatur", "°C", "temperature")
+    assert 'unit_of_meas' not in json.loads(messages[1].payload + "}")
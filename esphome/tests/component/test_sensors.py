@@ -0,0 +1,85 @@
+"""Tests for the sensor schema and code generation (sensors.py, sensors_config.py) with the ESPHome stand-ins"""
+
+import asyncio
+
+import pytest
+
+from component_helpers import check_golden, load_component_module
+
+
+@pytest.fixture
+def sensors(esphome_stubs):
+    return load_component_module("sensors")
+
+
+@pytest.fixture
+def sensors_config(esphome_stubs):
+    return load_component_module("sensors_config")
+
+
+def generate(sensors, codegen, config):
+    """Run the sensor part of to_code() for one instance, returns the enabled features"""
+    slots = sensors.write_sensor_table([config])
+    parent = codegen.MockObj("solaris", "->")
+    return asyncio.run(sensors.setup_sensors(parent, config, slots))
+
+
+def test_keys_in_every_language(sensors_config, translations):
+    keys = [sensor_cfg['key'] for sensor_cfg in sensors_config.SENSORS_CONFIG]
+    assert len(keys) == len(set(keys))
+    for lang in translations.available_languages():
+        names, _ = translations._load_pack(lang)
+        assert sorted(set(keys) - names.keys()) == [], lang
+        # Names no sensor uses any more
+        assert sorted(names.keys() - set(keys)) == [], lang
+
+
+def test_display_names(sensors_config, translations):
+    for sensor_cfg in sensors_config.SENSORS_CONFIG:
+        for lang in translations.available_languages():
+            name = sensor_cfg['display_name'](lang)
+            assert name and name != sensor_cfg['key'], (sensor_cfg['key'], lang)
+
+
+def test_schema_defaults(sensors, esphome_stubs, translations):
+    config = sensors.SENSORS_SCHEMA({"solaris_tk": {}, "solaris_bk": {"name": "Brenner"}})
+    assert config["solaris_tk"]["name"] == translations.get_sensor_name("solaris_tk", translations.DEFAULT_LANGUAGE)
+    assert config["solaris_tk"]["unit_of_measurement"] == "°C"
+    assert config["solaris_tk"]["deadband"] == 0.0
+    assert config["solaris_bk"] == {"name": "Brenner", "icon": "mdi:electric-switch", "device_class": "heat"}
+
+    import esphome.config_validation as cv
+    with pytest.raises(cv.Invalid):
+        sensors.SENSORS_SCHEMA({"solaris_xx": {}})
+    with pytest.raises(cv.Invalid) as err:
+        sensors.SENSORS_SCHEMA({"solaris_tk": {"deadband": -1}})
+    assert err.value.path == ["solaris_tk", "deadband"]
+
+
+def test_setup_sensors(sensors, esphome_stubs):
+    config = sensors.SENSORS_SCHEMA({
+        "solaris_tk": {"id": "tk", "deadband": 0.5},
+        "solaris_err": {"id": "err"},
+        "solaris_tk_max": {"id": "tk_max"},
+        "solaris_err_count_k": {"id": "err_count_k"},
+    })
+    config.update(language="en", name_prefix="Garage")
+    features = generate(sensors, esphome_stubs, config)
+
+    assert features == {"USE_SOLARIS_TK", "USE_SOLARIS_ERR", "USE_SOLARIS_AGGREGATES", "USE_SOLARIS_ERROR_STATS"}
+    assert esphome_stubs.STATEMENTS[:2] == ["#define USE_SOLARIS_TK", "#define USE_SOLARIS_ERR"]
+    assert 'tk->set_name("Garage Collector Temperature");' in esphome_stubs.STATEMENTS
+    assert "solaris->set_deadband(esphome::daikin_rotex_solaris::SOLARIS_TK, 0.5f);" in esphome_stubs.STATEMENTS
+    assert ("solaris->set_aggregate_sensor(esphome::daikin_rotex_solaris::SOLARIS_TK, "
+            "esphome::daikin_rotex_solaris::AGGREGATE_MAX, tk_max);") in esphome_stubs.STATEMENTS
+    assert 'solaris->set_error_count_sensor("K", err_count_k);' in esphome_stubs.STATEMENTS
+
+
+def test_golden_all_sensors(sensors, sensors_config, esphome_stubs, tmp_path):
+    """Every sensor of SENSORS_CONFIG configured, French names with a prefix"""
+    config = sensors.SENSORS_SCHEMA({cfg['key']: {"id": cfg['key']} for cfg in sensors_config.SENSORS_CONFIG})
+    config.update(language="fr", name_prefix="Garage")
+    generate(sensors, esphome_stubs, config)
+    check_golden("setup_sensors_fr.txt", "\n".join(esphome_stubs.STATEMENTS) + "\n")
+    header = tmp_path / "src" / "solaris_sensor_table.h"
+    check_golden("solaris_sensor_table.h", header.read_text(encoding="utf-8"))
@@ -0,0 +1,66 @@
+"""Tests for the lazily loaded language packs in translations/"""
+
+import json
+import subprocess
+import sys
+
+from component_helpers import LOADER, PACKAGE
+
+# Upper bound for importing the registry and resolving one name in a fresh
+# interpreter (ms). It measured about 3-4 ms on a desktop, roughly what eager
+# loading of all packs cost; the bound only catches gross regressions like
+# importing ESPHome or all packs with heavy dependencies from here.
+IMPORT_BUDGET_MS = 20
+
+# Runs after LOADER: imports the registry, resolves names in LANG and prints
+# the loaded language packs and the elapsed time
+PROBE = f"""
+import json, time
+start = time.perf_counter()
+t = importlib.import_module("{PACKAGE}.translations.translations")
+t.get_sensor_name("solaris_tk", LANG)
+t.get_codes_description(LANG)
+elapsed = (time.perf_counter() - start) * 1000
+prefix = "{PACKAGE}.translations."
+packs = sorted(m[len(prefix):] for m in sys.modules if m.startswith(prefix) and m != prefix + "translations")
+print(json.dumps({{"packs": packs, "ms": elapsed}}))
+"""
+
+
+def probe(lang):
+    """Load the registry in a fresh interpreter, returns the loaded packs and the time (ms)"""
+    proc = subprocess.run([sys.executable, "-c", LOADER + f"LANG = {lang!r}\n" + PROBE],
+                          capture_output=True, text=True, check=True)
+    result = json.loads(proc.stdout)
+    return result["packs"], result["ms"]
+
+
+def test_available_languages(translations):
+    assert translations.available_languages() == ("de", "en", "es", "fr", "it")
+    assert translations.translation_exists("en")
+    assert not translations.translation_exists("xx")
+
+
+def test_packs_are_complete(translations):
+    default_names, default_codes = translations._load_pack(translations.DEFAULT_LANGUAGE)
+    for lang in translations.available_languages():
+        names, codes = translations._load_pack(lang)
+        assert names.keys() == default_names.keys(), lang
+        # Same codes in the same order, the error codes header indexes them
+        assert list(codes) == list(default_codes), lang
+
+
+def test_fallback(translations):
+    assert translations.get_sensor_name("solaris_tk", "xx") == translations.get_sensor_name("solaris_tk")
+    assert translations.get_sensor_name("no_such_key", "en") == "no_such_key"
+    assert translations.get_codes_description("xx") is translations.get_codes_description()
+
+
+def test_only_selected_language_is_loaded():
+    assert probe("en")[0] == ["en"]
+    # Unknown language: only the fallback
+    assert probe("xx")[0] == ["de"]
+
+
+def test_import_time_budget():
+    assert probe("fr")[1] < IMPORT_BUDGET_MS
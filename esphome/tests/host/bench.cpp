@@ -0,0 +1,93 @@
+// Throughput benchmark for the Solaris line parser on the host.
+//
+// Replays a capture (default: corpus/frames.txt) through the fake UART and
+// loop() - or straight into parse_line_ with --direct - and reports lines/s,
+// ns per frame and how many publish_state() calls the component made.
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <string>
+
+#include "host_harness.h"
+
+using namespace esphome;
+using namespace esphome::daikin_rotex_solaris;
+
+static void usage(const char *prog) {
+  std::fprintf(stderr,
+               "usage: %s [-n LINES] [-c CHUNK] [--direct] [FRAMES_FILE]\n"
+               "  -n LINES   number of lines to push through the parser (default 2000000)\n"
+               "  -c CHUNK   bytes made available to each loop() call (default 16)\n"
+               "  --direct   call parse_line_ directly instead of going through loop()\n",
+               prog);
+}
+
+int main(int argc, char **argv) {
+  size_t total_lines = 2000000;
+  size_t chunk = 16;
+  bool direct = false;
+  const char *path = "corpus/frames.txt";
+
+  for (int i = 1; i < argc; i++) {
+    if (std::strcmp(argv[i], "-n") == 0 && i + 1 < argc) {
+      total_lines = std::strtoull(argv[++i], nullptr, 10);
+    } else if (std::strcmp(argv[i], "-c") == 0 && i + 1 < argc) {
+      chunk = std::strtoull(argv[++i], nullptr, 10);
+    } else if (std::strcmp(argv[i], "--direct") == 0) {
+      direct = true;
+    } else if (argv[i][0] == '-') {
+      usage(argv[0]);
+      return 2;
+    } else {
+      path = argv[i];
+    }
+  }
+
+  auto lines = read_lines(path);
+  if (lines.empty() || chunk == 0) {
+    std::fprintf(stderr, "No input lines in '%s'\n", path);
+    return 1;
+  }
+
+  // Pre-render the serial stream once so only the component is measured
+  std::string stream;
+  for (size_t i = 0; i < lines.size(); i++) stream += lines[i] + "\r\n";
+  size_t repeats = (total_lines + lines.size() - 1) / lines.size();
+
+  HostSolaris solaris;
+  host::set_millis(0);
+  size_t fed_lines = 0, fed_bytes = 0;
+
+  auto start = std::chrono::steady_clock::now();
+  for (size_t r = 0; r < repeats; r++) {
+    if (direct) {
+      for (const auto &line : lines) {
+        solaris.parse_line_(line.c_str(), line.size());
+        fed_bytes += line.size();
+      }
+    } else {
+      for (size_t pos = 0; pos < stream.size(); pos += chunk) {
+        size_t n = std::min(chunk, stream.size() - pos);
+        solaris.feed_and_loop(stream.data() + pos, n);
+        host::advance_millis(1);
+      }
+      fed_bytes += stream.size();
+    }
+    fed_lines += lines.size();
+  }
+  auto elapsed = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+
+  std::printf("mode:        %s\n", direct ? "parse_line_ (direct)" : "loop() via UART");
+  std::printf("lines:       %zu (%zu bytes, %zu distinct)\n", fed_lines, fed_bytes, lines.size());
+  std::printf("elapsed:     %.3f s\n", elapsed);
+  std::printf("throughput:  %.0f lines/s, %.2f MB/s\n", fed_lines / elapsed, fed_bytes / elapsed / 1e6);
+  std::printf("per frame:   %.1f ns\n", elapsed * 1e9 / fed_lines);
+  std::printf("publishes:   %llu total, %.2f per line\n",
+              static_cast<unsigned long long>(host::publish_count),
+              static_cast<double>(host::publish_count) / fed_lines);
+  for (const auto *entity : solaris.entities()) {
+    std::printf("  %-12s %u\n", entity->get_name().c_str(), entity->get_publish_count());
+  }
+  return 0;
+}
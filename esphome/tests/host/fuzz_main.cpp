@@ -0,0 +1,107 @@
+// Standalone driver for fuzz.cpp when libFuzzer is not available.
+//
+// Replays every seed in the given corpus files/directories, then applies
+// random protocol-aware mutations (delimiters, comma decimals, boot lines,
+// truncation, duplication beyond MAX_LINE_LEN) for -runs iterations.
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <dirent.h>
+#include <fstream>
+#include <iterator>
+#include <random>
+#include <string>
+#include <sys/stat.h>
+#include <vector>
+
+extern "C" int LLVMFuzzerTestOneInput(const uint8_t *data, size_t size);
+
+static const char *const DICTIONARY[] = {
+    ";", ";;", ",", "\n", "\r\n", "\r", "-", "0", "9", "K", "SOLARIS", "Zyklus",
+    "HA;BK;P1", "0;0;0;0;", "3,2", "65535", "-2147483649", "99999999999",
+};
+
+static void load_seed(const std::string &path, std::vector<std::string> &seeds) {
+  std::ifstream in(path, std::ios::binary);
+  seeds.emplace_back(std::istreambuf_iterator<char>(in), std::istreambuf_iterator<char>());
+}
+
+static void load_path(const std::string &path, std::vector<std::string> &seeds) {
+  struct stat st;
+  if (stat(path.c_str(), &st) != 0) return;
+  if (!S_ISDIR(st.st_mode)) {
+    load_seed(path, seeds);
+    return;
+  }
+  if (DIR *dir = opendir(path.c_str())) {
+    while (dirent *entry = readdir(dir)) {
+      if (entry->d_name[0] != '.') load_path(path + "/" + entry->d_name, seeds);
+    }
+    closedir(dir);
+  }
+}
+
+static void mutate(std::string &data, std::mt19937 &rng) {
+  auto pick = [&](size_t n) { return n == 0 ? 0 : std::uniform_int_distribution<size_t>(0, n - 1)(rng); };
+  switch (pick(6)) {
+    case 0:  // flip a bit
+      if (!data.empty()) data[pick(data.size())] ^= static_cast<char>(1u << pick(8));
+      break;
+    case 1:  // insert a dictionary token
+      data.insert(pick(data.size() + 1), DICTIONARY[pick(std::size(DICTIONARY))]);
+      break;
+    case 2:  // overwrite a byte with a random one
+      if (!data.empty()) data[pick(data.size())] = static_cast<char>(pick(256));
+      break;
+    case 3:  // truncate
+      data.resize(pick(data.size() + 1));
+      break;
+    case 4: {  // duplicate a range (grows lines past MAX_LINE_LEN)
+      size_t from = pick(data.size() + 1);
+      size_t len = pick(data.size() - from + 1);
+      data.insert(pick(data.size() + 1), data.substr(from, len));
+      break;
+    }
+    default: {  // erase a range
+      size_t from = pick(data.size() + 1);
+      data.erase(from, pick(data.size() - from + 1));
+      break;
+    }
+  }
+}
+
+int main(int argc, char **argv) {
+  unsigned long runs = 1000000;
+  unsigned long seed = 1;
+  std::vector<std::string> seeds;
+
+  for (int i = 1; i < argc; i++) {
+    if (std::strncmp(argv[i], "-runs=", 6) == 0) {
+      runs = std::strtoul(argv[i] + 6, nullptr, 10);
+    } else if (std::strncmp(argv[i], "-seed=", 6) == 0) {
+      seed = std::strtoul(argv[i] + 6, nullptr, 10);
+    } else {
+      load_path(argv[i], seeds);
+    }
+  }
+  if (seeds.empty()) seeds.emplace_back("0;1;75;0;84;58;61;63;3,2;;3500\r\n");
+
+  for (const auto &s : seeds) {
+    LLVMFuzzerTestOneInput(reinterpret_cast<const uint8_t *>(s.data()), s.size());
+  }
+
+  std::mt19937 rng(seed);
+  auto start = std::chrono::steady_clock::now();
+  for (unsigned long i = 0; i < runs; i++) {
+    std::string data = seeds[rng() % seeds.size()];
+    for (unsigned m = 1 + rng() % 4; m > 0; m--) mutate(data, rng);
+    if (data.size() > 4096) data.resize(4096);
+    LLVMFuzzerTestOneInput(reinterpret_cast<const uint8_t *>(data.data()), data.size());
+  }
+  auto elapsed = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+
+  std::printf("Done: %zu seeds, %lu mutated runs in %.1f s (%.0f exec/s), seed=%lu\n",
+              seeds.size(), runs, elapsed, runs / elapsed, seed);
+  return 0;
+}
@@ -0,0 +1,66 @@
+"""
+Generate the headers of the ESPHome build for the host harness without ESPHome:
+solaris_error_codes_<languages>.h and solaris_sensor_table.h.
+
+Loads error_codes.py, sensor_table.py and the translations from the component
+directory as submodules of a bare package object, so the ESPHome dependent
+__init__.py is never executed. Like the ESPHome build, the headers are only
+rewritten when their content changed.
+
+Usage: python gen_error_codes.py [languages] [output directory]
+
+Several languages (as with several component instances) are given as one
+space separated argument, e.g. "de en".
+"""
+
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+
+COMPONENT_DIR = Path(__file__).resolve().parents[2] / "components" / "daikin_rotex_solaris"
+
+
+def load_component_module(name):
+    """Import a submodule of the component package without running __init__.py"""
+    package = "daikin_rotex_solaris"
+    if package not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            package, COMPONENT_DIR / "__init__.py",
+            submodule_search_locations=[str(COMPONENT_DIR)])
+        sys.modules[package] = importlib.util.module_from_spec(spec)
+    return importlib.import_module(f"{package}.{name}")
+
+
+# All field sensors configured, same order and scaling as SENSORS_CONFIG
+# (sensors_config.py needs ESPHome): key, field, type, step, divisor
+HOST_SENSORS = [
+    ("solaris_p1", "SOLARIS_P1", "numeric", 1, 1),
+    ("solaris_tk", "SOLARIS_TK", "numeric", 1, 1),
+    ("solaris_tr", "SOLARIS_TR", "numeric", 1, 1),
+    ("solaris_ts", "SOLARIS_TS", "numeric", 1, 1),
+    ("solaris_tv", "SOLARIS_TV", "numeric", 1, 1),
+    ("solaris_df", "SOLARIS_DF", "numeric", 1, 100),
+    ("solaris_pwr", "SOLARIS_PWR", "numeric", 10, 100),
+    ("solaris_ha", "SOLARIS_HA", "binary", 1, 1),
+    ("solaris_bk", "SOLARIS_BK", "binary", 1, 1),
+    ("solaris_p2", "SOLARIS_P2", "binary", 1, 1),
+    ("solaris_err", "SOLARIS_ERR", "text", 1, 1),
+]
+
+
+def main():
+    languages = sys.argv[1].split() if len(sys.argv) > 1 else ["de"]
+    out_dir = sys.argv[2] if len(sys.argv) > 2 else "build"
+    error_codes = load_component_module("error_codes")
+    path, written = error_codes.write_error_codes_header(out_dir, languages)
+    print(f"{path}: {'generated' if written else 'unchanged'}")
+
+    sensor_table = load_component_module("sensor_table")
+    entries = [sensor_table.SensorTableEntry(*sensor) for sensor in HOST_SENSORS]
+    path, written, _ = sensor_table.write_sensor_table_header(out_dir, entries)
+    print(f"{path}: {'generated' if written else 'unchanged'}")
+
+
+if __name__ == "__main__":
+    main()
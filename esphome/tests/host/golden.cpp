@@ -0,0 +1,234 @@
+// Golden-output driver: replays a capture line by line (5 s apart, like a
+// Solaris cycle, with a 60 s heartbeat, aggregation window, counter save and
+// health interval) and prints every state and MQTT JSON document the component
+// publishes, followed by a link loss, the frame history download, the counters restored
+// after a simulated reboot, the simulate: data source and the UDP batches and
+// Wi-Fi switching of the low-power mode, two instances with different
+// features and the parser task. `make check` diffs the result against
+// golden/expected.txt.
+#include <cstdio>
+#include <cstring>
+
+#include "host_harness.h"
+
+using namespace esphome;
+using namespace esphome::daikin_rotex_solaris;
+
+static void print_publish(const EntityBase *entity, const char *state) {
+  std::printf("  %s=%s\n", entity->get_name().c_str(), state);
+}
+
+#ifdef USE_SOLARIS_MQTT_JSON
+static void print_mqtt(const std::string &topic, const char *payload, size_t len, bool retain) {
+  std::printf("  mqtt %s%s %.*s\n", topic.c_str(), retain ? " (retained)" : "", static_cast<int>(len), payload);
+}
+#endif
+
+#ifdef USE_SOLARIS_UDP
+static uint32_t get_u32(const uint8_t *in) {
+  return in[0] | in[1] << 8 | in[2] << 16 | static_cast<uint32_t>(in[3]) << 24;
+}
+
+// Sequence numbers and device times of the first and last record
+static void print_udp(const uint8_t *data, size_t len) {
+  const uint8_t count = data[3];
+  const uint8_t *last = data + UDP_HEADER_SIZE + (count - 1) * UDP_RECORD_SIZE;
+  std::printf("  udp %u records (%u bytes): seq %u-%u, %ums-%ums\n", count, static_cast<unsigned>(len),
+    get_u32(data + UDP_HEADER_SIZE), get_u32(last), get_u32(data + UDP_HEADER_SIZE + 4), get_u32(last + 4));
+}
+#endif
+
+#ifdef USE_SOLARIS_LOW_POWER
+
+static void print_wifi(bool enabled) {
+  std::printf("  wifi %s\n", enabled ? "enabled" : "disabled");
+}
+#endif
+
+int main(int argc, char **argv) {
+  const char *path = argc > 1 ? argv[1] : "corpus/frames.txt";
+  auto lines = read_lines(path);
+  if (lines.empty()) {
+    std::fprintf(stderr, "No input lines in '%s'\n", path);
+    return 1;
+  }
+
+  HostSolaris solaris;
+  solaris.set_heartbeat(60000);
+#ifdef USE_SOLARIS_AGGREGATES
+  solaris.set_aggregation_window(60000);
+#endif
+#ifdef USE_SOLARIS_ACCUMULATORS
+  solaris.set_accumulator_save_interval(60000);
+#endif
+#ifdef USE_SOLARIS_HEALTH
+  solaris.set_health_interval(60000);
+#endif
+#ifdef USE_TIME
+  solaris.clock.set_epoch(1700000000);  // 2023-11-14T22:13:20Z
+#endif
+#ifdef USE_SOLARIS_MQTT_JSON
+  solaris.set_mqtt_json("host/solaris/frame", 0, false);
+  solaris.add_mqtt_json_discovery("homeassistant/sensor/host/solaris_tk/config",
+    "{\"name\":\"solaris_tk\",\"stat_t\":\"host/solaris/frame\",\"val_tpl\":\"{{ value_json.tk }}\"");
+  host::mqtt_observer = print_mqtt;
+#endif
+  host::set_millis(0);
+  host::publish_observer = print_publish;
+
+  for (const auto &line : lines) {
+    std::printf("> %s\n", line.c_str());
+    std::string framed = line + "\r\n";
+    solaris.feed_and_loop(framed.data(), framed.size());
+    host::advance_millis(5000);
+  }
+
+  // Link loss: the field sensors become unknown after 3 cycles without a
+  // frame, the next frame publishes all of them again
+  std::printf("> silence (20 s)\n");
+  for (int i = 0; i < 4; i++) {
+    solaris.feed_and_loop("", 0);
+    host::advance_millis(5000);
+  }
+  static const char RESUMED_LINE[] = "0;0;35;0;75;46;59;49;0,0;;0\r\n";
+  std::printf("> %.*s\n", static_cast<int>(sizeof(RESUMED_LINE) - 3), RESUMED_LINE);
+  solaris.feed_and_loop(RESUMED_LINE, sizeof(RESUMED_LINE) - 1);
+  host::advance_millis(5000);
+
+#ifdef USE_SOLARIS_HISTORY
+  // Download of the frame history, must match the replayed data lines
+  std::printf("> history.csv (%u frames)\n", solaris.history().get_stored_frames());
+  solaris.history().export_to(HISTORY_FORMAT_CSV, millis(), [](const char *data, size_t len) {
+    std::fwrite(data, 1, len, stdout);
+  });
+#endif
+
+#ifdef USE_SOLARIS_ACCUMULATORS
+  // Reboot: the counters must survive in the (fake) flash
+  solaris.on_safe_shutdown();
+  std::printf("> reboot (%llu flash writes)\n", static_cast<unsigned long long>(host::preference_saves));
+  HostSolaris rebooted;
+#endif
+
+#ifdef USE_SOLARIS_SIMULATE
+  // Simulated data source: the configured lines in turn, UART data is ignored
+  std::printf("> simulate (2 lines every 5 s, 3 cycles)\n");
+  host::publish_observer = nullptr;
+#ifdef USE_SOLARIS_MQTT_JSON
+  host::mqtt_observer = nullptr;
+#endif
+  HostSolaris simulated;
+  simulated.set_simulate_interval(5000);
+  simulated.add_simulate_line("0;1;75;0;84;58;61;63;3,2;;3500");
+  simulated.add_simulate_line("0;0;0;0;40;45;60;42;0,0;K;0");
+  host::publish_observer = print_publish;
+  static const char UART_LINE[] = "1;1;100;1;99;99;99;99;9,9;;9999\r\n";
+  for (int i = 0; i < 3; i++) {
+    simulated.feed_and_loop(UART_LINE, sizeof(UART_LINE) - 1);
+    host::advance_millis(5000);
+  }
+#ifdef USE_SOLARIS_MQTT_JSON
+  // Without mqtt_json: (no topic) the instance publishes no documents
+  std::printf("> MQTT JSON without topic: %u published, %u failed\n", simulated.mqtt_json().get_published(),
+    simulated.mqtt_json().get_failed());
+#endif
+#endif
+
+#ifdef USE_SOLARIS_LOW_POWER
+  // Low-power mode: the frames are queued with the time they were received
+  // and sent as batches when Wi-Fi is up, every 30 s and right away on an
+  // error code change, the radio stays on for 10 s per flush
+  std::printf("> low power (flush every 30 s, 10 s awake, error K at 40 s)\n");
+  host::publish_observer = nullptr;
+#ifdef USE_SOLARIS_MQTT_JSON
+  host::mqtt_observer = nullptr;
+#endif
+  host::set_millis(0);
+  HostSolaris low_power;
+  low_power.set_udp_push("127.0.0.1", 9, 1);  // Discard port
+  low_power.set_low_power(30000, 16, true, 10000);
+  host::udp_observer = print_udp;
+  host::wifi_observer = print_wifi;
+  static const char LOW_POWER_LINE[] = "0;1;75;0;84;58;61;63;3,2;;3500\r\n";
+  static const char ERROR_LINE[] = "0;0;0;0;40;45;60;42;0,0;K;0\r\n";
+  for (int i = 0; i < 12; i++) {
+    const bool error = i == 8 || i == 9;
+    std::printf("> %us %s\n", millis() / 1000, error ? "error K" : "frame");
+    if (error) {
+      low_power.feed_and_loop(ERROR_LINE, sizeof(ERROR_LINE) - 1);
+    } else {
+      low_power.feed_and_loop(LOW_POWER_LINE, sizeof(LOW_POWER_LINE) - 1);
+    }
+    host::advance_millis(5000);
+  }
+  std::printf("> %u datagrams, %u frames queued, %u dropped\n", low_power.udp_push().get_sent(),
+    low_power.udp_push().get_queued(), low_power.udp_push().get_dropped());
+  host::udp_observer = nullptr;
+  host::wifi_observer = nullptr;
+#endif
+
+#if defined(USE_SOLARIS_UDP) && defined(USE_SOLARIS_HISTORY)
+  // Two instances, udp_push: and history: configured for the first only. The
+  // defines are global, the second must neither send nor allocate a history.
+  std::printf("> two instances (udp_push and history on the first only)\n");
+  host::publish_observer = nullptr;
+#ifdef USE_SOLARIS_MQTT_JSON
+  host::mqtt_observer = nullptr;
+#endif
+  host::set_millis(0);
+  HostSolaris first;
+  first.set_udp_push("127.0.0.1", 9, 1);  // Discard port
+  HostSolaris second(false);
+  second.set_instance(1, "daikin_rotex_solaris.second");
+  host::udp_observer = print_udp;
+  static const char INSTANCE_LINE[] = "0;1;75;0;84;58;61;63;3,2;;3500\r\n";
+  for (int i = 0; i < 2; i++) {
+    std::printf("> %us first\n", millis() / 1000);
+    first.feed_and_loop(INSTANCE_LINE, sizeof(INSTANCE_LINE) - 1);
+    std::printf("> %us second\n", millis() / 1000);
+    second.feed_and_loop(INSTANCE_LINE, sizeof(INSTANCE_LINE) - 1);
+    host::advance_millis(5000);
+  }
+  const HostSolaris *instances[] = {&first, &second};
+  for (const auto *instance : instances) {
+    std::printf("> %s: %u datagrams, history %u bytes, %u frames\n", instance == &first ? "first" : "second",
+      instance->udp_push().get_sent(), static_cast<unsigned>(instance->history().get_capacity()),
+      instance->history().get_stored_frames());
+  }
+  host::udp_observer = nullptr;
+#endif
+
+#ifdef USE_SOLARIS_PARSER_TASK
+  // Parser task: receive_() decodes the bytes and queues the lines (in the
+  // task on the device), loop() publishes them. Six frames while loop() is
+  // blocked overflow the queue of 4 lines, the newest are dropped and the
+  // latest queued frame is published. A partial line is discarded after half
+  // a cycle without data.
+  std::printf("> parser task (queue 4 lines)\n");
+  host::publish_observer = nullptr;
+#ifdef USE_SOLARIS_MQTT_JSON
+  host::mqtt_observer = nullptr;
+#endif
+  host::set_millis(0);
+  HostSolaris tasked;
+  tasked.set_parser_task(1, 5, 4);
+  tasked.setup();
+  host::publish_observer = print_publish;
+  auto receive = [&tasked](const char *data) {
+    tasked.receive_(reinterpret_cast<const uint8_t *>(data), std::strlen(data), millis());
+  };
+  std::printf("> 6 frames TK 80-85, one loop()\n");
+  receive("0;1;75;0;80;58;61;63;3,2;;3500\r\n0;1;75;0;81;58;61;63;3,2;;3500\r\n0;1;75;0;82;58;61;63;3,2;;3500\r\n");
+  receive("0;1;75;0;83;58;61;63;3,2;;3500\r\n0;1;75;0;84;58;61;63;3,2;;3500\r\n0;1;75;0;85;58;61;63;3,2;;3500\r\n");
+  tasked.loop();
+  std::printf("> %u lines dropped\n", tasked.line_queue().get_dropped());
+  host::advance_millis(5000);
+  std::printf("> partial line, 3 s silence, rest of the line and a frame TK 90\n");
+  receive("0;0;35;0;99;46");
+  host::advance_millis(3000);
+  tasked.receive_(nullptr, 0, millis());
+  receive(";59;49;0,0;;0\r\n0;0;35;0;90;46;59;49;0,0;;0\r\n");
+  tasked.loop();
+#endif
+  return 0;
+}
@@ -0,0 +1,174 @@
+#include "host_harness.h"
+
+#include <algorithm>
+#include <cctype>
+#include <fstream>
+
+namespace esphome {
+
+// ============================================================================
+// FAKE CLOCK - millis()/micros() are fully controlled by the harness
+// ============================================================================
+static uint32_t host_millis = 0;
+
+uint32_t millis() { return host_millis; }
+uint32_t micros() { return host_millis * 1000u; }
+
+namespace host {
+void set_millis(uint32_t ms) { host_millis = ms; }
+void advance_millis(uint32_t ms) { host_millis += ms; }
+
+PublishObserver publish_observer = nullptr;
+uint64_t publish_count = 0;
+
+std::map<uint32_t, std::vector<uint8_t>> preference_store;
+uint64_t preference_saves = 0;
+} // namespace host
+
+#ifdef USE_SOLARIS_MQTT_JSON
+namespace host {
+MqttObserver mqtt_observer = nullptr;
+bool mqtt_connected = true;
+} // namespace host
+
+static mqtt::MQTTClientComponent host_mqtt_client;
+mqtt::MQTTClientComponent *mqtt::global_mqtt_client = &host_mqtt_client;
+#endif
+
+#ifdef USE_SOLARIS_UDP
+namespace host {
+UdpObserver udp_observer = nullptr;
+} // namespace host
+#endif
+
+#ifdef USE_WIFI
+namespace host {
+WifiObserver wifi_observer = nullptr;
+bool wifi_reachable = true;
+} // namespace host
+
+static wifi::WiFiComponent host_wifi;
+wifi::WiFiComponent *wifi::global_wifi_component = &host_wifi;
+#endif
+
+static ESPPreferences host_preferences;
+ESPPreferences *global_preferences = &host_preferences;
+
+namespace daikin_rotex_solaris {
+
+HostSolaris::HostSolaris(bool history) {
+  // Same defaults as the YAML schema
+  set_loop_budget(2000);
+  set_latest_frame_only(true);
+
+  // Field sensors by their slot in the generated SENSOR_TABLE
+  sensor::Sensor *numeric[] = {&p1, &tk, &tr, &ts, &tv, &df, &pwr};
+  binary_sensor::BinarySensor *binary[] = {&ha, &bk, &p2};
+  for (const auto &sensor : SENSOR_TABLE) {
+    switch (sensor.kind) {
+      case SENSOR_KIND_NUMERIC:
+        for (auto *s : numeric) {
+          if (s->get_name() == sensor.key) set_sensor(sensor.slot, s);
+        }
+        break;
+      case SENSOR_KIND_BINARY:
+        for (auto *s : binary) {
+          if (s->get_name() == sensor.key) set_sensor(sensor.slot, s);
+        }
+        break;
+      case SENSOR_KIND_TEXT:
+        set_sensor(sensor.slot, &err);
+        break;
+    }
+  }
+
+#ifdef USE_SOLARIS_AGGREGATES
+  // Windowed aggregates of every numeric field, same keys as SENSORS_CONFIG
+  static const struct {
+    SolarisFields field;
+    const char *key;
+  } AGGREGATED[] = {
+    {SOLARIS_P1, "solaris_p1"}, {SOLARIS_TK, "solaris_tk"}, {SOLARIS_TR, "solaris_tr"},
+    {SOLARIS_TS, "solaris_ts"}, {SOLARIS_TV, "solaris_tv"}, {SOLARIS_DF, "solaris_df"},
+    {SOLARIS_PWR, "solaris_pwr"},
+  };
+  static const char *const STATS[] = {"min", "max", "mean", "twmean"};
+  for (const auto &agg : AGGREGATED) {
+    for (uint8_t stat = 0; stat < AGGREGATE_STAT_COUNT; stat++) {
+      if (stat == AGGREGATE_TIME_WEIGHTED_MEAN && agg.field != SOLARIS_PWR) continue;
+      extra_sensors.emplace_back(new sensor::Sensor(std::string(agg.key) + "_" + STATS[stat]));
+      set_aggregate_sensor(agg.field, static_cast<AggregateStat>(stat), extra_sensors.back().get());
+    }
+  }
+#endif
+
+#ifdef USE_SOLARIS_ACCUMULATORS
+  static const char *const ACCUMULATED[ACCUMULATOR_COUNT] = {
+    "solaris_energy", "solaris_p1_runtime", "solaris_p2_runtime", "solaris_bk_starts", "solaris_ha_starts",
+  };
+  for (uint8_t i = 0; i < ACCUMULATOR_COUNT; i++) {
+    extra_sensors.emplace_back(new sensor::Sensor(ACCUMULATED[i]));
+    set_accumulator_sensor(static_cast<AccumulatorType>(i), extra_sensors.back().get());
+  }
+#endif
+
+#ifdef USE_SOLARIS_ERROR_STATS
+  // Occurrence counters of every code, same keys as the translations
+  static const char *const ERROR_KEYS[] = {"K", "R", "S", "D", "V", "G", "F", "W", "unknown"};
+  for (const char *code : ERROR_KEYS) {
+    std::string key = std::string("solaris_err_count_") + code;
+    std::transform(key.begin(), key.end(), key.begin(), ::tolower);
+    extra_sensors.emplace_back(new sensor::Sensor(key));
+    set_error_count_sensor(code, extra_sensors.back().get());
+  }
+  extra_sensors.emplace_back(new sensor::Sensor("solaris_err_duration"));
+  set_error_duration_sensor(extra_sensors.back().get());
+  set_error_last_cleared_sensor(&err_last_cleared);
+#ifdef USE_TIME
+  set_time(&clock);
+#endif
+#endif
+
+#ifdef USE_SOLARIS_HEALTH
+  static const char *const HEALTH_KEYS[HEALTH_METRIC_COUNT] = {
+    "solaris_frames_ok", "solaris_frames_rejected_length", "solaris_frames_rejected_incomplete",
+    "solaris_frames_invalid_tokens", "solaris_line_timeouts", "solaris_uart_rate", "solaris_line_time_max",
+    "solaris_line_time_mean", "solaris_loop_time_max", "solaris_last_frame_age", "solaris_cycle",
+    "solaris_frames_missed", "solaris_frame_jitter_max", "solaris_frame_jitter_mean", "solaris_stale_events",
+  };
+  for (uint8_t i = 0; i < HEALTH_METRIC_COUNT; i++) {
+    extra_sensors.emplace_back(new sensor::Sensor(HEALTH_KEYS[i]));
+    set_health_sensor(static_cast<HealthMetric>(i), extra_sensors.back().get());
+  }
+#endif
+
+#ifdef USE_SOLARIS_HISTORY
+  if (history) set_history_size(16384);  // YAML default
+#endif
+
+  // Entities are registered, run setup() like App.setup() would
+  setup();
+}
+
+std::vector<const EntityBase *> HostSolaris::entities() const {
+  std::vector<const EntityBase *> all = {&p1, &tk, &tr, &ts, &tv, &df, &pwr, &ha, &bk, &p2, &err};
+  for (const auto &s : extra_sensors) all.push_back(s.get());
+#ifdef USE_SOLARIS_ERROR_STATS
+  all.push_back(&err_last_cleared);
+#endif
+  return all;
+}
+
+std::vector<std::string> read_lines(const char *path) {
+  std::vector<std::string> lines;
+  std::ifstream in(path, std::ios::binary);
+  std::string line;
+  while (std::getline(in, line)) {
+    while (!line.empty() && (line.back() == '\r' || line.back() == '\n')) line.pop_back();
+    if (!line.empty()) lines.push_back(line);
+  }
+  return lines;
+}
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
@@ -0,0 +1,79 @@
+#pragma once
+
+// Shared helpers for the host-native harness binaries (bench, fuzz, golden).
+// Builds daikin_rotex_solaris.cpp unchanged against the stand-ins in stubs/.
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include "daikin_rotex_solaris.h"
+#ifdef USE_SOLARIS_MQTT_JSON
+#include "esphome/components/mqtt/mqtt_client.h"
+#endif
+#ifdef USE_WIFI
+#include "esphome/components/wifi/wifi_component.h"
+#endif
+
+namespace esphome {
+namespace daikin_rotex_solaris {
+
+// Exposes the protected parser entry point and owns one instance of every entity
+class HostSolaris : public DaikinRotexSolarisComponent {
+  public:
+    // history: false leaves the frame history unconfigured (size 0)
+    explicit HostSolaris(bool history = true);
+
+    using DaikinRotexSolarisComponent::parse_line_;
+#ifdef USE_SOLARIS_PARSER_TASK
+    // The parser task's entry point, there is no FreeRTOS task on the host
+    using DaikinRotexSolarisComponent::receive_;
+#endif
+
+    // Feed raw bytes into the fake UART and run one loop() iteration
+    void feed_and_loop(const char *data, size_t len) {
+      host_feed(data, len);
+      loop();
+    }
+
+    sensor::Sensor p1{"solaris_p1"}, tk{"solaris_tk"}, tr{"solaris_tr"}, ts{"solaris_ts"};
+    sensor::Sensor tv{"solaris_tv"}, df{"solaris_df"}, pwr{"solaris_pwr"};
+    binary_sensor::BinarySensor ha{"solaris_ha"}, bk{"solaris_bk"}, p2{"solaris_p2"};
+    text_sensor::TextSensor err{"solaris_err"};
+#ifdef USE_SOLARIS_ERROR_STATS
+    text_sensor::TextSensor err_last_cleared{"solaris_err_last_cleared"};
+#endif
+#ifdef USE_TIME
+    time::RealTimeClock clock;  // Not synchronized until set_epoch()
+#endif
+
+    // Optional feature entities, owned here and registered with their setters
+    std::vector<std::unique_ptr<sensor::Sensor>> extra_sensors;
+
+    const SolarisWatchdog &watchdog() const { return watchdog_; }
+#ifdef USE_SOLARIS_HISTORY
+    SolarisHistory &history() { return history_; }
+    const SolarisHistory &history() const { return history_; }
+#endif
+#ifdef USE_SOLARIS_UDP
+    const SolarisUdpPush &udp_push() const { return udp_push_; }
+#endif
+#ifdef USE_SOLARIS_MQTT_JSON
+    SolarisMqttJson &mqtt_json() { return mqtt_json_; }
+#endif
+#ifdef USE_SOLARIS_LOW_POWER
+    const SolarisLowPower &low_power() const { return low_power_; }
+#endif
+#ifdef USE_SOLARIS_PARSER_TASK
+    const SolarisLineQueue &line_queue() const { return line_queue_; }
+#endif
+
+    // All entities in SENSORS_CONFIG order, used for reporting
+    std::vector<const EntityBase *> entities() const;
+};
+
+// Read a capture file into lines (CR/LF stripped, empty lines kept out)
+std::vector<std::string> read_lines(const char *path);
+
+} // namespace daikin_rotex_solaris
+} // namespace esphome
@@ -0,0 +1,113 @@
+// Checks of the parser task's line queue (solaris_line_queue.h): order,
+// capacity, drops when full, and a producer and a consumer thread passing
+// 200000 lines. Built with ThreadSanitizer by `make check`.
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <thread>
+
+#include "solaris_line_queue.h"
+
+using namespace esphome::daikin_rotex_solaris;
+
+static int failures = 0;
+
+#define CHECK(cond)                                                    \
+  do {                                                                 \
+    if (!(cond)) {                                                     \
+      std::fprintf(stderr, "%s:%d: check failed: %s\n", __FILE__, __LINE__, #cond); \
+      failures++;                                                      \
+    }                                                                  \
+  } while (0)
+
+// Line of a frame with seq as PWR, like the parser task would queue it
+static SolarisLine frame_line(uint32_t seq) {
+  char text[48];
+  int len = std::snprintf(text, sizeof(text), "0;1;75;0;84;58;61;63;3,2;;%u\n", static_cast<unsigned>(seq));
+  SolarisLine line;
+  for (int i = 0; i < len; i++) line.result = line.parser.feed(static_cast<uint8_t>(text[i]));
+  line.decode_us = seq;
+  return line;
+}
+
+static void test_order_and_drops() {
+  SolarisLineQueue queue;
+  CHECK(queue.get_capacity() == 0);
+  CHECK(queue.allocate(5));
+  CHECK(queue.get_capacity() == 8);
+  CHECK(queue.front() == nullptr);
+
+  for (uint32_t seq = 0; seq < 10; seq++) CHECK(queue.push(frame_line(seq)) == (seq < 8));
+  CHECK(queue.get_dropped() == 2);
+
+  // Oldest first, the dropped lines are the newest ones
+  for (uint32_t seq = 0; seq < 8; seq++) {
+    const SolarisLine *line = queue.front();
+    CHECK(line != nullptr && line->result == SolarisParseResult::FRAME);
+    CHECK(line != nullptr && line->parser.frame().values[SOLARIS_PWR] == static_cast<int32_t>(seq));
+    queue.pop();
+    // Free-running counters wrap around the ring
+    if (seq < 4) CHECK(queue.push(frame_line(100 + seq)));
+  }
+  for (uint32_t seq = 100; seq < 104; seq++) {
+    CHECK(queue.front() != nullptr && queue.front()->decode_us == seq);
+    queue.pop();
+  }
+  CHECK(queue.front() == nullptr);
+}
+
+static void test_threads(uint32_t lines) {
+  SolarisLineQueue queue;
+  CHECK(queue.allocate(16));
+
+  // Retries a full queue, except for every 1000th line which is dropped then
+  uint32_t failed_pushes = 0, lost = 0;
+  std::thread producer([&queue, &failed_pushes, &lost, lines]() {
+    for (uint32_t seq = 0; seq < lines; seq++) {
+      SolarisLine line = frame_line(seq);
+      while (!queue.push(line)) {
+        failed_pushes++;
+        if (seq % 1000 == 0) {
+          lost++;
+          break;
+        }
+        std::this_thread::yield();
+      }
+    }
+  });
+
+  // Every line arrives intact and in order, only lines dropped while full are missing
+  uint32_t received = 0, next = 0;
+  while (next < lines) {
+    const SolarisLine *line = queue.front();
+    if (line == nullptr) {
+      std::this_thread::yield();
+      continue;
+    }
+    const uint32_t seq = line->decode_us;
+    CHECK(seq == next || (next % 1000 == 0 && seq == next + 1));
+    // A slot read while it is written would mix two lines
+    CHECK(line->parser.frame().values[SOLARIS_PWR] == static_cast<int32_t>(seq));
+    queue.pop();
+    received++;
+    next = seq + 1;
+    if (failures > 10) std::exit(1);
+  }
+  producer.join();
+  CHECK(queue.front() == nullptr);
+  CHECK(queue.get_dropped() == failed_pushes);
+  CHECK(received + lost == lines);
+  std::printf("threads: %u lines, %u dropped\n", lines, lost);
+}
+
+int main(int argc, char **argv) {
+  const uint32_t lines = argc > 1 ? std::strtoul(argv[1], nullptr, 10) : 200000;
+  test_order_and_drops();
+  test_threads(lines);
+  if (failures > 0) {
+    std::fprintf(stderr, "%d check(s) failed\n", failures);
+    return 1;
+  }
+  std::printf("Line queue OK\n");
+  return 0;
+}
@@ -0,0 +1,94 @@
+// Replays a capture through the component with the UDP push enabled, e.g. to
+// feed tools/solaris_collector.py on localhost:
+//
+//   python3 ../../../tools/solaris_collector.py --listen 127.0.0.1:4210 --csv /tmp/frames.csv &
+//   ./build/replay -u 127.0.0.1:4210 -d 7 -n 3 corpus/frames.txt
+//
+// The fake clock advances one Solaris cycle per line, -r sets how many lines
+// are sent per real second. -b queues the frames and sends them as batches
+// like the low-power mode (the radio stays on).
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <string>
+#include <thread>
+
+#include "host_harness.h"
+
+using namespace esphome;
+using namespace esphome::daikin_rotex_solaris;
+
+static void usage(const char *prog) {
+  std::fprintf(stderr,
+               "usage: %s -u HOST:PORT [-d DEVICE_ID] [-n REPEATS] [-r LINES_PER_S] [-b FLUSH_S] [FRAMES_FILE]\n"
+               "  -u HOST:PORT  UDP target (IPv4)\n"
+               "  -d DEVICE_ID  device id in the datagrams (default 1)\n"
+               "  -n REPEATS    replay the capture this many times (default 1)\n"
+               "  -r LINES_PER_S  pace the replay (default 0 = as fast as possible)\n"
+               "  -b FLUSH_S    send the frames as batches every FLUSH_S device seconds (default 0 = each frame)\n",
+               prog);
+}
+
+int main(int argc, char **argv) {
+  std::string target;
+  uint16_t device_id = 1;
+  size_t repeats = 1;
+  double rate = 0;
+  uint32_t flush_s = 0;
+  const char *path = "corpus/frames.txt";
+
+  for (int i = 1; i < argc; i++) {
+    if (std::strcmp(argv[i], "-u") == 0 && i + 1 < argc) {
+      target = argv[++i];
+    } else if (std::strcmp(argv[i], "-d") == 0 && i + 1 < argc) {
+      device_id = std::strtoul(argv[++i], nullptr, 10);
+    } else if (std::strcmp(argv[i], "-n") == 0 && i + 1 < argc) {
+      repeats = std::strtoull(argv[++i], nullptr, 10);
+    } else if (std::strcmp(argv[i], "-r") == 0 && i + 1 < argc) {
+      rate = std::strtod(argv[++i], nullptr);
+    } else if (std::strcmp(argv[i], "-b") == 0 && i + 1 < argc) {
+      flush_s = std::strtoul(argv[++i], nullptr, 10);
+    } else if (argv[i][0] == '-') {
+      usage(argv[0]);
+      return 2;
+    } else {
+      path = argv[i];
+    }
+  }
+
+  size_t colon = target.rfind(':');
+  if (colon == std::string::npos) {
+    usage(argv[0]);
+    return 2;
+  }
+
+  auto lines = read_lines(path);
+  if (lines.empty()) {
+    std::fprintf(stderr, "No input lines in '%s'\n", path);
+    return 1;
+  }
+
+  HostSolaris solaris;
+  solaris.set_udp_push(target.substr(0, colon), std::atoi(target.c_str() + colon + 1), device_id);
+  if (flush_s > 0) solaris.set_low_power(flush_s * 1000, UDP_MAX_BATCH_RECORDS * 4, false, 0);
+  host::set_millis(0);
+
+  for (size_t r = 0; r < repeats; r++) {
+    for (const auto &line : lines) {
+      std::string framed = line + "\r\n";
+      solaris.feed_and_loop(framed.data(), framed.size());
+      host::advance_millis(5000);
+      if (rate > 0) std::this_thread::sleep_for(std::chrono::duration<double>(1.0 / rate));
+    }
+  }
+
+  if (flush_s > 0) {
+    // Last batch
+    host::advance_millis(flush_s * 1000);
+    solaris.feed_and_loop("", 0);
+  }
+
+  std::printf("sent %u datagrams, %u failed\n", solaris.udp_push().get_sent(), solaris.udp_push().get_failed());
+  return solaris.udp_push().get_failed() == 0 ? 0 : 1;
+}
@@ -0,0 +1,25 @@
+#pragma once
+
+// Host stand-in for esphome/components/binary_sensor/binary_sensor.h
+#include "esphome/core/entity_base.h"
+
+namespace esphome {
+namespace binary_sensor {
+
+class BinarySensor : public EntityBase {
+  public:
+    using EntityBase::EntityBase;
+
+    void publish_state(bool state) {
+      this->state = state;
+      notify_publish_(state ? "ON" : "OFF");
+    }
+
+    // No state (unknown in Home Assistant)
+    void invalidate_state() { notify_publish_("unknown"); }
+
+    bool state{false};
+};
+
+} // namespace binary_sensor
+} // namespace esphome
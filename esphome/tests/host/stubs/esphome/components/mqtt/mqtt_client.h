@@ -0,0 +1,33 @@
+#pragma once
+
+// Host stand-in for esphome/components/mqtt/mqtt_client.h - an always
+// connected client that hands every message to an observer of the harness
+#include <cstddef>
+#include <cstdint>
+#include <string>
+
+namespace esphome {
+
+namespace host {
+using MqttObserver = void (*)(const std::string &topic, const char *payload, size_t len, bool retain);
+extern MqttObserver mqtt_observer;
+extern bool mqtt_connected;
+} // namespace host
+
+namespace mqtt {
+
+class MQTTClientComponent {
+  public:
+    bool is_connected() { return host::mqtt_connected; }
+    bool publish(const std::string &topic, const char *payload, size_t payload_length, uint8_t qos = 0,
+                 bool retain = false) {
+      if (!host::mqtt_connected) return false;
+      if (host::mqtt_observer != nullptr) host::mqtt_observer(topic, payload, payload_length, retain);
+      return true;
+    }
+};
+
+extern MQTTClientComponent *global_mqtt_client;
+
+} // namespace mqtt
+} // namespace esphome
@@ -0,0 +1,25 @@
+#pragma once
+
+// Host stand-in for esphome/components/sensor/sensor.h
+#include <cstdio>
+#include "esphome/core/entity_base.h"
+
+namespace esphome {
+namespace sensor {
+
+class Sensor : public EntityBase {
+  public:
+    using EntityBase::EntityBase;
+
+    void publish_state(float state) {
+      this->state = state;
+      char buf[32];
+      std::snprintf(buf, sizeof(buf), "%.6g", state);
+      notify_publish_(buf);
+    }
+
+    float state{0.0f};
+};
+
+} // namespace sensor
+} // namespace esphome
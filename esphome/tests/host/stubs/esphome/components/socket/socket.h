@@ -0,0 +1,62 @@
+#pragma once
+
+// Host stand-in for esphome/components/socket/socket.h - thin wrapper around
+// POSIX sockets, so the UDP push can be received by a collector on localhost.
+// Every datagram sent is also handed to an observer of the harness.
+#include <arpa/inet.h>
+#include <fcntl.h>
+#include <netinet/in.h>
+#include <sys/socket.h>
+#include <unistd.h>
+
+#include <cstdint>
+#include <cstring>
+#include <memory>
+#include <string>
+
+namespace esphome {
+
+namespace host {
+using UdpObserver = void (*)(const uint8_t *data, size_t len);
+extern UdpObserver udp_observer;
+} // namespace host
+
+namespace socket {
+
+class Socket {
+  public:
+    explicit Socket(int fd) : fd_(fd) {}
+    ~Socket() { ::close(fd_); }
+
+    int setblocking(bool blocking) {
+      int flags = fcntl(fd_, F_GETFL, 0);
+      return fcntl(fd_, F_SETFL, blocking ? flags & ~O_NONBLOCK : flags | O_NONBLOCK);
+    }
+    ssize_t sendto(const void *buf, size_t len, int flags, const struct sockaddr *to, socklen_t tolen) {
+      ssize_t sent = ::sendto(fd_, buf, len, flags, to, tolen);
+      if (sent >= 0 && host::udp_observer != nullptr) host::udp_observer(static_cast<const uint8_t *>(buf), sent);
+      return sent;
+    }
+
+  protected:
+    int fd_;
+};
+
+inline std::unique_ptr<Socket> socket(int domain, int type, int protocol) {
+  int fd = ::socket(domain, type, protocol);
+  return fd < 0 ? nullptr : std::unique_ptr<Socket>(new Socket(fd));
+}
+
+inline socklen_t set_sockaddr(struct sockaddr *addr, socklen_t addrlen, const std::string &ip_address,
+                              uint16_t port) {
+  if (addrlen < sizeof(struct sockaddr_in)) return 0;
+  auto *server = reinterpret_cast<struct sockaddr_in *>(addr);
+  memset(server, 0, sizeof(struct sockaddr_in));
+  server->sin_family = AF_INET;
+  server->sin_port = htons(port);
+  if (inet_pton(AF_INET, ip_address.c_str(), &server->sin_addr) != 1) return 0;
+  return sizeof(struct sockaddr_in);
+}
+
+} // namespace socket
+} // namespace esphome
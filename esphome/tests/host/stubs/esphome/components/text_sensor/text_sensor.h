@@ -0,0 +1,23 @@
+#pragma once
+
+// Host stand-in for esphome/components/text_sensor/text_sensor.h
+#include <string>
+#include "esphome/core/entity_base.h"
+
+namespace esphome {
+namespace text_sensor {
+
+class TextSensor : public EntityBase {
+  public:
+    using EntityBase::EntityBase;
+
+    void publish_state(const std::string &state) {
+      this->state = state;
+      notify_publish_(this->state.c_str());
+    }
+
+    std::string state;
+};
+
+} // namespace text_sensor
+} // namespace esphome
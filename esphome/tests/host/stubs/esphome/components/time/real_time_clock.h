@@ -0,0 +1,39 @@
+#pragma once
+
+// Host stand-in for esphome/components/time/real_time_clock.h - the clock
+// follows millis() from an epoch set by the harness, in UTC
+#include <cstddef>
+#include <ctime>
+#include "esphome/core/hal.h"
+
+namespace esphome {
+
+struct ESPTime {
+  time_t timestamp{0};
+
+  bool is_valid() const { return timestamp > 0; }
+
+  size_t strftime(char *buffer, size_t buffer_len, const char *format) {
+    struct tm tm {};
+    gmtime_r(&timestamp, &tm);
+    return ::strftime(buffer, buffer_len, format, &tm);
+  }
+
+  static ESPTime from_epoch_local(time_t epoch) { return ESPTime{epoch}; }
+};
+
+namespace time {
+
+class RealTimeClock {
+  public:
+    // Unix time at millis() == 0, 0 = not synchronized
+    void set_epoch(time_t epoch) { epoch_ = epoch; }
+
+    ESPTime now() { return ESPTime{epoch_ > 0 ? epoch_ + static_cast<time_t>(millis() / 1000) : 0}; }
+
+  protected:
+    time_t epoch_{0};
+};
+
+} // namespace time
+} // namespace esphome
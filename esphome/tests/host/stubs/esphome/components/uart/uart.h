@@ -0,0 +1,54 @@
+#pragma once
+
+// Host stand-in for esphome/components/uart/uart.h - the RX side is a byte
+// queue filled by the harness instead of a hardware FIFO
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <vector>
+
+namespace esphome {
+namespace uart {
+
+class UARTDevice {
+  public:
+    // Harness side: queue bytes that will be "received" by the component
+    void host_feed(const uint8_t *data, size_t len) {
+      if (rx_pos_ == rx_.size()) {
+        rx_.clear();
+        rx_pos_ = 0;
+      }
+      rx_.insert(rx_.end(), data, data + len);
+    }
+    void host_feed(const char *data, size_t len) {
+      host_feed(reinterpret_cast<const uint8_t *>(data), len);
+    }
+
+    int available() { return static_cast<int>(rx_.size() - rx_pos_); }
+
+    bool read_byte(uint8_t *data) {
+      if (rx_pos_ >= rx_.size()) return false;
+      *data = rx_[rx_pos_++];
+      return true;
+    }
+
+    bool read_array(uint8_t *data, size_t len) {
+      if (len > rx_.size() - rx_pos_) return false;
+      std::memcpy(data, rx_.data() + rx_pos_, len);
+      rx_pos_ += len;
+      return true;
+    }
+
+    bool peek_byte(uint8_t *data) {
+      if (rx_pos_ >= rx_.size()) return false;
+      *data = rx_[rx_pos_];
+      return true;
+    }
+
+  protected:
+    std::vector<uint8_t> rx_;
+    size_t rx_pos_{0};
+};
+
+} // namespace uart
+} // namespace esphome
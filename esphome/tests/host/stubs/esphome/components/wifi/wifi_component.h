@@ -0,0 +1,36 @@
+#pragma once
+
+// Host stand-in for esphome/components/wifi/wifi_component.h - the connection
+// is up as soon as the radio is enabled (unless the harness keeps it down),
+// every enable/disable is handed to an observer of the harness
+namespace esphome {
+
+namespace host {
+using WifiObserver = void (*)(bool enabled);
+extern WifiObserver wifi_observer;
+extern bool wifi_reachable;  // Access point in range, connects when enabled
+} // namespace host
+
+namespace wifi {
+
+class WiFiComponent {
+  public:
+    bool is_connected() { return enabled_ && host::wifi_reachable; }
+    bool is_disabled() { return !enabled_; }
+    void enable() {
+      enabled_ = true;
+      if (host::wifi_observer != nullptr) host::wifi_observer(true);
+    }
+    void disable() {
+      enabled_ = false;
+      if (host::wifi_observer != nullptr) host::wifi_observer(false);
+    }
+
+  protected:
+    bool enabled_{true};
+};
+
+extern WiFiComponent *global_wifi_component;
+
+} // namespace wifi
+} // namespace esphome
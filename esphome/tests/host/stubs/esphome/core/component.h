@@ -0,0 +1,28 @@
+#pragma once
+
+// Host stand-in for esphome/core/component.h
+#include "esphome/core/helpers.h"
+
+namespace esphome {
+
+namespace setup_priority {
+static constexpr float DATA = 600.0f;
+} // namespace setup_priority
+
+class Component {
+  public:
+    virtual ~Component() = default;
+    virtual void setup() {}
+    virtual void loop() {}
+    virtual void dump_config() {}
+    virtual void on_safe_shutdown() {}
+    virtual float get_setup_priority() const { return setup_priority::DATA; }
+
+    void mark_failed() { failed_ = true; }
+    bool is_failed() const { return failed_; }
+
+  protected:
+    bool failed_{false};
+};
+
+} // namespace esphome
@@ -0,0 +1,29 @@
+#pragma once
+
+// Host stand-in for the generated esphome/core/defines.h - enables every
+// optional component feature that can be exercised on the host and every
+// sensor of the generated SENSOR_TABLE (see gen_error_codes.py)
+#define USE_SOLARIS_AGGREGATES
+#define USE_SOLARIS_ACCUMULATORS
+#define USE_SOLARIS_HISTORY
+#define USE_SOLARIS_UDP
+#define USE_SOLARIS_LOW_POWER
+#define USE_SOLARIS_ERROR_STATS
+#define USE_SOLARIS_SIMULATE
+#define USE_SOLARIS_HEALTH
+#define USE_SOLARIS_MQTT_JSON
+#define USE_SOLARIS_PARSER_TASK
+#define USE_MQTT
+#define USE_TIME
+#define USE_WIFI
+#define USE_SOLARIS_P1
+#define USE_SOLARIS_TK
+#define USE_SOLARIS_TR
+#define USE_SOLARIS_TS
+#define USE_SOLARIS_TV
+#define USE_SOLARIS_DF
+#define USE_SOLARIS_PWR
+#define USE_SOLARIS_HA
+#define USE_SOLARIS_BK
+#define USE_SOLARIS_P2
+#define USE_SOLARIS_ERR
@@ -0,0 +1,37 @@
+#pragma once
+
+// Host stand-in for esphome/core/entity_base.h - every published state is
+// counted and optionally forwarded to a harness-wide observer
+#include <cstdint>
+#include <string>
+
+namespace esphome {
+
+class EntityBase;
+
+namespace host {
+// Called after every publish_state() with the entity and its state rendered as text
+using PublishObserver = void (*)(const EntityBase *entity, const char *state);
+extern PublishObserver publish_observer;
+extern uint64_t publish_count;
+} // namespace host
+
+class EntityBase {
+  public:
+    explicit EntityBase(std::string name = "") : name_(std::move(name)) {}
+    const std::string &get_name() const { return name_; }
+    void set_name(const std::string &name) { name_ = name; }
+    uint32_t get_publish_count() const { return publish_count_; }
+
+  protected:
+    void notify_publish_(const char *state) {
+      publish_count_++;
+      host::publish_count++;
+      if (host::publish_observer != nullptr) host::publish_observer(this, state);
+    }
+
+    std::string name_;
+    uint32_t publish_count_{0};
+};
+
+} // namespace esphome
@@ -0,0 +1,16 @@
+#pragma once
+
+// Host stand-in for esphome/core/hal.h - time is driven by the harness
+#include <cstdint>
+
+namespace esphome {
+
+uint32_t millis();
+uint32_t micros();
+
+namespace host {
+void set_millis(uint32_t ms);   // Set the fake clock (micros() follows)
+void advance_millis(uint32_t ms);
+} // namespace host
+
+} // namespace esphome
@@ -0,0 +1,70 @@
+#pragma once
+
+// Host stand-in for esphome/core/helpers.h
+#include <cmath>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <mutex>
+#include <string>
+
+#include "esphome/core/hal.h"
+
+namespace esphome {
+
+// FNV-1 hash as used for preference keys
+inline uint32_t fnv1_hash(const std::string &str) {
+  uint32_t hash = 2166136261UL;
+  for (char c : str) {
+    hash *= 16777619UL;
+    hash ^= static_cast<uint8_t>(c);
+  }
+  return hash;
+}
+
+// Fixed MAC address of the host "device", lower case hex without separators
+inline std::string get_mac_address() { return "a0b1c2d3e4f5"; }
+
+} // namespace esphome
+
+namespace esphome {
+
+// Mutex/LockGuard as used to share state with the web server task
+class Mutex {
+  public:
+    void lock() { mutex_.lock(); }
+    void unlock() { mutex_.unlock(); }
+
+  protected:
+    std::mutex mutex_;
+};
+
+class LockGuard {
+  public:
+    explicit LockGuard(Mutex &mutex) : mutex_(mutex) { mutex_.lock(); }
+    ~LockGuard() { mutex_.unlock(); }
+
+  protected:
+    Mutex &mutex_;
+};
+
+// Allocator with the ESPHome flags, there is only one kind of RAM on the host
+template<class T> class RAMAllocator {
+  public:
+    enum Flags : uint8_t {
+      NONE = 0,
+      ALLOC_EXTERNAL = 1 << 0,
+      ALLOC_INTERNAL = 1 << 1,
+      ALLOW_FAILURE = 1 << 2,
+    };
+
+    explicit RAMAllocator(uint8_t flags = ALLOC_INTERNAL | ALLOC_EXTERNAL) : flags_(flags) {}
+    T *allocate(size_t n) { return static_cast<T *>(malloc(n * sizeof(T))); }
+    void deallocate(T *p, size_t n) { free(p); }
+
+  protected:
+    uint8_t flags_;
+};
+
+} // namespace esphome
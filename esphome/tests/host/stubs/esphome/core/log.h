@@ -0,0 +1,62 @@
+#pragma once
+
+// Host stand-in for esphome/core/log.h - messages above ESPHOME_LOG_LEVEL are
+// compiled out exactly like on the device, the rest is printed to stderr
+#include <cstdio>
+
+#define ESPHOME_LOG_LEVEL_NONE 0
+#define ESPHOME_LOG_LEVEL_ERROR 1
+#define ESPHOME_LOG_LEVEL_WARN 2
+#define ESPHOME_LOG_LEVEL_INFO 3
+#define ESPHOME_LOG_LEVEL_CONFIG 4
+#define ESPHOME_LOG_LEVEL_DEBUG 5
+#define ESPHOME_LOG_LEVEL_VERBOSE 6
+#define ESPHOME_LOG_LEVEL_VERY_VERBOSE 7
+
+#ifndef ESPHOME_LOG_LEVEL
+#define ESPHOME_LOG_LEVEL ESPHOME_LOG_LEVEL_NONE
+#endif
+
+#define ESPHOME_HOST_LOG_(letter, tag, format, ...) \
+  std::fprintf(stderr, "[" letter "][%s] " format "\n", tag, ##__VA_ARGS__)
+
+#if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_ERROR
+#define ESP_LOGE(tag, format, ...) ESPHOME_HOST_LOG_("E", tag, format, ##__VA_ARGS__)
+#else
+#define ESP_LOGE(tag, format, ...) ((void) 0)
+#endif
+
+#if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_WARN
+#define ESP_LOGW(tag, format, ...) ESPHOME_HOST_LOG_("W", tag, format, ##__VA_ARGS__)
+#else
+#define ESP_LOGW(tag, format, ...) ((void) 0)
+#endif
+
+#if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_INFO
+#define ESP_LOGI(tag, format, ...) ESPHOME_HOST_LOG_("I", tag, format, ##__VA_ARGS__)
+#else
+#define ESP_LOGI(tag, format, ...) ((void) 0)
+#endif
+
+#if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_CONFIG
+#define ESP_LOGCONFIG(tag, format, ...) ESPHOME_HOST_LOG_("C", tag, format, ##__VA_ARGS__)
+#else
+#define ESP_LOGCONFIG(tag, format, ...) ((void) 0)
+#endif
+
+#if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_DEBUG
+#define ESP_LOGD(tag, format, ...) ESPHOME_HOST_LOG_("D", tag, format, ##__VA_ARGS__)
+#else
+#define ESP_LOGD(tag, format, ...) ((void) 0)
+#endif
+
+#if ESPHOME_LOG_LEVEL >= ESPHOME_LOG_LEVEL_VERBOSE
+#define ESP_LOGV(tag, format, ...) ESPHOME_HOST_LOG_("V", tag, format, ##__VA_ARGS__)
+#else
+#define ESP_LOGV(tag, format, ...) ((void) 0)
+#endif
+
+#define LOG_SENSOR(prefix, type, obj) \
+  if ((obj) != nullptr) { ESP_LOGCONFIG("", "%s%s '%s'", prefix, type, (obj)->get_name().c_str()); }
+#define LOG_BINARY_SENSOR(prefix, type, obj) LOG_SENSOR(prefix, type, obj)
+#define LOG_TEXT_SENSOR(prefix, type, obj) LOG_SENSOR(prefix, type, obj)
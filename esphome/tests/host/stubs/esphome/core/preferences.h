@@ -0,0 +1,52 @@
+#pragma once
+
+// Host stand-in for esphome/core/preferences.h - an in-memory store that
+// counts the writes, so flash wear can be checked on the host
+#include <cstdint>
+#include <cstring>
+#include <map>
+#include <vector>
+
+namespace esphome {
+
+namespace host {
+extern std::map<uint32_t, std::vector<uint8_t>> preference_store;
+extern uint64_t preference_saves;   // Successful save() calls
+} // namespace host
+
+class ESPPreferenceObject {
+  public:
+    ESPPreferenceObject() = default;
+    ESPPreferenceObject(uint32_t type, size_t size) : type_(type), size_(size) {}
+
+    template<typename T> bool save(const T *src) {
+      if (sizeof(T) != size_) return false;
+      auto &data = host::preference_store[type_];
+      data.assign(reinterpret_cast<const uint8_t *>(src), reinterpret_cast<const uint8_t *>(src) + sizeof(T));
+      host::preference_saves++;
+      return true;
+    }
+
+    template<typename T> bool load(T *dest) {
+      auto it = host::preference_store.find(type_);
+      if (sizeof(T) != size_ || it == host::preference_store.end() || it->second.size() != sizeof(T)) return false;
+      memcpy(dest, it->second.data(), sizeof(T));
+      return true;
+    }
+
+  protected:
+    uint32_t type_{0};
+    size_t size_{0};
+};
+
+class ESPPreferences {
+  public:
+    template<typename T> ESPPreferenceObject make_preference(uint32_t type, bool in_flash) {
+      (void) in_flash;
+      return ESPPreferenceObject(type, sizeof(T));
+    }
+};
+
+extern ESPPreferences *global_preferences;
+
+} // namespace esphome
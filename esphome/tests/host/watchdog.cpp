@@ -0,0 +1,137 @@
+// Checks of the cycle learning and stale detection (solaris_watchdog.h):
+// frames handled late, backlogs, missed frames and a changed cycle. Run by
+// `make check`.
+#include <cstdio>
+#include <initializer_list>
+
+#include "solaris_watchdog.h"
+
+using namespace esphome::daikin_rotex_solaris;
+
+static int failures = 0;
+
+#define CHECK(cond)                                                    \
+  do {                                                                 \
+    if (!(cond)) {                                                     \
+      std::fprintf(stderr, "%s:%d: check failed: %s\n", __FILE__, __LINE__, #cond); \
+      failures++;                                                      \
+    }                                                                  \
+  } while (0)
+
+// Feed count frames every cycle ms from now on, returns the missed frames
+static uint32_t feed(SolarisWatchdog &watchdog, uint32_t &now, uint32_t cycle, int count) {
+  uint32_t missed = 0;
+  for (int i = 0; i < count; i++) {
+    now += cycle;
+    missed += watchdog.add_frame(now).missed;
+    CHECK(!watchdog.check_stale(now));
+  }
+  return missed;
+}
+
+// Cycle within 1% of the expected one
+static bool near(uint32_t cycle, uint32_t expected) {
+  return cycle * 100 >= expected * 99 && cycle * 100 <= expected * 101;
+}
+
+static void test_late_frame() {
+  for (uint32_t late : {2200u, 3900u}) {
+    SolarisWatchdog watchdog;
+    uint32_t now = 1000;
+    watchdog.add_frame(now);
+    CHECK(feed(watchdog, now, 5000, 10) == 0);
+    CHECK(watchdog.is_cycle_known() && near(watchdog.get_cycle(), 5000));
+
+    // One frame handled late: a long interval (counted as a missed frame
+    // beyond half a cycle) and a short one after it
+    watchdog.add_frame(now + 5000 + late);
+    now += 5000;
+    CHECK(near(watchdog.get_cycle(), 5000));
+    CHECK(feed(watchdog, now, 5000, 20) == 0);
+    CHECK(near(watchdog.get_cycle(), 5000));
+    CHECK(watchdog.get_stale_timeout() >= 15000);
+  }
+}
+
+static void test_backlog() {
+  SolarisWatchdog watchdog;
+  uint32_t now = 0;
+  watchdog.add_frame(now);
+  feed(watchdog, now, 5000, 10);
+
+  // Loop stalled for three cycles, the queued frames are handled together
+  now += 15000 + 800;
+  for (int i = 0; i < 3; i++) watchdog.add_frame(now + i * 5);
+  now += 10;
+  CHECK(near(watchdog.get_cycle(), 5000));
+  // The first regular frame after the backlog is timed from its last frame
+  watchdog.add_frame(now + 4200);
+  now += 5000 - 800;
+  CHECK(feed(watchdog, now, 5000, 10) == 0);
+  CHECK(near(watchdog.get_cycle(), 5000));
+}
+
+static void test_missed_frames() {
+  SolarisWatchdog watchdog;
+  uint32_t now = 0;
+  watchdog.add_frame(now);
+  feed(watchdog, now, 5000, 10);
+  // One and two frames missed
+  now += 10000;
+  CHECK(watchdog.add_frame(now).missed == 1);
+  now += 15000;
+  CHECK(watchdog.add_frame(now).missed == 2);
+  CHECK(near(watchdog.get_cycle(), 5000));
+}
+
+static void test_cycle_change() {
+  SolarisWatchdog watchdog;
+  uint32_t now = 0;
+  watchdog.add_frame(now);
+  feed(watchdog, now, 5000, 10);
+
+  // Controller set to a shorter and back to a longer cycle: followed after a
+  // few frames, not after the first one
+  feed(watchdog, now, 2000, 1);
+  CHECK(near(watchdog.get_cycle(), 5000));
+  feed(watchdog, now, 2000, 5);
+  CHECK(near(watchdog.get_cycle(), 2000));
+  feed(watchdog, now, 10000, 1);
+  CHECK(near(watchdog.get_cycle(), 2000));
+  now += 10000;
+  watchdog.add_frame(now);
+  feed(watchdog, now, 10000, 5);
+  CHECK(near(watchdog.get_cycle(), 10000));
+}
+
+static void test_boot_cycle_and_stale() {
+  SolarisWatchdog watchdog;
+  CHECK(!watchdog.is_cycle_known() && watchdog.get_cycle() == DEFAULT_CYCLE_MS);
+  watchdog.set_boot_cycle(10);
+  uint32_t now = 0;
+  watchdog.add_frame(now);
+  // The boot line's cycle is not replaced by learned intervals
+  feed(watchdog, now, 4000, 10);
+  CHECK(watchdog.get_cycle() == 10000);
+
+  // Stale once after 3 cycles plus half a cycle without a frame
+  CHECK(!watchdog.check_stale(now + 35000));
+  CHECK(watchdog.check_stale(now + 35001) && watchdog.is_stale());
+  CHECK(!watchdog.check_stale(now + 40000));
+  watchdog.add_frame(now + 40000);
+  CHECK(!watchdog.is_stale());
+}
+
+int main() {
+  test_late_frame();
+  test_backlog();
+  test_missed_frames();
+  test_cycle_change();
+  test_boot_cycle_and_stale();
+  if (failures > 0) {
+    std::fprintf(stderr, "%d check(s) failed\n", failures);
+    return 1;
+  }
+  std::printf("Watchdog OK\n");
+  return 0;
+}
@@ -1,33 +1,33 @@
 """
 SVG converter for ha-floorplan
-Replaces foreignObject with native SVG text elements
+Replaces foreignObject with native SVG text elements, optionally optimizes the result
 """
 
 import xml.etree.ElementTree as ET
-import sys, re, argparse
-from typing import Optional, Tuple
+import sys, re, argparse, base64, copy, glob, gzip, hashlib, json, os, time, zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from pathlib import Path
+from floorplan_rules import yaml_element_ids
+
+NUMBER_RE = re.compile(r'[-+]?(?:\d*\.)?\d+')
+SVG_NS = 'http://www.w3.org/2000/svg'
+# Cache manifest of the batch mode, next to the converted files
+CACHE_NAME = '.convert-svg-cache.json'
 
 # Parse a numeric value (with optional decimal or sign) from a string.
 def parse_number(value: str, default: float = 0.0) -> float:
     if not value: return default
-    match = re.match(r'[-+]?(?:\d*\.)?\d+', str(value))
+    match = NUMBER_RE.match(str(value))
     return float(match.group()) if match else default
 
-# Extract a CSS property’s value from a style attribute string.
-def extract_style(prop: str, style: str) -> Optional[str]:
-    if not style: return None
-    match = re.search(rf'{re.escape(prop)}\s*:\s*([^;]+)', style)
-    return match.group(1).strip() if match else None
-
-# Traverse up element tree to find nearest ancestor with a `data-cell-id`.
-def find_element_id(element: ET.Element, parent_map: dict) -> Optional[str]:
-    current = element
-    while current is not None:
-        if cell_id := current.get('data-cell-id'):
-            return cell_id
-        current = parent_map.get(id(current))
-    return None
+# Split a style attribute into its CSS properties in one pass (last declaration wins).
+def parse_style(style: str) -> Dict[str, str]:
+    props = {}
+    for declaration in style.split(';'):
+        name, sep, value = declaration.partition(':')
+        if sep and (value := value.strip()): props[name.strip().lower()] = value
+    return props
 
 # Compute position and style info from a <foreignObject> subtree.
 def get_text_position_and_style(foreign: ET.Element) -> Tuple[float, float, str, float, str, str, str]:
@@ -35,72 +35,68 @@ def get_text_position_and_style(foreign: ET.Element) -> Tuple[float, float, str,
     margin_left = padding_top = width = 0.0
     font_size = '14px'; font_size_num = 14.0
     fill_color = '#000000'; font_family = 'Helvetica, Arial, sans-serif'; font_weight = 'bold'
-    
+
     # Inspect nested elements for styled attributes
     for elem in foreign.iter():
-        style = elem.get('style', '')
+        style = elem.get('style')
         if not style: continue
-        if ml := extract_style('margin-left', style): margin_left = parse_number(ml)
-        if pt := extract_style('padding-top', style): padding_top = parse_number(pt)
-        if w := extract_style('width', style): width = parse_number(w)
-        if fs := extract_style('font-size', style):
+        props = parse_style(style)
+        if ml := props.get('margin-left'): margin_left = parse_number(ml)
+        if pt := props.get('padding-top'): padding_top = parse_number(pt)
+        if w := props.get('width'): width = parse_number(w)
+        if fs := props.get('font-size'):
             if fs not in ('0', '0px'): font_size = fs; font_size_num = parse_number(fs, 14.0)
-        if color := extract_style('color', style): fill_color = color
-        if family := extract_style('font-family', style): font_family = family
-        if weight := extract_style('font-weight', style): font_weight = weight
-    
+        if color := props.get('color'): fill_color = color
+        if family := props.get('font-family'): font_family = family
+        if weight := props.get('font-weight'): font_weight = weight
+
     # Return computed text anchor and visual style properties
     return margin_left + (width / 2), padding_top + (font_size_num * 0.35), font_size, font_size_num, fill_color, font_family, font_weight
 
-# Convert draw.io SVGs (with foreignObject) to standard SVG text elements
-def convert_svg(input_path: Path, output_path: Optional[Path] = None) -> bool:
-    # Validate input file
-    if not input_path.exists(): print(f"❌ Error: '{input_path}' not found!"); return False
-    if input_path.suffix.lower() != '.svg': print("❌ Error: Input must be .svg file"); return False
-    
-    output_path = output_path or input_path.with_suffix('.converted.svg')
-    if output_path.exists(): print(f"⚠️ Warning: Overwriting '{output_path}'")
-    
-    # Safely parse XML tree
-    try: tree = ET.parse(input_path)
-    except ET.ParseError as e: print(f"❌ Error: Invalid SVG: {e}"); return False
-    except OSError as e: print(f"❌ Error: Cannot read '{input_path}': {e}"); return False
-    
-    root = tree.getroot()
+# Collect every <foreignObject> with its parent and the nearest `data-cell-id` (itself or an ancestor)
+# in one document-order walk, their HTML content is not descended into.
+def find_foreign_objects(root: ET.Element, foreign_tag: str) -> List[Tuple[ET.Element, Optional[ET.Element], Optional[str]]]:
+    found = []
+    stack = [(root, None, None)]
+    while stack:
+        elem, parent, cell_id = stack.pop()
+        cell_id = elem.get('data-cell-id') or cell_id
+        if elem.tag == foreign_tag: found.append((elem, parent, cell_id)); continue
+        stack.extend((child, elem, cell_id) for child in reversed(elem))
+    return found
+
+# Replace the foreignObjects of an SVG tree by <text> elements, returns the converted and removed counts.
+def convert_tree(root: ET.Element, verbose: bool = True) -> Tuple[int, int]:
     # Detect XML namespace
     m = re.match(r'\{([^}]+)\}svg', root.tag)
-    ns = m.group(1) if m else 'http://www.w3.org/2000/svg'
-    FOREIGN_OBJECT = f'{{{ns}}}foreignObject'; TEXT = f'{{{ns}}}text'
-    
-    ET.register_namespace('', ns); ET.register_namespace('xlink', 'http://www.w3.org/1999/xlink')
-    print(f"🔄 Processing {input_path}...")
-    
-    # Build lookup of each element’s parent for reverse traversal
-    parent_map = {}
-    try:
-        for parent in root.iter():
-            for child in parent: parent_map[id(child)] = parent
-    except Exception as e: print(f"❌ Error: Cannot build tree: {e}"); return False
-    
+    ns = m.group(1) if m else SVG_NS
+    FOREIGN_OBJECT = f'{{{ns}}}foreignObject'; TEXT = f'{{{ns}}}text'; TSPAN = f'{{{ns}}}tspan'
+    log = print if verbose else (lambda *args, **kwargs: None)
+
     converted = removed_empty = 0
+    # New child per replaced foreignObject (None = removed), applied per parent at the end
+    replacements: Dict[int, Dict[int, Optional[ET.Element]]] = {}
+    parents: Dict[int, ET.Element] = {}
     # Iterate all <foreignObject> elements
-    for foreign in list(root.iter(FOREIGN_OBJECT)):
+    for foreign, parent, cell_id in find_foreign_objects(root, FOREIGN_OBJECT):
+        if parent is None: log(f" ⚠️ Orphaned foreignObject"); continue
         text_content = ''.join(foreign.itertext()).strip()
         if not text_content:
             # Remove empty containers with no visible text
-            if parent := parent_map.get(id(foreign)): parent.remove(foreign); removed_empty += 1
+            replacements.setdefault(id(parent), {})[id(foreign)] = None; parents[id(parent)] = parent
+            removed_empty += 1
             continue
-        
-        elem_id = find_element_id(foreign, parent_map) or f'element_{converted}'
-        if not elem_id.startswith('element_'): print(f" ⚠️ No data-cell-id for '{text_content[:30]}...', using {elem_id}")
-        
+
+        elem_id = cell_id or f'element_{converted}'
+        if not elem_id.startswith('element_'): log(f" ⚠️ No data-cell-id for '{text_content[:30]}...', using {elem_id}")
+
         # Compute position/style; continue on failure
         try:
             x, y, font_size, font_size_num, fill_color, font_family, font_weight = get_text_position_and_style(foreign)
-            if x == 0 or y == 0: print(f" ⚠️ Zero coord '{text_content[:20]}...' (x={x:.1f}, y={y:.1f})")
+            if x == 0 or y == 0: log(f" ⚠️ Zero coord '{text_content[:20]}...' (x={x:.1f}, y={y:.1f})")
         except Exception as e:
-            print(f" ❌ Error processing '{text_content[:30]}...': {e}"); continue
-        
+            log(f" ❌ Error processing '{text_content[:30]}...': {e}"); continue
+
         # Create replacement <text> element with matching attributes
         text_elem = ET.Element(TEXT)
         text_elem.attrib.update({
@@ -108,50 +104,476 @@ def convert_svg(input_path: Path, output_path: Optional[Path] = None) -> bool:
             'font-size': font_size, 'fill': fill_color, 'font-family': font_family,
             'text-anchor': 'middle', 'font-weight': font_weight
         })
-        
+
         # Add tspans for multi-line text; plain text otherwise
         lines = text_content.splitlines()
         if len(lines) > 1:
             for i, line in enumerate(lines):
-                tspan = ET.SubElement(text_elem, f'{{{ns}}}tspan', {
+                tspan = ET.SubElement(text_elem, TSPAN, {
                     'x': text_elem.attrib['x'], 'dy': str(font_size_num * (1.2 if i else 0))
                 })
                 tspan.text = line
         else:
             text_elem.text = text_content
-        
-        # Replace foreignObject node in-place with new text element
-        if parent := parent_map.get(id(foreign)):
-            try:
-                idx = list(parent).index(foreign)
-                parent.remove(foreign); parent.insert(idx, text_elem)
-                print(f" ✓ {elem_id}: '{text_content}' at ({x:.1f}, {y:.1f})")
-                converted += 1
-            except (ValueError, IndexError) as e:
-                print(f" ❌ Failed replace '{text_content[:20]}...': {e}")
-        else:
-            print(f" ⚠️ Orphaned '{text_content[:20]}...'")
-    
+
+        replacements.setdefault(id(parent), {})[id(foreign)] = text_elem; parents[id(parent)] = parent
+        log(f" ✓ {elem_id}: '{text_content}' at ({x:.1f}, {y:.1f})")
+        converted += 1
+
+    # Replace the foreignObject nodes in place, one pass over the children of each parent
+    for key, parent in parents.items():
+        new_children = replacements[key]
+        children = (new_children.get(id(child), child) for child in parent)
+        parent[:] = [child for child in children if child is not None]
+    return converted, removed_empty
+
+# ============================================================================
+# OPTIMIZER - Size and render cost of the converted SVG
+# ============================================================================
+# Options of the optimization stage (picklable for the batch workers)
+class Optimization(NamedTuple):
+    precision: int = 2                          # Decimals of coordinates and lengths
+    keep_ids: Optional[Tuple[str, ...]] = None  # Element ids of the ha-floorplan rules, None = keep every id
+    css_path: Optional[Path] = None             # Stylesheet receiving the hoisted styles, None = no hoisting
+    precompress: bool = True                    # Write .svg.gz (and .svg.br with brotli) alongside
+
+# draw.io metadata (svgdata plugin, HTML labels), not used for rendering
+METADATA_ATTRS = ('content', 'data-label', 'data-cell-id')
+# Attributes holding coordinates and lengths
+GEOMETRY_ATTRS = ('x', 'y', 'width', 'height', 'cx', 'cy', 'r', 'rx', 'ry', 'x1', 'y1', 'x2', 'y2', 'dx', 'dy',
+                  'd', 'points', 'transform', 'stroke-width', 'stroke-dasharray')
+# Presentation attributes that are moved into the stylesheet classes
+PAINT_ATTRS = ('fill', 'fill-opacity', 'stroke', 'stroke-width', 'stroke-opacity', 'stroke-miterlimit', 'stroke-dasharray',
+               'stroke-linecap', 'stroke-linejoin', 'opacity', 'pointer-events', 'font-family', 'font-size', 'font-weight',
+               'text-anchor')
+# PNG chunks needed for rendering (image data, palette, transparency, color space), APNG files stay untouched
+PNG_CHUNKS = (b'IHDR', b'PLTE', b'tRNS', b'gAMA', b'cHRM', b'sRGB', b'iCCP', b'sBIT', b'IEND')
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+PNG_DATA_URI = 'data:image/png;base64,'
+DECIMAL_RE = re.compile(r'-?\d*\.\d+')
+RGB_RE = re.compile(r'rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)')
+REFERENCE_RE = re.compile(r'url\(\s*["\']?#([^"\')\s]+)')
+CSS_BEGIN = '/* convert-svg: hoisted SVG styles (generated, do not edit) */'
+CSS_END = '/* convert-svg: end of hoisted SVG styles */'
+RULE_RE = re.compile(r'^\.([\w-]+) \{ (.*) \}$', re.M)
+
+try: import brotli
+except ImportError: brotli = None
+
+# Round the decimals of a coordinate/length attribute, trailing zeros dropped
+def round_numbers(value: str, precision: int) -> str:
+    def repl(m: re.Match) -> str:
+        text = f'{float(m.group()):.{precision}f}'.rstrip('0').rstrip('.')
+        return '0' if text in ('-0', '') else text
+    return DECIMAL_RE.sub(repl, value)
+
+# Comparable form of a paint value: rgb() as hex, url("#id") as url(#id), no spaces, lower case
+def normalize_value(value: str) -> str:
+    value = RGB_RE.sub(lambda m: '#%02x%02x%02x' % tuple(int(c) for c in m.groups()), value)
+    return re.sub(r'url\(\s*["\']([^"\']*)["\']\s*\)', r'url(\1)', value).replace(' ', '').lower()
+
+# PNG without ancillary chunks (EXIF, text, time, ...) and with one IDAT chunk, unchanged if not a plain PNG.
+def optimize_png(data: bytes) -> bytes:
+    if not data.startswith(PNG_SIGNATURE): return data
+    chunks, idat, pos = [], b'', len(PNG_SIGNATURE)
+    while pos + 12 <= len(data):
+        length = int.from_bytes(data[pos:pos + 4], 'big')
+        kind, body = data[pos + 4:pos + 8], data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if kind == b'acTL': return data
+        if kind == b'IDAT':
+            if not idat: chunks.append(b'IDAT')
+            idat += body
+        elif kind in PNG_CHUNKS: chunks.append((kind, body))
+    if pos != len(data) or not idat: return data
+    out = [PNG_SIGNATURE]
+    for kind, body in ((b'IDAT', idat) if chunk == b'IDAT' else chunk for chunk in chunks):
+        out += [len(body).to_bytes(4, 'big'), kind, body, zlib.crc32(kind + body).to_bytes(4, 'big')]
+    return b''.join(out)
+
+# Ids referenced by url(#id) and href="#id" (gradients, filters, markers, clip paths, uses)
+def referenced_ids(root: ET.Element) -> set:
+    refs = set()
+    for elem in root.iter():
+        if elem.text and 'url(' in elem.text: refs.update(REFERENCE_RE.findall(elem.text))
+        for name, value in elem.attrib.items():
+            if 'url(' in value: refs.update(REFERENCE_RE.findall(value))
+            elif name.endswith('href') and value.startswith('#'): refs.add(value[1:])
+    return refs
+
+# Replace children by the returned elements bottom-up: attribute-less groups unwrapped, empty anonymous groups removed.
+def simplify_groups(elem: ET.Element, group_tag: str) -> int:
+    removed = 0
+    children = []
+    for child in elem:
+        removed += simplify_groups(child, group_tag)
+        if child.tag == group_tag and not child.attrib: children += list(child); removed += 1
+        elif child.tag == group_tag and not len(child) and 'id' not in child.attrib: removed += 1
+        else: children.append(child)
+    elem[:] = children
+    return removed
+
+# Rules of the generated block of a stylesheet ({class: {property: value}})
+def hoisted_rules(css: str) -> Dict[str, Dict[str, str]]:
+    start, end = css.find(CSS_BEGIN), css.find(CSS_END)
+    if start < 0 or end < start: return {}
+    return {name: parse_style(body) for name, body in RULE_RE.findall(css[start:end])}
+
+# Put the properties of previously hoisted classes back on the elements (hoisting again starts from scratch)
+def inline_hoisted(root: ET.Element, rules: Dict[str, Dict[str, str]]) -> None:
+    for elem in root.iter():
+        classes = elem.get('class', '').split()
+        if not any(name in rules for name in classes): continue
+        style = parse_style(elem.get('style', ''))
+        for name in (name for name in classes if name in rules):
+            for prop, value in rules[name].items():
+                if prop in PAINT_ATTRS: elem.attrib.setdefault(prop, value)
+                else: style.setdefault(prop, value)
+        if style: elem.set('style', '; '.join(f'{prop}: {value}' for prop, value in style.items()))
+        classes = [name for name in classes if name not in rules]
+        if classes: elem.set('class', ' '.join(classes))
+        else: del elem.attrib['class']
+
+# Hoist repeated presentation attributes and inline styles of anonymous elements into classes, returns the CSS rules.
+def hoist_styles(root: ET.Element, defs_tag: str) -> List[str]:
+    skip = {id(elem) for defs in root.iter(defs_tag) for elem in defs.iter()}
+    candidates: Dict[Tuple[Tuple[str, str], ...], List[ET.Element]] = {}
+    for elem in root.iter():
+        if elem is root or id(elem) in skip or 'id' in elem.attrib: continue
+        # url() stays on the element: fragment references in stylesheets resolve against the stylesheet URL
+        props = [(name, elem.get(name)) for name in PAINT_ATTRS if name in elem.attrib and 'url(' not in elem.get(name)]
+        props += [(name, value) for name, value in parse_style(elem.get('style', '')).items() if 'url(' not in value]
+        if props: candidates.setdefault(tuple(props), []).append(elem)
+
+    rules = []
+    for props, elems in candidates.items():
+        name = f's{len(rules)}'
+        rule = f".{name} {{ {'; '.join(f'{prop}: {value}' for prop, value in props)} }}"
+        attr_bytes = sum(len(f' {prop}="{value}"') for prop, value in props)
+        # Only when the class (and its rule) is shorter than the repeated attributes
+        if len(elems) < 2 or (attr_bytes - len(f' class="{name}"')) * len(elems) <= len(rule): continue
+        rules.append(rule)
+        for elem in elems:
+            style = parse_style(elem.attrib.pop('style', ''))
+            for prop, _ in props:
+                if prop in style: del style[prop]
+                else: elem.attrib.pop(prop, None)
+            if style: elem.set('style', '; '.join(f'{prop}: {value}' for prop, value in style.items()))
+            elem.set('class', f"{elem.get('class')} {name}" if elem.get('class') else name)
+    return rules
+
+# Optimize a converted SVG tree in place, returns the counts per optimization (and the hoisted CSS rules).
+# `hoisted` are the classes of an earlier run (in the stylesheet), replaced by the new ones.
+def optimize_tree(root: ET.Element, options: Optimization, hoisted: Optional[Dict[str, Dict[str, str]]] = None) -> Dict[str, object]:
+    m = re.match(r'\{([^}]+)\}svg', root.tag)
+    ns = f'{{{m.group(1)}}}' if m else ''
+    stats = {'metadata': 0, 'fallbacks': 0, 'styles': 0, 'images': 0, 'image_bytes': 0, 'ids': 0, 'defs': 0, 'groups': 0,
+             'rules': []}
+
+    if options.css_path and hoisted: inline_hoisted(root, hoisted)
+    for parent in list(root.iter()):
+        for child in parent.findall(f'{ns}metadata'): parent.remove(child); stats['metadata'] += 1
+    for elem in root.iter():
+        # draw.io metadata
+        for name in METADATA_ATTRS:
+            if elem.attrib.pop(name, None) is not None: stats['metadata'] += 1
+        # Inline style declarations repeating the presentation attribute (rgb() vs hex, quoted urls)
+        if style := elem.get('style'):
+            props = parse_style(style)
+            kept = {name: value for name, value in props.items()
+                    if name not in elem.attrib or normalize_value(value) != normalize_value(elem.get(name))}
+            stats['styles'] += len(props) - len(kept)
+            if kept: elem.set('style', '; '.join(f'{name}: {value}' for name, value in kept.items()))
+            else: del elem.attrib['style']
+        for name in GEOMETRY_ATTRS:
+            if name in elem.attrib: elem.set(name, round_numbers(elem.get(name), options.precision))
+        # Embedded PNG images
+        for name in ('href', '{http://www.w3.org/1999/xlink}href'):
+            href = elem.get(name)
+            if href and href.startswith(PNG_DATA_URI):
+                try: data = base64.b64decode(href[len(PNG_DATA_URI):])
+                except ValueError: continue
+                optimized = base64.b64encode(optimize_png(data)).decode('ascii')
+                stats['images'] += len(href) - len(PNG_DATA_URI) - len(optimized)
+                elem.set(name, PNG_DATA_URI + optimized)
+            if href and href.startswith('data:'): stats['image_bytes'] += len(elem.get(name))
+
+    # <switch> fallbacks after a converted label (only the first child without conditions renders)
+    for parent in list(root.iter()):
+        for i, child in enumerate(list(parent)):
+            if child.tag != f'{ns}switch' or not len(child): continue
+            first = child[0]
+            if any(name in first.attrib for name in ('requiredFeatures', 'requiredExtensions', 'systemLanguage')): continue
+            parent[i] = first; stats['fallbacks'] += len(child) - 1
+
+    # Unused definitions, then the ids nothing refers to (kept: the elements of the rules and references)
+    refs = referenced_ids(root)
+    for defs in root.iter(f'{ns}defs'):
+        unused = [child for child in defs if child.get('id') and child.get('id') not in refs]
+        for child in unused: defs.remove(child)
+        stats['defs'] += len(unused)
+    if options.keep_ids is not None:
+        keep = set(options.keep_ids) | refs
+        for elem in root.iter():
+            if elem is not root and 'id' in elem.attrib and elem.get('id') not in keep:
+                del elem.attrib['id']; stats['ids'] += 1
+    stats['groups'] = simplify_groups(root, f'{ns}g')
+
+    if options.css_path: stats['rules'] = hoist_styles(root, f'{ns}defs')
+    return stats
+
+# Replace the generated block of a stylesheet by the hoisted rules (removed without rules)
+def update_stylesheet(css_path: Path, rules: List[str]) -> None:
+    css = css_path.read_text(encoding='utf-8') if css_path.exists() else ''
+    start, end = css.find(CSS_BEGIN), css.find(CSS_END)
+    if start >= 0 and end > start: css = css[:start].rstrip('\n') + css[end + len(CSS_END):].lstrip('\n')
+    css = css.rstrip('\n') + '\n'
+    if rules: css += '\n' + '\n'.join([CSS_BEGIN] + rules + [CSS_END]) + '\n'
+    css_path.write_text(css.lstrip('\n'), encoding='utf-8')
+
+# Write <file>.gz (and <file>.br with the brotli module), returns their sizes
+def precompress(path: Path) -> Dict[str, int]:
+    data = path.read_bytes()
+    sizes = {}
+    gz_path = path.with_name(path.name + '.gz')
+    gz_path.write_bytes(gzip.compress(data, 9, mtime=0)); sizes['gz'] = gz_path.stat().st_size
+    if brotli:
+        br_path = path.with_name(path.name + '.br')
+        br_path.write_bytes(brotli.compress(data, quality=11)); sizes['br'] = br_path.stat().st_size
+    return sizes
+
+# Convert draw.io SVGs (with foreignObject) to standard SVG text elements, optionally optimized
+def convert_svg(input_path: Path, output_path: Optional[Path] = None, verbose: bool = True,
+                optimize: Optional[Optimization] = None) -> bool:
+    log = print if verbose else (lambda *args, **kwargs: None)
+    # Validate input file
+    if not input_path.exists(): print(f"❌ Error: '{input_path}' not found!"); return False
+    if input_path.suffix.lower() != '.svg': print("❌ Error: Input must be .svg file"); return False
+
+    output_path = output_path or input_path.with_suffix('.converted.svg')
+    if output_path.exists(): log(f"⚠️ Warning: Overwriting '{output_path}'")
+
+    # Safely parse XML tree
+    try: tree = ET.parse(input_path); input_bytes = input_path.stat().st_size
+    except ET.ParseError as e: print(f"❌ Error: Invalid SVG '{input_path}': {e}"); return False
+    except OSError as e: print(f"❌ Error: Cannot read '{input_path}': {e}"); return False
+
+    root = tree.getroot()
+    m = re.match(r'\{([^}]+)\}svg', root.tag)
+    ET.register_namespace('', m.group(1) if m else SVG_NS); ET.register_namespace('xlink', 'http://www.w3.org/1999/xlink')
+    log(f"🔄 Processing {input_path}...")
+    input_elements = sum(1 for _ in root.iter())
+    converted, removed_empty = convert_tree(root, verbose)
+
+    if optimize:
+        try: hoisted = hoisted_rules(optimize.css_path.read_text(encoding='utf-8')) if optimize.css_path and optimize.css_path.exists() else {}
+        except OSError as e: print(f"❌ Error: Cannot read '{optimize.css_path}': {e}"); return False
+        stats = optimize_tree(root, optimize, hoisted)
+        ids = {elem.get('id') for elem in root.iter()}
+        missing = [element for element in optimize.keep_ids or () if element not in ids]
+        if missing: print(f"❌ Error: Elements of the rules missing in '{input_path}': {', '.join(missing)}"); return False
+        if optimize.css_path:
+            try: update_stylesheet(optimize.css_path, stats['rules'])
+            except OSError as e: print(f"❌ Error writing '{optimize.css_path}': {e}"); return False
+
     # Write back modified SVG
     try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
         tree.write(output_path, encoding='utf-8', xml_declaration=True)
-        print(f"\n✅ Success! Converted: {converted} texts", end='')
-        if removed_empty: print(f" | Removed: {removed_empty} empties")
-        print(f" → {output_path}")
+        log(f"\n✅ Success! Converted: {converted} texts", end='')
+        if removed_empty: log(f" | Removed: {removed_empty} empties")
+        log(f" → {output_path}")
+        if optimize:
+            sizes = precompress(output_path) if optimize.precompress else {}
+            output_bytes, output_elements = output_path.stat().st_size, sum(1 for _ in root.iter())
+            log(f"📦 Optimized: {input_bytes} → {output_bytes} bytes ({100 - output_bytes * 100 / input_bytes:.1f}% smaller), "
+                f"{input_elements} → {output_elements} elements")
+            log(f"   Removed: {stats['metadata']} metadata, {stats['fallbacks']} fallbacks, {stats['styles']} duplicate styles, "
+                f"{stats['ids']} unused ids, {stats['defs']} unused defs, {stats['groups']} groups, {stats['images']} image bytes")
+            if optimize.css_path: log(f"   Hoisted: {len(stats['rules'])} classes → {optimize.css_path}")
+            # Embedded raster images are only shrunk losslessly, large ones are better scaled down before embedding
+            if stats['image_bytes']: log(f"   Embedded images: {stats['image_bytes']} bytes ({stats['image_bytes'] * 100 / output_bytes:.0f}% of the SVG)")
+            if sizes: log('   Precompressed: ' + ', '.join(f"{output_path.name}.{ext} {size} bytes" for ext, size in sizes.items())
+                          + ('' if brotli else ' (.br needs: pip install brotli)'))
         return True
     except OSError as e: print(f"❌ Error writing '{output_path}': {e}"); return False
 
+# ============================================================================
+# BATCH MODE - Directories/globs, process pool, content-hash cache manifest
+# ============================================================================
+# SHA-256 of a file's content
+def file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+# Expand files, directories (their *.svg, except converted ones) and glob patterns into input files.
+def collect_inputs(patterns: List[str]) -> List[Path]:
+    inputs = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir(): matches = sorted(path.glob('*.svg'))
+        elif glob.has_magic(pattern): matches = sorted(Path(p) for p in glob.glob(pattern, recursive=True))
+        else: matches = [path]
+        inputs += [p for p in matches if not p.name.lower().endswith('.converted.svg')]
+    return list(dict.fromkeys(inputs))
+
+# Output file of an input in batch mode
+def batch_output(input_path: Path, output_dir: Optional[Path]) -> Path:
+    return output_dir / input_path.name if output_dir else input_path.with_suffix('.converted.svg')
+
+# Load the cache manifest ({input path: {'source': hash, 'converter': hash, 'options': repr, 'output': path}}), empty if missing/invalid.
+def load_cache(path: Path) -> dict:
+    try: return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError): return {}
+
+# Process pool job: convert (and optimize) one file quietly
+def _convert_job(job: Tuple[Path, Path, Optional[Optimization]]) -> bool:
+    return convert_svg(job[0], job[1], verbose=False, optimize=job[2])
+
+# Convert several files in a process pool, skipping those whose source (and converter) did not change.
+def convert_batch(inputs: List[Path], output_dir: Optional[Path] = None, jobs: Optional[int] = None,
+                  cache_path: Optional[Path] = None, force: bool = False, optimize: Optional[Optimization] = None) -> bool:
+    cache_path = cache_path or (output_dir or (inputs[0].parent if inputs else Path('.'))) / CACHE_NAME
+    cache = {} if force else load_cache(cache_path)
+    converter = file_hash(Path(__file__))
+    options = repr(optimize)
+
+    todo, keys, hashes, skipped = [], [], {}, 0
+    for input_path in inputs:
+        if not input_path.is_file(): print(f"❌ Error: '{input_path}' not found!"); return False
+        output_path = batch_output(input_path, output_dir)
+        key = str(input_path.resolve())
+        hashes[key] = file_hash(input_path)
+        entry = cache.get(key, {})
+        if (entry.get('source') == hashes[key] and entry.get('converter') == converter and entry.get('options', 'None') == options
+                and entry.get('output') == str(output_path.resolve()) and output_path.exists()):
+            skipped += 1; continue
+        todo.append((input_path, output_path, optimize))
+        keys.append(key)
+
+    print(f"🔄 Converting {len(todo)} of {len(inputs)} files ({skipped} unchanged)...")
+    start = time.perf_counter()
+    ok = True
+    # One job (or file) runs without starting worker processes
+    pool = ProcessPoolExecutor(max_workers=jobs) if (jobs or os.cpu_count() or 1) > 1 and len(todo) > 1 else None
+    results = pool.map(_convert_job, todo) if pool else map(_convert_job, todo)
+    try:
+        for (input_path, output_path, _), key, success in zip(todo, keys, results):
+            if success:
+                cache[key] = {'source': hashes[key], 'converter': converter, 'options': options,
+                              'output': str(output_path.resolve())}
+                print(f" ✓ {input_path} → {output_path}")
+            else: ok = False
+    finally:
+        if pool: pool.shutdown()
+
+    # Write the manifest even after failures, converted files stay cached
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(cache, indent=1, sort_keys=True), encoding='utf-8')
+    except OSError as e: print(f"❌ Error writing cache '{cache_path}': {e}"); ok = False
+    print(f"\n{'✅ Success!' if ok else '❌ Failed!'} {len(todo)} converted, {skipped} unchanged in "
+          f"{time.perf_counter() - start:.2f} s")
+    return ok
+
+# ============================================================================
+# BENCHMARK - Conversion time of a synthetically enlarged draw.io export
+# ============================================================================
+# Minimal draw.io export: labelled cells with the foreignObject/text switch draw.io writes.
+def synthetic_export(cells: int = 50) -> ET.ElementTree:
+    xhtml = 'http://www.w3.org/1999/xhtml'
+    root = ET.Element(f'{{{SVG_NS}}}svg', {'version': '1.1', 'width': '500px', 'height': '1000px'})
+    layer = ET.SubElement(ET.SubElement(ET.SubElement(root, f'{{{SVG_NS}}}g'), f'{{{SVG_NS}}}g', {'data-cell-id': '0'}),
+                          f'{{{SVG_NS}}}g', {'data-cell-id': '1'})
+    for i in range(cells):
+        cell = ET.SubElement(layer, f'{{{SVG_NS}}}g', {'data-cell-id': f'cell-{i}'})
+        ET.SubElement(ET.SubElement(cell, f'{{{SVG_NS}}}g'), f'{{{SVG_NS}}}rect',
+                      {'x': str(i % 10 * 40), 'y': str(i // 10 * 30), 'width': '38', 'height': '28'})
+        switch = ET.SubElement(ET.SubElement(cell, f'{{{SVG_NS}}}g'), f'{{{SVG_NS}}}switch')
+        foreign = ET.SubElement(switch, f'{{{SVG_NS}}}foreignObject', {
+            'style': 'overflow: visible; text-align: left;', 'pointer-events': 'none', 'width': '100%', 'height': '100%',
+            'requiredFeatures': 'http://www.w3.org/TR/SVG11/feature#Extensibility'})
+        outer = ET.SubElement(foreign, f'{{{xhtml}}}div', {'style': (
+            'display: flex; align-items: unsafe center; justify-content: unsafe center; width: 36px; height: 1px; '
+            f'padding-top: {i // 10 * 30 + 14}px; margin-left: {i % 10 * 40 + 1}px;')})
+        inner = ET.SubElement(ET.SubElement(outer, f'{{{xhtml}}}div', {
+            'style': 'box-sizing: border-box; font-size: 0px; text-align: center;'}), f'{{{xhtml}}}div', {'style': (
+            'display: inline-block; font-size: 12px; font-family: Helvetica; color: rgb(0, 0, 0); line-height: 1.2; '
+            'pointer-events: all; background-color: #ffffff; white-space: normal; overflow-wrap: normal;')})
+        inner.text = f'{i} °C'
+        ET.SubElement(switch, f'{{{SVG_NS}}}text', {'x': str(i % 10 * 40 + 19), 'y': str(i // 10 * 30 + 18)}).text = f'{i} °C'
+    return ET.ElementTree(root)
+
+# Enlarge an export by repeating the cells of its largest group as siblings (worst case for per-sibling lookups).
+def enlarge(tree: ET.ElementTree, factor: int) -> ET.ElementTree:
+    tree = copy.deepcopy(tree)
+    layer = max(tree.getroot().iter(), key=len)
+    cells = list(layer)
+    for _ in range(factor - 1): layer.extend(copy.deepcopy(cells))
+    return tree
+
+# Time parsing, conversion and serialization per enlargement factor; linear scaling keeps µs/foreignObject flat.
+def benchmark(input_path: Optional[Path], scales: List[int], repeat: int = 3) -> None:
+    base = ET.parse(input_path) if input_path else synthetic_export()
+    root = base.getroot()
+    m = re.match(r'\{([^}]+)\}svg', root.tag)
+    foreign_tag = f'{{{m.group(1) if m else SVG_NS}}}foreignObject'
+    print(f"{'scale':>6} {'foreignObjects':>15} {'elements':>9} {'time (ms)':>10} {'µs/foreignObject':>17}")
+    for scale in scales:
+        data = ET.tostring(enlarge(base, scale).getroot())
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            enlarged = ET.fromstring(data)
+            count = sum(1 for _ in enlarged.iter(foreign_tag))
+            elements = sum(1 for _ in enlarged.iter())
+            convert_tree(enlarged, verbose=False)
+            ET.tostring(enlarged)
+            best = min(best, time.perf_counter() - start)
+        print(f"{scale:>6} {count:>15} {elements:>9} {best * 1000:>10.1f} {best * 1e6 / max(count, 1):>17.1f}")
+
 # CLI entry point
 def main():
     parser = argparse.ArgumentParser(description="draw.io → ha-floorplan SVG converter",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="Examples:\n  python convert-svg.py floorplan.svg\n  python convert-svg.py floorplan.svg -o ha-floorplan.svg")
-    parser.add_argument('input', nargs='?', help="Input SVG")
-    parser.add_argument('-o', '--output', help="Output SVG (optional)")
+        epilog="Examples:\n  python convert-svg.py floorplan.svg\n  python convert-svg.py floorplan.svg -o ha-floorplan.svg"
+               "\n  python convert-svg.py exports/ 'variants/*.svg' -d converted -j 4"
+               "\n  python convert-svg.py floorplan.svg -o ha-floorplan.svg -O --yaml solaris-rps-dashboard.yaml --css solaris-rps-dashboard.css"
+               "\n  python convert-svg.py --benchmark --scales 1,4,16,64")
+    parser.add_argument('input', nargs='*', help="Input SVG, or several files, directories and glob patterns (batch mode)")
+    parser.add_argument('-o', '--output', help="Output SVG (optional, single file only)")
+    parser.add_argument('-d', '--output-dir', help="Batch mode: write the converted files here (default: <input>.converted.svg)")
+    parser.add_argument('-j', '--jobs', type=int, help="Batch mode: worker processes (default: CPU count)")
+    parser.add_argument('--cache', help=f"Batch mode: cache manifest (default: {CACHE_NAME} in the output directory)")
+    parser.add_argument('-f', '--force', action='store_true', help="Batch mode: convert unchanged files as well")
+    parser.add_argument('-O', '--optimize', action='store_true', help="Optimize the SVG: strip metadata and unused defs, round coordinates, precompress")
+    parser.add_argument('--precision', type=int, default=2, help="Optimize: decimals of coordinates (default: 2)")
+    parser.add_argument('--yaml', help="Optimize: ha-floorplan YAML, ids of its elements (also of commented-out rules) are kept and required, other ids removed")
+    parser.add_argument('--css', help="Optimize: hoist repeated styles into classes of this stylesheet (single file only)")
+    parser.add_argument('--no-precompress', action='store_true', help="Optimize: do not write .svg.gz/.svg.br")
+    parser.add_argument('--benchmark', action='store_true', help="Time the conversion of an enlarged export (input or synthetic)")
+    parser.add_argument('--scales', default='1,2,4,8,16,32', help="Benchmark enlargement factors (default: 1,2,4,8,16,32)")
     args = parser.parse_args()
-    
+
+    if args.benchmark:
+        benchmark(Path(args.input[0]) if args.input else None, [int(s) for s in args.scales.split(',')]); sys.exit(0)
     if not args.input: parser.print_help(); sys.exit(1)
-    sys.exit(0 if convert_svg(Path(args.input), Path(args.output) if args.output else None) else 1)
+    optimize = None
+    if args.optimize:
+        keep_ids = None
+        if args.yaml:
+            try: keep_ids = tuple(yaml_element_ids(Path(args.yaml).read_text(encoding='utf-8'), commented=True))
+            except OSError as e: print(f"❌ Error: Cannot read '{args.yaml}': {e}"); sys.exit(1)
+        optimize = Optimization(args.precision, keep_ids, Path(args.css) if args.css else None, not args.no_precompress)
+
+    # One plain file: convert it directly, anything else is a batch
+    if len(args.input) == 1 and not Path(args.input[0]).is_dir() and not glob.has_magic(args.input[0]) and not args.output_dir:
+        sys.exit(0 if convert_svg(Path(args.input[0]), Path(args.output) if args.output else None, optimize=optimize) else 1)
+    if args.output: print("❌ Error: --output needs a single input file, use --output-dir"); sys.exit(1)
+    if args.css: print("❌ Error: --css needs a single input file (one stylesheet per SVG)"); sys.exit(1)
+    inputs = collect_inputs(args.input)
+    if not inputs: print("❌ Error: No SVG files found"); sys.exit(1)
+    sys.exit(0 if convert_batch(inputs, Path(args.output_dir) if args.output_dir else None, args.jobs,
+                                Path(args.cache) if args.cache else None, args.force, optimize) else 1)
 
 # Run module directly
-if __name__ == "__main__": main()
\ No newline at end of file
+if __name__ == "__main__": main()
@@ -0,0 +1,380 @@
+"""
+draw.io compiler for ha-floorplan
+Renders the mxGraph model of a .drawio file directly to an SVG with native text elements
+"""
+
+import xml.etree.ElementTree as ET
+import sys, re, argparse, base64, html, math, time, zlib
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from urllib.parse import unquote
+from floorplan_rules import missing_elements
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+XLINK_NS = 'http://www.w3.org/1999/xlink'
+# draw.io defaults of the style keys used here
+DEFAULT_FONT_SIZE = 11.0
+DEFAULT_FONT_FAMILY = 'Helvetica'
+ARC_SIZE = 15            # % of the shorter side of rounded vertices
+EDGE_ARC_SIZE = 20       # Diameter of the rounded edge corners
+LABEL_SPACING = 2
+SHAPES = ('ellipse', 'triangle', 'image', 'text', 'group', 'line')
+LIGHT_DARK_RE = re.compile(r'light-dark\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)')
+BREAK_RE = re.compile(r'<br\s*/?>|</div>|</p>|</li>', re.I)
+TAG_RE = re.compile(r'<[^>]+>')
+
+# One vertex or edge of the model, geometry in absolute diagram coordinates
+class Cell:
+    def __init__(self, cell_id: str, value: str, style: Dict[str, str], parent: Optional[str], vertex: bool, edge: bool,
+                 geometry: Optional[ET.Element], source: Optional[str] = None, target: Optional[str] = None):
+        self.id, self.value, self.style, self.parent = cell_id, value, style, parent
+        self.vertex, self.edge, self.geometry, self.source, self.target = vertex, edge, geometry, source, target
+        self.children: List['Cell'] = []
+        self.x = self.y = self.width = self.height = 0.0
+
+    def bounds(self) -> Tuple[float, float, float, float]:
+        return self.x, self.y, self.width, self.height
+
+# Parse a draw.io style ("rounded=1;ellipse;fillColor=#fff;") into a dict, bare shape names become 'shape'.
+def parse_cell_style(style: str) -> Dict[str, str]:
+    props = {}
+    for declaration in style.split(';'):
+        name, sep, value = declaration.partition('=')
+        if sep: props[name.strip()] = value.strip()
+        elif name.strip() in SHAPES: props.setdefault('shape', name.strip())
+    return props
+
+# Style value as number
+def style_number(style: Dict[str, str], name: str, default: float = 0.0) -> float:
+    try: return float(style.get(name, default))
+    except ValueError: return default
+
+# SVG color of a style color: light-dark(light, dark) renders the light one, 'default' the draw.io default.
+def color(value: Optional[str], default: str) -> str:
+    if not value or value == 'default': return default
+    m = LIGHT_DARK_RE.fullmatch(value.strip())
+    return m.group(1) if m else value
+
+# Number as short SVG attribute value (2 decimals, no trailing zeros)
+def fmt(value: float) -> str:
+    text = f'{value:.2f}'.rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+# ============================================================================
+# MODEL - mxfile/diagram/mxGraphModel, compressed diagrams inflated
+# ============================================================================
+# Inflate a compressed <diagram>: base64 → raw deflate → URL-encoded mxGraphModel XML.
+def decode_diagram(data: str) -> ET.Element:
+    xml = unquote(zlib.decompress(base64.b64decode(data.strip()), -15).decode('utf-8'))
+    return ET.fromstring(xml)
+
+# mxGraphModel of a page (index or name) of a .drawio file, its <mxfile> or bare <mxGraphModel> root.
+def load_model(root: ET.Element, page: Optional[str] = None) -> ET.Element:
+    if root.tag == 'mxGraphModel': return root
+    diagrams = root.findall('diagram')
+    if not diagrams: raise ValueError("no <diagram> found")
+    if page is None: diagram = diagrams[0]
+    elif page.isdigit() and int(page) < len(diagrams): diagram = diagrams[int(page)]
+    else:
+        diagram = next((d for d in diagrams if d.get('name') == page), None)
+        if diagram is None: raise ValueError(f"page '{page}' not found ({', '.join(d.get('name', '?') for d in diagrams)})")
+    model = diagram.find('mxGraphModel')
+    return model if model is not None else decode_diagram(diagram.text or '')
+
+# Cells of a model in document (z-) order with their children linked, wrapper <object>/<UserObject> ids and labels.
+def load_cells(model: ET.Element) -> Tuple[List[Cell], Dict[str, Cell]]:
+    root = model.find('root')
+    if root is None: raise ValueError("<mxGraphModel> without <root>")
+    cells, by_id = [], {}
+    for elem in root:
+        if elem.tag == 'mxCell': mx, cell_id, value = elem, elem.get('id'), elem.get('value', '')
+        else:
+            mx = elem.find('mxCell')
+            if mx is None: continue
+            cell_id, value = elem.get('id'), elem.get('label', '')
+        cell = Cell(cell_id, value, parse_cell_style(mx.get('style', '')), mx.get('parent'), mx.get('vertex') == '1',
+                    mx.get('edge') == '1', mx.find('mxGeometry'), mx.get('source'), mx.get('target'))
+        cells.append(cell); by_id[cell_id] = cell
+    for cell in cells:
+        if cell.parent in by_id: by_id[cell.parent].children.append(cell)
+
+    # Absolute vertex bounds, the geometry is relative to the parent vertex (group)
+    for cell in cells:
+        geometry = cell.geometry
+        if not cell.vertex or geometry is None: continue
+        parent = by_id.get(cell.parent)
+        cell.x = float(geometry.get('x', 0)) + (parent.x if parent else 0)
+        cell.y = float(geometry.get('y', 0)) + (parent.y if parent else 0)
+        cell.width, cell.height = float(geometry.get('width', 0)), float(geometry.get('height', 0))
+    return cells, by_id
+
+# ============================================================================
+# SHAPES - Vertices, edges and labels as plain SVG
+# ============================================================================
+# Point where an edge leaves a terminal: the exit/entry constraint, else the box perimeter towards `toward`.
+def terminal_point(cell: Cell, style: Dict[str, str], prefix: str, toward: Tuple[float, float]) -> Tuple[float, float]:
+    x, y, w, h = cell.bounds()
+    if f'{prefix}X' in style:
+        return (x + w * style_number(style, f'{prefix}X') + style_number(style, f'{prefix}Dx'),
+                y + h * style_number(style, f'{prefix}Y') + style_number(style, f'{prefix}Dy'))
+    cx, cy = x + w / 2, y + h / 2
+    dx, dy = toward[0] - cx, toward[1] - cy
+    if dx == 0 and dy == 0: return cx, cy
+    scale = min(w / 2 / abs(dx) if dx else math.inf, h / 2 / abs(dy) if dy else math.inf)
+    return cx + dx * scale, cy + dy * scale
+
+# Absolute points of an edge: terminal, waypoints, terminal
+def edge_points(cell: Cell, by_id: Dict[str, Cell]) -> List[Tuple[float, float]]:
+    parent = by_id.get(cell.parent)
+    ox, oy = (parent.x, parent.y) if parent else (0.0, 0.0)
+    points, source, target = [], None, None
+    if cell.geometry is not None:
+        for point in cell.geometry.iter('mxPoint'):
+            xy = (float(point.get('x', 0)) + ox, float(point.get('y', 0)) + oy)
+            role = point.get('as')
+            if role == 'sourcePoint': source = xy
+            elif role == 'targetPoint': target = xy
+            elif role is None: points.append(xy)
+    source_cell, target_cell = by_id.get(cell.source), by_id.get(cell.target)
+    center = lambda c: (c.x + c.width / 2, c.y + c.height / 2)
+    # Connected terminals win over the (stale) stored points
+    if source_cell is not None:
+        toward = points[0] if points else target or center(target_cell or source_cell)
+        source = terminal_point(source_cell, cell.style, 'exit', toward)
+    if target_cell is not None:
+        toward = points[-1] if points else source or center(target_cell)
+        target = terminal_point(target_cell, cell.style, 'entry', toward)
+    if source is None or target is None: return []
+    return [source] + points + [target]
+
+# Path data of a polyline, bends rounded with quadratic curves like draw.io does for rounded=1.
+def edge_path(points: List[Tuple[float, float]], rounded: bool) -> str:
+    d = [f'M {fmt(points[0][0])} {fmt(points[0][1])}']
+    for i in range(1, len(points) - 1):
+        (px, py), (x, y), (nx, ny) = points[i - 1], points[i], points[i + 1]
+        if not rounded: d.append(f'L {fmt(x)} {fmt(y)}'); continue
+        before, after = math.hypot(x - px, y - py), math.hypot(nx - x, ny - y)
+        r = min(EDGE_ARC_SIZE / 2, before / 2, after / 2)
+        if r == 0: d.append(f'L {fmt(x)} {fmt(y)}'); continue
+        d.append(f'L {fmt(x - (x - px) * r / before)} {fmt(y - (y - py) * r / before)} '
+                 f'Q {fmt(x)} {fmt(y)} {fmt(x + (nx - x) * r / after)} {fmt(y + (ny - y) * r / after)}')
+    d.append(f'L {fmt(points[-1][0])} {fmt(points[-1][1])}')
+    return ' '.join(d)
+
+# Renders cells into an SVG tree, shared gradients in <defs>
+class Renderer:
+    def __init__(self, by_id: Dict[str, Cell]):
+        self.by_id = by_id
+        self.defs = ET.Element(f'{{{SVG_NS}}}defs')
+        self.gradients: Dict[Tuple[str, str, str], str] = {}
+        self.min_x = self.min_y = math.inf
+        self.max_x = self.max_y = -math.inf
+        self.texts = 0
+
+    # Grow the drawing bounds by a box (rotated around its center) and half the stroke
+    def extend(self, x: float, y: float, w: float, h: float, rotation: float = 0.0, stroke: float = 0.0) -> None:
+        if rotation:
+            a = math.radians(rotation)
+            rw = abs(w * math.cos(a)) + abs(h * math.sin(a)); rh = abs(w * math.sin(a)) + abs(h * math.cos(a))
+            x, y, w, h = x + (w - rw) / 2, y + (h - rh) / 2, rw, rh
+        self.min_x = min(self.min_x, x - stroke / 2); self.min_y = min(self.min_y, y - stroke / 2)
+        self.max_x = max(self.max_x, x + w + stroke / 2); self.max_y = max(self.max_y, y + h + stroke / 2)
+
+    # Fill of a vertex, a linear gradient from fillColor to gradientColor in gradientDirection
+    def fill(self, style: Dict[str, str]) -> str:
+        fill = color(style.get('fillColor'), '#ffffff')
+        gradient = style.get('gradientColor')
+        if fill == 'none' or not gradient or gradient == 'none': return fill
+        gradient, direction = color(gradient, '#ffffff'), style.get('gradientDirection', 'south')
+        key = (fill, gradient, direction)
+        if key not in self.gradients:
+            self.gradients[key] = gradient_id = f'gradient-{len(self.gradients)}'
+            x1, y1, x2, y2 = {'north': ('0%', '100%', '0%', '0%'), 'east': ('0%', '0%', '100%', '0%'),
+                              'west': ('100%', '0%', '0%', '0%')}.get(direction, ('0%', '0%', '0%', '100%'))
+            element = ET.SubElement(self.defs, f'{{{SVG_NS}}}linearGradient',
+                                    {'id': gradient_id, 'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2})
+            ET.SubElement(element, f'{{{SVG_NS}}}stop', {'offset': '0%', 'stop-color': fill})
+            ET.SubElement(element, f'{{{SVG_NS}}}stop', {'offset': '100%', 'stop-color': gradient})
+        return f'url(#{self.gradients[key]})'
+
+    # Stroke attributes of a vertex or edge
+    def stroke(self, style: Dict[str, str], attrib: Dict[str, str]) -> float:
+        stroke = color(style.get('strokeColor'), '#000000')
+        width = style_number(style, 'strokeWidth', 1.0)
+        attrib['stroke'] = stroke
+        if stroke == 'none': return 0.0
+        attrib['stroke-width'] = fmt(width)
+        if style.get('dashed') == '1':
+            pattern = style.get('dashPattern', '3 3').split()
+            attrib['stroke-dasharray'] = ' '.join(fmt(float(p) * width) for p in pattern)
+        return width
+
+    # Shape element of a vertex (None for groups and plain text)
+    def vertex(self, cell: Cell) -> Optional[ET.Element]:
+        style, (x, y, w, h) = cell.style, cell.bounds()
+        shape = style.get('shape', 'rect')
+        if shape in ('group', 'text') or (w == 0 and h == 0): return None
+        rotation = style_number(style, 'rotation')
+        attrib: Dict[str, str] = {}
+        if shape == 'image':
+            href = style.get('image', '')
+            # ';' separates style keys, draw.io stores data URIs without ';base64'
+            if href.startswith('data:image/') and ';base64,' not in href: href = href.replace(',', ';base64,', 1)
+            attrib.update({'x': fmt(x), 'y': fmt(y), 'width': fmt(w), 'height': fmt(h), f'{{{XLINK_NS}}}href': href})
+            if style.get('imageAspect') == '0': attrib['preserveAspectRatio'] = 'none'
+            tag, stroke = 'image', 0.0
+        else:
+            attrib['fill'] = self.fill(style)
+            stroke = self.stroke(style, attrib)
+            if shape == 'ellipse':
+                tag = 'ellipse'
+                attrib.update({'cx': fmt(x + w / 2), 'cy': fmt(y + h / 2), 'rx': fmt(w / 2), 'ry': fmt(h / 2)})
+            elif shape == 'triangle':
+                tag = 'path'
+                attrib['d'] = f'M {fmt(x)} {fmt(y)} L {fmt(x + w)} {fmt(y + h / 2)} L {fmt(x)} {fmt(y + h)} Z'
+            else:
+                tag = 'rect'
+                attrib.update({'x': fmt(x), 'y': fmt(y), 'width': fmt(w), 'height': fmt(h)})
+                if style.get('rounded') == '1':
+                    arc = style_number(style, 'arcSize', ARC_SIZE)
+                    r = arc / 2 if style.get('absoluteArcSize') == '1' else min(w, h) * arc / 100
+                    attrib['rx'] = attrib['ry'] = fmt(r)
+        if rotation: attrib['transform'] = f'rotate({fmt(rotation)},{fmt(x + w / 2)},{fmt(y + h / 2)})'
+        self.extend(x, y, w, h, rotation, stroke)
+        return ET.Element(f'{{{SVG_NS}}}{tag}', attrib)
+
+    # Path element of an edge
+    def edge(self, cell: Cell) -> Optional[ET.Element]:
+        points = edge_points(cell, self.by_id)
+        if not points: return None
+        attrib = {'d': edge_path(points, cell.style.get('rounded') == '1'), 'fill': 'none'}
+        stroke = self.stroke(cell.style, attrib)
+        xs, ys = [p[0] for p in points], [p[1] for p in points]
+        self.extend(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys), stroke=stroke)
+        return ET.Element(f'{{{SVG_NS}}}path', attrib)
+
+    # Native <text> of a label, the id of the cell, centered like draw.io (font size × 0.35 below the middle)
+    def label(self, cell: Cell, box: Tuple[float, float, float, float]) -> Optional[ET.Element]:
+        style, value = cell.style, cell.value
+        bold = bool(int(style_number(style, 'fontStyle')) & 1)
+        if style.get('html') == '1':
+            bold = bold or bool(re.search(r'<(b|strong)\b', value, re.I))
+            value = TAG_RE.sub('', BREAK_RE.sub('\n', value))
+        lines = [line.strip() for line in html.unescape(value).replace('\xa0', ' ').splitlines()]
+        lines = [line for line in lines if line]
+        if not lines: return None
+
+        x, y, w, h = box
+        font_size = style_number(style, 'fontSize', DEFAULT_FONT_SIZE)
+        align, valign = style.get('align', 'center'), style.get('verticalAlign', 'middle')
+        spacing = style_number(style, 'spacing', LABEL_SPACING)
+        text_x = {'left': x + spacing, 'right': x + w - spacing}.get(align, x + w / 2)
+        block = font_size * 1.2 * (len(lines) - 1)
+        top = {'top': y + spacing + font_size * 0.85, 'bottom': y + h - spacing - font_size * 0.25 - block}.get(
+            valign, y + h / 2 + font_size * 0.35 - block / 2)
+
+        text = ET.Element(f'{{{SVG_NS}}}text', {
+            'id': cell.id, 'x': fmt(text_x), 'y': fmt(top), 'font-size': f'{fmt(font_size)}px',
+            'fill': color(style.get('fontColor'), '#000000'),
+            'font-family': style.get('fontFamily', DEFAULT_FONT_FAMILY),
+            'text-anchor': {'left': 'start', 'right': 'end'}.get(align, 'middle'),
+            'font-weight': 'bold' if bold else 'normal'})
+        font_style = int(style_number(style, 'fontStyle'))
+        if font_style & 2: text.set('font-style', 'italic')
+        if font_style & 4: text.set('text-decoration', 'underline')
+        if len(lines) > 1:
+            for i, line in enumerate(lines):
+                tspan = ET.SubElement(text, f'{{{SVG_NS}}}tspan', {'x': text.get('x'), 'dy': fmt(font_size * 1.2 if i else 0)})
+                tspan.text = line
+        else: text.text = lines[0]
+        self.texts += 1
+        return text
+
+    # <g id="cell-<id>"> with the shape, the label and the child cells
+    def render(self, cell: Cell, parent: ET.Element) -> None:
+        if cell.style.get('visible') == '0' or cell.style.get('opacity') == '0': return
+        group = ET.SubElement(parent, f'{{{SVG_NS}}}g', {'id': f'cell-{cell.id}'})
+        shape, box = None, cell.bounds()
+        if cell.edge:
+            shape = self.edge(cell)
+            points = edge_points(cell, self.by_id)
+            if points:
+                # Edge labels sit on the middle waypoint (or between both terminals)
+                (ax, ay), (bx, by) = points[(len(points) - 1) // 2], points[len(points) // 2]
+                box = ((ax + bx) / 2, (ay + by) / 2, 0.0, 0.0)
+        elif cell.vertex: shape = self.vertex(cell)
+        if shape is not None:
+            if cell.style.get('shadow') == '1':
+                wrapper = ET.SubElement(group, f'{{{SVG_NS}}}g', {'style': 'filter: drop-shadow(rgba(0, 0, 0, 0.25) 2px 3px 2px);'})
+                wrapper.append(shape)
+            else: group.append(shape)
+        if (cell.vertex or cell.edge) and (text := self.label(cell, box)) is not None:
+            group.append(text)
+            if cell.vertex and shape is None: self.extend(*box)
+        for child in cell.children: self.render(child, group)
+
+# Compile a model to an SVG root, returns (svg, labels)
+def compile_model(model: ET.Element) -> Tuple[ET.Element, int]:
+    cells, by_id = load_cells(model)
+    renderer = Renderer(by_id)
+    svg = ET.Element(f'{{{SVG_NS}}}svg', {'version': '1.1', 'style': 'background: transparent; color-scheme: light dark;'})
+    svg.append(renderer.defs)
+    content = ET.SubElement(svg, f'{{{SVG_NS}}}g')
+    for cell in cells:
+        # Roots (and their layers) are the cells without a known parent
+        if cell.parent not in by_id: renderer.render(cell, content)
+    if not renderer.defs: svg.remove(renderer.defs)
+    if renderer.min_x == math.inf: renderer.min_x = renderer.min_y = renderer.max_x = renderer.max_y = 0.0
+
+    # Drawing at the origin, whole pixels around it
+    min_x, min_y = math.floor(renderer.min_x), math.floor(renderer.min_y)
+    width, height = math.ceil(renderer.max_x) - min_x, math.ceil(renderer.max_y) - min_y
+    svg.set('width', f'{width}px'); svg.set('height', f'{height}px')
+    svg.set('viewBox', f'{min_x} {min_y} {width} {height}')
+    return svg, renderer.texts
+
+# Compile a .drawio file to an ha-floorplan SVG
+def compile_drawio(input_path: Path, output_path: Optional[Path] = None, page: Optional[str] = None,
+                   check: Optional[Path] = None, verbose: bool = True) -> bool:
+    log = print if verbose else (lambda *args, **kwargs: None)
+    if not input_path.exists(): print(f"❌ Error: '{input_path}' not found!"); return False
+    output_path = output_path or input_path.with_suffix('.svg')
+
+    start = time.perf_counter()
+    try:
+        model = load_model(ET.parse(input_path).getroot(), page)
+        svg, texts = compile_model(model)
+    except ET.ParseError as e: print(f"❌ Error: Invalid draw.io file '{input_path}': {e}"); return False
+    except (ValueError, zlib.error, UnicodeDecodeError) as e: print(f"❌ Error: Cannot read diagram of '{input_path}': {e}"); return False
+    except OSError as e: print(f"❌ Error: Cannot read '{input_path}': {e}"); return False
+
+    if check:
+        try: missing = missing_elements(svg, check.read_text(encoding='utf-8'))
+        except OSError as e: print(f"❌ Error: Cannot read '{check}': {e}"); return False
+        if missing: print(f"❌ Error: Elements of '{check}' missing in the diagram: {', '.join(missing)}"); return False
+        log(f" ✓ All elements of {check} found")
+
+    ET.register_namespace('', SVG_NS); ET.register_namespace('xlink', XLINK_NS)
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        ET.ElementTree(svg).write(output_path, encoding='utf-8', xml_declaration=True)
+    except OSError as e: print(f"❌ Error writing '{output_path}': {e}"); return False
+    log(f"✅ Success! Compiled {input_path}: {texts} texts in {time.perf_counter() - start:.2f} s → {output_path}")
+    return True
+
+# CLI entry point
+def main():
+    parser = argparse.ArgumentParser(description="draw.io (.drawio) → ha-floorplan SVG compiler",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="Examples:\n  python drawio-to-svg.py ../drawio/solaris-dashboard.drawio -o solaris-rps-dashboard.svg"
+               "\n  python drawio-to-svg.py diagram.drawio --page 1 --check solaris-rps-dashboard.yaml")
+    parser.add_argument('input', help="Input .drawio file (compressed or not)")
+    parser.add_argument('-o', '--output', help="Output SVG (default: <input>.svg)")
+    parser.add_argument('-p', '--page', help="Page index (from 0) or name (default: first page)")
+    parser.add_argument('-c', '--check', help="ha-floorplan YAML whose element ids must exist in the SVG")
+    args = parser.parse_args()
+    sys.exit(0 if compile_drawio(Path(args.input), Path(args.output) if args.output else None, args.page,
+                                 Path(args.check) if args.check else None) else 1)
+
+# Run module directly
+if __name__ == "__main__": main()
@@ -0,0 +1,35 @@
+"""
+ha-floorplan rules helpers
+Element ids referenced by the dashboard YAML, shared by convert-svg.py and drawio-to-svg.py
+"""
+
+import xml.etree.ElementTree as ET
+import re
+from typing import List
+
+ELEMENT_RE = re.compile(r'^(\s*)(?:-\s+)?(elements?):\s*(\S+)?\s*$')
+ITEM_RE = re.compile(r'\s*-\s+([^\s#:]+)\s*$')
+COMMENT_RE = re.compile(r'^(\s*)# ?')
+
+# Element ids of the ha-floorplan rules ('element: id' and 'elements:' lists). Commented-out rules
+# (optional variants like the RPS4 block) are ignored unless `commented` is set.
+def yaml_element_ids(text: str, commented: bool = False) -> List[str]:
+    ids, list_indent = [], None
+    for line in text.splitlines():
+        if commented: line = COMMENT_RE.sub(r'\1', line)
+        if not line.strip() or line.lstrip().startswith('#'): continue
+        indent = len(line) - len(line.lstrip())
+        if list_indent is not None:
+            item = ITEM_RE.match(line)
+            if item and indent >= list_indent: ids.append(item.group(1)); continue
+            list_indent = None
+        m = ELEMENT_RE.match(line)
+        if not m: continue
+        if m.group(2) == 'element' and m.group(3): ids.append(m.group(3).strip('\'"'))
+        elif m.group(2) == 'elements' and not m.group(3): list_indent = indent
+    return list(dict.fromkeys(ids))
+
+# Element ids of the rules missing in an SVG
+def missing_elements(svg: ET.Element, yaml_text: str) -> List[str]:
+    ids = {elem.get('id') for elem in svg.iter()}
+    return [element for element in yaml_element_ids(yaml_text) if element not in ids]
@@ -0,0 +1,211 @@
+"""
+ha-floorplan dashboard generator
+Writes solaris-rps-dashboard.yaml with the entity ids of the sensors in SENSORS_CONFIG
+"""
+
+import ast, sys, argparse, importlib, importlib.util, unicodedata, re
+from typing import Dict, List, NamedTuple
+from pathlib import Path
+
+COMPONENT_DIR = Path(__file__).resolve().parents[1] / 'esphome' / 'components' / 'daikin_rotex_solaris'
+PACKAGE = 'daikin_rotex_solaris'
+DEFAULT_DEVICE = 'esp-rotex-solaris-rps3'
+IMAGE = '/local/floorplans/solaris_rps/solaris-rps-dashboard.svg'
+STYLESHEET = '/local/floorplans/solaris_rps/solaris-rps-dashboard.css'
+# Units of esphome.const used in SENSORS_CONFIG (sensors_config.py is read without ESPHome)
+ESPHOME_UNITS = {'UNIT_PERCENT': '%', 'UNIT_CELSIUS': '°C', 'UNIT_KILOWATT': 'kW'}
+DOMAINS = {'numeric': 'sensor', 'binary': 'binary_sensor', 'text': 'sensor'}
+# Texts of the binary sensor values (on, off)
+ON_OFF = {'de': ('ein', 'aus'), 'en': ('on', 'off'), 'es': ('sí', 'no'), 'fr': ('oui', 'non'), 'it': ('sì', 'no')}
+LABEL_CLASS = 'txt-{} txt-large txt-bold non-clickable'
+VALUE_CLASS = 'txt-{} txt-medium txt-bold'
+# Booster pump elements, hidden on the RPS4 (no P2)
+P2_ELEMENTS = ['p2_txt', 'cell-p2_txt', 'p2_val', 'cell-p2_val', 'cell-p2_symbol', 'cell-p2_led']
+SLUG_RE = re.compile(r'[^a-z0-9]+')
+PLAIN_RE = re.compile(r'^[^-?:,\[\]{}#&*!|>\'"%@`\s]([^"\'#]|(?<! )#)*$')
+
+# Value shown by the floorplan: label <element>_txt, value <element>_val
+class Value(NamedTuple):
+    key: str
+    element: str
+    label: str
+    color: str
+    value_color: str
+
+VALUES = [
+    Value('solaris_p1', 'p1', 'P1', 'blue', 'green'),
+    Value('solaris_p2', 'p2', 'P2', 'blue', 'green'),
+    Value('solaris_pwr', 'pwr', 'P', 'yellow', 'yellow'),
+    Value('solaris_tk', 'tk', 'Tk', 'red', 'red'),
+    Value('solaris_df', 'df', 'V', 'blue', 'blue'),
+    Value('solaris_tv', 'tv', 'Tv', 'blue', 'blue'),
+    Value('solaris_ts', 'ts', 'Ts', 'blue', 'blue'),
+    Value('solaris_tr', 'tr', 'Tr', 'blue', 'blue'),
+]
+# Status texts shown with their box (cell-<element>_txt) while the binary sensor is on, value_color is
+# the class of the text
+STATUS = [
+    Value('solaris_bk', 'bk', 'Br', 'red', 'txt-red txt-medium txt-bold non-clickable'),
+    Value('solaris_ha', 'ha', 'H', 'yellow', 'txt-yellow txt-large txt-bold'),
+]
+
+# ============================================================================
+# SENSORS - SENSORS_CONFIG and the translations of the component
+# ============================================================================
+
+# Literal fields (type, key, unit, accuracy) of the SENSORS_CONFIG entries, read from the source since
+# sensors_config.py imports ESPHome
+def load_sensors_config(path: Path = COMPONENT_DIR / 'sensors_config.py') -> Dict[str, Dict]:
+    tree = ast.parse(path.read_text(encoding='utf-8'))
+    names, sensors = dict(ESPHOME_UNITS), {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1 or not isinstance(node.targets[0], ast.Name): continue
+        target = node.targets[0].id
+        if isinstance(node.value, ast.Constant): names[target] = node.value.value
+        if target != 'SENSORS_CONFIG': continue
+        for entry in node.value.elts:
+            fields = {}
+            for key, value in zip(entry.keys, entry.values):
+                if isinstance(value, ast.Constant): fields[key.value] = value.value
+                elif isinstance(value, ast.Name) and value.id in names: fields[key.value] = names[value.id]
+            sensors[fields['key']] = fields
+    if not sensors: raise ValueError(f"No SENSORS_CONFIG in '{path}'")
+    return sensors
+
+# The translations module of the component (bare package, no ESPHome)
+def load_translations():
+    if PACKAGE not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            PACKAGE, COMPONENT_DIR / '__init__.py', submodule_search_locations=[str(COMPONENT_DIR)])
+        sys.modules[PACKAGE] = importlib.util.module_from_spec(spec)
+    return importlib.import_module(f'{PACKAGE}.translations.translations')
+
+# Home Assistant slug of a name ("Umwälzpumpe" -> "umwalzpumpe")
+def slugify(text: str) -> str:
+    text = unicodedata.normalize('NFKD', text.replace('ß', 'ss')).encode('ascii', 'ignore').decode()
+    return SLUG_RE.sub('_', text.lower()).strip('_')
+
+# Entity id of a sensor, named by the component as "[<name_prefix> ]<translated name>"
+def entity_id(sensor: Dict, name: str, device: str, prefix: str = '') -> str:
+    return f"{DOMAINS[sensor['type']]}.{slugify(device)}_{slugify(f'{prefix} {name}')}"
+
+# Floorplan text of a sensor state, formatted like the ESPHome sensor (accuracy and unit)
+def value_text(sensor: Dict, lang: str) -> str:
+    if sensor['type'] == 'binary':
+        on, off = ON_OFF.get(lang, ON_OFF['en'])
+        return f'${{entity.state === "on" ? "{on}" : "{off}"}}'
+    accuracy, unit = sensor.get('accuracy', 0), sensor.get('unit') or ''
+    number = f'parseFloat(entity.state).toFixed({accuracy})' if accuracy else 'parseInt(entity.state)'
+    return f'${{{number}}}' + (unit if unit == '%' else f' {unit}' if unit else '')
+
+# ============================================================================
+# YAML - Startup actions for the static texts and classes, rules for the states
+# ============================================================================
+
+# YAML scalar, single quoted unless plain
+def scalar(value: str) -> str:
+    return value if PLAIN_RE.match(value) and not value.endswith(':') and ': ' not in value else "'" + value.replace("'", "''") + "'"
+
+# floorplan service call lines at indent
+def service(name: str, data: Dict, indent: int) -> List[str]:
+    pad = ' ' * indent
+    lines = [f'{pad}- service: floorplan.{name}', f'{pad}  service_data:']
+    for key, value in data.items():
+        if isinstance(value, list): lines += [f'{pad}    {key}:'] + [f'{pad}      - {item}' for item in value]
+        else: lines.append(f'{pad}    {key}: {scalar(value)}')
+    return lines
+
+# Rule updating elements from the state of an entity
+def rule(comment: str, entity: str, elements: List[str], actions: List[List[str]]) -> List[str]:
+    lines = [f'        # {comment}', f'        - entity: {entity}']
+    if len(elements) == 1: lines.append(f'          element: {elements[0]}')
+    else: lines += ['          elements:'] + [f'            - {element}' for element in elements]
+    lines.append('          state_action:')
+    for action in actions: lines += action
+    return lines + ['']
+
+# Dashboard YAML for a device, language and model (rps3, rps4). Static texts and classes are set once by
+# startup_action, the rules only update what depends on a state: one service call per value and update.
+def generate_dashboard(sensors: Dict[str, Dict], names: Dict[str, str], lang: str = 'de',
+                       device: str = DEFAULT_DEVICE, prefix: str = '', model: str = 'rps3') -> str:
+    values = [value for value in VALUES if model == 'rps3' or value.key != 'solaris_p2']
+    entity = lambda key: entity_id(sensors[key], names[key], device, prefix)
+    title = model.upper()
+
+    startup = []
+    for value in values + STATUS:
+        startup += service('text_set', {'element': f'{value.element}_txt', 'text': value.label}, 8)
+    classes: Dict[str, List[str]] = {}
+    for value in values:
+        classes.setdefault(LABEL_CLASS.format(value.color), []).append(f'{value.element}_txt')
+        classes.setdefault(VALUE_CLASS.format(value.value_color), []).append(f'{value.element}_val')
+    for status in STATUS: classes.setdefault(status.value_color, []).append(f'{status.element}_txt')
+    if model == 'rps4': classes['hidden'] = P2_ELEMENTS
+    for name, elements in classes.items(): startup += service('class_set', {'class': name, 'elements': elements}, 8)
+
+    rules = []
+    for value in values:
+        text = service('text_set', {'text': value_text(sensors[value.key], lang)}, 12)
+        rules += rule(f"{value.label} - {names[value.key]}", entity(value.key), [f'{value.element}_val'], [text])
+    for status in STATUS:
+        visible = service('class_set', {'class': '${entity.state === "on" ? "visible" : "hidden"}'}, 12)
+        rules += rule(f"{status.label} - {names[status.key]} (shown while on)", entity(status.key),
+                      [f'cell-{status.element}_txt'], [visible])
+    flow = service('class_set', {'class': '${parseInt(entity.state) > 0 ? "flow-animation visible" : "hidden"}'}, 12)
+    rules += rule("Animated water lines (shown while P1 is running)", entity('solaris_p1'),
+                  ['cell-wasser_hoch', 'cell-wasser_runter'], [flow])
+
+    lines = [
+        f'# Generated by generate-dashboard.py (device {device}, language {lang}, {title}), do not edit',
+        'type: panel', f'title: Solaris {title} Dashboard', 'icon: mdi:solar-power-variant',
+        f'path: solaris-{model}-dashboard', 'cards:', '  - type: custom:floorplan-card', '    config:',
+        f'      image: {IMAGE}', f'      stylesheet: {STYLESHEET}', '      defaults:', '        tap_action: more-info',
+        '      # Static labels and text classes, set once when the floorplan is loaded',
+        '      startup_action:', *startup,
+    ]
+    if model == 'rps3':
+        # Kept as comment: the ids hidden on the RPS4 stay in the SVG optimized with convert-svg.py --yaml
+        lines += ['      # RPS4 (--model rps4): the booster pump (P2) is hidden', '      #   elements:']
+        lines += [f'      #     - {element}' for element in P2_ELEMENTS]
+    lines += ['      rules:', *rules[:-1], '    full_height: true']
+    return '\n'.join(lines) + '\n'
+
+# ============================================================================
+# MAIN - Command line interface
+# ============================================================================
+
+# Generate the dashboard YAML
+def write_dashboard(output_path: Path, lang: str = 'de', device: str = DEFAULT_DEVICE, prefix: str = '',
+                    model: str = 'rps3', verbose: bool = True) -> bool:
+    translations = load_translations()
+    if not translations.translation_exists(lang): print(f"❌ Error: No translation for language '{lang}'"); return False
+    try: sensors = load_sensors_config()
+    except (OSError, SyntaxError, ValueError) as e: print(f"❌ Error: Cannot read SENSORS_CONFIG: {e}"); return False
+    names = {key: translations.get_sensor_name(key, lang) for key in sensors}
+    text = generate_dashboard(sensors, names, lang, device, prefix, model)
+    try: output_path.write_text(text, encoding='utf-8')
+    except OSError as e: print(f"❌ Error writing '{output_path}': {e}"); return False
+    if verbose:
+        print(f"✅ Success! {output_path}: {model.upper()}, {text.count('- entity:')} state rules, "
+              f"entities {slugify(device)}_* ({lang})")
+    return True
+
+# CLI entry point
+def main():
+    parser = argparse.ArgumentParser(description="ha-floorplan dashboard YAML generator",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="Examples:\n  python generate-dashboard.py"
+               "\n  python generate-dashboard.py --device rotex-solaris --language en --model rps4 -o dashboard.yaml")
+    parser.add_argument('-o', '--output', default=str(Path(__file__).with_name('solaris-rps-dashboard.yaml')),
+                        help="Output YAML (default: solaris-rps-dashboard.yaml next to this script)")
+    parser.add_argument('-d', '--device', default=DEFAULT_DEVICE,
+                        help=f"Device name in Home Assistant, prefix of the entity ids (default: {DEFAULT_DEVICE})")
+    parser.add_argument('-l', '--language', default='de', help="'language:' of the component (default: de)")
+    parser.add_argument('--name-prefix', default='', help="'name_prefix:' of the component (default: none)")
+    parser.add_argument('-m', '--model', choices=['rps3', 'rps4'], default='rps3',
+                        help="Solaris controller, the RPS4 has no booster pump (default: rps3)")
+    args = parser.parse_args()
+    sys.exit(0 if write_dashboard(Path(args.output), args.language, args.device, args.name_prefix, args.model) else 1)
+
+# Run module directly
+if __name__ == "__main__": main()
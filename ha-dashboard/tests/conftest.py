@@ -0,0 +1,43 @@
+"""Load the ha-dashboard scripts (not importable by their file names) as modules for the tests"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+DASHBOARD_DIR = Path(__file__).resolve().parents[1]
+# Shared helper modules of the scripts (floorplan_rules.py)
+sys.path.insert(0, str(DASHBOARD_DIR))
+
+
+def load_script(name):
+    """Import a script of ha-dashboard/ by its file name (as convert_svg, ...)"""
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), DASHBOARD_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    # Registered so the process pool workers can unpickle its functions
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def dashboard_dir():
+    """ha-dashboard/ ("from conftest import" would clash with the conftest of
+    the other test directories in one pytest run)"""
+    return DASHBOARD_DIR
+
+
+@pytest.fixture(scope="session")
+def convert_svg():
+    return load_script("convert-svg")
+
+
+@pytest.fixture(scope="session")
+def drawio_to_svg():
+    return load_script("drawio-to-svg")
+
+
+@pytest.fixture(scope="session")
+def generate_dashboard():
+    return load_script("generate-dashboard")
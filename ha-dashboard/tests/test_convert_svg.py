@@ -0,0 +1,129 @@
+"""Tests for convert-svg.py - style parser, foreignObject replacement, the batch mode and the optimizer"""
+
+import gzip
+import xml.etree.ElementTree as ET
+import zlib
+from pathlib import Path
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def test_parse_style(convert_svg):
+    props = convert_svg.parse_style("background-color: #fff; COLOR: rgb(0, 0, 0); max-width: 5px; width: 36px;;")
+    assert props == {"background-color": "#fff", "color": "rgb(0, 0, 0)", "max-width": "5px", "width": "36px"}
+    # Properties are matched by name, not as part of longer names
+    foreign = ET.fromstring('<foreignObject><div style="background-color: #fff; max-width: 8px; '
+                            'color: red; width: 36px; padding-top: 14px; margin-left: 1px"/></foreignObject>')
+    x, y, _, _, fill, _, _ = convert_svg.get_text_position_and_style(foreign)
+    assert (x, y, fill) == (19, 14 + 14 * 0.35, "red")
+
+
+def test_convert_tree(convert_svg):
+    root = convert_svg.synthetic_export(12).getroot()
+    empty = root.find(f".//{SVG}switch")
+    empty.find(f"{SVG}foreignObject").clear()
+    converted, removed = convert_svg.convert_tree(root, verbose=False)
+    assert (converted, removed) == (11, 1)
+    assert not list(root.iter(f"{SVG}foreignObject"))
+    # Replaced in place, before the fallback <text> of the draw.io switch
+    switch = root.findall(f".//{SVG}switch")[1]
+    label = switch[0]
+    assert label.tag == f"{SVG}text" and len(switch) == 2
+    assert (label.get("id"), label.text, label.get("x"), label.get("y")) == ("cell-1", "1 °C", "59.0", "18.2")
+
+
+def test_enlarge(convert_svg):
+    base = convert_svg.synthetic_export(5)
+    enlarged = convert_svg.enlarge(base, 4).getroot()
+    assert len(list(enlarged.iter(f"{SVG}foreignObject"))) == 20
+    assert len(list(base.getroot().iter(f"{SVG}foreignObject"))) == 5
+
+
+def test_batch_cache(convert_svg, tmp_path, capsys):
+    source = tmp_path / "exports"
+    source.mkdir()
+    for name in ("rps3", "rps4"):
+        convert_svg.synthetic_export(3).write(source / f"{name}.svg")
+    out = tmp_path / "out"
+
+    inputs = convert_svg.collect_inputs([str(source)])
+    assert [p.name for p in inputs] == ["rps3.svg", "rps4.svg"]
+    assert convert_svg.convert_batch(inputs, out, jobs=1)
+    assert "2 converted, 0 unchanged" in capsys.readouterr().out
+    assert (out / convert_svg.CACHE_NAME).is_file()
+
+    # Only the changed source is converted again
+    (source / "rps4.svg").write_text((source / "rps4.svg").read_text() + "\n")
+    assert convert_svg.convert_batch(inputs, out, jobs=1)
+    assert "1 converted, 1 unchanged" in capsys.readouterr().out
+    # Process pool
+    assert convert_svg.convert_batch(inputs, out, jobs=2, force=True)
+    assert "2 converted, 0 unchanged" in capsys.readouterr().out
+    assert not list(ET.parse(out / "rps3.svg").getroot().iter(f"{SVG}foreignObject"))
+
+
+def png(*chunks):
+    out = [b"\x89PNG\r\n\x1a\n"]
+    for kind, body in chunks:
+        out += [len(body).to_bytes(4, "big"), kind, body, zlib.crc32(kind + body).to_bytes(4, "big")]
+    return b"".join(out)
+
+
+def test_optimize_png(convert_svg):
+    header = (b"IHDR", (1).to_bytes(4, "big") * 2 + bytes([8, 2, 0, 0, 0]))
+    pixels = zlib.compress(b"\x00\xff\x00\x00")
+    original = png(header, (b"eXIf", b"MM\x00*"), (b"IDAT", pixels[:5]), (b"IDAT", pixels[5:]), (b"tEXt", b"a\x00b"),
+                   (b"IEND", b""))
+    # Ancillary chunks dropped, image data in one chunk
+    assert convert_svg.optimize_png(original) == png(header, (b"IDAT", pixels), (b"IEND", b""))
+    # Animated PNGs and other data stay untouched
+    animated = png(header, (b"acTL", bytes(8)), (b"IDAT", pixels), (b"IEND", b""))
+    assert convert_svg.optimize_png(animated) == animated
+    assert convert_svg.optimize_png(b"GIF89a") == b"GIF89a"
+
+
+def test_optimize_tree(convert_svg):
+    root = convert_svg.synthetic_export(4).getroot()
+    convert_svg.convert_tree(root, verbose=False)
+    defs = ET.SubElement(root, f"{SVG}defs")
+    ET.SubElement(defs, f"{SVG}linearGradient", {"id": "unused"})
+    ET.SubElement(defs, f"{SVG}linearGradient", {"id": "used"})
+    for i, rect in enumerate(root.iter(f"{SVG}rect")):
+        fill = ("url(#used)", 'url("#used")') if i == 3 else ("#333333", "rgb(51, 51, 51)")
+        rect.attrib.update({"fill": fill[0], "stroke": "#666666", "stroke-width": "2", "x": f"{i}.123456",
+                            "style": f"fill: {fill[1]}; stroke: light-dark(#666666, #999999);"})
+    stats = convert_svg.optimize_tree(root, convert_svg.Optimization(keep_ids=("cell-1",), css_path=Path("x.css")))
+
+    assert (stats["fallbacks"], stats["defs"], stats["styles"]) == (4, 1, 4)
+    assert not list(root.iter(f"{SVG}switch")) and not any("data-cell-id" in e.attrib for e in root.iter())
+    assert [e.get("id") for e in root.iter() if e.get("id")] == ["cell-1", "used"]
+    rects = list(root.iter(f"{SVG}rect"))
+    assert rects[1].get("x") == "1.12"
+    # The three plain rects share a class, the dark mode color moves with it, url() stays on the element
+    assert stats["rules"][0] == ".s0 { fill: #333333; stroke: #666666; stroke-width: 2; stroke: light-dark(#666666, #999999) }"
+    assert [r.get("class") for r in rects] == ["s0", "s0", "s0", None]
+    assert rects[0].attrib.keys() == {"x", "y", "width", "height", "class"}
+    assert rects[3].get("fill") == "url(#used)"
+
+
+def test_convert_optimized(convert_svg, tmp_path, capsys):
+    source, css = tmp_path / "export.svg", tmp_path / "dashboard.css"
+    convert_svg.synthetic_export(6).write(source)
+    for rect in (root := ET.parse(source)).iter(f"{SVG}rect"): rect.attrib.update({"fill": "#333333", "stroke": "#666666"})
+    root.write(source)
+    css.write_text(".txt-blue { fill: #3CBCF3 }")
+    output = tmp_path / "out" / "dashboard.svg"
+    options = convert_svg.Optimization(keep_ids=("cell-2",), css_path=css)
+
+    assert convert_svg.convert_svg(source, output, optimize=options)
+    report = capsys.readouterr().out
+    assert f"64 → {sum(1 for _ in ET.parse(output).getroot().iter())} elements" in report and "dashboard.svg.gz" in report
+    assert gzip.decompress((tmp_path / "out" / "dashboard.svg.gz").read_bytes()) == output.read_bytes()
+    assert css.read_text().startswith(".txt-blue { fill: #3CBCF3 }\n\n" + convert_svg.CSS_BEGIN)
+    # Optimizing the optimized SVG again keeps the SVG and the stylesheet
+    svg, stylesheet = output.read_bytes(), css.read_text()
+    assert convert_svg.convert_svg(output, output, verbose=False, optimize=options)
+    assert (output.read_bytes(), css.read_text()) == (svg, stylesheet)
+    # Every element of the rules has to survive
+    assert not convert_svg.convert_svg(source, output, verbose=False, optimize=options._replace(keep_ids=("p1_val",)))
+    assert "p1_val" in capsys.readouterr().out
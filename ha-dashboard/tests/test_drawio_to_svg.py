@@ -0,0 +1,55 @@
+"""Tests for drawio-to-svg.py - model loading, shapes, labels and the element check"""
+
+import base64
+import xml.etree.ElementTree as ET
+import zlib
+from urllib.parse import quote
+
+SVG = "{http://www.w3.org/2000/svg}"
+MODEL = """<mxGraphModel><root>
+  <mxCell id="0"/><mxCell id="1" parent="0"/>
+  <mxCell id="box" value="" style="group" parent="1" vertex="1"><mxGeometry x="100" y="50" width="80" height="60" as="geometry"/></mxCell>
+  <object label="&lt;b&gt;P1&lt;/b&gt;" id="p1_txt">
+    <mxCell style="rounded=1;html=1;fontColor=light-dark(#3CBCF3,#3CBCF3);fontSize=32;fillColor=#333333;strokeWidth=2;" parent="box" vertex="1">
+      <mxGeometry x="10" y="10" width="60" height="30" as="geometry"/></mxCell></object>
+  <mxCell id="pipe" style="endArrow=none;rounded=1;strokeWidth=4;dashed=1;dashPattern=1 1;exitX=0;exitY=0.5;" parent="1" source="p1_txt" edge="1">
+    <mxGeometry relative="1" as="geometry"><mxPoint x="60" y="200" as="targetPoint"/>
+      <Array as="points"><mxPoint x="60" y="75"/></Array></mxGeometry></mxCell>
+</root></mxGraphModel>"""
+
+
+def compressed(model):
+    deflate = zlib.compressobj(9, zlib.DEFLATED, -15)
+    data = deflate.compress(quote(model).encode()) + deflate.flush()
+    return f'<mxfile><diagram name="Page-1">{base64.b64encode(data).decode()}</diagram></mxfile>'
+
+
+def test_compressed_diagram(drawio_to_svg):
+    plain = drawio_to_svg.load_model(ET.fromstring(f'<mxfile><diagram name="Page-1">{MODEL}</diagram></mxfile>'))
+    inflated = drawio_to_svg.load_model(ET.fromstring(compressed(MODEL)), "Page-1")
+    assert ET.tostring(drawio_to_svg.compile_model(plain)[0]) == ET.tostring(drawio_to_svg.compile_model(inflated)[0])
+
+
+def test_compile_model(drawio_to_svg):
+    svg, texts = drawio_to_svg.compile_model(ET.fromstring(MODEL))
+    assert texts == 1
+    cell = svg.find(f".//{SVG}g[@id='cell-p1_txt']")
+    rect, text = cell
+    # Geometry relative to the group, arc 15% of the shorter side
+    assert (rect.get("x"), rect.get("y"), rect.get("rx")) == ("110", "60", "4.5")
+    assert (text.get("id"), text.text, text.get("x"), text.get("y")) == ("p1_txt", "P1", "140", "86.2")
+    assert (text.get("fill"), text.get("font-weight")) == ("#3CBCF3", "bold")
+    # Edge leaves the terminal at exitX/exitY, the bend is rounded
+    path = svg.find(f".//{SVG}g[@id='cell-pipe']/{SVG}path")
+    assert path.get("d") == "M 110 75 L 70 75 Q 60 75 60 85 L 60 200"
+    assert path.get("stroke-dasharray") == "4 4"
+
+
+def test_dashboard_elements(drawio_to_svg, dashboard_dir, tmp_path):
+    output = tmp_path / "dashboard.svg"
+    assert drawio_to_svg.compile_drawio(dashboard_dir.parent / "drawio" / "solaris-dashboard.drawio", output,
+                                        check=dashboard_dir / "solaris-rps-dashboard.yaml", verbose=False)
+    root = ET.parse(output).getroot()
+    texts = {text.get("id"): text.text for text in root.iter(f"{SVG}text")}
+    assert texts["p1_val"] == "000%" and texts["pwr_val"] == "0,00 kW"
+    assert not list(root.iter(f"{SVG}foreignObject"))
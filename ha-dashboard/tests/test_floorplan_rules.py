@@ -0,0 +1,29 @@
+"""Tests for floorplan_rules.py - element ids of the ha-floorplan rules"""
+
+import xml.etree.ElementTree as ET
+
+from floorplan_rules import missing_elements, yaml_element_ids
+
+
+def test_yaml_element_ids():
+    yaml = """
+      rules:
+        - element: p1_txt
+        - entity: sensor.p1
+          element: 'p1_val'
+        # - elements:
+        #     - p2_txt
+        - entity: sensor.p1
+          elements:
+            - cell-wasser_hoch
+            - cell-wasser_runter
+          state_action:
+            - service: floorplan.class_set
+"""
+    assert yaml_element_ids(yaml) == ["p1_txt", "p1_val", "cell-wasser_hoch", "cell-wasser_runter"]
+    assert yaml_element_ids(yaml, commented=True) == ["p1_txt", "p1_val", "p2_txt", "cell-wasser_hoch", "cell-wasser_runter"]
+
+
+def test_missing_elements():
+    svg = ET.fromstring('<svg><g id="cell-p1_txt"><text id="p1_txt"/></g></svg>')
+    assert missing_elements(svg, "- element: p1_txt\n- element: cell-p1_txt\n- element: p1_val\n") == ["p1_val"]
@@ -0,0 +1,54 @@
+"""Tests for generate-dashboard.py - entity ids, value texts and the generated rules"""
+
+import pytest
+
+from floorplan_rules import yaml_element_ids
+
+
+@pytest.fixture(scope="module")
+def sensors(generate_dashboard):
+    return generate_dashboard.load_sensors_config()
+
+
+def names(generate_dashboard, sensors, lang):
+    translations = generate_dashboard.load_translations()
+    return {key: translations.get_sensor_name(key, lang) for key in sensors}
+
+
+def test_entity_ids(generate_dashboard, sensors):
+    assert generate_dashboard.slugify("Rücklauftemperatur") == "rucklauftemperatur"
+    assert generate_dashboard.slugify("Température de départ") == "temperature_de_depart"
+    assert generate_dashboard.entity_id(sensors['solaris_p1'], "Umwälzpumpe", "esp-rotex-solaris-rps3") == \
+        "sensor.esp_rotex_solaris_rps3_umwalzpumpe"
+    assert generate_dashboard.entity_id(sensors['solaris_bk'], "Burner Contact", "Solaris", "Garage") == \
+        "binary_sensor.solaris_garage_burner_contact"
+
+
+def test_value_texts(generate_dashboard, sensors):
+    # Accuracy and unit come from SENSORS_CONFIG
+    assert generate_dashboard.value_text(sensors['solaris_p1'], "de") == "${parseInt(entity.state)}%"
+    assert generate_dashboard.value_text(sensors['solaris_pwr'], "de") == "${parseFloat(entity.state).toFixed(2)} kW"
+    assert generate_dashboard.value_text(sensors['solaris_df'], "de") == "${parseFloat(entity.state).toFixed(1)} l/min"
+    assert generate_dashboard.value_text(sensors['solaris_p2'], "en") == '${entity.state === "on" ? "on" : "off"}'
+
+
+def test_models(generate_dashboard, sensors):
+    rps3 = generate_dashboard.generate_dashboard(sensors, names(generate_dashboard, sensors, "de"))
+    rps4 = generate_dashboard.generate_dashboard(sensors, names(generate_dashboard, sensors, "en"), "en",
+                                                 "rotex-solaris", "Garage", "rps4")
+    # One state rule per value, the labels and classes are set at startup
+    assert rps3.count("- entity:") == 11 and rps4.count("- entity:") == 10
+    assert rps3.count("floorplan.text_set") == 10 + 8
+    assert "binary_sensor.esp_rotex_solaris_rps3_boosterpumpe" in rps3
+    assert "sensor.rotex_solaris_garage_circulation_pump" in rps4 and "booster_pump" not in rps4
+    assert "title: Solaris RPS4 Dashboard" in rps4 and "class: hidden" in rps4
+    # The ids hidden on the RPS4 are referenced by the RPS3 dashboard as well (commented out)
+    assert set(yaml_element_ids(rps3, commented=True)) == set(yaml_element_ids(rps4))
+
+
+def test_shipped_dashboard(generate_dashboard, sensors, dashboard_dir):
+    yaml = pytest.importorskip("yaml")
+    shipped = (dashboard_dir / "solaris-rps-dashboard.yaml").read_text(encoding="utf-8")
+    assert shipped == generate_dashboard.generate_dashboard(sensors, names(generate_dashboard, sensors, "de"))
+    config = yaml.safe_load(shipped)['cards'][0]['config']
+    assert config['rules'][1]['state_action'][0]['service_data']['text'] == '${entity.state === "on" ? "ein" : "aus"}'
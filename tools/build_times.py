@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Build time report for a fleet of ESPHome device configurations.
+
+Compiles every given device YAML one or more times with `esphome compile` and
+reports per build the wall time, whether the component's error codes header
+was regenerated and how many object files were compiled. The second and later
+runs show the incremental rebuild cost, where no component source should be
+recompiled.
+
+Only the Python standard library is used.
+
+Usage:
+    python3 build_times.py solaris-garage.yaml solaris-house.yaml
+    python3 build_times.py --runs 3 --csv build_times.csv esphome/*.yaml
+"""
+
+import argparse
+import csv
+import re
+import shlex
+import subprocess
+import sys
+import time
+from collections import namedtuple
+
+# Logged by __init__.py for the error codes header of the configured language
+HEADER_RE = re.compile(r"(solaris_error_codes_\w+\.h) (generated|unchanged) in ([\d.]+) ms")
+# PlatformIO prints one line per compiled translation unit
+COMPILING_RE = re.compile(r"^Compiling \S+\.o$", re.MULTILINE)
+COMPONENT_OBJECT_RE = re.compile(r"^Compiling \S*daikin_rotex_solaris/\S+\.o$", re.MULTILINE)
+
+Build = namedtuple("Build", [
+    "config", "run", "seconds", "returncode", "header", "header_status", "header_ms",
+    "compiled", "component_compiled",
+])
+
+
+def parse_output(output):
+    """Extract the header status and compile counts from the build output.
+
+    Returns:
+        Tuple of header name, status, generation time (ms), compiled objects
+        and compiled objects of the component (None for missing values)
+    """
+    match = HEADER_RE.search(output)
+    header, status, header_ms = (match.group(1), match.group(2), float(match.group(3))) if match else (None,) * 3
+    return header, status, header_ms, len(COMPILING_RE.findall(output)), len(COMPONENT_OBJECT_RE.findall(output))
+
+
+def build(esphome, config, run):
+    """Compile one configuration and measure it"""
+    start = time.perf_counter()
+    proc = subprocess.run([*esphome, "compile", config], stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, errors="replace", check=False)
+    seconds = time.perf_counter() - start
+    return Build(config, run, seconds, proc.returncode, *parse_output(proc.stdout))
+
+
+def print_report(builds):
+    print(f"{'config':<32} {'run':>3} {'time/s':>8} {'header':<28} {'objects':>7} {'component':>9}")
+    for b in builds:
+        header = f"{b.header} {b.header_status}" if b.header else "-"
+        result = "" if b.returncode == 0 else f"  FAILED ({b.returncode})"
+        print(f"{b.config:<32} {b.run:>3} {b.seconds:>8.1f} {header:<28} {b.compiled:>7} "
+              f"{b.component_compiled:>9}{result}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report ESPHome build times of several device configurations")
+    parser.add_argument("configs", nargs="+", help="Device YAML files")
+    parser.add_argument("--runs", type=int, default=2, help="Builds per configuration (default 2)")
+    parser.add_argument("--esphome", default="esphome", help="ESPHome command (default 'esphome')")
+    parser.add_argument("--csv", help="Also write the results to this CSV file")
+    args = parser.parse_args()
+
+    esphome = shlex.split(args.esphome)
+    builds = [build(esphome, config, run) for config in args.configs for run in range(1, args.runs + 1)]
+    print_report(builds)
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(Build._fields)
+            writer.writerows(builds)
+
+    return 0 if all(b.returncode == 0 for b in builds) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+UDP collector for the DAIKIN/ROTEX Solaris RPS frame push.
+
+Receives the binary datagrams sent by the daikin_rotex_solaris component
+('udp_push' option), decodes them in batches and stores the frames in a
+SQLite database and/or a CSV file. Lost, reordered and duplicate frames are
+detected per device from the sequence numbers and reported periodically.
+
+Only the Python standard library is used.
+
+Usage:
+    python3 solaris_collector.py --listen 0.0.0.0:4210 --sqlite solaris.db
+    python3 solaris_collector.py --listen 127.0.0.1:4210 --csv frames.csv
+"""
+
+import argparse
+import asyncio
+import csv
+import logging
+import signal
+import sqlite3
+import struct
+import time
+from collections import namedtuple
+
+_LOGGER = logging.getLogger("solaris_collector")
+
+# ============================================================================
+# DATAGRAM FORMAT - see solaris_udp.h in the component
+# ============================================================================
+MAGIC = b"SR"
+FORMAT_VERSION = 1
+# magic, version, record count, device id, record size
+HEADER = struct.Struct("<2sBBHH")
+# seq, millis, pwr, tk, tr, ts, tv, df, p1, flags, err, reserved, invalid mask
+RECORD = struct.Struct("<IIihhhhhBBBBH")
+
+FLAG_HA = 0x01
+FLAG_BK = 0x02
+FLAG_P2 = 0x04
+
+# Frames coming later than this many sequence numbers, or with a device time
+# this much (ms) before the newest frame, are treated as a device restart
+# instead of reordering
+REORDER_WINDOW = 1024
+REORDER_MAX_AGE_MS = 60000
+
+Frame = namedtuple("Frame", [
+    "device_id", "seq", "millis", "received",
+    "ha", "bk", "p1", "p2", "tk", "tr", "ts", "tv", "df", "err", "pwr", "invalid_mask",
+])
+FRAME_COLUMNS = Frame._fields
+
+
+def decode_datagram(data, received=None):
+    """Decode one datagram into a list of frames.
+
+    Args:
+        data: Datagram payload
+        received: Reception time (Unix seconds) of the datagram. Frames of a
+            batch (low-power mode) are back-dated by their device time
+            (millis) relative to the last record.
+
+    Returns:
+        List of Frame tuples
+
+    Raises:
+        ValueError: The datagram is not a valid Solaris frame push
+    """
+    if len(data) < HEADER.size:
+        raise ValueError(f"datagram too short ({len(data)} bytes)")
+    magic, version, count, device_id, record_size = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"bad magic {magic!r}")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported format version {version}")
+    # Newer senders may append fields to the record, the known prefix is used
+    if record_size < RECORD.size or len(data) != HEADER.size + count * record_size:
+        raise ValueError(f"size mismatch: {len(data)} bytes for {count} records of {record_size} bytes")
+
+    if received is None:
+        received = time.time()
+    if record_size == RECORD.size:
+        records = list(RECORD.iter_unpack(memoryview(data)[HEADER.size:]))
+    else:
+        records = [RECORD.unpack_from(data, offset) for offset in range(HEADER.size, len(data), record_size)]
+
+    # The device sends a batch right after its last frame
+    newest_millis = records[-1][1] if records else 0
+    frames = []
+    for seq, millis, pwr, tk, tr, ts, tv, df, p1, flags, err, _reserved, invalid_mask in records:
+        frames.append(Frame(
+            device_id, seq, millis, received - ((newest_millis - millis) % 2**32) / 1000,
+            int(bool(flags & FLAG_HA)), int(bool(flags & FLAG_BK)), p1, int(bool(flags & FLAG_P2)),
+            tk, tr, ts, tv, df / 100, chr(err) if err else "", pwr, invalid_mask,
+        ))
+    return frames
+
+
+# ============================================================================
+# SEQUENCE TRACKING - loss, reordering and duplicates per device
+# ============================================================================
+class SequenceTracker:
+    """Tracks the sequence numbers of one device.
+
+    A gap counts as lost until the missing frames arrive late, then they are
+    counted as reordered instead. Frames further back than REORDER_WINDOW or
+    REORDER_MAX_AGE_MS are treated as a device restart.
+    """
+
+    def __init__(self):
+        self.expected = None
+        self.newest_millis = None
+        self.missing = set()
+        self.received = 0
+        self.lost = 0
+        self.reordered = 0
+        self.duplicates = 0
+        self.restarts = 0
+
+    def update(self, seq, millis):
+        """Account one received sequence number with its device time (ms)"""
+        self.received += 1
+        if self.expected is None:
+            self.expected = seq + 1
+            self.newest_millis = millis
+            return
+
+        if seq >= self.expected:
+            gap = seq - self.expected
+            if gap:
+                self.lost += gap
+                # Remember recent gaps only, older ones stay lost
+                self.missing.update(range(max(self.expected, seq - REORDER_WINDOW), seq))
+            self.expected = seq + 1
+            self.newest_millis = millis
+        elif seq in self.missing:
+            self.missing.discard(seq)
+            self.lost -= 1
+            self.reordered += 1
+        elif (self.expected - seq > REORDER_WINDOW or
+              (self.newest_millis - millis) % 2**32 > REORDER_MAX_AGE_MS):
+            # Sequence restarted: the device rebooted
+            self.restarts += 1
+            self.missing.clear()
+            self.expected = seq + 1
+            self.newest_millis = millis
+        else:
+            self.duplicates += 1
+
+        if len(self.missing) > REORDER_WINDOW:
+            self.missing = {s for s in self.missing if self.expected - s <= REORDER_WINDOW}
+
+    def stats(self):
+        """Counters as dict"""
+        return {
+            "received": self.received,
+            "lost": self.lost,
+            "reordered": self.reordered,
+            "duplicates": self.duplicates,
+            "restarts": self.restarts,
+        }
+
+
+# ============================================================================
+# STORAGE - batched writes to SQLite and CSV
+# ============================================================================
+class SqliteSink:
+    """Stores frames in table 'frames' of a SQLite database"""
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS frames ("
+            "device_id INTEGER, seq INTEGER, millis INTEGER, received REAL, "
+            "ha INTEGER, bk INTEGER, p1 INTEGER, p2 INTEGER, "
+            "tk INTEGER, tr INTEGER, ts INTEGER, tv INTEGER, df REAL, err TEXT, pwr INTEGER, "
+            "invalid_mask INTEGER)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS frames_device_time ON frames (device_id, received)")
+        self.insert = f"INSERT INTO frames VALUES ({', '.join('?' * len(FRAME_COLUMNS))})"
+
+    def write(self, frames):
+        with self.conn:
+            self.conn.executemany(self.insert, frames)
+
+    def close(self):
+        self.conn.close()
+
+
+class CsvSink:
+    """Appends frames to a CSV file (header written for new files)"""
+
+    def __init__(self, path):
+        self.file = open(path, "a", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        if self.file.tell() == 0:
+            self.writer.writerow(FRAME_COLUMNS)
+
+    def write(self, frames):
+        self.writer.writerows(frames)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+# ============================================================================
+# COLLECTOR - asyncio datagram endpoint
+# ============================================================================
+class Collector(asyncio.DatagramProtocol):
+    """Receives datagrams, buffers the decoded frames and flushes them in batches.
+
+    Args:
+        sinks: Objects with write(frames) and close()
+        batch_size: Flush as soon as this many frames are buffered
+    """
+
+    def __init__(self, sinks, batch_size=256):
+        self.sinks = sinks
+        self.batch_size = batch_size
+        self.buffer = []
+        self.trackers = {}
+        self.invalid = 0
+        self.stored = 0
+
+    def datagram_received(self, data, addr):
+        try:
+            frames = decode_datagram(data)
+        except ValueError as err:
+            self.invalid += 1
+            _LOGGER.debug("Ignoring datagram from %s: %s", addr[0], err)
+            return
+
+        for frame in frames:
+            self.trackers.setdefault(frame.device_id, SequenceTracker()).update(frame.seq, frame.millis)
+        self.buffer.extend(frames)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered frames to all sinks"""
+        if not self.buffer:
+            return
+        frames, self.buffer = self.buffer, []
+        for sink in self.sinks:
+            sink.write(frames)
+        self.stored += len(frames)
+
+    def stats(self):
+        """Per-device counters keyed by device id"""
+        return {device_id: tracker.stats() for device_id, tracker in sorted(self.trackers.items())}
+
+    def log_stats(self):
+        for device_id, stats in self.stats().items():
+            _LOGGER.info(
+                "device %u: %u received, %u lost, %u reordered, %u duplicates, %u restarts",
+                device_id, stats["received"], stats["lost"], stats["reordered"],
+                stats["duplicates"], stats["restarts"],
+            )
+        if self.invalid:
+            _LOGGER.info("%u invalid datagrams", self.invalid)
+
+    def close(self):
+        self.flush()
+        for sink in self.sinks:
+            sink.close()
+
+
+async def run_collector(host, port, sinks, batch_size=256, flush_interval=1.0,
+                        stats_interval=60.0, stop=None, ready=None):
+    """Receive until stop is set, flushing at least every flush_interval seconds.
+
+    Args:
+        host: Listen address
+        port: UDP port (0 = any free port)
+        sinks: Storage sinks (SqliteSink, CsvSink)
+        batch_size: Frames per batch write
+        flush_interval: Max seconds a frame stays buffered
+        stats_interval: Seconds between statistics log lines (0 = only at the end)
+        stop: asyncio.Event ending the collector (default: SIGINT/SIGTERM)
+        ready: Optional callback receiving the bound (host, port)
+
+    Returns:
+        The Collector with the final statistics
+    """
+    loop = asyncio.get_running_loop()
+    if stop is None:
+        stop = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+
+    collector = Collector(sinks, batch_size)
+    transport, _ = await loop.create_datagram_endpoint(lambda: collector, local_addr=(host, port))
+    bound = transport.get_extra_info("sockname")[:2]
+    _LOGGER.info("Listening on %s:%u", *bound)
+    if ready is not None:
+        ready(bound)
+
+    last_stats = loop.time()
+    try:
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            collector.flush()
+            if stats_interval and loop.time() - last_stats >= stats_interval:
+                last_stats = loop.time()
+                collector.log_stats()
+    finally:
+        transport.close()
+        collector.close()
+        collector.log_stats()
+    return collector
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collect Solaris RPS frames pushed via UDP")
+    parser.add_argument("--listen", default="0.0.0.0:4210", help="HOST:PORT to listen on (default 0.0.0.0:4210)")
+    parser.add_argument("--sqlite", help="SQLite database to store the frames in")
+    parser.add_argument("--csv", help="CSV file to append the frames to")
+    parser.add_argument("--batch", type=int, default=256, help="Frames per batch write (default 256)")
+    parser.add_argument("--flush-interval", type=float, default=1.0, help="Max seconds before a write (default 1)")
+    parser.add_argument("--stats-interval", type=float, default=60.0,
+                        help="Seconds between statistics (default 60, 0 = only at exit)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log ignored datagrams")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format="%(asctime)s %(levelname)s %(message)s")
+
+    host, _, port = args.listen.rpartition(":")
+    sinks = []
+    if args.sqlite:
+        sinks.append(SqliteSink(args.sqlite))
+    if args.csv:
+        sinks.append(CsvSink(args.csv))
+    if not sinks:
+        _LOGGER.warning("No --sqlite or --csv given, frames are only counted")
+
+    asyncio.run(run_collector(host, int(port), sinks, args.batch, args.flush_interval, args.stats_interval))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,601 @@
+#!/usr/bin/env python3
+"""
+Offline decoder for captured DAIKIN/ROTEX Solaris RPS serial logs.
+
+Decodes raw captures of the controller's output (as read by a USB-serial
+adapter, or written by solaris_simulator.py --output) in bulk. The lines of
+each chunk are split, classified and converted with NumPy array operations
+instead of line by line, following the rules of the component's parser
+(solaris_parser.h): line length, boot lines, field count, comma decimals and
+invalid tokens. The file is read in chunks, so memory stays bounded on
+multi-GB captures.
+
+The frames are written as columns to NPZ and/or Parquet, a summary per day
+(solar yield, pump and burner hours, maximum temperatures) is printed and
+optionally written to CSV. Captures carry no timestamps: the time of a frame
+is reconstructed from the frame count and the controller's cycle.
+
+Needs NumPy, the Parquet output additionally pyarrow.
+
+Usage:
+    python3 solaris_decoder.py capture.txt --npz frames.npz --summary daily.csv
+    python3 solaris_decoder.py capture.txt --parquet frames.parquet --start 2026-06-01T06:00
+"""
+
+import argparse
+import csv
+import datetime
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from collections import namedtuple
+
+import numpy as np
+
+# ============================================================================
+# LINE FORMAT - validation rules of solaris_parser.h
+# ============================================================================
+MIN_LINE_LEN = 22
+MAX_LINE_LEN = 48
+MAX_TOKEN_LEN = 15
+TOTAL_FIELDS = 11
+BOOT_LINES = (b"SOLARIS", b"Zyklus", b"HA;BK;P1")
+CYCLE_LINE = b"Zyklus"
+
+FIELDS = ("ha", "bk", "p1", "p2", "tk", "tr", "ts", "tv", "df", "err", "pwr")
+SOLARIS_DF, SOLARIS_ERR, SOLARIS_PWR = 8, 9, 10
+DF_SCALE = 100
+
+INT32_MAX = 2**31 - 1
+# Largest accumulated number that still takes another digit (SolarisParser::accumulate_)
+ACC_LIMIT = (INT32_MAX - 9) // 10
+POW10 = 10 ** np.arange(MAX_TOKEN_LEN + 1, dtype=np.int64)
+
+# Line classes, as SolarisParseResult
+LINE_NONE, LINE_FRAME, LINE_BOOT, LINE_INVALID_LENGTH, LINE_INCOMPLETE = range(5)
+
+NEWLINE, RETURN = ord("\n"), ord("\r")
+SEMICOLON, COMMA, DOT = ord(";"), ord(","), ord(".")
+PLUS, MINUS = ord("+"), ord("-")
+ZERO, FIVE, NINE = ord("0"), ord("5"), ord("9")
+# strtol skips these before a number
+SPACES = b" \t\n\v\f\r"
+
+DEFAULT_CYCLE = 5
+DEFAULT_CHUNK_SIZE = 4 << 20
+
+# Columns of the decoded frames: line number in the capture, reconstructed
+# time since the first frame (s) and the cycle it accounts for (s), the
+# values in protocol units (DF in l/min, ERR as character code, 0 = no error)
+# and the invalid-token mask (bit per field, published as 0)
+COLUMNS = ("line", "elapsed", "cycle") + FIELDS + ("invalid_mask",)
+
+Line = namedtuple("Line", ["kind", "values", "invalid_mask", "cycle"])
+
+
+# ============================================================================
+# REFERENCE PARSER - one line at a time, like SolarisParser
+# ============================================================================
+def _parse_token(token, field):
+    """Value and invalid flag of one token"""
+    if field == SOLARIS_ERR:
+        return (token[0] if token else 0), False
+    if len(token) > MAX_TOKEN_LEN:
+        return 0, True
+
+    pos = 0
+    while pos < len(token) and token[pos] in SPACES:
+        pos += 1
+    negative = False
+    if pos < len(token) and token[pos] in (PLUS, MINUS):
+        negative = token[pos] == MINUS
+        pos += 1
+
+    acc, has_digits, frac_digits, round_up = 0, False, None, False
+    for c in token[pos:]:
+        if ZERO <= c <= NINE:
+            if frac_digits is None or frac_digits < 2:
+                acc = acc * 10 + c - ZERO if acc <= ACC_LIMIT else INT32_MAX
+                has_digits = True
+                if frac_digits is not None:
+                    frac_digits += 1
+            else:
+                if frac_digits == 2 and c >= FIVE:
+                    round_up = True
+                frac_digits = 3
+        elif c in (COMMA, DOT) and field == SOLARIS_DF and frac_digits is None:
+            frac_digits = 0
+        else:
+            break
+
+    if not has_digits:
+        return 0, bool(token)
+    if field == SOLARIS_DF:
+        if acc > INT32_MAX // DF_SCALE:
+            acc = INT32_MAX
+        elif not frac_digits:
+            acc *= 100
+        elif frac_digits == 1:
+            acc *= 10
+        elif round_up:
+            acc += 1
+    return -acc if negative else acc, False
+
+
+def boot_cycle(line):
+    """Cycle (s) of a "Zyklus 5s" boot line as read by the parser, 0 if it has none"""
+    cycle, done = 0, False
+    for c in line[len(CYCLE_LINE):]:
+        if ZERO <= c <= NINE and not done:
+            cycle = cycle * 10 + c - ZERO if cycle < 1000 else cycle
+        elif cycle != 0:
+            done = True
+    return cycle
+
+
+def parse_line(line):
+    """Decode one line (without the newline) with the rules of SolarisParser.
+
+    Reference for the vectorized decoder, and handy for single lines.
+
+    Returns:
+        Line tuple: kind (LINE_*), the TOTAL_FIELDS values (None unless a
+        frame), the invalid-token mask and the cycle of a "Zyklus" line
+    """
+    line = line.replace(b"\r", b"")
+    if not line:
+        return Line(LINE_NONE, None, 0, 0)
+
+    if len(line) < MIN_LINE_LEN or len(line) > MAX_LINE_LEN:
+        if any(line.startswith(prefix) for prefix in BOOT_LINES):
+            return Line(LINE_BOOT, None, 0, boot_cycle(line) if line.startswith(CYCLE_LINE) else 0)
+        return Line(LINE_INVALID_LENGTH, None, 0, 0)
+
+    # Fields after the 11th are ignored
+    tokens = line.split(b";")[:TOTAL_FIELDS]
+    if len(tokens) != TOTAL_FIELDS:
+        return Line(LINE_INCOMPLETE, None, 0, 0)
+    values, invalid_mask = [], 0
+    for field, token in enumerate(tokens):
+        value, invalid = _parse_token(token, field)
+        values.append(value)
+        invalid_mask |= invalid << field
+    return Line(LINE_FRAME, values, invalid_mask, 0)
+
+
+# ============================================================================
+# VECTORIZED DECODER - all lines of a chunk at once
+# ============================================================================
+def decode_numbers(block, starts, lengths, is_df):
+    """Values of number tokens, the scanner of the parser applied to all tokens at once.
+
+    The characters of the tokens are gathered into one flat array, every
+    count the parser keeps per token is a cumulative sum over that array
+    taken at the token boundaries.
+
+    Args:
+        block: uint8 array the tokens are taken from
+        starts: Position of each token in block
+        lengths: Length of each token
+        is_df: True for the tokens of the DF field (decimal separator allowed)
+
+    Returns:
+        (values, invalid): value of each token in protocol units (DF in
+        1/DF_SCALE l/min), invalid-token flags
+    """
+    # Tokens longer than MAX_TOKEN_LEN are invalid, their first characters suffice
+    kept = np.minimum(lengths, MAX_TOKEN_LEN + 1)
+    offsets = np.zeros(kept.size + 1, np.int64)
+    np.cumsum(kept, out=offsets[1:])
+    token = np.repeat(np.arange(kept.size), kept)
+    chars = block[(starts - offsets[:-1])[token] + np.arange(offsets[-1])]
+    df = is_df[token]
+
+    def counts(mask, dtype=np.int32):
+        """Running count of mask within each token and the total per token"""
+        count = np.zeros(mask.size + 1, dtype)
+        np.cumsum(mask, dtype=dtype, out=count[1:])
+        before = count[offsets[:-1]]
+        return count[1:] - before[token], count[offsets[1:]] - before
+
+    # Blanks, one sign, digits up to the first other character - for DF
+    # one decimal separator, then the decimals
+    space = (chars == ord(" ")) | ((chars >= ord("\t")) & (chars <= ord("\f")))
+    digit = (chars >= ZERO) & (chars <= NINE)
+    printed, _ = counts(~space)
+    sign = ~space & (printed == 1) & ((chars == PLUS) | (chars == MINUS))
+    body = (printed > 0) & ~sign
+    stops, _ = counts(body & ~digit)
+    _, decimal = counts(body & ~digit & df & (stops == 1) & ((chars == COMMA) | (chars == DOT)))
+    frac = body & digit & (stops == 1) & (decimal > 0)[token]
+    frac_rank, frac_digits = counts(frac)
+    accumulated = (body & digit & (stops == 0)) | (frac & (frac_rank <= 2))
+    _, round_up = counts(frac & (frac_rank == 3) & (chars >= FIVE))
+    _, negative = counts(sign & (chars == MINUS))
+
+    # Numbers from the digit weights. accumulate_() saturates once the
+    # number without its last digit exceeds ACC_LIMIT.
+    rank, digits = counts(accumulated)
+    power = np.minimum(digits[token] - rank, MAX_TOKEN_LEN)
+    _, acc = counts(np.where(accumulated, (chars - ZERO) * POW10[power], 0), np.int64)
+    acc = np.where(acc // 10 > ACC_LIMIT, INT32_MAX, acc)
+
+    # DF in 1/DF_SCALE l/min depending on the decimals received
+    frac_digits = np.minimum(frac_digits, 3)
+    scale = np.where(frac_digits == 0, 100, np.where(frac_digits == 1, 10, 1))
+    scaled = np.where(acc > INT32_MAX // DF_SCALE, INT32_MAX, acc * scale + ((round_up > 0) & (frac_digits >= 2)))
+    acc = np.where(is_df, scaled, acc)
+
+    too_long = lengths > MAX_TOKEN_LEN
+    values = np.where((digits > 0) & ~too_long, np.where(negative > 0, -acc, acc), 0)
+    return values, too_long | ((digits == 0) & (lengths > 0))
+
+
+def _empty_columns():
+    dtypes = {"line": np.int64, "elapsed": np.float64, "cycle": np.uint16, "df": np.float64,
+              "err": np.uint8, "invalid_mask": np.uint16}
+    return {name: np.empty(0, dtypes.get(name, np.int32)) for name in COLUMNS}
+
+
+class LogDecoder:
+    """Decodes a captured log chunk by chunk.
+
+    Lines split between two chunks are completed by the next one, a last line
+    without newline is dropped (the parser never completes it). Only the
+    first MAX_LINE_LEN + 1 bytes of an unfinished line are kept: it is too
+    long for a frame anyway.
+
+    Args:
+        cycle: Seconds per frame until a "Zyklus" boot line gives the
+            controller's cycle
+    """
+
+    def __init__(self, cycle=DEFAULT_CYCLE):
+        self.cycle = cycle
+        self.lines = 0
+        self.elapsed = 0.0
+        self.frames = 0
+        self.boot_lines = 0
+        self.invalid_length = 0
+        self.incomplete = 0
+        self.invalid_tokens = 0
+        self._tail = np.empty(0, np.uint8)
+
+    def feed(self, data):
+        """Decode the lines completed by data.
+
+        Returns:
+            Dict of COLUMNS arrays with one entry per frame
+        """
+        buf = np.frombuffer(data, np.uint8)
+        buf = buf[buf != RETURN]  # CR is never part of a line
+        if self._tail.size:
+            buf = np.concatenate((self._tail, buf))
+        ends = np.flatnonzero(buf == NEWLINE)
+        if ends.size == 0:
+            self._tail = buf[:MAX_LINE_LEN + 1].copy()
+            return _empty_columns()
+        self._tail = buf[ends[-1] + 1:][:MAX_LINE_LEN + 1].copy()
+
+        block = buf[:ends[-1] + 1]
+        starts = np.concatenate(([0], ends[:-1] + 1))
+        lengths = ends - starts
+        numbers = self.lines + 1 + np.arange(ends.size)
+        self.lines += ends.size
+
+        # ====================================================================
+        # CLASSIFY - length first, then boot lines, then field count
+        # ====================================================================
+        delimiters = np.flatnonzero((block == SEMICOLON) | (block == NEWLINE))
+        line_end = block[delimiters] == NEWLINE
+        last_tokens = np.flatnonzero(line_end)
+        fields = np.diff(last_tokens, prepend=-1)
+        empty = lengths == 0  # CRLF only, not counted by the parser
+        in_range = (lengths >= MIN_LINE_LEN) & (lengths <= MAX_LINE_LEN)
+        frame = in_range & (fields >= TOTAL_FIELDS)
+        prefixes = {}
+        candidates = np.flatnonzero(~in_range & ~empty)
+        padded = np.concatenate((block, np.zeros(len(BOOT_LINES[2]), np.uint8)))
+        head = padded[starts[candidates, None] + np.arange(len(BOOT_LINES[2]))]
+        for prefix in BOOT_LINES:
+            pattern = np.frombuffer(prefix, np.uint8)
+            prefixes[prefix] = candidates[(lengths[candidates] >= pattern.size) &
+                                          (head[:, :pattern.size] == pattern).all(axis=1)]
+        boot = np.unique(np.concatenate(list(prefixes.values())))
+
+        self.frames += int(np.count_nonzero(frame))
+        self.boot_lines += boot.size
+        self.invalid_length += candidates.size - boot.size
+        self.incomplete += int(np.count_nonzero(in_range)) - int(np.count_nonzero(frame))
+
+        # Frame times: the cycle of the last "Zyklus" line before the frame
+        cycles = np.zeros(lengths.size, np.int64)
+        for i in prefixes[CYCLE_LINE]:
+            cycles[i] = boot_cycle(block[starts[i]:ends[i]].tobytes())
+        last = np.maximum.accumulate(np.where(cycles > 0, np.arange(cycles.size), -1))
+        effective = np.where(last >= 0, cycles[np.maximum(last, 0)], self.cycle)[frame]
+        if last[-1] >= 0:
+            self.cycle = int(cycles[last[-1]])
+
+        # ====================================================================
+        # TOKENS - the first TOTAL_FIELDS of each frame, later ones are ignored
+        # ====================================================================
+        line = np.cumsum(line_end) - line_end
+        field = np.arange(delimiters.size) - np.concatenate(([0], last_tokens[:-1] + 1))[line]
+        select = frame[line] & (field < TOTAL_FIELDS)
+        token_starts = np.concatenate(([0], delimiters[:-1] + 1))[select].reshape(-1, TOTAL_FIELDS)
+        token_lengths = delimiters[select].reshape(-1, TOTAL_FIELDS) - token_starts
+
+        values = np.zeros(token_starts.shape, np.int64)
+        invalid = np.zeros(token_starts.shape, bool)
+        numeric = np.arange(TOTAL_FIELDS) != SOLARIS_ERR
+        values[:, numeric], invalid[:, numeric] = (result.reshape(-1, TOTAL_FIELDS - 1) for result in decode_numbers(
+            block, token_starts[:, numeric].ravel(), token_lengths[:, numeric].ravel(),
+            np.tile(np.arange(TOTAL_FIELDS)[numeric] == SOLARIS_DF, token_starts.shape[0])))
+        # Error code: first character of its token, 0 = no error
+        err_len = token_lengths[:, SOLARIS_ERR]
+        values[:, SOLARIS_ERR] = np.where(err_len > 0, block[token_starts[:, SOLARIS_ERR]], 0)
+        bits = np.left_shift(1, np.arange(TOTAL_FIELDS, dtype=np.uint16))
+        invalid_mask = (invalid * bits).sum(axis=1, dtype=np.uint16)
+        self.invalid_tokens += int(np.count_nonzero(invalid_mask))
+
+        columns = {
+            "line": numbers[frame],
+            "elapsed": self.elapsed + np.cumsum(effective, dtype=np.float64) - effective,
+            "cycle": effective.astype(np.uint16),
+        }
+        self.elapsed += float(effective.sum())
+        for index, name in enumerate(FIELDS):
+            columns[name] = values[:, index].astype(np.int32)
+        columns["df"] = values[:, SOLARIS_DF] / DF_SCALE
+        columns["err"] = values[:, SOLARIS_ERR].astype(np.uint8)
+        columns["invalid_mask"] = invalid_mask
+        return columns
+
+    def stats(self):
+        """Line counters as dict"""
+        return {
+            "lines": self.lines,
+            "frames": self.frames,
+            "boot_lines": self.boot_lines,
+            "invalid_length": self.invalid_length,
+            "incomplete": self.incomplete,
+            "invalid_tokens": self.invalid_tokens,
+        }
+
+
+def decode_file(file, decoder, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield the frame columns of a binary file object chunk by chunk"""
+    while True:
+        data = file.read(chunk_size)
+        if not data:
+            return
+        yield decoder.feed(data)
+
+
+def decode_bytes(data, cycle=DEFAULT_CYCLE):
+    """Frame columns of a whole capture held in memory"""
+    return LogDecoder(cycle).feed(data)
+
+
+# ============================================================================
+# DAILY SUMMARY - per minute of the capture, per day once the start is known
+# ============================================================================
+SUMMARY_COLUMNS = ("date", "frames", "hours", "yield_kwh", "peak_kw", "pump_hours", "burner_hours",
+                   "tk_max", "ts_max", "error_frames")
+# Per-minute totals and maximums
+_TOTALS = ("frames", "seconds", "energy_wh", "pump_s", "burner_s", "error_frames")
+_PEAKS = ("peak_w", "tk_max", "ts_max")
+
+
+def _reduce(parts):
+    """Merge per-minute parts (sorted by minute) into one row per minute"""
+    merged = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+    index = np.flatnonzero(np.diff(merged["minute"], prepend=-1))
+    result = {"minute": merged["minute"][index]}
+    for name in _TOTALS:
+        result[name] = np.add.reduceat(merged[name], index)
+    for name in _PEAKS:
+        result[name] = np.maximum.reduceat(merged[name], index)
+    return result
+
+
+class DailySummary:
+    """Solar yield and run times per day of the decoded frames.
+
+    The frames are accumulated per minute of the capture while decoding, the
+    minutes are assigned to days once the start time is known (a minute
+    around midnight counts for the day it starts in).
+    """
+
+    def __init__(self):
+        self._parts = []
+
+    def add(self, columns):
+        """Account the frames of one decoded chunk"""
+        if columns["elapsed"].size == 0:
+            return
+        seconds = columns["cycle"].astype(np.float64)
+        pwr = columns["pwr"].astype(np.float64)
+        minute = (columns["elapsed"] // 60).astype(np.int64)
+        self._parts.append(_reduce([{
+            "minute": minute,
+            "frames": np.ones(minute.size, np.int64),
+            "seconds": seconds,
+            "energy_wh": pwr * seconds / 3600,
+            "pump_s": seconds * (columns["p1"] > 0),
+            "burner_s": seconds * (columns["bk"] != 0),
+            "error_frames": (columns["err"] != 0).astype(np.int64),
+            "peak_w": pwr,
+            "tk_max": columns["tk"],
+            "ts_max": columns["ts"],
+        }]))
+        if len(self._parts) >= 64:
+            self._parts = [_reduce(self._parts)]
+
+    def days(self, start, utc=False):
+        """One dict of SUMMARY_COLUMNS per day.
+
+        Args:
+            start: Unix time of the first frame
+            utc: Days in UTC instead of the local time zone
+        """
+        if not self._parts:
+            return []
+        minutes = _reduce(self._parts)
+        times = start + minutes["minute"] * 60.0
+        if utc:
+            offsets = 0
+        else:
+            hours, inverse = np.unique(times // 3600, return_inverse=True)
+            offsets = np.array([time.localtime(hour * 3600).tm_gmtoff for hour in hours])[inverse]
+        day = ((times + offsets) // 86400).astype(np.int64)
+        days, index = np.unique(day, return_index=True)
+
+        totals = {name: np.add.reduceat(minutes[name], index) for name in _TOTALS}
+        peaks = {name: np.maximum.reduceat(minutes[name], index) for name in _PEAKS}
+        epoch = datetime.date(1970, 1, 1)
+        return [{
+            "date": (epoch + datetime.timedelta(days=int(days[i]))).isoformat(),
+            "frames": int(totals["frames"][i]),
+            "hours": round(totals["seconds"][i] / 3600, 2),
+            "yield_kwh": round(totals["energy_wh"][i] / 1000, 3),
+            "peak_kw": round(peaks["peak_w"][i] / 1000, 2),
+            "pump_hours": round(totals["pump_s"][i] / 3600, 2),
+            "burner_hours": round(totals["burner_s"][i] / 3600, 2),
+            "tk_max": int(peaks["tk_max"][i]),
+            "ts_max": int(peaks["ts_max"][i]),
+            "error_frames": int(totals["error_frames"][i]),
+        } for i in range(days.size)]
+
+
+# ============================================================================
+# OUTPUT - columnar files written chunk by chunk
+# ============================================================================
+class NpzWriter:
+    """Writes the columns to an NPZ archive (numpy.load).
+
+    Each column is appended to a temporary file and copied into the archive
+    at the end, so the frames never have to fit in memory.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.tmp = tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(path)))
+        self.files = {}
+        self.dtypes = {}
+        self.rows = 0
+
+    def write(self, columns):
+        for name, column in columns.items():
+            if name not in self.files:
+                self.files[name] = open(os.path.join(self.tmp.name, name), "wb")
+                self.dtypes[name] = column.dtype
+            self.files[name].write(np.ascontiguousarray(column, self.dtypes[name]).tobytes())
+        self.rows += len(columns["line"])
+
+    def close(self):
+        with zipfile.ZipFile(self.path, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as archive:
+            for name, file in self.files.items():
+                file.close()
+                header = {"descr": np.lib.format.dtype_to_descr(self.dtypes[name]),
+                          "fortran_order": False, "shape": (self.rows,)}
+                with archive.open(f"{name}.npy", "w", force_zip64=True) as member, open(file.name, "rb") as data:
+                    np.lib.format.write_array_header_1_0(member, header)
+                    shutil.copyfileobj(data, member, 1 << 20)
+        self.tmp.cleanup()
+
+
+class ParquetWriter:
+    """Writes the columns to a Parquet file, one row group per chunk (needs pyarrow)"""
+
+    def __init__(self, path):
+        import pyarrow  # pylint: disable=import-outside-toplevel
+        import pyarrow.parquet  # pylint: disable=import-outside-toplevel
+        self.pyarrow = pyarrow
+        self.path = path
+        self.writer = None
+
+    def write(self, columns):
+        table = self.pyarrow.table(columns)
+        if self.writer is None:
+            self.writer = self.pyarrow.parquet.ParquetWriter(self.path, table.schema)
+        elif table.num_rows == 0:
+            return
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def write_summary(path, days):
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, SUMMARY_COLUMNS)
+        writer.writeheader()
+        writer.writerows(days)
+
+
+def print_summary(days):
+    print(" ".join(f"{name:>12}" for name in SUMMARY_COLUMNS))
+    for day in days:
+        print(" ".join(f"{day[name]:>12}" for name in SUMMARY_COLUMNS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decode captured Solaris RPS logs in bulk")
+    parser.add_argument("log", help="Captured log ('-' for stdin)")
+    parser.add_argument("--npz", help="Write the frames to this NPZ archive")
+    parser.add_argument("--parquet", help="Write the frames to this Parquet file (needs pyarrow)")
+    parser.add_argument("--summary", help="Write the daily summary to this CSV file")
+    parser.add_argument("--start", type=datetime.datetime.fromisoformat,
+                        help="Local time of the first frame, e.g. 2026-06-01T06:00 "
+                             "(default: the capture ended at the log's modification time)")
+    parser.add_argument("--utc", action="store_true", help="Summary days in UTC instead of local time")
+    parser.add_argument("--cycle", type=int, default=DEFAULT_CYCLE,
+                        help=f"Seconds per frame until a 'Zyklus' line (default {DEFAULT_CYCLE})")
+    parser.add_argument("--chunk-size", type=float, default=DEFAULT_CHUNK_SIZE / (1 << 20),
+                        help=f"MiB read per chunk (default {DEFAULT_CHUNK_SIZE >> 20})")
+    args = parser.parse_args()
+
+    writers = []
+    if args.npz:
+        writers.append(NpzWriter(args.npz))
+    if args.parquet:
+        try:
+            writers.append(ParquetWriter(args.parquet))
+        except ImportError:
+            parser.error("--parquet needs pyarrow (pip install pyarrow)")
+
+    decoder = LogDecoder(args.cycle)
+    summary = DailySummary()
+    started = time.monotonic()
+    with (open(args.log, "rb") if args.log != "-" else sys.stdin.buffer) as file:
+        for columns in decode_file(file, decoder, max(1, int(args.chunk_size * (1 << 20)))):
+            summary.add(columns)
+            for writer in writers:
+                writer.write(columns)
+    for writer in writers:
+        writer.close()
+    seconds = time.monotonic() - started
+
+    if args.start is not None:
+        start = args.start.timestamp()
+    else:
+        start = (os.path.getmtime(args.log) if args.log != "-" else time.time()) - decoder.elapsed
+    days = summary.days(start, args.utc)
+    if args.summary:
+        write_summary(args.summary, days)
+
+    stats = decoder.stats()
+    print(", ".join(f"{value} {name.replace('_', ' ')}" for name, value in stats.items()) +
+          f" in {seconds:.1f} s ({stats['lines'] / seconds if seconds else 0:.0f} lines/s)")
+    print_summary(days)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Serial stream simulator for the DAIKIN/ROTEX Solaris RPS controller.
+
+Writes realistic Solaris RPS output to a Linux pseudo-terminal (or a file):
+the boot lines (SOLARIS, Zyklus, HA;BK;P1 header) followed by one frame per
+cycle in the Ha;BK;P1;P2;TK;TR;TS;TV;DF;Err;PWR format, latin-1 encoded with
+CRLF line endings like the controller. The frames follow a simple model of a
+solar day: collector temperature from the sun's course and passing clouds,
+pump control by temperature difference, storage heating and hot water draw,
+burner reheating and the power from flow rate and temperature spread.
+
+Error codes, line noise, truncated lines and line timeouts can be injected,
+captured logs can be replayed instead of the model. The simulated clock
+advances one cycle per frame, --rate sets how much faster than real time the
+frames are written (0 = as fast as the reader consumes them), so the parser
+and everything behind it can be load tested far above one frame per cycle.
+
+Only the Python standard library is used.
+
+Usage:
+    python3 solaris_simulator.py --link /tmp/solaris --rate 60
+    python3 solaris_simulator.py --rate 0 --frames 100000 --noise 0.01 --output frames.txt
+    python3 solaris_simulator.py --replay capture.txt --rate 100
+"""
+
+import argparse
+import logging
+import math
+import os
+import random
+import sys
+import time
+import tty
+from collections import namedtuple
+
+_LOGGER = logging.getLogger("solaris_simulator")
+
+# ============================================================================
+# LINE FORMAT - as sent by the controller (see README, Serial data structure)
+# ============================================================================
+ENCODING = "latin-1"
+EOL = b"\r\n"
+BOOT_LINES = (
+    "SOLARIS RPS3 V2.1",
+    "Zyklus {cycle:g}s",
+    "HA;BK;P1 /%;P2;TK /°C;TR /°C;TS /°C;TV /°C;V /l/min;ERROR;P/W",
+)
+ERROR_CODES = "KRSDVGFW"
+# The component discards a partial line after half a cycle of silence, this covers cycles up to 10 s
+LINE_TIMEOUT_S = 5
+
+Frame = namedtuple("Frame", ["ha", "bk", "p1", "p2", "tk", "tr", "ts", "tv", "df", "err", "pwr"])
+
+# ============================================================================
+# SOLAR DAY MODEL
+# ============================================================================
+WATER_HEAT_CAPACITY = 4186       # J/(kg*K), 1 l = 1 kg
+STORAGE_LITERS = 500
+SUNRISE_H, SUNSET_H = 6.0, 20.0
+PUMP_ON_DELTA, PUMP_OFF_DELTA = 8, 3    # Collector above storage (K) to start/stop the pump
+MAX_FLOW = 7.5                          # l/min at 100 % pump rate
+STORAGE_MAX = 85                        # Pump stays off above this storage temperature
+BURNER_ON, BURNER_OFF = 45, 55          # Burner reheats the storage between these
+
+
+def format_frame(frame):
+    """Format a frame like the controller (comma decimal flow rate, empty error code)"""
+    df = f"{frame.df:.1f}".replace(".", ",")
+    return (f"{frame.ha};{frame.bk};{frame.p1};{frame.p2};{frame.tk};{frame.tr};{frame.ts};"
+            f"{frame.tv};{df};{frame.err};{frame.pwr}")
+
+
+class SolarDay:
+    """First-order model of collector, storage and pump over the day.
+
+    Args:
+        cycle: Seconds between two frames
+        start_hour: Simulated time of day of the first frame
+        rng: random.Random for clouds and measurement noise
+    """
+
+    def __init__(self, cycle, start_hour, rng):
+        self.cycle = cycle
+        self.rng = rng
+        self.seconds = start_hour * 3600.0
+        self.clouds = 1.0                   # Share of the sun getting through
+        self.tk = self.tv = self._ambient()
+        self.ts = 50.0
+        self.tr = 35.0
+        self.pump = False
+        self.burner = False
+
+    def _hour(self):
+        return (self.seconds / 3600.0) % 24
+
+    def _ambient(self):
+        return 12 + 8 * math.sin(math.pi * (self._hour() - 9) / 12)
+
+    def _irradiance(self):
+        """0..1, sine between sunrise and sunset"""
+        hour = self._hour()
+        if not SUNRISE_H < hour < SUNSET_H:
+            return 0.0
+        return math.sin(math.pi * (hour - SUNRISE_H) / (SUNSET_H - SUNRISE_H))
+
+    @staticmethod
+    def _lag(value, target, tau, dt):
+        """Move value towards target with time constant tau (s)"""
+        return target + (value - target) * math.exp(-dt / tau)
+
+    def step(self):
+        """Advance one cycle and return the frame (without error code)"""
+        dt = self.cycle
+        self.seconds += dt
+        self.clouds = min(1.0, max(0.3, self.clouds + self.rng.gauss(0, 0.02)))
+        sun = self._irradiance() * self.clouds
+        ambient = self._ambient()
+
+        # Pump control by the collector to storage difference
+        delta = self.tk - self.ts
+        if self.pump and (delta < PUMP_OFF_DELTA or self.ts > STORAGE_MAX):
+            self.pump = False
+        elif not self.pump and delta > PUMP_ON_DELTA and self.ts < STORAGE_MAX:
+            self.pump = True
+        p1 = min(100, max(30, round(30 + (delta - PUMP_ON_DELTA) * 5))) if self.pump else 0
+        df = round(MAX_FLOW * p1 / 100 + self.rng.gauss(0, 0.1), 1) if self.pump else 0.0
+
+        # Collector heats up in the sun, the flowing water cools it down
+        if self.pump:
+            self.tk = self._lag(self.tk, self.ts + 8 + 20 * sun, 300, dt)
+            self.tv = self._lag(self.tv, self.tk - 12, 60, dt)
+            self.tr = self._lag(self.tr, self.ts - 8, 60, dt)
+        else:
+            self.tk = self._lag(self.tk, ambient + 90 * sun, 900, dt)
+            self.tv = self._lag(self.tv, ambient + 20, 1800, dt)
+            self.tr = self._lag(self.tr, 35, 1800, dt)
+        pwr = round(df / 60 * WATER_HEAT_CAPACITY * (self.tv - self.tr)) if self.pump and self.tv > self.tr else 0
+
+        # Storage: solar yield and burner in, standing losses and evening hot water draw out
+        if self.ts < BURNER_ON:
+            self.burner = True
+        elif self.ts > BURNER_OFF:
+            self.burner = False
+        heat = pwr + (15000 if self.burner else 0)
+        loss = (self.ts - 20) * 3 + (4000 if 18 <= self._hour() < 21 else 0)
+        self.ts += (heat - loss) * dt / (STORAGE_LITERS * WATER_HEAT_CAPACITY)
+
+        return Frame(0, int(self.burner), p1, 0, round(self.tk), round(self.tr), round(self.ts),
+                     round(self.tv), max(0.0, df), "", max(0, pwr))
+
+
+class ErrorInjector:
+    """Starts a random error code with the given probability per frame and
+    keeps it for duration seconds (simulated time)"""
+
+    def __init__(self, rate, codes, duration, cycle, rng):
+        self.rate = rate
+        self.codes = codes
+        self.frames = max(1, round(duration / cycle))
+        self.rng = rng
+        self.code = ""
+        self.left = 0
+
+    def apply(self, frame):
+        if self.left == 0 and self.rate > 0 and self.rng.random() < self.rate:
+            self.code = self.rng.choice(self.codes)
+            self.left = self.frames
+        if self.left == 0:
+            return frame
+        self.left -= 1
+        return frame._replace(err=self.code)
+
+
+# ============================================================================
+# LINE SOURCES
+# ============================================================================
+def model_lines(args, rng):
+    """Boot lines, then the frames of the solar day model (endless)"""
+    for line in BOOT_LINES:
+        yield line.format(cycle=args.cycle).encode(ENCODING)
+    model = SolarDay(args.cycle, args.start_hour, rng)
+    errors = ErrorInjector(args.error_rate, args.error_codes, args.error_duration, args.cycle, rng)
+    while True:
+        yield format_frame(errors.apply(model.step())).encode(ENCODING)
+
+
+def replay_lines(path, repeat):
+    """Lines of a captured log (bytes as captured, line endings stripped)"""
+    with open(path, "rb") as f:
+        lines = [line.rstrip(b"\r\n") for line in f if line.strip()]
+    for _ in range(repeat):
+        yield from lines
+
+
+# ============================================================================
+# FAULTS - Applied to the encoded lines of either source
+# ============================================================================
+Chunk = namedtuple("Chunk", ["data", "stall"])   # Bytes to write, seconds to stay silent afterwards
+
+
+def inject_faults(lines, args, rng):
+    """Corrupt, truncate or stall lines with the configured probabilities"""
+    for line in lines:
+        if args.noise > 0 and line and rng.random() < args.noise:
+            pos = rng.randrange(len(line))
+            line = line[:pos] + bytes([rng.randrange(256)]) + line[pos + 1:]
+        if args.truncate > 0 and rng.random() < args.truncate:
+            line = line[:rng.randrange(len(line) + 1)]
+        if args.timeout > 0 and rng.random() < args.timeout:
+            # Partial line without terminator, the receiver has to time it out
+            yield Chunk(line[:rng.randrange(1, max(2, len(line)))], args.timeout_pause)
+            continue
+        yield Chunk(line + EOL, 0)
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+def open_pty(link=None):
+    """Open a raw pseudo-terminal, optionally symlinked to a fixed path.
+
+    Returns:
+        Tuple of the master fd (written by the simulator), the slave fd (kept
+        open so the terminal survives reconnecting readers) and its path
+    """
+    master, slave = os.openpty()
+    tty.setraw(slave)
+    path = os.ttyname(slave)
+    if link:
+        if os.path.islink(link):
+            os.unlink(link)
+        os.symlink(path, link)
+        path = link
+    return master, slave, path
+
+
+def write_stream(fd, chunks, interval, frames=0):
+    """Write the chunks paced by interval seconds per line (0 = unpaced).
+
+    Returns:
+        Number of lines written
+    """
+    count = 0
+    start = time.monotonic()
+    for chunk in chunks:
+        if frames and count >= frames:
+            break
+        data = memoryview(chunk.data)
+        while data:
+            data = data[os.write(fd, data):]
+        count += 1
+        if chunk.stall:
+            time.sleep(chunk.stall)
+            start += chunk.stall
+        if interval > 0:
+            delay = start + count * interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate the serial output of a Solaris RPS controller")
+    parser.add_argument("--cycle", type=float, default=5, help="Seconds between frames, as 'Zyklus' (default 5)")
+    parser.add_argument("--rate", type=float, default=1,
+                        help="Speed-up over real time, 0 = as fast as possible (default 1)")
+    parser.add_argument("--frames", type=int, default=0, help="Stop after this many lines (default endless)")
+    parser.add_argument("--start-hour", type=float, default=8, help="Simulated time of day at start (default 8)")
+    parser.add_argument("--seed", type=int, help="Random seed for a reproducible stream")
+    parser.add_argument("--error-rate", type=float, default=0, help="Probability per frame to raise an error")
+    parser.add_argument("--error-codes", default=ERROR_CODES, help=f"Codes to raise (default {ERROR_CODES})")
+    parser.add_argument("--error-duration", type=float, default=300,
+                        help="Simulated seconds an error lasts (default 300)")
+    parser.add_argument("--noise", type=float, default=0, help="Probability per line of one corrupted byte")
+    parser.add_argument("--truncate", type=float, default=0, help="Probability per line to cut it short")
+    parser.add_argument("--timeout", type=float, default=0,
+                        help="Probability per line to stop mid-line and stay silent")
+    parser.add_argument("--timeout-pause", type=float, default=LINE_TIMEOUT_S + 1,
+                        help=f"Real seconds of silence after a stopped line (default {LINE_TIMEOUT_S + 1})")
+    parser.add_argument("--replay", help="Replay this captured log instead of the model")
+    parser.add_argument("--repeat", type=int, default=1, help="Replay the capture this many times (default 1)")
+    parser.add_argument("--output", help="Write to this file ('-' for stdout) instead of a pty")
+    parser.add_argument("--link", help="Symlink to the pty slave, e.g. /tmp/solaris")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    rng = random.Random(args.seed)
+    lines = replay_lines(args.replay, args.repeat) if args.replay else model_lines(args, rng)
+    chunks = inject_faults(lines, args, rng)
+    interval = args.cycle / args.rate if args.rate > 0 else 0
+
+    slave = None
+    if args.output == "-":
+        fd = sys.stdout.fileno()
+    elif args.output:
+        fd = os.open(args.output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    else:
+        fd, slave, path = open_pty(args.link)
+        _LOGGER.info("Serial stream on %s (%.1f lines/s)", path, 1 / interval if interval else math.inf)
+
+    start = time.monotonic()
+    count = 0
+    try:
+        count = write_stream(fd, chunks, interval, args.frames)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        elapsed = time.monotonic() - start
+        _LOGGER.info("%u lines in %.1f s (%.0f lines/s)", count, elapsed, count / elapsed if elapsed else 0)
+        if slave is not None:
+            os.close(slave)
+            if args.link and os.path.islink(args.link):
+                os.unlink(args.link)
+        if fd != sys.stdout.fileno():
+            os.close(fd)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+"""Tests for build_times.py - output parsing and the report with a stand-in esphome command"""
+
+import sys
+
+import build_times as bt
+
+OUTPUT = """INFO Reading configuration solaris.yaml...
+INFO solaris_error_codes_en.h unchanged in 0.4 ms
+INFO Compiling app...
+Compiling .pioenvs/solaris/src/esphome/components/daikin_rotex_solaris/solaris_parser.cpp.o
+Compiling .pioenvs/solaris/src/main.cpp.o
+Linking .pioenvs/solaris/firmware.elf
+"""
+
+
+def test_parse_output():
+    assert bt.parse_output(OUTPUT) == ("solaris_error_codes_en.h", "unchanged", 0.4, 2, 1)
+    assert bt.parse_output("INFO Nothing to do\n") == (None, None, None, 0, 0)
+
+
+def test_report_with_fake_esphome(tmp_path, capsys, monkeypatch):
+    fake = tmp_path / "fake_esphome.py"
+    fake.write_text(
+        "import sys\n"
+        "assert sys.argv[1] == 'compile'\n"
+        f"print({OUTPUT!r})\n"
+        "sys.exit(0 if sys.argv[2].endswith('ok.yaml') else 2)\n"
+    )
+    csv_path = tmp_path / "times.csv"
+    monkeypatch.setattr(sys, "argv", ["build_times.py", "--esphome", f"{sys.executable} {fake}",
+                                      "--csv", str(csv_path), "ok.yaml", "broken.yaml"])
+    assert bt.main() == 1
+
+    out = capsys.readouterr().out
+    assert out.count("ok.yaml") == 2
+    assert "FAILED (2)" in out
+    assert len(csv_path.read_text().splitlines()) == 5
@@ -0,0 +1,151 @@
+"""Tests for solaris_collector.py - decoding, sequence tracking and a localhost round trip"""
+
+import asyncio
+import csv
+import socket
+import sqlite3
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import solaris_collector as sc
+
+HOST_HARNESS = Path(__file__).resolve().parents[2] / "esphome" / "tests" / "host"
+
+
+def encode(device_id, records):
+    """Build a datagram like SolarisUdpPush does. records: (seq, millis, values dict)"""
+    data = sc.HEADER.pack(sc.MAGIC, sc.FORMAT_VERSION, len(records), device_id, sc.RECORD.size)
+    for seq, millis, v in records:
+        flags = (sc.FLAG_HA if v.get("ha") else 0) | (sc.FLAG_BK if v.get("bk") else 0) | \
+            (sc.FLAG_P2 if v.get("p2") else 0)
+        data += sc.RECORD.pack(
+            seq, millis, v.get("pwr", 0), v.get("tk", 0), v.get("tr", 0), v.get("ts", 0), v.get("tv", 0),
+            round(v.get("df", 0) * 100), v.get("p1", 0), flags, ord(v.get("err", "\0")), 0, 0,
+        )
+    return data
+
+
+def test_decode_datagram():
+    data = encode(7, [(41, 5000, {"ha": 1, "p2": 1, "p1": 85, "tk": -12, "tr": 42, "ts": 53, "tv": 64,
+                                  "df": 6.7, "err": "K", "pwr": 10289})])
+    assert len(data) == 36
+    (frame,) = sc.decode_datagram(data, received=1.5)
+    assert frame == sc.Frame(7, 41, 5000, 1.5, 1, 0, 85, 1, -12, 42, 53, 64, 6.7, "K", 10289, 0)
+
+
+def test_decode_batch_and_longer_records():
+    data = encode(1, [(i, i * 5000, {"tk": i}) for i in range(3)])
+    assert [f.tk for f in sc.decode_datagram(data)] == [0, 1, 2]
+
+    # Frames of a batch are back-dated from the last one by their device time,
+    # also across the millis() wrap-around
+    assert [f.received for f in sc.decode_datagram(data, received=100.0)] == [90.0, 95.0, 100.0]
+    data = encode(1, [(0, 2**32 - 2000, {}), (1, 3000, {})])
+    assert [f.received for f in sc.decode_datagram(data, received=100.0)] == [95.0, 100.0]
+
+    # A newer sender with 4 extra bytes per record still decodes
+    header = sc.HEADER.pack(sc.MAGIC, sc.FORMAT_VERSION, 2, 1, sc.RECORD.size + 4)
+    body = b"".join(sc.RECORD.pack(i, 0, 0, i, 0, 0, 0, 0, 0, 0, 0, 0, 0) + b"\xff" * 4 for i in range(2))
+    assert [f.tk for f in sc.decode_datagram(header + body)] == [0, 1]
+
+
+@pytest.mark.parametrize("data", [
+    b"SR",
+    b"XX" + encode(1, [(0, 0, {})])[2:],
+    encode(1, [(0, 0, {})])[:-1],
+    sc.HEADER.pack(sc.MAGIC, 99, 0, 1, sc.RECORD.size),
+])
+def test_decode_rejects_invalid(data):
+    with pytest.raises(ValueError):
+        sc.decode_datagram(data)
+
+
+def test_tracker_loss_reorder_duplicates():
+    tracker = sc.SequenceTracker()
+    for seq in [0, 1, 2, 5, 3, 6, 6, 9]:
+        tracker.update(seq, seq * 5000)
+    # 3 and 4 missing after 5, 3 came late, 4, 7 and 8 never arrived
+    assert tracker.stats() == {"received": 8, "lost": 3, "reordered": 1, "duplicates": 1, "restarts": 0}
+
+
+def test_tracker_restart():
+    tracker = sc.SequenceTracker()
+    for seq in range(100):
+        tracker.update(seq, 3_600_000 + seq * 5000)
+    # Device rebooted: sequence and uptime start from scratch
+    tracker.update(0, 5000)
+    tracker.update(1, 10000)
+    stats = tracker.stats()
+    assert stats["restarts"] == 1
+    assert stats["lost"] == 0 and stats["duplicates"] == 0
+
+
+def test_localhost_round_trip(tmp_path):
+    db, csv_path = tmp_path / "frames.db", tmp_path / "frames.csv"
+
+    async def scenario():
+        stop = asyncio.Event()
+        bound = asyncio.get_running_loop().create_future()
+        task = asyncio.create_task(sc.run_collector(
+            "127.0.0.1", 0, [sc.SqliteSink(str(db)), sc.CsvSink(str(csv_path))],
+            batch_size=4, flush_interval=0.05, stats_interval=0, stop=stop, ready=bound.set_result))
+        addr = await bound
+
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            for seq in [0, 1, 3, 2, 4]:
+                sock.sendto(encode(3, [(seq, seq * 5000, {"tk": 20 + seq, "pwr": 100 * seq})]), addr)
+            sock.sendto(encode(4, [(i, i * 5000, {"p1": i}) for i in range(10)]), addr)
+            sock.sendto(b"garbage", addr)
+        await asyncio.sleep(0.2)
+        stop.set()
+        return await task
+
+    collector = asyncio.run(scenario())
+    assert collector.invalid == 1
+    assert collector.stats()[3] == {"received": 5, "lost": 0, "reordered": 1, "duplicates": 0, "restarts": 0}
+    assert collector.stats()[4]["received"] == 10
+
+    with sqlite3.connect(db) as conn:
+        rows = conn.execute("SELECT seq, tk, pwr FROM frames WHERE device_id = 3 ORDER BY seq").fetchall()
+    assert rows == [(seq, 20 + seq, 100 * seq) for seq in range(5)]
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        assert len(list(csv.DictReader(f))) == 15
+
+
+@pytest.mark.skipif(not (HOST_HARNESS / "build" / "replay").exists(),
+                    reason="host harness not built (make -C esphome/tests/host build/replay)")
+@pytest.mark.parametrize("batch", [[], ["-b", "60"]], ids=["each_frame", "batches"])
+def test_component_replay_round_trip(tmp_path, batch):
+    """Frames sent by the component itself (host build) arrive complete and in order,
+    batches of the low-power mode with the original frame times"""
+
+    async def scenario():
+        stop = asyncio.Event()
+        bound = asyncio.get_running_loop().create_future()
+        task = asyncio.create_task(sc.run_collector(
+            "127.0.0.1", 0, [sc.SqliteSink(str(tmp_path / "frames.db"))],
+            flush_interval=0.05, stats_interval=0, stop=stop, ready=bound.set_result))
+        host, port = await bound
+        proc = await asyncio.create_subprocess_exec(
+            "./build/replay", "-u", f"{host}:{port}", "-d", "9", "-r", "2000", *batch, "corpus/frames.txt",
+            cwd=HOST_HARNESS, stdout=subprocess.PIPE)
+        await proc.communicate()
+        await asyncio.sleep(0.2)
+        stop.set()
+        return proc.returncode, await task
+
+    returncode, collector = asyncio.run(scenario())
+    assert returncode == 0
+    stats = collector.stats()[9]
+    assert stats["received"] > 0
+    assert stats["lost"] == stats["reordered"] == stats["duplicates"] == 0
+
+    with sqlite3.connect(tmp_path / "frames.db") as conn:
+        rows = conn.execute("SELECT millis, received FROM frames ORDER BY seq").fetchall()
+    if batch:
+        # Back-dated by the device times: one clock offset per datagram, not one per frame
+        offsets = {round(received - millis / 1000, 2) for millis, received in rows}
+        assert len(offsets) < len(rows) / 2
@@ -0,0 +1,211 @@
+"""Tests for solaris_decoder.py - parser rules, vectorized vs. reference decoding, chunking and output"""
+
+import csv
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import solaris_decoder as dec  # noqa: E402  pylint: disable=wrong-import-position
+
+TOOLS = Path(__file__).resolve().parents[1]
+CORPUS = TOOLS.parent / "esphome" / "tests" / "host" / "corpus"
+FRAME = b"0;1;75;0;84;58;61;63;3,2;K;3500"
+
+
+def df_of(token):
+    line = parse(b"0;0;45;0;80;46;59;62;" + token + b";;5412")
+    return line.values[dec.SOLARIS_DF], line.invalid_mask
+
+
+def parse(line):
+    return dec.parse_line(line)
+
+
+def test_parse_line_frame():
+    line = parse(FRAME + b"\r")
+    assert line.kind == dec.LINE_FRAME
+    assert line.values == [0, 1, 75, 0, 84, 58, 61, 63, 320, ord("K"), 3500]
+    assert line.invalid_mask == 0
+
+
+@pytest.mark.parametrize("token, expected", [
+    (b"3,2", (320, 0)), (b"3.2", (320, 0)), (b",5", (50, 0)), (b"3,", (300, 0)), (b"3,2,1", (320, 0)),
+    (b"-1,5", (-150, 0)), (b"19,99", (1999, 0)), (b"4,885", (489, 0)), (b"4,884", (488, 0)),
+    (b" +7", (700, 0)), (b"", (0, 0)), (b",", (0, 1 << dec.SOLARIS_DF)), (b"- 3", (0, 1 << dec.SOLARIS_DF)),
+    (b"99999999999", (dec.INT32_MAX, 0)), (b"1" * 16, (0, 1 << dec.SOLARIS_DF)),
+])
+def test_parse_df(token, expected):
+    assert df_of(token) == expected
+
+
+def test_parse_line_classes():
+    assert parse(b"").kind == dec.LINE_NONE
+    assert parse(b"SOLARIS RPS3 V2.1") == dec.Line(dec.LINE_BOOT, None, 0, 0)
+    assert parse(b"Zyklus 10s") == dec.Line(dec.LINE_BOOT, None, 0, 10)
+    assert parse(b"HA;BK;P1 /%;P2;TK /\xb0C;TR /\xb0C;TS /\xb0C;TV /\xb0C;V /l/min;ERROR;P/W").kind == dec.LINE_BOOT
+    assert parse(b"0;0;45;0;80;4").kind == dec.LINE_INVALID_LENGTH
+    assert parse(b"0" * 49).kind == dec.LINE_INVALID_LENGTH
+    assert parse(b";" * dec.MIN_LINE_LEN).kind == dec.LINE_FRAME
+    assert parse(b"0;0;45;0;80;46;59;62;4,8;").kind == dec.LINE_INCOMPLETE
+    # Fields after the 11th are ignored, tokens without digits are invalid
+    line = parse(b"0;x;45;0;80;46;59;62;4,8;;5412;7;8")
+    assert line.kind == dec.LINE_FRAME and line.values[dec.SOLARIS_PWR] == 5412
+    assert line.invalid_mask == 1 << 1
+
+
+def random_lines(rng, count):
+    """Frames, mutated frames and random lines over the characters the parser treats specially"""
+    alphabet = b"0123456789;;;,.-+ \txK"
+    lines = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.3:
+            line = bytearray(FRAME)
+            for _ in range(rng.randint(1, 4)):
+                line[rng.randrange(len(line))] = rng.choice(alphabet)
+        elif kind < 0.6:
+            fields = [bytes(rng.choice(alphabet[:10] + b",.-+ ") for _ in range(rng.randint(0, 12)))
+                      for _ in range(rng.randint(9, 13))]
+            line = b";".join(fields)
+        else:
+            line = bytes(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        lines.append(bytes(line))
+    return lines
+
+
+def reference(lines):
+    return [parse(line) for line in lines]
+
+
+def assert_matches_reference(columns, lines):
+    frames = [(number, line) for number, line in enumerate(reference(lines), 1) if line.kind == dec.LINE_FRAME]
+    assert columns["line"].tolist() == [number for number, _ in frames]
+    for name_index, name in enumerate(dec.FIELDS):
+        expected = [line.values[name_index] for _, line in frames]
+        if name == "df":
+            expected = [value / dec.DF_SCALE for value in expected]
+        assert columns[name].tolist() == expected, name
+    assert columns["invalid_mask"].tolist() == [line.invalid_mask for _, line in frames]
+
+
+def test_vectorized_matches_reference_corpus():
+    for path in sorted(CORPUS.glob("*.txt")):
+        data = path.read_bytes()
+        assert_matches_reference(dec.decode_bytes(data), data.replace(b"\r", b"").split(b"\n")[:-1])
+
+
+def test_vectorized_matches_reference_random():
+    lines = random_lines(random.Random(7), 20000)
+    columns = dec.decode_bytes(b"\n".join(lines) + b"\n")
+    assert_matches_reference(columns, lines)
+    assert len(columns["line"]) > 3000
+
+
+def test_chunks_and_counters():
+    lines = random_lines(random.Random(8), 3000) + [b"x" * 500, b"SOLARIS " + b"y" * 300]
+    data = b"\r\n".join(lines) + b"\r\npartial"
+    whole = dec.LogDecoder()
+    expected = whole.feed(data)
+    chunked = dec.LogDecoder()
+    parts = [chunked.feed(data[i:i + 37]) for i in range(0, len(data), 37)]
+    for name in dec.COLUMNS:
+        assert np.concatenate([part[name] for part in parts]).tolist() == expected[name].tolist(), name
+    assert chunked.stats() == whole.stats()
+
+    kinds = [line.kind for line in reference(lines)]
+    assert whole.stats() == {
+        "lines": len(lines),
+        "frames": kinds.count(dec.LINE_FRAME),
+        "boot_lines": kinds.count(dec.LINE_BOOT),
+        "invalid_length": kinds.count(dec.LINE_INVALID_LENGTH),
+        "incomplete": kinds.count(dec.LINE_INCOMPLETE),
+        "invalid_tokens": sum(1 for line in reference(lines) if line.invalid_mask),
+    }
+
+
+def test_cycle_from_boot_line():
+    data = b"\n".join([FRAME, FRAME, b"Zyklus 10s", FRAME, FRAME, b"Zyklus 0s", FRAME]) + b"\n"
+    decoder = dec.LogDecoder(cycle=5)
+    columns = decoder.feed(data)
+    assert columns["elapsed"].tolist() == [0, 5, 10, 20, 30]
+    assert columns["cycle"].tolist() == [5, 5, 10, 10, 10]
+    assert decoder.elapsed == 40 and decoder.cycle == 10
+
+
+def frame_line(p1=0, bk=0, tk=20, ts=40, err=b"", pwr=0):
+    return b"0;%d;%d;0;%d;30;%d;35;2,5;%s;%d" % (bk, p1, tk, ts, err, pwr)
+
+
+def test_daily_summary():
+    # Two hours at 3600 W before midnight UTC, one hour of burner and an error after it
+    lines = [frame_line(p1=50, tk=70 + i % 3, pwr=3600) for i in range(720)]
+    lines += [frame_line(bk=1, ts=60, err=b"K" if i < 10 else b"") for i in range(360)]
+    summary = dec.DailySummary()
+    data = b"\n".join(lines) + b"\n"
+    decoder = dec.LogDecoder(cycle=10)
+    for i in range(0, len(data), 4096):
+        summary.add(decoder.feed(data[i:i + 4096]))
+
+    start = 1780351200.0  # 2026-06-01 22:00 UTC
+    days = summary.days(start, utc=True)
+    assert days == [
+        {"date": "2026-06-01", "frames": 720, "hours": 2.0, "yield_kwh": 7.2, "peak_kw": 3.6, "pump_hours": 2.0,
+         "burner_hours": 0.0, "tk_max": 72, "ts_max": 40, "error_frames": 0},
+        {"date": "2026-06-02", "frames": 360, "hours": 1.0, "yield_kwh": 0.0, "peak_kw": 0.0, "pump_hours": 0.0,
+         "burner_hours": 1.0, "tk_max": 20, "ts_max": 60, "error_frames": 10},
+    ]
+    assert dec.DailySummary().days(start) == []
+
+
+def write_chunks(writer, data):
+    decoder = dec.LogDecoder()
+    for i in range(0, len(data), 1000):
+        writer.write(decoder.feed(data[i:i + 1000]))
+    writer.close()
+
+
+def test_npz(tmp_path):
+    data = b"\n".join(random_lines(random.Random(9), 2000)) + b"\n"
+    expected = dec.decode_bytes(data)
+    write_chunks(dec.NpzWriter(tmp_path / "frames.npz"), data)
+    with np.load(tmp_path / "frames.npz") as npz:
+        assert sorted(npz.files) == sorted(dec.COLUMNS)
+        for name in dec.COLUMNS:
+            assert npz[name].dtype == expected[name].dtype
+            assert npz[name].tolist() == expected[name].tolist(), name
+
+
+def test_parquet(tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    data = b"\n".join(random_lines(random.Random(10), 2000)) + b"\n"
+    expected = dec.decode_bytes(data)
+    write_chunks(dec.ParquetWriter(tmp_path / "frames.parquet"), data)
+    table = parquet.read_table(tmp_path / "frames.parquet")
+    assert table.column_names == list(dec.COLUMNS)
+    for name in dec.COLUMNS:
+        assert table.column(name).to_pylist() == expected[name].tolist(), name
+
+
+def test_command_line(tmp_path):
+    log = tmp_path / "capture.txt"
+    subprocess.run([sys.executable, str(TOOLS / "solaris_simulator.py"), "--rate", "0", "--frames", "20003",
+                    "--seed", "1", "--start-hour", "0", "--output", str(log)], check=True, capture_output=True)
+    proc = subprocess.run(
+        [sys.executable, str(TOOLS / "solaris_decoder.py"), str(log), "--npz", str(tmp_path / "frames.npz"),
+         "--summary", str(tmp_path / "daily.csv"), "--start", "2026-06-01T00:00", "--chunk-size", "0.1"],
+        check=True, capture_output=True, text=True)
+    assert proc.stdout.startswith("20003 lines, 20000 frames, 3 boot lines, 0 invalid length")
+
+    with open(tmp_path / "daily.csv", newline="", encoding="utf-8") as file:
+        days = list(csv.DictReader(file))
+    # 20000 frames of 5 s: a solar day from midnight, then the night until 3:46
+    assert [day["date"] for day in days] == ["2026-06-01", "2026-06-02"]
+    assert [int(day["frames"]) for day in days] == [17280, 2720]
+    assert float(days[0]["yield_kwh"]) > 1 and float(days[1]["yield_kwh"]) == 0
+    with np.load(tmp_path / "frames.npz") as npz:
+        assert npz["elapsed"][-1] == 19999 * 5
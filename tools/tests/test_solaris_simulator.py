@@ -0,0 +1,95 @@
+"""Tests for solaris_simulator.py - frame format, day model, faults and the pty output"""
+
+import os
+import random
+import re
+import threading
+from argparse import Namespace
+
+import solaris_simulator as sim
+
+# Ha;BK;P1;P2;TK;TR;TS;TV;DF;Err;PWR with the length limits of the component's parser
+FRAME_RE = re.compile(rb"^[01];[01];\d{1,3};[01];-?\d+;-?\d+;-?\d+;-?\d+;\d+,\d;[KRSDVGFW]?;\d+$")
+MIN_LINE_LEN, MAX_LINE_LEN = 22, 48
+
+
+def options(**kwargs):
+    defaults = dict(cycle=5, start_hour=0, error_rate=0, error_codes=sim.ERROR_CODES, error_duration=300,
+                    noise=0, truncate=0, timeout=0, timeout_pause=0)
+    return Namespace(**{**defaults, **kwargs})
+
+
+def take(lines, n):
+    return [line for line, _ in zip(lines, range(n))]
+
+
+def test_format_frame():
+    frame = sim.Frame(0, 1, 75, 0, 84, 58, 61, 63, 3.2, "", 3500)
+    assert sim.format_frame(frame) == "0;1;75;0;84;58;61;63;3,2;;3500"
+
+
+def test_boot_lines_and_frame_format():
+    lines = take(sim.model_lines(options(), random.Random(1)), 3 + 24 * 720)
+    assert lines[0].startswith(b"SOLARIS")
+    assert lines[1] == b"Zyklus 5s"
+    assert lines[2].startswith(b"HA;BK;P1") and "°".encode(sim.ENCODING) in lines[2]
+    for line in lines[3:]:
+        assert FRAME_RE.match(line), line
+        assert MIN_LINE_LEN <= len(line) <= MAX_LINE_LEN, line
+
+
+def test_solar_day():
+    model = sim.SolarDay(5, 0, random.Random(2))
+    day = [model.step() for _ in range(24 * 720)]
+    night, noon = day[2 * 720:4 * 720], day[11 * 720:14 * 720]
+    assert all(f.p1 == 0 and f.pwr == 0 for f in night)
+    assert any(f.p1 > 0 and f.pwr > 1000 for f in noon)
+    # Power follows flow rate and temperature spread, within 1 K of rounding
+    for f in noon:
+        watts_per_kelvin = f.df / 60 * sim.WATER_HEAT_CAPACITY
+        if f.pwr:
+            assert abs(f.pwr - watts_per_kelvin * (f.tv - f.tr)) <= watts_per_kelvin + 1
+    assert max(f.ts for f in day) <= sim.STORAGE_MAX + 1
+
+
+def test_error_injection():
+    lines = take(sim.model_lines(options(error_rate=1, error_codes="K", error_duration=15),
+                                 random.Random(3)), 3 + 10)
+    assert all(line.split(b";")[9] == b"K" for line in lines[3:])
+
+
+def test_faults():
+    lines = [b"0;0;100;0;84;44;53;68;7,4;;12396"] * 2000
+    faults = options(noise=0.1, truncate=0.1, timeout=0.05, timeout_pause=6)
+    chunks = list(sim.inject_faults(iter(lines), faults, random.Random(4)))
+    assert len(chunks) == len(lines)
+    stalled = [c for c in chunks if c.stall]
+    assert stalled and all(not c.data.endswith(sim.EOL) for c in stalled)
+    complete = [c.data for c in chunks if not c.stall]
+    assert all(c.endswith(sim.EOL) for c in complete)
+    assert 0 < sum(c != lines[0] + sim.EOL for c in complete) < len(complete)
+
+
+def test_replay(tmp_path):
+    capture = tmp_path / "capture.txt"
+    capture.write_bytes(b"SOLARIS RPS3 V2.1\r\n0;0;0;0;12;36;52;38;0,0;;0\r\n\r\n")
+    assert list(sim.replay_lines(capture, 2)) == [b"SOLARIS RPS3 V2.1", b"0;0;0;0;12;36;52;38;0,0;;0"] * 2
+
+
+def test_pty_stream():
+    master, slave, path = sim.open_pty()
+    chunks = sim.inject_faults(sim.model_lines(options(), random.Random(5)), options(), random.Random(5))
+    writer = threading.Thread(target=sim.write_stream, args=(master, chunks, 0, 10))
+    writer.start()
+    try:
+        with open(path, "rb", buffering=0) as reader:
+            data = b""
+            while data.count(sim.EOL) < 10:
+                data += os.read(reader.fileno(), 4096)
+    finally:
+        writer.join()
+        os.close(master)
+        os.close(slave)
+    lines = data.split(sim.EOL)
+    assert lines[0].startswith(b"SOLARIS")
+    assert all(FRAME_RE.match(line) for line in lines[3:10])